@@ -1,8 +1,15 @@
 """Main module of this project."""
 
 import datetime
+from .cache_utils import PROBLEM_CACHE, SolutionCache
+from .database_utils import get_count_table, get_database
 from .expr_utils import Node, build_node
-from .problem_utils import Problem
+from .problem_utils import DEFAULT_SEED, Problem
+
+
+def is_solvable(problem, target=42) -> bool:
+    """Check if a problem has any solution, without generating the answers."""
+    return Problem(list(problem)).has_solution(target)
 
 
 class FTPtsGame(object):
@@ -13,6 +20,7 @@ class FTPtsGame(object):
     __init__(): initialization. (Entry point)
     is_playing(): show the status of current game. (+-)
     generate_problem(): generate a problem manually. (-)
+    generate_random_problem(): generate a random problem in database. (-)
     get_elapsed_time(): get the time elapsed during the game. (+)
     get_current_problem(): get current problem (tuple). (+)
     get_current_solutions(): get current solutions (list). (+)
@@ -23,10 +31,11 @@ class FTPtsGame(object):
     solve(): put forward a solution and show solution intervals. (+)
     """
 
-    def __init__(self):
-        """Start the game session, serving as an initialization."""
+    def __init__(self, cache_path: str = None):
+        """Start the game session, serving as an initialization. Solved problems are cached in cache_path if given."""
+        self.__cache = SolutionCache(cache_path) if cache_path else None
         self.__valid = []  # this list stores readable answers
-        self.__formula = []  # this list stores converted formulas
+        self.__solved = {}  # this dict stores solved classes (and the index of their answers)
         self.__players = []  # this list stores player statistics
         self.__playing = False  # this stores playing status
 
@@ -45,16 +54,32 @@ class FTPtsGame(object):
         elapsed = datetime.datetime.now() - self.__timer
         return elapsed
 
-    def generate_problem(self, problem, target=42):
-        """Generate a problem manually."""
+    def generate_problem(self, problem, target=42, seed=DEFAULT_SEED):
+        """
+        Generate a problem manually. The seed makes the classification of answers reproducible.
+
+        Solved problems are shared with other games of the process through PROBLEM_CACHE.
+        """
         self.__status_check(required_status=False)
         self.__target = target
         self.__problem = tuple(sorted(problem))
-        self.__problem_class = Problem(list(self.__problem))
-        self.__problem_class.generate_answers(self.__target)
+        solve = None if self.__cache is None else self.__cache.solve
+        self.__problem_class = PROBLEM_CACHE.get(self.__problem, self.__target, seed, solve)
         if len(self.__problem_class.distinct_answer_table) == 0:
             raise ValueError('No solution found.')
 
+    def generate_random_problem(self, min_solutions: int = 1, max_solutions: int = None, target=42):
+        """Generate a random problem in database, with min_solutions to max_solutions (unbounded if None) solutions."""
+        self.__status_check(required_status=False)
+        database, table = get_database(target), get_count_table()
+        if database is not None:
+            problem = database.random_hand(max(min_solutions, 1), max_solutions)
+        elif table is not None and target in table.targets:
+            problem = table.random_hand(max(min_solutions, 1), max_solutions, target)
+        else:
+            raise ValueError('No database for target: %s' % target)
+        self.generate_problem(problem, target)
+
     def get_current_target(self) -> int:
         """Get current target. Effective when playing."""
         self.__status_check(required_status=True)
@@ -83,13 +108,9 @@ class FTPtsGame(object):
     def get_remaining_solutions(self) -> list:
         """Get remaining solutions. Effective when playing."""
         self.__status_check(required_status=True)
-        current_solution_set = set()
-        for expr_str in self.__valid:
-            node = build_node(expr_str)
-            current_solution_set.add(self.__problem_class.equivalence_dict[node.unique_id()])
         return_list = []
         for expr in self.__problem_class.distinct_answer_table:
-            if self.__problem_class.equivalence_dict[expr.unique_id()] not in current_solution_set:
+            if self.__problem_class.get_equivalence_class(expr) not in self.__solved:
                 return_list.append(str(expr))
         return return_list
 
@@ -98,14 +119,12 @@ class FTPtsGame(object):
         self.__status_check(required_status=True)
         return self.__players
 
-    def __validate_repeated(self, node: Node):
-        """Validate distinguishing expressions. Private method."""
-        class_id = self.__problem_class.equivalence_dict[node.unique_id()]
-        for ind in range(0, len(self.__formula)):
-            cmp_node = self.__formula[ind]
-            cmp_class_id = self.__problem_class.equivalence_dict[cmp_node.unique_id()]
-            if cmp_class_id == class_id:
-                raise LookupError(self.__valid[ind])
+    def __validate_repeated(self, node: Node) -> int:
+        """Validate distinguishing expressions and return the class of it. Private method."""
+        class_id = self.__problem_class.get_equivalence_class(node)
+        if class_id in self.__solved:
+            raise LookupError(self.__valid[self.__solved[class_id]])
+        return class_id
 
     def solve(self, math_expr: str, player_id: int = -1) -> datetime.timedelta:
         """Put forward a solution and show solution intervals if correct."""
@@ -137,8 +156,7 @@ class FTPtsGame(object):
         if math_expr_value != self.__target:
             raise ArithmeticError(str(math_expr_value))
 
-        self.__validate_repeated(node)
-        self.__formula.append(node)
+        self.__solved[self.__validate_repeated(node)] = len(self.__valid)
         self.__valid.append(math_expr)
         elapsed = self.get_elapsed_time()
         interval = elapsed - self.__last
@@ -150,7 +168,7 @@ class FTPtsGame(object):
         """Start the game. Effective when not playing."""
         self.__status_check(required_status=False)
         self.__valid = []
-        self.__formula = []
+        self.__solved = {}
         self.__players = []
         self.__timer = datetime.datetime.now()
         self.__last = datetime.timedelta(seconds=0)  # A tag for each solution.
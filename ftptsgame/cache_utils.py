@@ -0,0 +1,157 @@
+"""Solution cache utilities for 42 points."""
+
+import os
+import threading
+import zlib
+from collections import OrderedDict
+from .database_utils import get_database, write_atomic
+from .expr_utils import RULES_VERSION
+from .problem_utils import DEFAULT_SEED, Problem
+
+DEFAULT_MAX_BYTES = 128 << 20
+
+
+def _solve(problem, target: int, seed) -> Problem:
+    """Return a problem with all its answers, from the packaged database if possible."""
+    database = get_database(target) if seed == DEFAULT_SEED else None
+    if database is not None and problem in database:
+        return database.load(problem, seed)
+    problem_class = Problem(list(problem), seed)
+    if problem_class.has_solution(target):  # unsolvable problems are found without generating any answer
+        problem_class.generate_answers(target)
+    return problem_class
+
+
+class SolutionCache(object):
+    """
+    A persistent on-disk cache of solved problems.
+
+    An entry keeps all answers of a problem and the representatives of their
+    classes, as given by Problem.export_answers, compressed. Entries are keyed by the
+    sorted problem, the target, the seed and RULES_VERSION, so entries saved with
+    other equivalence rules are never read. Problems seeded by random generators
+    are never cached. Entries are written to a temporary file and then renamed,
+    so several processes can share the cache directory.
+    """
+
+    def __init__(self, path: str):
+        """Initialize the cache in a directory, which is created if needed."""
+        self.path = path
+        os.makedirs(path, exist_ok=True)
+
+    def __entry_path(self, problem, target: int, seed: int) -> str:
+        """Return the path of the entry of a problem."""
+        name = '%s_%s_s%d_v%d.json.z' % ('-'.join(map(str, sorted(problem))), target, seed, RULES_VERSION)
+        return os.path.join(self.path, name)
+
+    def load(self, problem, target: int = 42, seed=DEFAULT_SEED) -> Problem:
+        """Return the cached problem with all its answers, or None if it is not cached."""
+        if not isinstance(seed, int):
+            return None
+        import json  # only needed by this cache, and slow to import
+        # Missing or broken entries, even well-formed JSON of another shape, are solved again.
+        try:
+            with open(self.__entry_path(problem, target, seed), 'rb') as f:
+                entry = json.loads(zlib.decompress(f.read()).decode())
+            if entry['version'] != RULES_VERSION:
+                return None
+            problem_class = Problem(list(problem), seed)
+            problem_class.import_answers(entry['nodes'], entry['answers'], entry['representatives'])
+        except (OSError, ValueError, zlib.error, KeyError, TypeError, IndexError):
+            return None
+        return problem_class
+
+    def save(self, problem_class: Problem, target: int = 42):
+        """Save a problem whose answers are generated, unless it is seeded by a random generator."""
+        if not isinstance(problem_class.seed, int):
+            return
+        import json  # only needed by this cache, and slow to import
+        table, answers, representatives = problem_class.export_answers()
+        entry = {'version': RULES_VERSION, 'nodes': table, 'answers': answers, 'representatives': representatives}
+        data = zlib.compress(json.dumps(entry, separators=(',', ':')).encode())
+        write_atomic(self.__entry_path(problem_class.problem, target, problem_class.seed), data)
+
+    def solve(self, problem, target: int = 42, seed=DEFAULT_SEED) -> Problem:
+        """Return a problem with all its answers, from the cache if possible."""
+        problem_class = self.load(problem, target, seed)
+        if problem_class is None:
+            problem_class = _solve(problem, target, seed)
+            self.save(problem_class, target)
+        return problem_class
+
+
+class ProblemCache(object):
+    """
+    A thread-safe LRU cache of solved problems, shared in a process.
+
+    Problems are keyed by the sorted problem, the target and the seed, and the
+    least recently used ones are evicted when their estimated size exceeds
+    max_bytes. Problems in the cache are shared and must not be modified.
+    """
+
+    def __init__(self, max_bytes: int = DEFAULT_MAX_BYTES):
+        """Initialize the cache."""
+        self.max_bytes = max_bytes
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.__lock = threading.Lock()
+        self.__entries = OrderedDict()  # key -> (problem, estimated size when cached)
+
+    def __len__(self) -> int:
+        """Return the number of cached problems."""
+        return len(self.__entries)
+
+    def get(self, problem, target: int = 42, seed=DEFAULT_SEED, solve=None) -> Problem:
+        """
+        Return a problem with all its answers, from the cache if possible.
+
+        Missing problems are given by solve(problem, target, seed), or solved
+        directly if it is not given. Problems seeded by random generators are
+        never cached.
+        """
+        solve = solve or _solve
+        if not isinstance(seed, int):
+            return solve(problem, target, seed)
+
+        key = (tuple(sorted(problem)), target, seed)
+        with self.__lock:
+            if key in self.__entries:
+                self.hits += 1
+                self.__entries.move_to_end(key)
+                return self.__entries[key][0]
+            self.misses += 1
+
+        problem_class = solve(problem, target, seed)  # not locked, so other problems can be served meanwhile
+        with self.__lock:
+            if key in self.__entries:  # solved by another thread meanwhile
+                return self.__entries[key][0]
+            size = problem_class.estimated_size()
+            self.__entries[key] = (problem_class, size)
+            self.size += size
+            while self.size > self.max_bytes and len(self.__entries) > 1:
+                _, (_, evicted_size) = self.__entries.popitem(last=False)
+                self.size -= evicted_size
+                self.evictions += 1
+        return problem_class
+
+    def stats(self) -> dict:
+        """Return the counters of the cache."""
+        with self.__lock:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'entries': len(self.__entries),
+                'size': self.size,
+            }
+
+    def clear(self):
+        """Remove all problems from the cache."""
+        with self.__lock:
+            self.__entries.clear()
+            self.size = 0
+
+
+PROBLEM_CACHE = ProblemCache()
@@ -0,0 +1,225 @@
+"""
+Precomputed database of 42 points.
+
+Hands are looked up by get and count. Packaged databases are opened on first
+use, so importing ftptsgame never loads them.
+
+A database can be re-generated by command line, for example:
+    python -m ftptsgame.database build --target 42 --workers 64
+    python -m ftptsgame.database counts --first 1 --last 100 --workers 64
+"""
+
+import argparse
+import os
+import shutil
+import struct
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from .cache_utils import PROBLEM_CACHE
+from .database_utils import (DATA_PATH, all_hands, count_hand, get_count_table, get_database, release, solve_hand,
+                             write_atomic, write_count_table, write_database)
+from .expr_utils import RULES_VERSION
+from .problem_utils import DEFAULT_SEED, Problem
+
+
+def get(problem, target: int = 42, seed=DEFAULT_SEED) -> Problem:
+    """
+    Return a hand with all its answers from the packaged database of a target.
+
+    Hands are shared through PROBLEM_CACHE, so repeated lookups are served
+    without decoding the hand again. Answers in the database are classified
+    with DEFAULT_SEED, so hands of other seeds are solved instead.
+    """
+    database = get_database(target)
+    if database is None:
+        raise ValueError('No database for target: %s' % target)
+    if problem not in database:
+        raise KeyError(tuple(sorted(problem)))
+    return PROBLEM_CACHE.get(problem, target, seed)
+
+
+def count(problem, target: int = 42) -> int:
+    """Return the number of distinct answers of a hand for a target, from the packaged database or count table."""
+    database, table = get_database(target), get_count_table()
+    if database is not None:
+        return database.count(problem)
+    if table is not None and target in table.targets:
+        return table.count(problem, target)
+    raise ValueError('No database for target: %s' % target)
+
+
+def _answer_record(hand: tuple, target: int) -> bytes:
+    """Return the number of distinct answers of a hand and its encoded answers, as a record."""
+    count, data = solve_hand(hand, target)
+    return struct.pack('<I', count) + data
+
+
+def _count_record(hand: tuple, targets: range) -> bytes:
+    """Return the numbers of distinct answers of a hand for some targets, as a record."""
+    counts = count_hand(hand, targets)
+    return struct.pack('<%dI' % len(counts), *counts)
+
+
+def _solve_chunk(solve, hands: list, argument) -> list:
+    """Solve a chunk of hands. Run in worker processes."""
+    return [solve(hand, argument) for hand in hands]
+
+
+def _save_chunk(path: str, records: list):
+    """Save the records of a chunk as a checkpoint."""
+    write_atomic(path, b''.join(struct.pack('<I', len(record)) + record for record in records))
+
+
+def _load_chunk(path: str) -> list:
+    """Load the records of a chunk saved as a checkpoint."""
+    with open(path, 'rb') as f:
+        data = f.read()
+    records, offset = [], 0
+    while offset < len(data):
+        length = struct.unpack_from('<I', data, offset)[0]
+        records.append(data[offset + 4:offset + 4 + length])
+        offset += 4 + length
+    return records
+
+
+def _solve_all(solve, argument, hands: list, workers: int, chunk_size: int, checkpoint: str, progress) -> list:
+    """
+    Solve all hands by solve(hand, argument) and return their records, in order.
+
+    Hands are solved in chunks by a pool of processes. Every solved chunk is
+    saved in the checkpoint directory, so an interrupted run resumes from the
+    chunks already solved. The progress function, if given, is called with the
+    numbers of solved and all hands.
+    """
+    chunks = [hands[i:i + chunk_size] for i in range(0, len(hands), chunk_size)]
+    os.makedirs(checkpoint, exist_ok=True)
+
+    def _chunk_path(i: int) -> str:
+        return os.path.join(checkpoint, '%d-%d.part' % (i * chunk_size, len(chunks[i])))
+
+    results = {i: _load_chunk(_chunk_path(i)) for i in range(len(chunks)) if os.path.exists(_chunk_path(i))}
+    solved = sum(len(records) for records in results.values())
+    if progress is not None:
+        progress(solved, len(hands))
+
+    with ProcessPoolExecutor(workers) as executor:
+        futures = {
+            executor.submit(_solve_chunk, solve, chunks[i], argument): i
+            for i in range(len(chunks)) if i not in results
+        }
+        try:
+            for future in as_completed(futures):
+                i = futures[future]
+                results[i] = future.result()
+                _save_chunk(_chunk_path(i), results[i])
+                solved += len(results[i])
+                if progress is not None:
+                    progress(solved, len(hands))
+        except BaseException:
+            # Stop at once: queued chunks are cancelled, and chunks which are
+            # already running are waited for and saved, so no work is lost.
+            for future in futures:
+                future.cancel()
+            executor.shutdown(wait=True)
+            for future, i in futures.items():
+                if i not in results and not future.cancelled() and future.exception() is None:
+                    _save_chunk(_chunk_path(i), future.result())
+            raise
+
+    return [record for i in range(len(chunks)) for record in results[i]]
+
+
+def build(path: str,
+          target: int = 42,
+          size: int = 5,
+          maximum: int = 13,
+          workers: int = None,
+          chunk_size: int = 64,
+          checkpoint: str = None,
+          progress=None):
+    """
+    Build the database of all hands for a target.
+
+    Chunks of hands are solved by workers processes, and checkpoints are kept
+    in the checkpoint directory (by default next to the database) until the
+    database is written, see _solve_all.
+    """
+    if checkpoint is None:
+        checkpoint = '%s.%d-%d-%d-v%d.parts' % (path, target, size, maximum, RULES_VERSION)
+    records = _solve_all(_answer_record, target, list(all_hands(size, maximum)), workers, chunk_size, checkpoint,
+                         progress)
+    release(path)  # a mapped file can't be replaced on Windows
+    write_database(path, target, ((struct.unpack_from('<I', record)[0], record[4:]) for record in records), size,
+                   maximum)
+    shutil.rmtree(checkpoint)
+
+
+def build_counts(path: str,
+                 targets: range,
+                 size: int = 5,
+                 maximum: int = 13,
+                 workers: int = None,
+                 chunk_size: int = 16,
+                 checkpoint: str = None,
+                 progress=None):
+    """
+    Build the count table of all hands for a range of targets.
+
+    Chunks of hands are solved by workers processes, and checkpoints are kept
+    in the checkpoint directory (by default next to the table) until the table
+    is written, see _solve_all.
+    """
+    if checkpoint is None:
+        checkpoint = '%s.%d-%d-%d-%d-v%d.parts' % (path, targets.start, targets.stop - 1, size, maximum, RULES_VERSION)
+    records = _solve_all(_count_record, targets, list(all_hands(size, maximum)), workers, chunk_size, checkpoint,
+                         progress)
+    release(path)
+    write_count_table(path, targets, (struct.unpack('<%dI' % len(targets), record) for record in records), size,
+                      maximum)
+    shutil.rmtree(checkpoint)
+
+
+def main(argv: list = None):
+    """Run the command line."""
+    parser = argparse.ArgumentParser(prog='python -m ftptsgame.database', description=__doc__.strip().splitlines()[0])
+    commands = parser.add_subparsers(dest='command')
+    builder = commands.add_parser('build', help='solve all hands for a target and write their database')
+    builder.add_argument('-t', '--target', type=int, default=42, help='target of all hands (default: 42)')
+    counter = commands.add_parser('counts', help='count distinct answers of all hands for a range of targets')
+    counter.add_argument('-f', '--first', type=int, default=1, help='first target (default: 1)')
+    counter.add_argument('-l', '--last', type=int, default=100, help='last target (default: 100)')
+    for command, chunk_size, output in [(builder, 64, 'database'), (counter, 16, 'count table')]:
+        command.add_argument('-s', '--size', type=int, default=5, help='numbers in a hand (default: 5)')
+        command.add_argument('-m', '--maximum', type=int, default=13, help='maximum number of a hand (default: 13)')
+        command.add_argument('-j', '--workers', type=int, default=None, help='worker processes (default: all CPUs)')
+        command.add_argument('-c',
+                             '--chunk-size',
+                             type=int,
+                             default=chunk_size,
+                             help='hands solved by a task (default: %d)' % chunk_size)
+        command.add_argument('-o', '--output', help='%s file (default: the packaged %s)' % (output, output))
+        command.add_argument('--checkpoint', help='directory of solved chunks (default: next to the %s)' % output)
+    args = parser.parse_args(argv)
+    if args.command is None:
+        parser.print_help()
+        return
+
+    start = time.time()
+
+    def _progress(solved: int, total: int):
+        sys.stderr.write('\r%d/%d hands solved, %.0f s elapsed' % (solved, total, time.time() - start))
+        sys.stderr.flush()
+
+    if args.command == 'build':
+        output = args.output or os.path.join(DATA_PATH, 'database_%d.bin' % args.target)
+        build(output, args.target, args.size, args.maximum, args.workers, args.chunk_size, args.checkpoint, _progress)
+    else:
+        output = args.output or os.path.join(DATA_PATH, 'counts.bin')
+        build_counts(output, range(args.first, args.last + 1), args.size, args.maximum, args.workers, args.chunk_size,
+                     args.checkpoint, _progress)
+    sys.stderr.write('\nWritten to %s\n' % output)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,366 @@
+"""Precomputed database utilities for 42 points."""
+
+import itertools
+import mmap
+import os
+import random
+import struct
+import threading
+import zlib
+from bisect import bisect_left, bisect_right
+from .expr_utils import RULES_VERSION, NodePool
+from .problem_utils import DEFAULT_SEED, Problem, rank_hand, unrank_hand
+
+# A database file starts with a header, followed by one index record for every
+# hand (and a last one for the end of the blob), followed by a blob of all
+# answers. Hands are sorted 5-multisets in the order of
+# itertools.combinations_with_replacement, and every index record keeps the
+# number of distinct answers of the hand and the offset of its answers in the
+# blob. Answers of a hand are compressed by zlib, see encode_answers.
+MAGIC = b'42PD'
+FORMAT_VERSION = 1
+HEADER = struct.Struct('<4sHHiHHI')  # magic, format version, rules version, target, size, maximum, hands
+RECORD = struct.Struct('<II')  # distinct answers, offset in blob
+# A count table file starts with a header, followed by a column for every
+# target in a range, keeping the number of distinct answers of every hand by
+# rank. The count of a hand for a target is read at a single position.
+COUNT_MAGIC = b'42PC'
+COUNT_HEADER = struct.Struct('<4sHHHHIiI')  # magic, format version, rules version, size, maximum, hands, first target, targets
+COUNT = struct.Struct('<H')
+DATA_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data')
+
+
+def encode_answers(problem_class: Problem) -> bytes:
+    """
+    Encode all answers of a problem, as given by Problem.export_answers.
+
+    Every answer is kept in prefix notation, one byte per token: numbers (up
+    to 127) as they are and operators from 128. They are followed by the
+    indices of the representatives of all answers. Unsolved problems are
+    encoded as empty bytes.
+    """
+    table, answers, representatives = problem_class.export_answers()
+    if not answers:
+        return b''
+
+    tokens = bytearray()
+
+    def _encode(row: int):
+        item = table[row]
+        if type(item) is int:
+            if not 0 <= item < 128:
+                raise ValueError('Number out of range: %d' % item)
+            tokens.append(item)
+        else:
+            tokens.append(128 + NodePool.OPERATORS.index(item[0]))
+            _encode(item[1])
+            _encode(item[2])
+
+    for row in answers:
+        _encode(row)
+    width = 'H' if len(answers) < 65536 else 'I'
+    data = struct.pack('<I', len(answers)) + struct.pack('<%d%s' % (len(answers), width), *representatives)
+    return zlib.compress(data + tokens, 9)
+
+
+def decode_answers(data: bytes) -> tuple:
+    """Decode answers given by encode_answers, in the form of Problem.export_answers."""
+    if not data:
+        return [], [], []
+    data = zlib.decompress(data)
+    count = struct.unpack_from('<I', data)[0]
+    width = 'H' if count < 65536 else 'I'
+    representatives = list(struct.unpack_from('<%d%s' % (count, width), data, 4))
+
+    table, stack, rows = [], [], {}  # rows: token and children -> row, to share common nodes
+    for token in reversed(data[4 + struct.calcsize('<%d%s' % (count, width)):]):
+        key = token if token < 128 else (token, stack.pop(), stack.pop())
+        if key not in rows:
+            rows[key] = len(table)
+            table.append(key if token < 128 else [NodePool.OPERATORS[token - 128], key[1], key[2]])
+        stack.append(rows[key])
+    return table, stack[::-1], representatives  # the roots of all answers are left, the last one at the bottom
+
+
+def write_atomic(path: str, data: bytes):
+    """Write a file through a temporary file, so no process can read it partially written."""
+    import tempfile  # only needed by writers, and slow to import
+    fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(path)), suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        os.chmod(temp_path, 0o644)  # readable by all processes, as a packaged file
+        os.replace(temp_path, path)
+    except BaseException:
+        os.remove(temp_path)
+        raise
+
+
+def solve_hand(problem, target: int = 42) -> tuple:
+    """Solve a hand and return the number of its distinct answers and the encoded answers."""
+    problem_class = Problem(list(problem))
+    if problem_class.has_solution(target):
+        problem_class.generate_answers(target)
+    return len(problem_class.distinct_answer_table), encode_answers(problem_class)
+
+
+def count_hand(problem, targets) -> list:
+    """Solve a hand for some targets and return the numbers of its distinct answers."""
+    problem_class = Problem(list(problem))  # sub-expressions are shared by all targets
+    counts = []
+    for target in targets:
+        if problem_class.has_solution(target):
+            problem_class.generate_answers(target, keep_index=True)
+            counts.append(len(problem_class.distinct_answer_table))
+        else:
+            counts.append(0)
+    return counts
+
+
+def all_hands(size: int = 5, maximum: int = 13):
+    """Iterate all hands in the order of a database."""
+    return itertools.combinations_with_replacement(range(maximum + 1), size)
+
+
+def write_database(path: str, target: int, records, size: int = 5, maximum: int = 13):
+    """Write a database from the records given by solve_hand for all hands, in order."""
+    index, blob = bytearray(), bytearray()
+    hands = 0
+    for count, data in records:
+        index += RECORD.pack(count, len(blob))
+        blob += data
+        hands += 1
+    index += RECORD.pack(0, len(blob))
+    header = HEADER.pack(MAGIC, FORMAT_VERSION, RULES_VERSION, target, size, maximum, hands)
+    write_atomic(path, header + index + blob)
+
+
+def write_count_table(path: str, targets: range, records, size: int = 5, maximum: int = 13):
+    """Write a count table from the counts given by count_hand for all hands, in order."""
+    if targets.step != 1:
+        raise ValueError('Targets must be consecutive.')
+    rows = list(records)
+    header = COUNT_HEADER.pack(COUNT_MAGIC, FORMAT_VERSION, RULES_VERSION, size, maximum, len(rows), targets.start,
+                               len(targets))
+    columns = [struct.pack('<%dH' % len(rows), *(row[i] for row in rows)) for i in range(len(targets))]
+    write_atomic(path, header + b''.join(columns))
+
+
+class _CountIndex(object):
+    """Ranks of hands sorted by their numbers of distinct answers, to draw hands by numbers."""
+
+    def __init__(self, counts: list):
+        """Sort the ranks of all hands by their numbers of distinct answers."""
+        self.ranks = sorted(range(len(counts)), key=counts.__getitem__)
+        self.counts = [counts[rank] for rank in self.ranks]
+
+    def draw(self, min_count: int, max_count: int, rng) -> int:
+        """Return the rank of a random hand with min_count to max_count (unbounded if None) distinct answers."""
+        low = bisect_left(self.counts, min_count)
+        high = len(self.counts) if max_count is None else bisect_right(self.counts, max_count)
+        if low >= high:
+            raise ValueError('No hand found.')
+        return self.ranks[rng.randrange(low, high)]
+
+
+class Database(object):
+    """
+    A precomputed database of the answers of all hands for a target.
+
+    The file is memory-mapped, so processes opening the same database share
+    its pages, and the record of a hand is read by its rank. Answers of a hand
+    are only decoded on demand, so a round can start without generating any
+    answer.
+    """
+
+    def __init__(self, path: str):
+        """Open a database file."""
+        self.path = path
+        with open(path, 'rb') as f:
+            self.__map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            if len(self.__map) < HEADER.size:
+                raise ValueError('Broken database: %s' % path)
+            magic, version, rules, self.target, self.size, self.maximum, self.hands = HEADER.unpack_from(self.__map)
+            if magic != MAGIC or version != FORMAT_VERSION:
+                raise ValueError('Unsupported database: %s' % path)
+            if rules != RULES_VERSION:
+                raise ValueError('Database made by other equivalence rules: %s' % path)
+            self.__blob = HEADER.size + (self.hands + 1) * RECORD.size
+            if len(self.__map) < self.__blob:
+                raise ValueError('Broken database: %s' % path)
+        except ValueError:
+            self.__map.close()
+            raise
+        self.__index = None  # hands by numbers of distinct answers
+
+    def close(self):
+        """Close the database, so its file can be replaced or deleted."""
+        self.__map.close()
+
+    def __enter__(self):
+        """Use the database in a with statement, which closes it."""
+        return self
+
+    def __exit__(self, *exc_info):
+        """Close the database."""
+        self.close()
+
+    def __len__(self) -> int:
+        """Return the number of hands."""
+        return self.hands
+
+    def __contains__(self, problem) -> bool:
+        """Check if a hand is in the database."""
+        return self.rank(problem) is not None
+
+    def rank(self, problem) -> int:
+        """Return the rank of a hand in the database, or None if it is not in the database."""
+        problem = tuple(problem)
+        if len(problem) != self.size:
+            return None
+        try:
+            return rank_hand(problem, self.maximum)
+        except ValueError:
+            return None
+
+    def __record(self, problem) -> tuple:
+        """Return the number of distinct answers of a hand, and the start and end of its answers in the file."""
+        rank = self.rank(problem)
+        if rank is None:
+            raise KeyError(tuple(sorted(problem)))
+        count, start = RECORD.unpack_from(self.__map, HEADER.size + rank * RECORD.size)
+        end = RECORD.unpack_from(self.__map, HEADER.size + (rank + 1) * RECORD.size)[1]
+        return count, self.__blob + start, self.__blob + end
+
+    def count(self, problem) -> int:
+        """Return the number of distinct answers of a hand."""
+        return self.__record(problem)[0]
+
+    def counts(self) -> list:
+        """Return the numbers of distinct answers of all hands, by rank."""
+        return [count for count, _ in RECORD.iter_unpack(self.__map[HEADER.size:self.__blob - RECORD.size])]
+
+    def random_hand(self, min_count: int = 1, max_count: int = None, rng=random) -> tuple:
+        """Return a random hand with min_count to max_count (unbounded if None) distinct answers."""
+        if self.__index is None:
+            self.__index = _CountIndex(self.counts())
+        return unrank_hand(self.__index.draw(min_count, max_count, rng), self.size, self.maximum)
+
+    def load(self, problem, seed=DEFAULT_SEED) -> Problem:
+        """Return a hand with all its answers."""
+        _, start, end = self.__record(problem)
+        problem_class = Problem(list(problem), seed)
+        problem_class.import_answers(*decode_answers(self.__map[start:end]))
+        return problem_class
+
+
+_databases = {}  # target -> packaged database, or None if there is none
+_lock = threading.Lock()  # packaged files are only opened once
+
+
+def get_database(target: int = 42) -> Database:
+    """Return the packaged database of a target, or None if there is none (or it is out of date). Opened on first use."""
+    if target not in _databases:
+        with _lock:
+            if target not in _databases:
+                try:
+                    _databases[target] = Database(os.path.join(DATA_PATH, 'database_%d.bin' % target))
+                except (OSError, ValueError):
+                    _databases[target] = None
+    return _databases[target]
+
+
+class CountTable(object):
+    """
+    A precomputed table of the numbers of distinct answers of all hands for a range of targets.
+
+    The file is memory-mapped like a database, and is stored by columns, so
+    the count of a hand for a target is a single read and the counts of all
+    hands for a target are contiguous.
+    """
+
+    def __init__(self, path: str):
+        """Open a count table file."""
+        self.path = path
+        with open(path, 'rb') as f:
+            self.__map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            if len(self.__map) < COUNT_HEADER.size:
+                raise ValueError('Broken count table: %s' % path)
+            magic, version, rules, self.size, self.maximum, self.hands, first, targets = COUNT_HEADER.unpack_from(self.__map)
+            if magic != COUNT_MAGIC or version != FORMAT_VERSION:
+                raise ValueError('Unsupported count table: %s' % path)
+            if rules != RULES_VERSION:
+                raise ValueError('Count table made by other equivalence rules: %s' % path)
+            if len(self.__map) < COUNT_HEADER.size + targets * self.hands * COUNT.size:
+                raise ValueError('Broken count table: %s' % path)
+        except ValueError:
+            self.__map.close()
+            raise
+        self.targets = range(first, first + targets)
+        self.__indices = {}  # target -> hands by numbers of distinct answers
+
+    def close(self):
+        """Close the count table, so its file can be replaced or deleted."""
+        self.__map.close()
+
+    def __enter__(self):
+        """Use the count table in a with statement, which closes it."""
+        return self
+
+    def __exit__(self, *exc_info):
+        """Close the count table."""
+        self.close()
+
+    def __column(self, target) -> int:
+        """Return the position of the column of a target."""
+        if target not in self.targets:
+            raise KeyError(target)
+        return COUNT_HEADER.size + (target - self.targets.start) * self.hands * COUNT.size
+
+    def count(self, problem, target: int = 42) -> int:
+        """Return the number of distinct answers of a hand for a target."""
+        problem = tuple(problem)
+        if len(problem) != self.size:
+            raise KeyError(problem)
+        try:
+            rank = rank_hand(problem, self.maximum)
+        except ValueError:
+            raise KeyError(problem)
+        return COUNT.unpack_from(self.__map, self.__column(target) + rank * COUNT.size)[0]
+
+    def counts(self, target: int = 42) -> list:
+        """Return the numbers of distinct answers of all hands for a target, by rank."""
+        return list(struct.unpack_from('<%dH' % self.hands, self.__map, self.__column(target)))
+
+    def random_hand(self, min_count: int = 1, max_count: int = None, target: int = 42, rng=random) -> tuple:
+        """Return a random hand with min_count to max_count (unbounded if None) distinct answers for a target."""
+        if target not in self.__indices:
+            self.__indices[target] = _CountIndex(self.counts(target))
+        return unrank_hand(self.__indices[target].draw(min_count, max_count, rng), self.size, self.maximum)
+
+
+_count_tables = {}  # name -> packaged count table, or None if there is none
+
+
+def get_count_table(name: str = 'counts') -> CountTable:
+    """Return a packaged count table, or None if there is none (or it is out of date). Opened on first use."""
+    if name not in _count_tables:
+        with _lock:
+            if name not in _count_tables:
+                try:
+                    _count_tables[name] = CountTable(os.path.join(DATA_PATH, name + '.bin'))
+                except (OSError, ValueError):
+                    _count_tables[name] = None
+    return _count_tables[name]
+
+
+def release(path: str):
+    """Close and forget the packaged database or count table of a file, so the file can be replaced."""
+    with _lock:
+        for tables in (_databases, _count_tables):
+            for key, table in list(tables.items()):
+                if table is not None and os.path.abspath(table.path) == os.path.abspath(path):
+                    table.close()
+                    del tables[key]
@@ -1,9 +1,68 @@
 """Expression utilities for 42 points."""
 
 import ast
-import itertools
-from copy import deepcopy
 from fractions import Fraction
+from functools import partial
+from math import gcd
+
+# The version of the equivalence rules. Bump it whenever answers could be
+# classified differently, so results saved by older versions are not reused.
+# test_rules_version fails when the rule code changes, as a reminder.
+RULES_VERSION = 1
+
+# Values are kept as ints, or as normalized (numerator, denominator) tuples
+# with a denominator greater than 1. Fractions are only used for the results
+# given to users, as they are much slower to build and to operate on.
+
+
+def _rational(num: int, den: int):
+    """Return the normalized value of num/den."""
+    if den < 0:
+        num, den = -num, -den
+    divisor = gcd(num, den)
+    if divisor != 1:
+        num, den = num // divisor, den // divisor
+    return num if den == 1 else (num, den)
+
+
+def _pair(x) -> tuple:
+    """Return the (numerator, denominator) pair of a value."""
+    return (x, 1) if type(x) is int else x
+
+
+def _add(x, y):
+    """Return x+y."""
+    if type(x) is int and type(y) is int:
+        return x + y
+    (xn, xd), (yn, yd) = _pair(x), _pair(y)
+    return _rational(xn * yd + yn * xd, xd * yd)
+
+
+def _sub(x, y):
+    """Return x-y."""
+    if type(x) is int and type(y) is int:
+        return x - y
+    (xn, xd), (yn, yd) = _pair(x), _pair(y)
+    return _rational(xn * yd - yn * xd, xd * yd)
+
+
+def _mul(x, y):
+    """Return x*y."""
+    if type(x) is int and type(y) is int:
+        return x * y
+    (xn, xd), (yn, yd) = _pair(x), _pair(y)
+    return _rational(xn * yn, xd * yd)
+
+
+def _div(x, y):
+    """Return x/y."""
+    if y == 0:
+        raise ArithmeticError('x/0')
+    (xn, xd), (yn, yd) = _pair(x), _pair(y)
+    return _rational(xn * yd, xd * yn)
+
+
+_OPERATIONS = {'+': _add, '-': _sub, '*': _mul, '/': _div}
 
 
 class Node(object):
@@ -12,11 +71,16 @@ class Node(object):
     NODE_TYPE_NUMBER = 0
     NODE_TYPE_OPERATOR = 1
 
+    # A problem holds a huge number of nodes, so they have no __dict__.
+    __slots__ = ('type', 'left', 'right', 'ch', 'value', 'serial', 'uid')
+
     def __init__(self, _type=NODE_TYPE_NUMBER, ch=None, left=None, right=None):
         """Initialize the node."""
         self.type = _type
         self.left = left
         self.right = right
+        self.serial = None  # set by the pool this node belongs to
+        self.uid = None  # cache of unique_id(), reset when this node is modified
         if self.type == Node.NODE_TYPE_OPERATOR:
             self.value = Node.operation(ch, self.left.value, self.right.value)
             self.ch = ch
@@ -27,15 +91,20 @@ class Node(object):
     @staticmethod
     def operation(opt, x, y):
         """Basic arithmetic operation between two numbers."""
-        if opt == '/' and y == 0:
-            raise ArithmeticError('x/0')
-        operation_list = {
-            '+': lambda x, y: x + y,
-            '-': lambda x, y: x - y,
-            '*': lambda x, y: x * y,
-            '/': lambda x, y: Fraction(x, y)
-        }
-        return operation_list[opt](x, y)
+        return _OPERATIONS[opt](x, y)
+
+    @staticmethod
+    def compare(x, y) -> int:
+        """Compare two numbers, returning -1, 0 or 1 like the sign of x-y."""
+        if type(x) is int and type(y) is int:
+            return (x > y) - (x < y)
+        (xn, xd), (yn, yd) = _pair(x), _pair(y)
+        return (xn * yd > yn * xd) - (xn * yd < yn * xd)
+
+    @staticmethod
+    def fraction(x) -> Fraction:
+        """Convert a number to a fraction."""
+        return Fraction(*_pair(x))
 
     def node_list(self) -> list:
         """Get the list of a node."""
@@ -44,12 +113,32 @@ class Node(object):
         else:
             return [self]
 
-    def unique_id(self) -> str:
-        """Return the unique id (postfix) of this expression."""
+    def node_path_list(self, path: tuple = ()) -> list:
+        """Get the list of a node along with the paths (0: left, 1: right) to them."""
         if self.type == Node.NODE_TYPE_OPERATOR:
-            return self.ch + self.left.unique_id() + self.right.unique_id()
+            return self.left.node_path_list(path + (0,)) + [(self, path)] + self.right.node_path_list(path + (1,))
+        else:
+            return [(self, path)]
+
+    def replace(self, path: tuple, node, make=None):
+        """Return a copy of this expression with the sub-expression at path replaced by node."""
+        if not path:
+            return node
+        if make is None:
+            make = partial(Node, Node.NODE_TYPE_OPERATOR)
+        if path[0] == 0:
+            return make(self.ch, self.left.replace(path[1:], node, make), self.right)
         else:
-            return '[' + str(self.value) + ']'
+            return make(self.ch, self.left, self.right.replace(path[1:], node, make))
+
+    def unique_id(self) -> str:
+        """Return the unique id (postfix) of this expression."""
+        if self.uid is None:
+            if self.type == Node.NODE_TYPE_OPERATOR:
+                self.uid = self.ch + self.left.unique_id() + self.right.unique_id()
+            else:
+                self.uid = '[' + str(self.value) + ']'
+        return self.uid
 
     def __repr__(self) -> str:
         """Return the string form of this expression."""
@@ -65,11 +154,15 @@ class Node(object):
     def evaluate(self, values: dict = None) -> Fraction:
         """Evaluate the value of this expression using substitution."""
         if values is None:
-            return self.value
+            return Node.fraction(self.value)
+        return Node.fraction(self.__evaluate(values))
+
+    def __evaluate(self, values: dict):
+        """Evaluate this expression using substitution, without conversion."""
         if self.type == Node.NODE_TYPE_OPERATOR:
-            return Node.operation(self.ch, self.left.evaluate(values), self.right.evaluate(values))
+            return Node.operation(self.ch, self.left.__evaluate(values), self.right.__evaluate(values))
         else:
-            return Fraction(values[int(self.value)])
+            return values[self.value]
 
     def extract(self) -> list:
         """Extract numbers from the node."""
@@ -82,21 +175,30 @@ class Node(object):
         """
         Make all intermediate results of this expression not be negative.
 
-        The result of whole expression will become its absolute value.
+        The result of whole expression will become its absolute value. The
+        expression is modified in place, so it must not contain a node of a
+        pool, which is shared.
         """
+        if any(node.serial is not None for node in self.node_list()):
+            raise ValueError('Expressions of a pool must not be modified.')
+        return self.__reduce_negative_number()
+
+    def __reduce_negative_number(self):
+        """Make all intermediate results of this expression not be negative, and return its original value."""
 
-        def _neg(v1: Fraction, v2: Fraction) -> Fraction:
-            return v1 * (1 - 2 * (v2 < 0))
+        def _neg(v1, v2):
+            return Node.operation('*', v1, -1) if Node.compare(v2, 0) < 0 else v1
 
         if self.type != Node.NODE_TYPE_OPERATOR:
             return self.value
 
-        left_value = self.left.reduce_negative_number()
-        right_value = self.right.reduce_negative_number()
+        self.uid = None
+        left_value = self.left.__reduce_negative_number()
+        right_value = self.right.__reduce_negative_number()
         return_value = Node.operation(self.ch, left_value, right_value)
 
         if self.ch not in '+-':
-            self.value = abs(return_value)
+            self.value = _neg(return_value, return_value)
             return return_value
 
         char_map = {'+': 1, '-': -1, 1: '+', -1: '-'}
@@ -117,89 +219,93 @@ class Node(object):
             self.ch = '-'
             self.left, self.right = self.right, self.left
 
-        self.value = abs(return_value)
+        self.value = _neg(return_value, return_value)
         return return_value
 
-    def all_equivalent_expression(self):
+    def all_equivalent_expression(self, pool=None):
         """
         Return the list of all equivalent expression of an expression.
 
         Rule 1 (equivalence by identical equation) is not considered.
         If expression A induces expression B, B may not induce A.
+        If a pool is given, this expression must belong to it, and so will
+        all the equivalent expressions.
+        """
+        make = partial(Node, Node.NODE_TYPE_OPERATOR) if pool is None else pool.operator
+        return self.__equivalent_expression(make)
+
+    def all_equivalent_serial(self, pool):
+        """
+        Return the serial numbers of all equivalent expressions in a pool.
+
+        Same as all_equivalent_expression, but only the serial numbers are
+        generated, and no node is built for them.
         """
+        return self.__equivalent_expression(pool.serial)
+
+    def __equivalent_expression(self, make):
+        """Apply the equivalence rules, building expressions with make(operator, left, right)."""
         if self.type != Node.NODE_TYPE_OPERATOR:
             return
 
-        left_equal_list = self.left.all_equivalent_expression()
-        right_equal_list = self.right.all_equivalent_expression()
+        left_equal_list = self.left.__equivalent_expression(make)
+        right_equal_list = self.right.__equivalent_expression(make)
         left_value, right_value = self.left.value, self.right.value
         for new_left in left_equal_list:
-            yield Node(Node.NODE_TYPE_OPERATOR, self.ch, new_left, self.right)
+            yield make(self.ch, new_left, self.right)
         for new_right in right_equal_list:
-            yield Node(Node.NODE_TYPE_OPERATOR, self.ch, self.left, new_right)
+            yield make(self.ch, self.left, new_right)
 
         # Rule 2: x-0 --> x+0
         #         x/1 --> x*1
         #         0/x --> 0*x
         if self.ch == '-' and right_value == 0:
-            yield Node(Node.NODE_TYPE_OPERATOR, '+', self.left, self.right)
+            yield make('+', self.left, self.right)
         if self.ch == '/' and right_value == 1:
-            yield Node(Node.NODE_TYPE_OPERATOR, '*', self.left, self.right)
+            yield make('*', self.left, self.right)
         if self.ch == '/' and left_value == 0:
-            yield Node(Node.NODE_TYPE_OPERATOR, '*', self.left, self.right)
+            yield make('*', self.left, self.right)
 
         # Rule 3: (x?y)+0 --> (x+0)?y, x?(y+0)
         #         (x?y)*1 --> (x*1)?y, x?(y*1)
         if ((self.ch == '+' and right_value == 0) or
             (self.ch == '*' and right_value == 1)) \
                 and self.left.type == Node.NODE_TYPE_OPERATOR:
-            yield Node(Node.NODE_TYPE_OPERATOR, self.left.ch, Node(Node.NODE_TYPE_OPERATOR, self.ch, self.left.left,
-                                                                   self.right), self.left.right)
-            yield Node(Node.NODE_TYPE_OPERATOR, self.left.ch, self.left.left,
-                       Node(Node.NODE_TYPE_OPERATOR, self.ch, self.left.right, self.right))
+            yield make(self.left.ch, make(self.ch, self.left.left, self.right), self.left.right)
+            yield make(self.left.ch, self.left.left, make(self.ch, self.left.right, self.right))
 
         # Rule 4: (y+z)/x --> (x-y)/z, (x-z)/y when x=y+z
         if self.ch == '/' and self.left.ch == '+' and \
                 left_value == right_value and \
                 self.left.left.value != 0 and self.left.right.value != 0:
-            yield Node(Node.NODE_TYPE_OPERATOR, '/', Node(Node.NODE_TYPE_OPERATOR, '-', self.right, self.left.left),
-                       self.left.right)
-            yield Node(Node.NODE_TYPE_OPERATOR, '/', Node(Node.NODE_TYPE_OPERATOR, '-', self.right, self.left.right),
-                       self.left.left)
+            yield make('/', make('-', self.right, self.left.left), self.left.right)
+            yield make('/', make('-', self.right, self.left.right), self.left.left)
 
         # Rule 5: x*(y/y) --> x+(y-y)
         if self.ch == '*' and self.right.ch == '/' and right_value == 1:
-            yield Node(Node.NODE_TYPE_OPERATOR, '+', self.left,
-                       Node(Node.NODE_TYPE_OPERATOR, '-', self.right.left, self.right.right))
+            yield make('+', self.left, make('-', self.right.left, self.right.right))
 
         # Rule 6: x_1/x_2 --> x_2/x_1
         if self.ch == '/' and left_value == right_value:
-            yield Node(Node.NODE_TYPE_OPERATOR, '/', self.right, self.left)
+            yield make('/', self.right, self.left)
 
         # Rule 7: Changing two sub-expressions which have the same result
         #         doesn't change the equivalence class of this expression.
-        left_node_list = self.left.node_list()
-        right_node_list = self.right.node_list()
-        for nl, nr in itertools.product(left_node_list, right_node_list):
-            if nl.value == nr.value:
-                nl.type, nl.left, nl.right, nl.ch, nl.value, \
-                    nr.type, nr.left, nr.right, nr.ch, nr.value = \
-                    nr.type, nr.left, nr.right, nr.ch, nr.value, \
-                    nl.type, nl.left, nl.right, nl.ch, nl.value
-
-                yield deepcopy(self)
-
-                nl.type, nl.left, nl.right, nl.ch, nl.value, \
-                    nr.type, nr.left, nr.right, nr.ch, nr.value = \
-                    nr.type, nr.left, nr.right, nr.ch, nr.value, \
-                    nl.type, nl.left, nl.right, nl.ch, nl.value
+        #         Only the nodes on the paths to the changed sub-expressions
+        #         are rebuilt, the others are shared with this expression.
+        right_node_table = {}
+        for nr, path_r in self.right.node_path_list():
+            right_node_table.setdefault(nr.value, []).append((nr, path_r))
+        for nl, path_l in self.left.node_path_list():
+            for nr, path_r in right_node_table.get(nl.value, []):
+                yield make(self.ch, self.left.replace(path_l, nr, make), self.right.replace(path_r, nl, make))
 
         # Rule 8: 2*2 --> 2+2
         #         4/2 --> 4-2
         if self.ch == '*' and left_value == 2 and right_value == 2:
-            yield Node(Node.NODE_TYPE_OPERATOR, '+', self.left, self.right)
+            yield make('+', self.left, self.right)
         if self.ch == '/' and left_value == 4 and right_value == 2:
-            yield Node(Node.NODE_TYPE_OPERATOR, '-', self.left, self.right)
+            yield make('-', self.left, self.right)
 
     def unique_id_for_rule_1(self, values_list: list) -> tuple:
         """
@@ -207,10 +313,115 @@ class Node(object):
 
         Two expressions is equivalent by rule 1 iff they have the same id.
         """
-        results = [self.evaluate(values) for values in values_list]
+        results = [self.__evaluate(values) for values in values_list]
         return tuple(results)
 
 
+class NodePool(object):
+    """
+    A pool of hash-consed expressions.
+
+    Every distinct expression is built only once in a pool and then shared by
+    all its parents, so two expressions of the same pool are equal iff they
+    are the same object. Nodes of a pool are shared and must not be modified,
+    so reduce_negative_number refuses them.
+    """
+
+    OPERATORS = '+-*/'
+
+    def __init__(self):
+        """Initialize the pool."""
+        self.__numbers = {}  # number -> node
+        self.__table = {}  # packed (left serial, right serial, operator) -> node
+        self.__serials = {}  # packed operation -> serial, for operations without a node
+        self.__size = 0
+
+    def __len__(self) -> int:
+        """Return the number of serial numbers given by the pool."""
+        return self.__size
+
+    def __add(self, node: Node) -> Node:
+        """Give a serial number to a new node."""
+        node.serial = self.__size
+        self.__size += 1
+        return node
+
+    def number(self, n) -> Node:
+        """Return the node of a number."""
+        node = self.__numbers.get(n)
+        if node is None:
+            node = self.__numbers[n] = self.__add(Node(Node.NODE_TYPE_NUMBER, n))
+        return node
+
+    @staticmethod
+    def __key(ch, left, right) -> int:
+        """Pack an operation on two nodes (or serial numbers) into an integer key."""
+        left = left if type(left) is int else left.serial
+        right = right if type(right) is int else right.serial
+        return (left << 34) | (right << 2) | NodePool.OPERATORS.index(ch)
+
+    def operator(self, ch, left: Node, right: Node) -> Node:
+        """Return the node of an operation. Both operands must belong to the pool."""
+        key = NodePool.__key(ch, left, right)
+        node = self.__table.get(key)
+        if node is None:
+            node = Node(Node.NODE_TYPE_OPERATOR, ch, left, right)
+            if key in self.__serials:
+                node.serial = self.__serials.pop(key)
+            else:
+                self.__add(node)
+            self.__table[key] = node
+        return node
+
+    def serial(self, ch, left, right) -> int:
+        """
+        Return the serial number of an operation, without building its node.
+
+        Operands can be nodes of the pool or serial numbers.
+        """
+        key = NodePool.__key(ch, left, right)
+        node = self.__table.get(key)
+        if node is not None:
+            return node.serial
+        if key not in self.__serials:
+            self.__serials[key] = self.__size
+            self.__size += 1
+        return self.__serials[key]
+
+    def intern(self, node: Node) -> Node:
+        """Return the node of the pool which is equal to an expression."""
+        if node.type == Node.NODE_TYPE_OPERATOR:
+            return self.operator(node.ch, self.intern(node.left), self.intern(node.right))
+        else:
+            return self.number(node.value)
+
+    def node_count(self) -> int:
+        """Return the number of nodes built in the pool."""
+        return len(self.__numbers) + len(self.__table)
+
+    def retain(self, roots: list):
+        """Drop all nodes which are not in the expressions of roots, and all serial numbers without a node."""
+        kept, stack = set(), list(roots)
+        while stack:
+            node = stack.pop()
+            if node.serial not in kept:
+                kept.add(node.serial)
+                if node.type == Node.NODE_TYPE_OPERATOR:
+                    stack.extend((node.left, node.right))
+        self.__numbers = {n: node for n, node in self.__numbers.items() if node.serial in kept}
+        self.__table = {key: node for key, node in self.__table.items() if node.serial in kept}
+        self.__serials = {}
+
+    def find(self, node: Node) -> Node:
+        """Return the node of the pool which is equal to an expression, or None if there is none."""
+        if node.type != Node.NODE_TYPE_OPERATOR:
+            return self.__numbers.get(node.value)
+        left, right = self.find(node.left), self.find(node.right)
+        if left is None or right is None:
+            return None
+        return self.__table.get(NodePool.__key(node.ch, left, right))
+
+
 def _build_node(node) -> Node:
     """Convert an AST node to an expression node."""
     node_ref = {type(ast.Add()): '+', type(ast.Sub()): '-', type(ast.Mult()): '*', type(ast.Div()): '/'}
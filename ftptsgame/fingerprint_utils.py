@@ -0,0 +1,138 @@
+"""Rule 1 fingerprint utilities for 42 points."""
+
+from functools import lru_cache
+from .expr_utils import Node
+
+# Expressions are evaluated modulo a prime, so fingerprints have a fixed width.
+# Products of two residues of this prime fit in int64.
+PRIME = 2147483647
+
+
+@lru_cache(maxsize=None)
+def get_numpy():
+    """Return numpy, or None if it is not installed. It is imported on first use, as it is slow to import."""
+    try:
+        import numpy
+    except ImportError:  # numpy is optional, a pure Python engine is used without it
+        return None
+    return numpy
+
+
+def random_points(numbers: list, count: int, rng) -> list:
+    """
+    Return some random points to evaluate expressions at.
+
+    A point maps every number to a random residue, except 0 and 1, which are
+    kept as they are.
+    """
+    points = []
+    dif = sorted(set(numbers))
+    for _ in range(count):
+        residues = rng.sample(range(2, PRIME), len(dif))
+        point = {dif[i]: residues[i] for i in range(len(dif))}
+        point[0], point[1] = 0, 1
+        points.append(point)
+    return points
+
+
+def _evaluate(node: Node, points: list, memo: dict) -> tuple:
+    """Evaluate an expression at all points modulo PRIME, sharing results of common nodes."""
+    key = id(node)
+    if key in memo:
+        return memo[key]
+
+    if node.type == Node.NODE_TYPE_OPERATOR:
+        left = _evaluate(node.left, points, memo)
+        right = _evaluate(node.right, points, memo)
+        if node.ch == '+':
+            result = tuple((x + y) % PRIME for x, y in zip(left, right))
+        elif node.ch == '-':
+            result = tuple((x - y) % PRIME for x, y in zip(left, right))
+        elif node.ch == '*':
+            result = tuple(x * y % PRIME for x, y in zip(left, right))
+        else:
+            result = tuple(x * pow(y, PRIME - 2, PRIME) % PRIME for x, y in zip(left, right))
+    else:
+        result = tuple(point[node.value] for point in points)
+
+    memo[key] = result
+    return result
+
+
+def _inverse(array):
+    """Return the modular inverses of an array by Fermat's little theorem."""
+    result = get_numpy().ones_like(array)
+    base = array.copy()
+    exponent = PRIME - 2
+    while exponent:
+        if exponent & 1:
+            result = result * base % PRIME
+        base = base * base % PRIME
+        exponent >>= 1
+    return result
+
+
+def _evaluate_numpy(exprs: list, points: list):
+    """Evaluate expressions at all points modulo PRIME, level by level in batches."""
+    numpy = get_numpy()
+    nodes, levels, lefts, rights = [], [], [], []
+    index = {}  # id of node -> row
+
+    def _visit(node: Node) -> int:
+        key = id(node)
+        if key not in index:
+            if node.type == Node.NODE_TYPE_OPERATOR:
+                left, right = _visit(node.left), _visit(node.right)
+                level = max(levels[left], levels[right]) + 1
+            else:
+                left, right, level = -1, -1, 0
+            index[key] = len(nodes)
+            nodes.append(node)
+            levels.append(level)
+            lefts.append(left)
+            rights.append(right)
+        return index[key]
+
+    rows = [_visit(expr) for expr in exprs]
+    levels, lefts, rights = numpy.array(levels), numpy.array(lefts), numpy.array(rights)
+    chars = numpy.array([node.ch for node in nodes])
+
+    table = numpy.zeros((len(nodes), len(points)), dtype=numpy.int64)
+    for row in numpy.flatnonzero(levels == 0):
+        table[row] = [point[nodes[row].value] for point in points]
+    for level in range(1, levels.max() + 1):
+        for ch in '+-*/':
+            selected = numpy.flatnonzero((levels == level) & (chars == ch))
+            if len(selected) == 0:
+                continue
+            x, y = table[lefts[selected]], table[rights[selected]]
+            if ch == '+':
+                table[selected] = (x + y) % PRIME
+            elif ch == '-':
+                table[selected] = (x - y) % PRIME
+            elif ch == '*':
+                table[selected] = x * y % PRIME
+            else:
+                table[selected] = x * _inverse(y) % PRIME
+
+    return table[rows]
+
+
+def group_by_fingerprint(exprs: list, points: list, use_numpy: bool = True) -> list:
+    """
+    Group expressions which are equivalent by rule 1.
+
+    Every expression is evaluated at the points, and for each expression the
+    index of the first expression with the same results is returned. NumPy is
+    used if it is available, unless use_numpy is unset.
+    """
+    numpy = get_numpy() if use_numpy and exprs else None
+    if numpy is not None:
+        table = _evaluate_numpy(exprs, points)
+        _, first, inverse = numpy.unique(table, axis=0, return_index=True, return_inverse=True)
+        return first[inverse.reshape(-1)].tolist()
+
+    memo, first, groups = {}, {}, []
+    for i, expr in enumerate(exprs):
+        groups.append(first.setdefault(_evaluate(expr, points, memo), i))
+    return groups
@@ -2,20 +2,37 @@
 
 import random
 import itertools
-from .expr_utils import Node
+from functools import lru_cache
+from .expr_utils import Node, NodePool
+from .fingerprint_utils import group_by_fingerprint, random_points
+
+
+DEFAULT_SEED = 42
 
 
 class Problem(object):
     """A 42-points problem."""
 
-    def __init__(self, problem):
-        """Initialize the problem."""
+    def __init__(self, problem, seed=DEFAULT_SEED):
+        """
+        Initialize the problem.
+
+        The seed (an int, or a random.Random instance to draw from) decides the
+        random values used to classify answers, so classification is
+        reproducible and never touches the global random generator.
+        """
         self.problem = sorted(problem)
+        self.seed = seed
         self.answer_table = []
         self.distinct_answer_table = []
-        self.equivalence_dict = {}
+        self.__class_dict = {}  # answer serial -> representative serial
+        self.__representatives = {}  # representative serial -> answer
+        self.__equivalence_dict = None
         self.__parent = {}
         self.__rank = {}
+        self.__pool = NodePool()  # all expressions of this problem
+        self.__expr_index = {}  # sub-problem -> value -> expressions
+        self.__value_cache = {}  # sub-problem -> values
 
     def __root(self, uid):
         """Method for union set."""
@@ -43,89 +60,428 @@ class Problem(object):
         Returns:
         1. A list including all answers (as expression trees);
         2. A dictionary, for any answer expression save the representative
-           expression of its class (as the unique id of expressions).
+           expression of its class (as serial numbers in the pool).
         """
-        values_list = []
         n = len(self.problem)
-        dif = list(set(self.problem))  # different numbers of the problem
-        for _ in range(10):
-            numbers = random.sample(range(500000, 1000000), len(dif))
-            values = {dif[i]: numbers[i] for i in range(len(dif))}
-            values[0], values[1] = 0, 1
-            values_list.append(values)
-        answers = _get_all_expr(self.problem, n, target)
-
-        uid_table, uid_r1_table = {}, {}
-        for expr in answers:
-            uid = expr.unique_id()
-            uid_table[uid] = expr
-            uid_r1 = expr.unique_id_for_rule_1(values_list)
-            if uid_r1 in uid_r1_table:
-                self.__parent[uid] = uid_r1_table[uid_r1]
+        rng = self.seed if isinstance(self.seed, random.Random) else random.Random(self.seed)
+        points = random_points(self.problem, 10, rng)
+        answers = _get_all_expr(self.problem, n, target, self.__expr_index, self.__pool)
+
+        # Answers with the same fingerprint are equivalent by rule 1, and the
+        # first one of them becomes their root.
+        groups = group_by_fingerprint(answers, points)
+        for expr, first in zip(answers, groups):
+            uid = expr.serial
+            if answers[first] is not expr:
+                self.__parent[uid] = answers[first].serial
                 self.__rank[uid] = 1
             else:
                 self.__parent[uid] = uid
-                uid_r1_table[uid_r1] = uid
                 self.__rank[uid] = 2
 
         for expr in answers:
-            uid1 = expr.unique_id()
-            for expr2 in expr.all_equivalent_expression():
-                uid2 = expr2.unique_id()
+            uid1 = expr.serial
+            for uid2 in expr.all_equivalent_serial(self.__pool):
                 self.__union(uid1, uid2)
 
+        # The representative of a class is its first generated answer, so it
+        # doesn't depend on the order of the unions.
+        representatives = {}
+        for expr in answers:
+            root = self.__root(expr.serial)
+            representatives[root] = min(representatives.get(root, expr.serial), expr.serial)
+
         return_dict = {}
         for expr in answers:
-            uid = expr.unique_id()
-            return_dict[uid] = self.__root(uid)
+            uid = expr.serial
+            return_dict[uid] = representatives[self.__root(uid)]
 
         return answers, return_dict
 
-    def generate_answers(self, target: int = 42):
-        """Generate all answers divided into equivalence classes."""
-        self.answer_table, self.equivalence_dict = self.__classify(target)
+    def has_solution(self, target: int = 42) -> bool:
+        """Check if target can be reached, stopping at the first solution found."""
+        if len(self.problem) == 1:
+            return self.problem[0] == target
+
+        for left_prob, right_prob in _split_problem(self.problem):
+            left_values = _get_value_set(left_prob, self.__value_cache)
+            right_values = _get_value_set(right_prob, self.__value_cache)
+            for x in left_values:
+                for opt, value, reverse in _required_operands(x, target, mirror=True):
+                    if value is None:
+                        if any((opt, reverse) in _operators(x, y, mirror=True) for y in right_values):
+                            return True
+                    elif value in right_values and (opt, reverse) in _operators(x, value, mirror=True):
+                        return True
+        return False
+
+    def generate_answers(self, target: int = 42, keep_index: bool = False):
+        """
+        Generate all answers divided into equivalence classes.
+
+        The scratch state of the generation is freed afterwards, and so are
+        all expressions which are not in an answer, unless keep_index is set to
+        reuse the sub-expressions for other targets.
+        """
+        self.__set_answers(*self.__classify(target))
+        self.__parent, self.__rank = {}, {}
+        if not keep_index:
+            self.__expr_index, self.__value_cache = {}, {}
+            self.__pool.retain(self.answer_table)
+
+    def __set_answers(self, answers: list, class_dict: dict):
+        """Set all answers and the representatives of their classes."""
+        self.answer_table, self.__class_dict = answers, class_dict
+        self.__equivalence_dict = None
         self.distinct_answer_table = []
         for expr in self.answer_table:
-            uid = expr.unique_id()
-            if self.equivalence_dict[uid] == uid:
+            uid = expr.serial
+            if self.__class_dict[uid] == uid:
                 self.distinct_answer_table.append(expr)
+        self.__representatives = {expr.serial: expr for expr in self.distinct_answer_table}
 
+    def export_answers(self) -> tuple:
+        """
+        Return all answers in a compact form.
 
-def _combine_expr(left_set: list, right_set: list):
-    """Combine two node sets to a single node set with different operators."""
-    for left_expr, right_expr in itertools.product(left_set, right_set):
-        yield Node(Node.NODE_TYPE_OPERATOR, '+', left_expr, right_expr)
+        Returns:
+        1. A table of all nodes of the answers, where children come before their
+           parents. A number is kept as it is, and an operation as a list of the
+           operator and the rows of its children;
+        2. The row of every answer in the table;
+        3. The index of the representative of every answer.
+        """
+        table, rows = [], {}  # serial -> row
 
-        yield Node(Node.NODE_TYPE_OPERATOR, '*', left_expr, right_expr)
+        def _row(node: Node) -> int:
+            if node.serial not in rows:
+                if node.type == Node.NODE_TYPE_OPERATOR:
+                    item = [node.ch, _row(node.left), _row(node.right)]
+                else:
+                    item = node.value
+                rows[node.serial] = len(table)
+                table.append(item)
+            return rows[node.serial]
 
-        if left_expr.value >= right_expr.value:
-            yield Node(Node.NODE_TYPE_OPERATOR, '-', left_expr, right_expr)
+        index = {expr.serial: i for i, expr in enumerate(self.answer_table)}
+        answers = [_row(expr) for expr in self.answer_table]
+        return table, answers, [index[self.__class_dict[expr.serial]] for expr in self.answer_table]
 
-        if right_expr.value != 0:
-            yield Node(Node.NODE_TYPE_OPERATOR, '/', left_expr, right_expr)
+    def import_answers(self, table: list, answers: list, representatives: list):
+        """Restore answers given by export_answers, instead of generating them."""
+        nodes = []
+        for item in table:
+            if type(item) is int:
+                nodes.append(self.__pool.number(item))
+            else:
+                nodes.append(self.__pool.operator(item[0], nodes[item[1]], nodes[item[2]]))
+        answers = [nodes[row] for row in answers]
+        self.__set_answers(answers, {expr.serial: answers[i].serial for expr, i in zip(answers, representatives)})
 
+    @property
+    def equivalence_dict(self) -> dict:
+        """Map the unique id of every answer to the unique id of its representative."""
+        if self.__equivalence_dict is None:
+            self.__equivalence_dict = {
+                expr.unique_id(): self.__representatives[self.__class_dict[expr.serial]].unique_id()
+                for expr in self.answer_table
+            }
+        return self.__equivalence_dict
+
+    def estimated_size(self) -> int:
+        """Return a rough estimate of the memory used by the problem in bytes, from its nodes and answers."""
+        size = 192 * self.__pool.node_count() + 64 * len(self.answer_table)
+        if self.__equivalence_dict is not None:
+            size += 144 * len(self.answer_table)
+        return size
+
+    def get_equivalence_class(self, node: Node) -> int:
+        """Return the id of the equivalence class of an answer (the serial number of its representative)."""
+        expr = self.__pool.find(node)
+        if expr is None or expr.serial not in self.__class_dict:
+            raise KeyError(node.unique_id())
+        return self.__class_dict[expr.serial]
+
+    def canonicalize(self, node: Node) -> Node:
+        """Return the representative of the equivalence class of an answer."""
+        return self.__representatives[self.get_equivalence_class(node)]
 
-def _get_all_expr(problem: list, length: int, target: int) -> list:
-    """Return the list of all possible expressions of a problem."""
-    n = len(problem)
-    if n == 1:
-        return [Node(Node.NODE_TYPE_NUMBER, problem[0])]
-    return_list = []
-    unique_id_set = set()
 
-    for mask in itertools.filterfalse(lambda x: sum(x) == 0 or sum(x) == n, itertools.product([0, 1], repeat=n)):
+def _split_problem(problem: list):
+    """Yield every unordered partition of a problem into two non-empty sub-problems once."""
+    numbers = sorted(set(problem))
+    counts = [problem.count(number) for number in numbers]
+    for choice in itertools.product(*[range(count + 1) for count in counts]):
         left_prob, right_prob = [], []
-        for i in range(n):
-            left_prob.append(problem[i]) if mask[i] == 0 \
-                else right_prob.append(problem[i])
+        for number, count, k in zip(numbers, counts, choice):
+            left_prob.extend([number] * k)
+            right_prob.extend([number] * (count - k))
+        if left_prob and right_prob and left_prob <= right_prob:
+            yield left_prob, right_prob
+
+
+def _operators(x, y, mirror: bool = False) -> tuple:
+    """
+    Return the operators which combine a left value x with a right value y.
+
+    Items are (operator, reverse), where reverse means the operands are
+    combined in reversed order, which is only done if mirror is set. These are
+    the only rules of which operations are generated, and every function
+    enumerating, counting or solving operations follows them.
+    """
+    return _operator_rules(Node.compare(x, y), x != 0, y != 0, mirror)
+
+
+@lru_cache(maxsize=None)
+def _operator_rules(order: int, left_nonzero: bool, right_nonzero: bool, mirror: bool) -> tuple:
+    """Return the operators of _operators, from the order of the operands and whether they are zero."""
+    operators = [('+', False), ('*', False)]
+    if order >= 0:
+        operators.append(('-', False))
+    if right_nonzero:
+        operators.append(('/', False))
+    if mirror:
+        operators += [('+', True), ('*', True)]
+        if order <= 0:
+            operators.append(('-', True))
+        if left_nonzero:
+            operators.append(('/', True))
+    return tuple(operators)
+
+
+def _combine_expr(left_index: dict, right_index: dict, pool: NodePool, mirror: bool = False):
+    """
+    Combine two value-indexed node sets to a single node set with different operators.
+
+    If mirror is set, the operands are also combined in reversed order.
+    """
+    for left_value, right_value in itertools.product(left_index, right_index):
+        operators = _operators(left_value, right_value, mirror)
+        for left_expr, right_expr in itertools.product(left_index[left_value], right_index[right_value]):
+            for opt, reverse in operators:
+                if reverse:
+                    yield pool.operator(opt, right_expr, left_expr)
+                else:
+                    yield pool.operator(opt, left_expr, right_expr)
+
+
+def _required_operands(x, target: int, mirror: bool = False) -> list:
+    """
+    Return the right operands which combine with a left operand x to target.
+
+    Items are (operator, value, reverse), where value is None if any right
+    operand works, and reverse means the operands are combined in reversed
+    order. The operands are only solved for, so a right operand y must also
+    be allowed by _operators(x, y, mirror).
+    """
+    required = [('+', Node.operation('-', target, x), False)]
+    if x != 0:
+        required.append(('*', Node.operation('/', target, x), False))
+    elif target == 0:
+        required.append(('*', None, False))
+    required.append(('-', Node.operation('-', x, target), False))
+    if target != 0:
+        required.append(('/', Node.operation('/', x, target), False))
+    elif x == 0:
+        required.append(('/', None, False))
+
+    if mirror:
+        required += [(opt, value, True) for opt, value, _ in required if opt in '+*']
+        required.append(('-', Node.operation('+', x, target), True))
+        if x != 0:
+            required.append(('/', Node.operation('*', target, x), True))
+
+    return required
 
-        left_set = _get_all_expr(left_prob, length, target)
-        right_set = _get_all_expr(right_prob, length, target)
 
-        for expr in itertools.filterfalse(lambda x: x.value != target and n == length, _combine_expr(left_set, right_set)):
-            expr_id = expr.unique_id()
-            if expr_id not in unique_id_set:
-                return_list.append(expr)
-                unique_id_set.add(expr_id)
+def _combine_expr_to_target(left_index: dict, right_index: dict, target: int, pool: NodePool, mirror: bool = False):
+    """
+    Combine two value-indexed node sets to the expressions which evaluate to target.
+
+    Same as filtering the results of _combine_expr, but the value required of
+    the right operand is solved for each left value and looked up in the index.
+    """
+    for x, left_set in left_index.items():
+        for opt, value, reverse in _required_operands(x, target, mirror):
+            if value is None:  # any right operand works
+                right_set = [
+                    expr for y in right_index if (opt, reverse) in _operators(x, y, mirror) for expr in right_index[y]
+                ]
+            elif value in right_index and (opt, reverse) in _operators(x, value, mirror):
+                right_set = right_index[value]
+            else:
+                continue
+            for left_expr, right_expr in itertools.product(left_set, right_set):
+                if reverse:
+                    yield pool.operator(opt, right_expr, left_expr)
+                else:
+                    yield pool.operator(opt, left_expr, right_expr)
+
+
+def _get_expr_index(problem: list, cache: dict, pool: NodePool) -> dict:
+    """
+    Return all possible expressions of a problem, indexed by their values.
+
+    The index of every sub-problem is memoized in cache (keyed by the sorted
+    sub-problem), so each of them is expanded only once.
+    """
+    key = tuple(sorted(problem))
+    if key in cache:
+        return cache[key]
+
+    index = {}
+    if len(key) == 1:
+        index[key[0]] = [pool.number(key[0])]
+
+    # Every partition is visited once with both operand orders, so no
+    # expression can be generated twice.
+    for left_prob, right_prob in _split_problem(key):
+        left_index = _get_expr_index(left_prob, cache, pool)
+        right_index = _get_expr_index(right_prob, cache, pool)
+        for expr in _combine_expr(left_index, right_index, pool, left_prob != right_prob):
+            index.setdefault(expr.value, []).append(expr)
+
+    cache[key] = index
+    return index
+
+
+def _get_value_set(problem: list, cache: dict) -> set:
+    """
+    Return all possible values of a problem, without building expressions.
+
+    The value set of every sub-problem is memoized in cache.
+    """
+    key = tuple(sorted(problem))
+    if key in cache:
+        return cache[key]
+
+    values = set()
+    if len(key) == 1:
+        values.add(key[0])
+
+    for left_prob, right_prob in _split_problem(key):
+        left_values = _get_value_set(left_prob, cache)
+        right_values = _get_value_set(right_prob, cache)
+        mirror = left_prob != right_prob  # otherwise both orders are covered by the product
+        for x, y in itertools.product(left_values, right_values):
+            for opt, reverse in _operators(x, y, mirror):
+                if not reverse:
+                    values.add(Node.operation(opt, x, y))
+                elif opt in '-/':  # others are commutative
+                    values.add(Node.operation(opt, y, x))
+
+    cache[key] = values
+    return values
+
+
+def _get_value_count(problem: list, cache: dict) -> dict:
+    """
+    Return the number of expressions evaluating to each value of a problem.
+
+    Expressions are counted as _get_expr_index generates them, but none of
+    them is built. The histogram of every sub-problem is memoized in cache.
+    """
+    key = tuple(sorted(problem))
+    if key in cache:
+        return cache[key]
+
+    counts = {}
+    if len(key) == 1:
+        counts[key[0]] = 1
+
+    for left_prob, right_prob in _split_problem(key):
+        left_counts = _get_value_count(left_prob, cache)
+        right_counts = _get_value_count(right_prob, cache)
+        mirror = left_prob != right_prob
+        for x, y in itertools.product(left_counts, right_counts):
+            count = left_counts[x] * right_counts[y]
+            for opt, reverse in _operators(x, y, mirror):
+                value = Node.operation(opt, y, x) if reverse else Node.operation(opt, x, y)
+                counts[value] = counts.get(value, 0) + count
+
+    cache[key] = counts
+    return counts
+
+
+def reachable_values(problem: list, histogram: bool = False, cache: dict = None):
+    """
+    Return all values which can be reached by a problem.
+
+    No expression is built. If histogram is set, a dictionary mapping each
+    value to the number of expressions evaluating to it is returned instead.
+    A cache can be shared between calls to reuse the results of common
+    sub-problems.
+    """
+    if cache is None:
+        cache = {}
+    if histogram:
+        counts = _get_value_count(problem, cache.setdefault('histogram', {}))
+        return {Node.fraction(value): count for value, count in counts.items()}
+    return {Node.fraction(value) for value in _get_value_set(problem, cache.setdefault('values', {}))}
+
+
+def _get_all_expr(problem: list, length: int, target: int, cache: dict = None, pool: NodePool = None) -> list:
+    """
+    Return the list of all possible expressions of a problem.
+
+    Only expressions evaluating to target are returned if the problem has the
+    full length. Indices of sub-problems are memoized in cache, and all
+    expressions are built in pool.
+    """
+    if cache is None:
+        cache = {}
+    if pool is None:
+        pool = NodePool()
+    n = len(problem)
+    if n < length or n == 1:
+        return [expr for expr_set in _get_expr_index(problem, cache, pool).values() for expr in expr_set]
+
+    return_list = []
+    for left_prob, right_prob in _split_problem(tuple(sorted(problem))):
+        left_index = _get_expr_index(left_prob, cache, pool)
+        right_index = _get_expr_index(right_prob, cache, pool)
+        return_list.extend(_combine_expr_to_target(left_index, right_index, target, pool, left_prob != right_prob))
 
     return return_list
+
+
+@lru_cache(maxsize=None)
+def _binomial(n: int, k: int) -> int:
+    """Return the binomial coefficient C(n, k)."""
+    if k < 0 or k > n:
+        return 0
+    result = 1
+    for i in range(k):
+        result = result * (n - i) // (i + 1)
+    return result
+
+
+def rank_hand(problem, maximum: int = 13) -> int:
+    """
+    Return the rank of a hand among all hands of its size.
+
+    Hands are multisets of numbers between 0 and maximum, ranked in the order
+    of itertools.combinations_with_replacement. A sorted hand a maps to the
+    combination a[i] + i, which is ranked by the combinatorial number system.
+    """
+    hand = sorted(problem)
+    for number in hand:
+        if not 0 <= number <= maximum:
+            raise ValueError('Number out of range: %s' % number)
+    size, n = len(hand), maximum + len(hand)
+    return _binomial(n, size) - 1 - sum(_binomial(n - 1 - number - i, size - i) for i, number in enumerate(hand))
+
+
+def unrank_hand(index: int, size: int = 5, maximum: int = 13) -> tuple:
+    """Return the hand of a rank, see rank_hand."""
+    n = maximum + size
+    if not 0 <= index < _binomial(n, size):
+        raise ValueError('Rank out of range: %s' % index)
+    hand, element = [], 0
+    for i in range(size):
+        while index >= _binomial(n - 1 - element, size - 1 - i):  # skip combinations starting with element
+            index -= _binomial(n - 1 - element, size - 1 - i)
+            element += 1
+        hand.append(element - i)
+        element += 1
+    return tuple(hand)
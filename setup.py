@@ -21,6 +21,9 @@ setuptools.setup(
     long_description_content_type='text/markdown',
     url='https://github.com/T0nyX1ang/42-Points-Game',
     packages=setuptools.find_packages(include=['ftptsgame']),
+    package_data={
+        'ftptsgame': ['data/*.bin'],
+    },
     classifiers=[
         "Programming Language :: Python :: 3.5",
         "Programming Language :: Python :: 3.6",
@@ -31,4 +34,7 @@ setuptools.setup(
         "Development Status :: 4 - Beta",
     ],
     python_requires='>=3.5',
+    extras_require={
+        'numpy': ['numpy'],
+    },
 )
@@ -1,7074 +1,46 @@
 """
 Global database for this project.
 
-This database can be re-generated by command line.
+This database can be re-generated by command line:
+    python -m ftptsgame.database build --target 42
 """
 
+from collections.abc import Mapping
+from ftptsgame.database_utils import all_hands, get_database
 
-DATABASE_42 = {
-    (0, 0, 0, 6, 7): 1,
-    (0, 0, 1, 3, 13): 1,
-    (0, 0, 1, 5, 7): 1,
-    (0, 0, 1, 6, 6): 1,
-    (0, 0, 1, 6, 7): 1,
-    (0, 0, 1, 6, 8): 1,
-    (0, 0, 1, 7, 7): 1,
-    (0, 0, 2, 3, 7): 1,
-    (0, 0, 2, 3, 12): 1,
-    (0, 0, 2, 4, 7): 1,
-    (0, 0, 2, 4, 10): 1,
-    (0, 0, 2, 4, 11): 1,
-    (0, 0, 2, 5, 6): 1,
-    (0, 0, 2, 5, 8): 1,
-    (0, 0, 2, 6, 7): 1,
-    (0, 0, 2, 6, 9): 1,
-    (0, 0, 2, 7, 8): 1,
-    (0, 0, 2, 7, 12): 1,
-    (0, 0, 2, 8, 13): 1,
-    (0, 0, 2, 9, 12): 1,
-    (0, 0, 2, 10, 11): 1,
-    (0, 0, 3, 3, 7): 1,
-    (0, 0, 3, 3, 11): 1,
-    (0, 0, 3, 3, 13): 1,
-    (0, 0, 3, 4, 6): 1,
-    (0, 0, 3, 4, 10): 1,
-    (0, 0, 3, 5, 9): 2,
-    (0, 0, 3, 6, 7): 1,
-    (0, 0, 3, 6, 8): 1,
-    (0, 0, 3, 6, 10): 1,
-    (0, 0, 3, 6, 12): 1,
-    (0, 0, 3, 7, 7): 1,
-    (0, 0, 3, 7, 9): 1,
-    (0, 0, 3, 9, 11): 1,
-    (0, 0, 3, 10, 12): 1,
-    (0, 0, 4, 6, 7): 1,
-    (0, 0, 4, 6, 9): 1,
-    (0, 0, 4, 6, 11): 1,
-    (0, 0, 4, 6, 12): 1,
-    (0, 0, 4, 7, 10): 1,
-    (0, 0, 4, 8, 10): 1,
-    (0, 0, 4, 10, 13): 1,
-    (0, 0, 5, 6, 7): 1,
-    (0, 0, 5, 6, 12): 2,
-    (0, 0, 5, 7, 7): 1,
-    (0, 0, 5, 7, 11): 1,
-    (0, 0, 5, 8, 10): 1,
-    (0, 0, 5, 11, 13): 1,
-    (0, 0, 6, 6, 6): 1,
-    (0, 0, 6, 6, 7): 1,
-    (0, 0, 6, 6, 8): 1,
-    (0, 0, 6, 6, 13): 1,
-    (0, 0, 6, 7, 7): 1,
-    (0, 0, 6, 7, 8): 1,
-    (0, 0, 6, 7, 9): 1,
-    (0, 0, 6, 7, 10): 1,
-    (0, 0, 6, 7, 11): 1,
-    (0, 0, 6, 7, 12): 2,
-    (0, 0, 6, 7, 13): 1,
-    (0, 0, 6, 9, 12): 1,
-    (0, 0, 7, 7, 7): 1,
-    (0, 0, 7, 7, 13): 1,
-    (0, 1, 1, 2, 13): 1,
-    (0, 1, 1, 3, 7): 1,
-    (0, 1, 1, 3, 12): 1,
-    (0, 1, 1, 3, 13): 1,
-    (0, 1, 1, 4, 7): 1,
-    (0, 1, 1, 4, 10): 1,
-    (0, 1, 1, 4, 11): 1,
-    (0, 1, 1, 4, 13): 1,
-    (0, 1, 1, 5, 6): 2,
-    (0, 1, 1, 5, 7): 1,
-    (0, 1, 1, 5, 8): 2,
-    (0, 1, 1, 6, 6): 1,
-    (0, 1, 1, 6, 7): 2,
-    (0, 1, 1, 6, 8): 1,
-    (0, 1, 1, 6, 9): 1,
-    (0, 1, 1, 7, 7): 1,
-    (0, 1, 1, 7, 8): 2,
-    (0, 1, 1, 7, 12): 1,
-    (0, 1, 1, 8, 13): 1,
-    (0, 1, 1, 9, 12): 1,
-    (0, 1, 1, 10, 11): 1,
-    (0, 1, 2, 2, 7): 1,
-    (0, 1, 2, 2, 10): 1,
-    (0, 1, 2, 2, 11): 1,
-    (0, 1, 2, 2, 12): 1,
-    (0, 1, 2, 3, 6): 2,
-    (0, 1, 2, 3, 7): 2,
-    (0, 1, 2, 3, 8): 1,
-    (0, 1, 2, 3, 10): 1,
-    (0, 1, 2, 3, 11): 3,
-    (0, 1, 2, 3, 12): 2,
-    (0, 1, 2, 3, 13): 4,
-    (0, 1, 2, 4, 5): 1,
-    (0, 1, 2, 4, 6): 3,
-    (0, 1, 2, 4, 7): 2,
-    (0, 1, 2, 4, 8): 2,
-    (0, 1, 2, 4, 9): 1,
-    (0, 1, 2, 4, 10): 4,
-    (0, 1, 2, 4, 11): 3,
-    (0, 1, 2, 4, 12): 3,
-    (0, 1, 2, 5, 5): 1,
-    (0, 1, 2, 5, 6): 1,
-    (0, 1, 2, 5, 7): 4,
-    (0, 1, 2, 5, 8): 1,
-    (0, 1, 2, 5, 9): 4,
-    (0, 1, 2, 5, 10): 1,
-    (0, 1, 2, 5, 11): 1,
-    (0, 1, 2, 5, 12): 1,
-    (0, 1, 2, 5, 13): 1,
-    (0, 1, 2, 6, 6): 2,
-    (0, 1, 2, 6, 7): 1,
-    (0, 1, 2, 6, 8): 5,
-    (0, 1, 2, 6, 9): 1,
-    (0, 1, 2, 6, 10): 1,
-    (0, 1, 2, 6, 12): 3,
-    (0, 1, 2, 6, 13): 1,
-    (0, 1, 2, 7, 7): 3,
-    (0, 1, 2, 7, 8): 1,
-    (0, 1, 2, 7, 9): 2,
-    (0, 1, 2, 7, 10): 1,
-    (0, 1, 2, 7, 11): 1,
-    (0, 1, 2, 7, 12): 1,
-    (0, 1, 2, 7, 13): 2,
-    (0, 1, 2, 8, 8): 1,
-    (0, 1, 2, 8, 12): 2,
-    (0, 1, 2, 8, 13): 1,
-    (0, 1, 2, 9, 11): 2,
-    (0, 1, 2, 9, 12): 2,
-    (0, 1, 2, 9, 13): 1,
-    (0, 1, 2, 10, 10): 1,
-    (0, 1, 2, 10, 11): 1,
-    (0, 1, 2, 10, 12): 2,
-    (0, 1, 2, 11, 11): 1,
-    (0, 1, 3, 3, 5): 1,
-    (0, 1, 3, 3, 6): 2,
-    (0, 1, 3, 3, 7): 2,
-    (0, 1, 3, 3, 8): 1,
-    (0, 1, 3, 3, 10): 1,
-    (0, 1, 3, 3, 11): 1,
-    (0, 1, 3, 3, 12): 2,
-    (0, 1, 3, 3, 13): 1,
-    (0, 1, 3, 4, 5): 1,
-    (0, 1, 3, 4, 6): 1,
-    (0, 1, 3, 4, 7): 2,
-    (0, 1, 3, 4, 9): 2,
-    (0, 1, 3, 4, 10): 2,
-    (0, 1, 3, 4, 11): 3,
-    (0, 1, 3, 4, 13): 3,
-    (0, 1, 3, 5, 6): 1,
-    (0, 1, 3, 5, 7): 1,
-    (0, 1, 3, 5, 8): 3,
-    (0, 1, 3, 5, 9): 3,
-    (0, 1, 3, 5, 10): 3,
-    (0, 1, 3, 5, 12): 1,
-    (0, 1, 3, 5, 13): 1,
-    (0, 1, 3, 6, 6): 1,
-    (0, 1, 3, 6, 7): 2,
-    (0, 1, 3, 6, 8): 2,
-    (0, 1, 3, 6, 9): 5,
-    (0, 1, 3, 6, 10): 1,
-    (0, 1, 3, 6, 11): 2,
-    (0, 1, 3, 6, 12): 2,
-    (0, 1, 3, 6, 13): 3,
-    (0, 1, 3, 7, 7): 2,
-    (0, 1, 3, 7, 8): 2,
-    (0, 1, 3, 7, 9): 1,
-    (0, 1, 3, 7, 10): 2,
-    (0, 1, 3, 7, 12): 2,
-    (0, 1, 3, 7, 13): 1,
-    (0, 1, 3, 8, 9): 1,
-    (0, 1, 3, 8, 10): 1,
-    (0, 1, 3, 8, 11): 1,
-    (0, 1, 3, 8, 13): 2,
-    (0, 1, 3, 9, 10): 1,
-    (0, 1, 3, 9, 11): 2,
-    (0, 1, 3, 9, 12): 3,
-    (0, 1, 3, 9, 13): 2,
-    (0, 1, 3, 10, 11): 3,
-    (0, 1, 3, 10, 12): 1,
-    (0, 1, 3, 10, 13): 3,
-    (0, 1, 3, 11, 12): 1,
-    (0, 1, 3, 11, 13): 1,
-    (0, 1, 3, 12, 13): 1,
-    (0, 1, 3, 13, 13): 1,
-    (0, 1, 4, 4, 6): 1,
-    (0, 1, 4, 4, 10): 1,
-    (0, 1, 4, 5, 7): 1,
-    (0, 1, 4, 5, 8): 1,
-    (0, 1, 4, 5, 9): 3,
-    (0, 1, 4, 5, 10): 1,
-    (0, 1, 4, 5, 11): 1,
-    (0, 1, 4, 5, 12): 1,
-    (0, 1, 4, 6, 6): 1,
-    (0, 1, 4, 6, 7): 1,
-    (0, 1, 4, 6, 8): 3,
-    (0, 1, 4, 6, 9): 1,
-    (0, 1, 4, 6, 10): 3,
-    (0, 1, 4, 6, 11): 2,
-    (0, 1, 4, 6, 12): 4,
-    (0, 1, 4, 6, 13): 1,
-    (0, 1, 4, 7, 7): 3,
-    (0, 1, 4, 7, 9): 2,
-    (0, 1, 4, 7, 10): 2,
-    (0, 1, 4, 7, 11): 2,
-    (0, 1, 4, 7, 12): 1,
-    (0, 1, 4, 7, 13): 2,
-    (0, 1, 4, 8, 9): 1,
-    (0, 1, 4, 8, 10): 3,
-    (0, 1, 4, 8, 11): 1,
-    (0, 1, 4, 9, 10): 1,
-    (0, 1, 4, 9, 11): 1,
-    (0, 1, 4, 9, 13): 1,
-    (0, 1, 4, 10, 12): 3,
-    (0, 1, 4, 10, 13): 1,
-    (0, 1, 4, 11, 13): 2,
-    (0, 1, 4, 12, 13): 1,
-    (0, 1, 4, 13, 13): 1,
-    (0, 1, 5, 5, 7): 1,
-    (0, 1, 5, 5, 12): 2,
-    (0, 1, 5, 6, 6): 3,
-    (0, 1, 5, 6, 7): 5,
-    (0, 1, 5, 6, 8): 3,
-    (0, 1, 5, 6, 9): 1,
-    (0, 1, 5, 6, 11): 3,
-    (0, 1, 5, 6, 12): 3,
-    (0, 1, 5, 6, 13): 3,
-    (0, 1, 5, 7, 7): 2,
-    (0, 1, 5, 7, 8): 3,
-    (0, 1, 5, 7, 9): 1,
-    (0, 1, 5, 7, 10): 3,
-    (0, 1, 5, 7, 11): 2,
-    (0, 1, 5, 7, 12): 5,
-    (0, 1, 5, 7, 13): 1,
-    (0, 1, 5, 8, 9): 1,
-    (0, 1, 5, 8, 10): 2,
-    (0, 1, 5, 8, 11): 2,
-    (0, 1, 5, 8, 13): 1,
-    (0, 1, 5, 9, 10): 1,
-    (0, 1, 5, 9, 12): 1,
-    (0, 1, 5, 10, 13): 2,
-    (0, 1, 5, 11, 12): 1,
-    (0, 1, 5, 11, 13): 1,
-    (0, 1, 5, 12, 13): 1,
-    (0, 1, 6, 6, 6): 1,
-    (0, 1, 6, 6, 7): 4,
-    (0, 1, 6, 6, 8): 2,
-    (0, 1, 6, 6, 9): 2,
-    (0, 1, 6, 6, 10): 1,
-    (0, 1, 6, 6, 11): 1,
-    (0, 1, 6, 6, 12): 4,
-    (0, 1, 6, 6, 13): 2,
-    (0, 1, 6, 7, 7): 4,
-    (0, 1, 6, 7, 8): 5,
-    (0, 1, 6, 7, 9): 1,
-    (0, 1, 6, 7, 10): 1,
-    (0, 1, 6, 7, 11): 2,
-    (0, 1, 6, 7, 12): 2,
-    (0, 1, 6, 7, 13): 5,
-    (0, 1, 6, 8, 8): 1,
-    (0, 1, 6, 8, 9): 1,
-    (0, 1, 6, 8, 10): 2,
-    (0, 1, 6, 8, 11): 1,
-    (0, 1, 6, 8, 12): 3,
-    (0, 1, 6, 8, 13): 1,
-    (0, 1, 6, 9, 11): 1,
-    (0, 1, 6, 9, 12): 1,
-    (0, 1, 6, 9, 13): 2,
-    (0, 1, 6, 10, 12): 1,
-    (0, 1, 6, 11, 13): 1,
-    (0, 1, 7, 7, 7): 1,
-    (0, 1, 7, 7, 8): 3,
-    (0, 1, 7, 7, 9): 1,
-    (0, 1, 7, 7, 10): 1,
-    (0, 1, 7, 7, 11): 1,
-    (0, 1, 7, 7, 12): 2,
-    (0, 1, 7, 7, 13): 2,
-    (0, 1, 7, 8, 13): 3,
-    (0, 1, 7, 9, 12): 2,
-    (0, 1, 7, 10, 12): 1,
-    (0, 1, 7, 10, 13): 1,
-    (0, 1, 8, 11, 13): 1,
-    (0, 1, 9, 12, 13): 1,
-    (0, 1, 10, 13, 13): 1,
-    (0, 2, 2, 2, 7): 2,
-    (0, 2, 2, 2, 10): 2,
-    (0, 2, 2, 2, 11): 2,
-    (0, 2, 2, 3, 5): 1,
-    (0, 2, 2, 3, 6): 3,
-    (0, 2, 2, 3, 7): 1,
-    (0, 2, 2, 3, 8): 2,
-    (0, 2, 2, 3, 9): 2,
-    (0, 2, 2, 3, 10): 2,
-    (0, 2, 2, 3, 12): 3,
-    (0, 2, 2, 3, 13): 1,
-    (0, 2, 2, 4, 5): 2,
-    (0, 2, 2, 4, 7): 2,
-    (0, 2, 2, 4, 8): 1,
-    (0, 2, 2, 4, 9): 2,
-    (0, 2, 2, 4, 10): 1,
-    (0, 2, 2, 4, 11): 1,
-    (0, 2, 2, 4, 12): 1,
-    (0, 2, 2, 4, 13): 2,
-    (0, 2, 2, 5, 6): 2,
-    (0, 2, 2, 5, 7): 2,
-    (0, 2, 2, 5, 8): 3,
-    (0, 2, 2, 5, 10): 1,
-    (0, 2, 2, 5, 11): 1,
-    (0, 2, 2, 5, 12): 2,
-    (0, 2, 2, 5, 13): 1,
-    (0, 2, 2, 6, 6): 1,
-    (0, 2, 2, 6, 7): 1,
-    (0, 2, 2, 6, 8): 1,
-    (0, 2, 2, 6, 9): 4,
-    (0, 2, 2, 6, 10): 2,
-    (0, 2, 2, 6, 11): 3,
-    (0, 2, 2, 6, 12): 3,
-    (0, 2, 2, 6, 13): 1,
-    (0, 2, 2, 7, 7): 2,
-    (0, 2, 2, 7, 8): 3,
-    (0, 2, 2, 7, 10): 3,
-    (0, 2, 2, 7, 12): 2,
-    (0, 2, 2, 7, 13): 1,
-    (0, 2, 2, 8, 9): 1,
-    (0, 2, 2, 8, 10): 3,
-    (0, 2, 2, 8, 11): 2,
-    (0, 2, 2, 8, 12): 1,
-    (0, 2, 2, 8, 13): 1,
-    (0, 2, 2, 9, 10): 1,
-    (0, 2, 2, 9, 11): 1,
-    (0, 2, 2, 9, 12): 2,
-    (0, 2, 2, 9, 13): 1,
-    (0, 2, 2, 10, 10): 1,
-    (0, 2, 2, 10, 11): 1,
-    (0, 2, 2, 10, 12): 1,
-    (0, 2, 2, 10, 13): 3,
-    (0, 2, 2, 11, 11): 1,
-    (0, 2, 2, 11, 12): 2,
-    (0, 2, 2, 12, 13): 1,
-    (0, 2, 3, 3, 4): 2,
-    (0, 2, 3, 3, 5): 1,
-    (0, 2, 3, 3, 6): 2,
-    (0, 2, 3, 3, 7): 2,
-    (0, 2, 3, 3, 8): 2,
-    (0, 2, 3, 3, 9): 3,
-    (0, 2, 3, 3, 10): 1,
-    (0, 2, 3, 3, 11): 2,
-    (0, 2, 3, 3, 12): 2,
-    (0, 2, 3, 3, 13): 3,
-    (0, 2, 3, 4, 4): 2,
-    (0, 2, 3, 4, 5): 1,
-    (0, 2, 3, 4, 6): 3,
-    (0, 2, 3, 4, 7): 5,
-    (0, 2, 3, 4, 8): 3,
-    (0, 2, 3, 4, 9): 5,
-    (0, 2, 3, 4, 10): 3,
-    (0, 2, 3, 4, 11): 2,
-    (0, 2, 3, 4, 12): 8,
-    (0, 2, 3, 4, 13): 1,
-    (0, 2, 3, 5, 5): 1,
-    (0, 2, 3, 5, 6): 3,
-    (0, 2, 3, 5, 7): 4,
-    (0, 2, 3, 5, 8): 1,
-    (0, 2, 3, 5, 9): 3,
-    (0, 2, 3, 5, 11): 4,
-    (0, 2, 3, 5, 12): 4,
-    (0, 2, 3, 5, 13): 3,
-    (0, 2, 3, 6, 6): 4,
-    (0, 2, 3, 6, 7): 4,
-    (0, 2, 3, 6, 8): 5,
-    (0, 2, 3, 6, 9): 2,
-    (0, 2, 3, 6, 10): 5,
-    (0, 2, 3, 6, 11): 2,
-    (0, 2, 3, 6, 12): 7,
-    (0, 2, 3, 6, 13): 4,
-    (0, 2, 3, 7, 7): 4,
-    (0, 2, 3, 7, 8): 2,
-    (0, 2, 3, 7, 9): 6,
-    (0, 2, 3, 7, 10): 2,
-    (0, 2, 3, 7, 11): 5,
-    (0, 2, 3, 7, 12): 5,
-    (0, 2, 3, 7, 13): 1,
-    (0, 2, 3, 8, 8): 2,
-    (0, 2, 3, 8, 9): 2,
-    (0, 2, 3, 8, 10): 4,
-    (0, 2, 3, 8, 11): 1,
-    (0, 2, 3, 8, 12): 4,
-    (0, 2, 3, 8, 13): 1,
-    (0, 2, 3, 9, 9): 4,
-    (0, 2, 3, 9, 10): 3,
-    (0, 2, 3, 9, 11): 1,
-    (0, 2, 3, 9, 12): 4,
-    (0, 2, 3, 9, 13): 2,
-    (0, 2, 3, 10, 10): 1,
-    (0, 2, 3, 10, 11): 1,
-    (0, 2, 3, 10, 12): 5,
-    (0, 2, 3, 10, 13): 1,
-    (0, 2, 3, 11, 11): 1,
-    (0, 2, 3, 11, 12): 3,
-    (0, 2, 3, 11, 13): 2,
-    (0, 2, 3, 12, 12): 5,
-    (0, 2, 3, 12, 13): 3,
-    (0, 2, 3, 13, 13): 1,
-    (0, 2, 4, 4, 5): 2,
-    (0, 2, 4, 4, 6): 1,
-    (0, 2, 4, 4, 7): 4,
-    (0, 2, 4, 4, 9): 1,
-    (0, 2, 4, 4, 10): 4,
-    (0, 2, 4, 4, 11): 4,
-    (0, 2, 4, 4, 12): 2,
-    (0, 2, 4, 4, 13): 3,
-    (0, 2, 4, 5, 5): 2,
-    (0, 2, 4, 5, 6): 4,
-    (0, 2, 4, 5, 7): 2,
-    (0, 2, 4, 5, 8): 5,
-    (0, 2, 4, 5, 10): 4,
-    (0, 2, 4, 5, 11): 3,
-    (0, 2, 4, 5, 12): 4,
-    (0, 2, 4, 5, 13): 2,
-    (0, 2, 4, 6, 6): 4,
-    (0, 2, 4, 6, 7): 3,
-    (0, 2, 4, 6, 8): 2,
-    (0, 2, 4, 6, 9): 6,
-    (0, 2, 4, 6, 10): 4,
-    (0, 2, 4, 6, 11): 4,
-    (0, 2, 4, 6, 12): 2,
-    (0, 2, 4, 6, 13): 3,
-    (0, 2, 4, 7, 7): 4,
-    (0, 2, 4, 7, 8): 5,
-    (0, 2, 4, 7, 9): 1,
-    (0, 2, 4, 7, 10): 4,
-    (0, 2, 4, 7, 11): 2,
-    (0, 2, 4, 7, 12): 8,
-    (0, 2, 4, 7, 13): 1,
-    (0, 2, 4, 8, 8): 1,
-    (0, 2, 4, 8, 9): 3,
-    (0, 2, 4, 8, 10): 4,
-    (0, 2, 4, 8, 11): 6,
-    (0, 2, 4, 8, 12): 2,
-    (0, 2, 4, 8, 13): 6,
-    (0, 2, 4, 9, 10): 3,
-    (0, 2, 4, 9, 11): 1,
-    (0, 2, 4, 9, 12): 5,
-    (0, 2, 4, 10, 10): 2,
-    (0, 2, 4, 10, 11): 6,
-    (0, 2, 4, 10, 12): 2,
-    (0, 2, 4, 10, 13): 3,
-    (0, 2, 4, 11, 11): 1,
-    (0, 2, 4, 11, 12): 4,
-    (0, 2, 4, 11, 13): 1,
-    (0, 2, 4, 12, 12): 2,
-    (0, 2, 4, 12, 13): 3,
-    (0, 2, 5, 5, 6): 1,
-    (0, 2, 5, 5, 7): 2,
-    (0, 2, 5, 5, 8): 2,
-    (0, 2, 5, 5, 9): 2,
-    (0, 2, 5, 5, 11): 2,
-    (0, 2, 5, 5, 13): 1,
-    (0, 2, 5, 6, 6): 2,
-    (0, 2, 5, 6, 7): 2,
-    (0, 2, 5, 6, 8): 3,
-    (0, 2, 5, 6, 9): 6,
-    (0, 2, 5, 6, 10): 5,
-    (0, 2, 5, 6, 11): 1,
-    (0, 2, 5, 6, 12): 6,
-    (0, 2, 5, 6, 13): 2,
-    (0, 2, 5, 7, 7): 5,
-    (0, 2, 5, 7, 8): 3,
-    (0, 2, 5, 7, 9): 4,
-    (0, 2, 5, 7, 11): 1,
-    (0, 2, 5, 7, 12): 1,
-    (0, 2, 5, 7, 13): 2,
-    (0, 2, 5, 8, 8): 3,
-    (0, 2, 5, 8, 9): 1,
-    (0, 2, 5, 8, 10): 3,
-    (0, 2, 5, 8, 11): 1,
-    (0, 2, 5, 8, 12): 6,
-    (0, 2, 5, 8, 13): 2,
-    (0, 2, 5, 9, 10): 1,
-    (0, 2, 5, 9, 11): 3,
-    (0, 2, 5, 9, 12): 2,
-    (0, 2, 5, 9, 13): 1,
-    (0, 2, 5, 10, 10): 1,
-    (0, 2, 5, 10, 11): 3,
-    (0, 2, 5, 10, 12): 2,
-    (0, 2, 5, 11, 11): 1,
-    (0, 2, 5, 11, 13): 2,
-    (0, 2, 5, 12, 12): 2,
-    (0, 2, 5, 12, 13): 1,
-    (0, 2, 5, 13, 13): 2,
-    (0, 2, 6, 6, 6): 2,
-    (0, 2, 6, 6, 7): 3,
-    (0, 2, 6, 6, 8): 4,
-    (0, 2, 6, 6, 9): 3,
-    (0, 2, 6, 6, 10): 2,
-    (0, 2, 6, 6, 11): 1,
-    (0, 2, 6, 6, 12): 4,
-    (0, 2, 6, 6, 13): 2,
-    (0, 2, 6, 7, 7): 3,
-    (0, 2, 6, 7, 8): 3,
-    (0, 2, 6, 7, 9): 4,
-    (0, 2, 6, 7, 10): 2,
-    (0, 2, 6, 7, 11): 3,
-    (0, 2, 6, 7, 12): 6,
-    (0, 2, 6, 7, 13): 3,
-    (0, 2, 6, 8, 8): 2,
-    (0, 2, 6, 8, 9): 3,
-    (0, 2, 6, 8, 10): 2,
-    (0, 2, 6, 8, 11): 3,
-    (0, 2, 6, 8, 12): 2,
-    (0, 2, 6, 8, 13): 3,
-    (0, 2, 6, 9, 9): 2,
-    (0, 2, 6, 9, 10): 4,
-    (0, 2, 6, 9, 11): 3,
-    (0, 2, 6, 9, 12): 7,
-    (0, 2, 6, 9, 13): 1,
-    (0, 2, 6, 10, 10): 2,
-    (0, 2, 6, 10, 11): 2,
-    (0, 2, 6, 10, 12): 2,
-    (0, 2, 6, 10, 13): 3,
-    (0, 2, 6, 11, 12): 2,
-    (0, 2, 6, 11, 13): 1,
-    (0, 2, 6, 12, 12): 3,
-    (0, 2, 6, 12, 13): 2,
-    (0, 2, 7, 7, 7): 3,
-    (0, 2, 7, 7, 8): 2,
-    (0, 2, 7, 7, 9): 2,
-    (0, 2, 7, 7, 10): 2,
-    (0, 2, 7, 7, 11): 2,
-    (0, 2, 7, 7, 12): 2,
-    (0, 2, 7, 7, 13): 2,
-    (0, 2, 7, 8, 8): 1,
-    (0, 2, 7, 8, 9): 1,
-    (0, 2, 7, 8, 10): 5,
-    (0, 2, 7, 8, 11): 2,
-    (0, 2, 7, 8, 12): 6,
-    (0, 2, 7, 8, 13): 2,
-    (0, 2, 7, 9, 10): 1,
-    (0, 2, 7, 9, 12): 4,
-    (0, 2, 7, 9, 13): 3,
-    (0, 2, 7, 10, 11): 3,
-    (0, 2, 7, 10, 12): 2,
-    (0, 2, 7, 10, 13): 1,
-    (0, 2, 7, 11, 11): 1,
-    (0, 2, 7, 11, 12): 2,
-    (0, 2, 7, 11, 13): 2,
-    (0, 2, 7, 12, 12): 3,
-    (0, 2, 7, 12, 13): 1,
-    (0, 2, 8, 8, 9): 1,
-    (0, 2, 8, 8, 10): 2,
-    (0, 2, 8, 8, 11): 1,
-    (0, 2, 8, 8, 13): 3,
-    (0, 2, 8, 9, 12): 4,
-    (0, 2, 8, 9, 13): 1,
-    (0, 2, 8, 10, 10): 1,
-    (0, 2, 8, 10, 11): 1,
-    (0, 2, 8, 10, 12): 2,
-    (0, 2, 8, 10, 13): 2,
-    (0, 2, 8, 11, 12): 3,
-    (0, 2, 8, 11, 13): 1,
-    (0, 2, 8, 12, 12): 2,
-    (0, 2, 8, 12, 13): 2,
-    (0, 2, 8, 13, 13): 2,
-    (0, 2, 9, 9, 12): 2,
-    (0, 2, 9, 10, 11): 1,
-    (0, 2, 9, 10, 12): 1,
-    (0, 2, 9, 10, 13): 2,
-    (0, 2, 9, 11, 11): 1,
-    (0, 2, 9, 11, 12): 2,
-    (0, 2, 9, 11, 13): 2,
-    (0, 2, 9, 12, 12): 4,
-    (0, 2, 9, 12, 13): 1,
-    (0, 2, 10, 10, 11): 2,
-    (0, 2, 10, 10, 12): 1,
-    (0, 2, 10, 11, 11): 2,
-    (0, 2, 10, 11, 12): 1,
-    (0, 2, 10, 11, 13): 2,
-    (0, 2, 10, 12, 13): 2,
-    (0, 2, 10, 13, 13): 1,
-    (0, 3, 3, 3, 4): 1,
-    (0, 3, 3, 3, 5): 2,
-    (0, 3, 3, 3, 7): 2,
-    (0, 3, 3, 3, 8): 1,
-    (0, 3, 3, 3, 10): 2,
-    (0, 3, 3, 3, 11): 1,
-    (0, 3, 3, 3, 12): 2,
-    (0, 3, 3, 3, 13): 1,
-    (0, 3, 3, 4, 6): 3,
-    (0, 3, 3, 4, 7): 2,
-    (0, 3, 3, 4, 9): 3,
-    (0, 3, 3, 4, 10): 1,
-    (0, 3, 3, 4, 11): 3,
-    (0, 3, 3, 4, 12): 1,
-    (0, 3, 3, 4, 13): 2,
-    (0, 3, 3, 5, 6): 2,
-    (0, 3, 3, 5, 7): 3,
-    (0, 3, 3, 5, 8): 1,
-    (0, 3, 3, 5, 9): 3,
-    (0, 3, 3, 5, 10): 1,
-    (0, 3, 3, 5, 11): 1,
-    (0, 3, 3, 5, 12): 4,
-    (0, 3, 3, 5, 13): 1,
-    (0, 3, 3, 6, 6): 3,
-    (0, 3, 3, 6, 7): 3,
-    (0, 3, 3, 6, 8): 4,
-    (0, 3, 3, 6, 9): 2,
-    (0, 3, 3, 6, 10): 1,
-    (0, 3, 3, 6, 11): 4,
-    (0, 3, 3, 6, 12): 4,
-    (0, 3, 3, 6, 13): 6,
-    (0, 3, 3, 7, 7): 3,
-    (0, 3, 3, 7, 8): 2,
-    (0, 3, 3, 7, 9): 3,
-    (0, 3, 3, 7, 10): 2,
-    (0, 3, 3, 7, 11): 2,
-    (0, 3, 3, 7, 12): 3,
-    (0, 3, 3, 7, 13): 2,
-    (0, 3, 3, 8, 9): 3,
-    (0, 3, 3, 8, 10): 1,
-    (0, 3, 3, 8, 11): 1,
-    (0, 3, 3, 8, 13): 1,
-    (0, 3, 3, 9, 10): 2,
-    (0, 3, 3, 9, 11): 3,
-    (0, 3, 3, 9, 12): 3,
-    (0, 3, 3, 9, 13): 4,
-    (0, 3, 3, 10, 11): 1,
-    (0, 3, 3, 10, 12): 1,
-    (0, 3, 3, 10, 13): 1,
-    (0, 3, 3, 11, 11): 1,
-    (0, 3, 3, 11, 12): 2,
-    (0, 3, 3, 11, 13): 2,
-    (0, 3, 3, 12, 13): 2,
-    (0, 3, 3, 13, 13): 1,
-    (0, 3, 4, 4, 6): 3,
-    (0, 3, 4, 4, 10): 2,
-    (0, 3, 4, 4, 13): 1,
-    (0, 3, 4, 5, 5): 2,
-    (0, 3, 4, 5, 6): 4,
-    (0, 3, 4, 5, 7): 3,
-    (0, 3, 4, 5, 9): 2,
-    (0, 3, 4, 5, 10): 3,
-    (0, 3, 4, 5, 11): 3,
-    (0, 3, 4, 5, 13): 2,
-    (0, 3, 4, 6, 6): 3,
-    (0, 3, 4, 6, 7): 5,
-    (0, 3, 4, 6, 8): 5,
-    (0, 3, 4, 6, 9): 6,
-    (0, 3, 4, 6, 10): 7,
-    (0, 3, 4, 6, 11): 4,
-    (0, 3, 4, 6, 12): 9,
-    (0, 3, 4, 6, 13): 1,
-    (0, 3, 4, 7, 7): 4,
-    (0, 3, 4, 7, 8): 2,
-    (0, 3, 4, 7, 9): 2,
-    (0, 3, 4, 7, 10): 2,
-    (0, 3, 4, 7, 11): 3,
-    (0, 3, 4, 7, 12): 1,
-    (0, 3, 4, 7, 13): 5,
-    (0, 3, 4, 8, 9): 1,
-    (0, 3, 4, 8, 10): 4,
-    (0, 3, 4, 8, 12): 2,
-    (0, 3, 4, 8, 13): 1,
-    (0, 3, 4, 9, 9): 3,
-    (0, 3, 4, 9, 10): 2,
-    (0, 3, 4, 9, 11): 3,
-    (0, 3, 4, 9, 12): 1,
-    (0, 3, 4, 9, 13): 1,
-    (0, 3, 4, 10, 10): 3,
-    (0, 3, 4, 10, 11): 2,
-    (0, 3, 4, 10, 12): 3,
-    (0, 3, 4, 10, 13): 3,
-    (0, 3, 4, 11, 12): 2,
-    (0, 3, 4, 11, 13): 1,
-    (0, 3, 4, 12, 13): 2,
-    (0, 3, 4, 13, 13): 1,
-    (0, 3, 5, 5, 6): 1,
-    (0, 3, 5, 5, 8): 1,
-    (0, 3, 5, 5, 9): 2,
-    (0, 3, 5, 5, 10): 1,
-    (0, 3, 5, 5, 11): 1,
-    (0, 3, 5, 5, 12): 1,
-    (0, 3, 5, 5, 13): 1,
-    (0, 3, 5, 6, 6): 2,
-    (0, 3, 5, 6, 7): 2,
-    (0, 3, 5, 6, 8): 3,
-    (0, 3, 5, 6, 9): 7,
-    (0, 3, 5, 6, 10): 2,
-    (0, 3, 5, 6, 11): 1,
-    (0, 3, 5, 6, 12): 4,
-    (0, 3, 5, 6, 13): 1,
-    (0, 3, 5, 7, 7): 3,
-    (0, 3, 5, 7, 8): 2,
-    (0, 3, 5, 7, 9): 4,
-    (0, 3, 5, 7, 10): 4,
-    (0, 3, 5, 7, 11): 1,
-    (0, 3, 5, 7, 12): 2,
-    (0, 3, 5, 7, 13): 1,
-    (0, 3, 5, 8, 9): 2,
-    (0, 3, 5, 8, 10): 1,
-    (0, 3, 5, 8, 11): 2,
-    (0, 3, 5, 8, 12): 1,
-    (0, 3, 5, 8, 13): 6,
-    (0, 3, 5, 9, 9): 4,
-    (0, 3, 5, 9, 10): 5,
-    (0, 3, 5, 9, 11): 3,
-    (0, 3, 5, 9, 12): 6,
-    (0, 3, 5, 9, 13): 2,
-    (0, 3, 5, 10, 11): 4,
-    (0, 3, 5, 10, 12): 3,
-    (0, 3, 5, 11, 11): 1,
-    (0, 3, 5, 11, 12): 1,
-    (0, 3, 5, 11, 13): 1,
-    (0, 3, 5, 12, 13): 1,
-    (0, 3, 6, 6, 6): 2,
-    (0, 3, 6, 6, 7): 1,
-    (0, 3, 6, 6, 8): 3,
-    (0, 3, 6, 6, 9): 3,
-    (0, 3, 6, 6, 10): 4,
-    (0, 3, 6, 6, 11): 2,
-    (0, 3, 6, 6, 12): 3,
-    (0, 3, 6, 6, 13): 2,
-    (0, 3, 6, 7, 7): 3,
-    (0, 3, 6, 7, 8): 4,
-    (0, 3, 6, 7, 9): 5,
-    (0, 3, 6, 7, 10): 2,
-    (0, 3, 6, 7, 11): 2,
-    (0, 3, 6, 7, 12): 7,
-    (0, 3, 6, 7, 13): 2,
-    (0, 3, 6, 8, 8): 2,
-    (0, 3, 6, 8, 9): 4,
-    (0, 3, 6, 8, 10): 2,
-    (0, 3, 6, 8, 11): 2,
-    (0, 3, 6, 8, 12): 6,
-    (0, 3, 6, 8, 13): 2,
-    (0, 3, 6, 9, 9): 2,
-    (0, 3, 6, 9, 10): 3,
-    (0, 3, 6, 9, 11): 6,
-    (0, 3, 6, 9, 12): 4,
-    (0, 3, 6, 9, 13): 4,
-    (0, 3, 6, 10, 10): 2,
-    (0, 3, 6, 10, 11): 2,
-    (0, 3, 6, 10, 12): 7,
-    (0, 3, 6, 10, 13): 1,
-    (0, 3, 6, 11, 12): 3,
-    (0, 3, 6, 11, 13): 1,
-    (0, 3, 6, 12, 12): 7,
-    (0, 3, 6, 12, 13): 2,
-    (0, 3, 7, 7, 7): 2,
-    (0, 3, 7, 7, 8): 2,
-    (0, 3, 7, 7, 9): 5,
-    (0, 3, 7, 7, 10): 4,
-    (0, 3, 7, 7, 11): 2,
-    (0, 3, 7, 7, 12): 1,
-    (0, 3, 7, 7, 13): 3,
-    (0, 3, 7, 8, 9): 2,
-    (0, 3, 7, 8, 10): 3,
-    (0, 3, 7, 8, 11): 3,
-    (0, 3, 7, 8, 13): 2,
-    (0, 3, 7, 9, 9): 3,
-    (0, 3, 7, 9, 10): 2,
-    (0, 3, 7, 9, 11): 3,
-    (0, 3, 7, 9, 12): 5,
-    (0, 3, 7, 9, 13): 1,
-    (0, 3, 7, 10, 11): 3,
-    (0, 3, 7, 10, 12): 3,
-    (0, 3, 7, 10, 13): 5,
-    (0, 3, 7, 11, 12): 1,
-    (0, 3, 7, 11, 13): 1,
-    (0, 3, 7, 12, 13): 1,
-    (0, 3, 8, 8, 10): 2,
-    (0, 3, 8, 8, 13): 1,
-    (0, 3, 8, 9, 9): 2,
-    (0, 3, 8, 9, 10): 2,
-    (0, 3, 8, 9, 11): 1,
-    (0, 3, 8, 9, 13): 2,
-    (0, 3, 8, 10, 12): 4,
-    (0, 3, 8, 11, 11): 2,
-    (0, 3, 8, 11, 13): 3,
-    (0, 3, 9, 9, 11): 2,
-    (0, 3, 9, 9, 12): 2,
-    (0, 3, 9, 9, 13): 4,
-    (0, 3, 9, 10, 11): 1,
-    (0, 3, 9, 10, 12): 2,
-    (0, 3, 9, 10, 13): 1,
-    (0, 3, 9, 11, 11): 1,
-    (0, 3, 9, 11, 12): 3,
-    (0, 3, 9, 11, 13): 1,
-    (0, 3, 9, 12, 13): 2,
-    (0, 3, 10, 10, 12): 1,
-    (0, 3, 10, 10, 13): 1,
-    (0, 3, 10, 11, 12): 1,
-    (0, 3, 10, 11, 13): 2,
-    (0, 3, 10, 12, 12): 2,
-    (0, 3, 10, 12, 13): 2,
-    (0, 3, 10, 13, 13): 2,
-    (0, 3, 11, 11, 13): 1,
-    (0, 3, 11, 12, 13): 1,
-    (0, 3, 12, 12, 13): 1,
-    (0, 3, 12, 13, 13): 1,
-    (0, 3, 13, 13, 13): 2,
-    (0, 4, 4, 4, 10): 1,
-    (0, 4, 4, 5, 6): 1,
-    (0, 4, 4, 5, 7): 1,
-    (0, 4, 4, 5, 8): 1,
-    (0, 4, 4, 5, 10): 1,
-    (0, 4, 4, 6, 6): 2,
-    (0, 4, 4, 6, 7): 1,
-    (0, 4, 4, 6, 8): 3,
-    (0, 4, 4, 6, 9): 3,
-    (0, 4, 4, 6, 10): 1,
-    (0, 4, 4, 6, 11): 2,
-    (0, 4, 4, 6, 12): 2,
-    (0, 4, 4, 6, 13): 2,
-    (0, 4, 4, 7, 7): 1,
-    (0, 4, 4, 7, 8): 1,
-    (0, 4, 4, 7, 10): 4,
-    (0, 4, 4, 8, 10): 3,
-    (0, 4, 4, 8, 11): 2,
-    (0, 4, 4, 8, 12): 1,
-    (0, 4, 4, 9, 10): 2,
-    (0, 4, 4, 10, 11): 1,
-    (0, 4, 4, 10, 12): 3,
-    (0, 4, 4, 10, 13): 1,
-    (0, 4, 4, 13, 13): 1,
-    (0, 4, 5, 5, 7): 1,
-    (0, 4, 5, 5, 8): 1,
-    (0, 4, 5, 5, 10): 1,
-    (0, 4, 5, 5, 13): 2,
-    (0, 4, 5, 6, 6): 1,
-    (0, 4, 5, 6, 7): 2,
-    (0, 4, 5, 6, 8): 5,
-    (0, 4, 5, 6, 9): 1,
-    (0, 4, 5, 6, 11): 1,
-    (0, 4, 5, 6, 12): 5,
-    (0, 4, 5, 6, 13): 2,
-    (0, 4, 5, 7, 7): 2,
-    (0, 4, 5, 7, 9): 3,
-    (0, 4, 5, 7, 10): 3,
-    (0, 4, 5, 7, 11): 4,
-    (0, 4, 5, 7, 13): 1,
-    (0, 4, 5, 8, 8): 1,
-    (0, 4, 5, 8, 10): 5,
-    (0, 4, 5, 9, 11): 2,
-    (0, 4, 5, 9, 12): 3,
-    (0, 4, 5, 9, 13): 1,
-    (0, 4, 5, 10, 10): 2,
-    (0, 4, 5, 10, 11): 2,
-    (0, 4, 5, 10, 12): 5,
-    (0, 4, 5, 10, 13): 2,
-    (0, 4, 5, 11, 11): 2,
-    (0, 4, 5, 11, 12): 1,
-    (0, 4, 5, 11, 13): 1,
-    (0, 4, 6, 6, 6): 2,
-    (0, 4, 6, 6, 7): 1,
-    (0, 4, 6, 6, 8): 1,
-    (0, 4, 6, 6, 9): 2,
-    (0, 4, 6, 6, 10): 2,
-    (0, 4, 6, 6, 11): 1,
-    (0, 4, 6, 6, 12): 3,
-    (0, 4, 6, 6, 13): 1,
-    (0, 4, 6, 7, 7): 1,
-    (0, 4, 6, 7, 8): 4,
-    (0, 4, 6, 7, 9): 3,
-    (0, 4, 6, 7, 10): 4,
-    (0, 4, 6, 7, 11): 3,
-    (0, 4, 6, 7, 12): 6,
-    (0, 4, 6, 7, 13): 1,
-    (0, 4, 6, 8, 9): 4,
-    (0, 4, 6, 8, 10): 5,
-    (0, 4, 6, 8, 11): 3,
-    (0, 4, 6, 8, 12): 3,
-    (0, 4, 6, 8, 13): 1,
-    (0, 4, 6, 9, 9): 3,
-    (0, 4, 6, 9, 10): 2,
-    (0, 4, 6, 9, 11): 2,
-    (0, 4, 6, 9, 12): 8,
-    (0, 4, 6, 9, 13): 2,
-    (0, 4, 6, 10, 11): 2,
-    (0, 4, 6, 10, 12): 5,
-    (0, 4, 6, 10, 13): 3,
-    (0, 4, 6, 11, 11): 1,
-    (0, 4, 6, 11, 12): 5,
-    (0, 4, 6, 11, 13): 1,
-    (0, 4, 6, 12, 12): 3,
-    (0, 4, 6, 12, 13): 2,
-    (0, 4, 7, 7, 7): 3,
-    (0, 4, 7, 7, 8): 1,
-    (0, 4, 7, 7, 9): 2,
-    (0, 4, 7, 7, 10): 1,
-    (0, 4, 7, 7, 11): 2,
-    (0, 4, 7, 7, 12): 1,
-    (0, 4, 7, 7, 13): 1,
-    (0, 4, 7, 8, 8): 1,
-    (0, 4, 7, 8, 10): 4,
-    (0, 4, 7, 8, 12): 1,
-    (0, 4, 7, 9, 10): 2,
-    (0, 4, 7, 9, 11): 3,
-    (0, 4, 7, 9, 12): 1,
-    (0, 4, 7, 9, 13): 1,
-    (0, 4, 7, 10, 10): 2,
-    (0, 4, 7, 10, 11): 1,
-    (0, 4, 7, 10, 12): 3,
-    (0, 4, 7, 10, 13): 2,
-    (0, 4, 7, 11, 13): 3,
-    (0, 4, 7, 12, 12): 1,
-    (0, 4, 7, 12, 13): 1,
-    (0, 4, 8, 8, 10): 2,
-    (0, 4, 8, 8, 11): 1,
-    (0, 4, 8, 8, 13): 1,
-    (0, 4, 8, 9, 10): 2,
-    (0, 4, 8, 9, 12): 3,
-    (0, 4, 8, 10, 10): 2,
-    (0, 4, 8, 10, 11): 4,
-    (0, 4, 8, 10, 12): 1,
-    (0, 4, 8, 10, 13): 3,
-    (0, 4, 8, 12, 12): 1,
-    (0, 4, 9, 10, 11): 1,
-    (0, 4, 9, 10, 12): 3,
-    (0, 4, 9, 10, 13): 1,
-    (0, 4, 9, 11, 11): 1,
-    (0, 4, 9, 11, 12): 1,
-    (0, 4, 9, 11, 13): 1,
-    (0, 4, 10, 10, 12): 1,
-    (0, 4, 10, 10, 13): 2,
-    (0, 4, 10, 11, 12): 1,
-    (0, 4, 10, 11, 13): 2,
-    (0, 4, 10, 12, 12): 1,
-    (0, 4, 10, 12, 13): 1,
-    (0, 4, 10, 13, 13): 1,
-    (0, 4, 11, 11, 13): 1,
-    (0, 4, 12, 12, 13): 1,
-    (0, 4, 12, 13, 13): 1,
-    (0, 5, 5, 5, 7): 1,
-    (0, 5, 5, 5, 8): 1,
-    (0, 5, 5, 5, 12): 1,
-    (0, 5, 5, 6, 6): 1,
-    (0, 5, 5, 6, 7): 2,
-    (0, 5, 5, 6, 8): 1,
-    (0, 5, 5, 6, 10): 1,
-    (0, 5, 5, 6, 11): 1,
-    (0, 5, 5, 6, 12): 2,
-    (0, 5, 5, 6, 13): 1,
-    (0, 5, 5, 7, 7): 2,
-    (0, 5, 5, 7, 8): 1,
-    (0, 5, 5, 7, 10): 1,
-    (0, 5, 5, 7, 11): 1,
-    (0, 5, 5, 7, 12): 2,
-    (0, 5, 5, 8, 9): 3,
-    (0, 5, 5, 8, 10): 2,
-    (0, 5, 5, 8, 11): 1,
-    (0, 5, 5, 10, 13): 1,
-    (0, 5, 5, 11, 12): 2,
-    (0, 5, 5, 11, 13): 1,
-    (0, 5, 5, 12, 13): 1,
-    (0, 5, 6, 6, 6): 3,
-    (0, 5, 6, 6, 7): 2,
-    (0, 5, 6, 6, 8): 2,
-    (0, 5, 6, 6, 11): 2,
-    (0, 5, 6, 6, 12): 2,
-    (0, 5, 6, 6, 13): 2,
-    (0, 5, 6, 7, 7): 3,
-    (0, 5, 6, 7, 8): 1,
-    (0, 5, 6, 7, 9): 3,
-    (0, 5, 6, 7, 10): 1,
-    (0, 5, 6, 7, 11): 3,
-    (0, 5, 6, 7, 12): 4,
-    (0, 5, 6, 7, 13): 3,
-    (0, 5, 6, 8, 8): 2,
-    (0, 5, 6, 8, 9): 1,
-    (0, 5, 6, 8, 10): 2,
-    (0, 5, 6, 8, 11): 2,
-    (0, 5, 6, 8, 12): 4,
-    (0, 5, 6, 9, 9): 3,
-    (0, 5, 6, 9, 10): 3,
-    (0, 5, 6, 9, 11): 1,
-    (0, 5, 6, 9, 12): 5,
-    (0, 5, 6, 10, 12): 4,
-    (0, 5, 6, 10, 13): 1,
-    (0, 5, 6, 11, 12): 2,
-    (0, 5, 6, 11, 13): 3,
-    (0, 5, 6, 12, 12): 5,
-    (0, 5, 6, 12, 13): 2,
-    (0, 5, 7, 7, 7): 2,
-    (0, 5, 7, 7, 8): 3,
-    (0, 5, 7, 7, 9): 1,
-    (0, 5, 7, 7, 10): 2,
-    (0, 5, 7, 7, 11): 2,
-    (0, 5, 7, 7, 12): 4,
-    (0, 5, 7, 7, 13): 2,
-    (0, 5, 7, 8, 8): 1,
-    (0, 5, 7, 8, 9): 3,
-    (0, 5, 7, 8, 10): 2,
-    (0, 5, 7, 8, 11): 1,
-    (0, 5, 7, 8, 13): 1,
-    (0, 5, 7, 9, 9): 1,
-    (0, 5, 7, 9, 10): 3,
-    (0, 5, 7, 9, 11): 1,
-    (0, 5, 7, 9, 12): 1,
-    (0, 5, 7, 10, 10): 1,
-    (0, 5, 7, 10, 11): 3,
-    (0, 5, 7, 10, 12): 1,
-    (0, 5, 7, 11, 11): 2,
-    (0, 5, 7, 11, 12): 3,
-    (0, 5, 7, 11, 13): 2,
-    (0, 5, 7, 12, 12): 1,
-    (0, 5, 7, 12, 13): 3,
-    (0, 5, 7, 13, 13): 1,
-    (0, 5, 8, 8, 10): 2,
-    (0, 5, 8, 9, 10): 2,
-    (0, 5, 8, 9, 11): 4,
-    (0, 5, 8, 10, 10): 2,
-    (0, 5, 8, 10, 11): 1,
-    (0, 5, 8, 10, 12): 4,
-    (0, 5, 8, 10, 13): 2,
-    (0, 5, 8, 11, 13): 2,
-    (0, 5, 8, 12, 12): 1,
-    (0, 5, 9, 9, 12): 3,
-    (0, 5, 9, 10, 12): 1,
-    (0, 5, 9, 10, 13): 3,
-    (0, 5, 9, 11, 12): 1,
-    (0, 5, 9, 11, 13): 1,
-    (0, 5, 10, 10, 11): 1,
-    (0, 5, 10, 11, 13): 2,
-    (0, 5, 10, 13, 13): 1,
-    (0, 5, 11, 11, 13): 1,
-    (0, 5, 11, 12, 13): 2,
-    (0, 5, 11, 13, 13): 2,
-    (0, 5, 12, 12, 13): 1,
-    (0, 6, 6, 6, 6): 1,
-    (0, 6, 6, 6, 7): 2,
-    (0, 6, 6, 6, 8): 2,
-    (0, 6, 6, 6, 9): 2,
-    (0, 6, 6, 6, 10): 1,
-    (0, 6, 6, 6, 11): 1,
-    (0, 6, 6, 6, 12): 3,
-    (0, 6, 6, 6, 13): 2,
-    (0, 6, 6, 7, 7): 3,
-    (0, 6, 6, 7, 8): 3,
-    (0, 6, 6, 7, 9): 1,
-    (0, 6, 6, 7, 10): 1,
-    (0, 6, 6, 7, 11): 1,
-    (0, 6, 6, 7, 12): 2,
-    (0, 6, 6, 7, 13): 4,
-    (0, 6, 6, 8, 8): 2,
-    (0, 6, 6, 8, 9): 4,
-    (0, 6, 6, 8, 10): 1,
-    (0, 6, 6, 8, 11): 1,
-    (0, 6, 6, 8, 12): 3,
-    (0, 6, 6, 8, 13): 2,
-    (0, 6, 6, 9, 9): 1,
-    (0, 6, 6, 9, 10): 2,
-    (0, 6, 6, 9, 12): 2,
-    (0, 6, 6, 9, 13): 1,
-    (0, 6, 6, 10, 10): 1,
-    (0, 6, 6, 10, 11): 1,
-    (0, 6, 6, 10, 12): 2,
-    (0, 6, 6, 10, 13): 1,
-    (0, 6, 6, 11, 11): 1,
-    (0, 6, 6, 11, 12): 2,
-    (0, 6, 6, 11, 13): 1,
-    (0, 6, 6, 12, 12): 1,
-    (0, 6, 6, 12, 13): 3,
-    (0, 6, 6, 13, 13): 2,
-    (0, 6, 7, 7, 7): 2,
-    (0, 6, 7, 7, 8): 2,
-    (0, 6, 7, 7, 9): 2,
-    (0, 6, 7, 7, 10): 1,
-    (0, 6, 7, 7, 11): 2,
-    (0, 6, 7, 7, 12): 2,
-    (0, 6, 7, 7, 13): 4,
-    (0, 6, 7, 8, 8): 2,
-    (0, 6, 7, 8, 9): 1,
-    (0, 6, 7, 8, 10): 2,
-    (0, 6, 7, 8, 11): 1,
-    (0, 6, 7, 8, 12): 4,
-    (0, 6, 7, 8, 13): 3,
-    (0, 6, 7, 9, 9): 1,
-    (0, 6, 7, 9, 10): 1,
-    (0, 6, 7, 9, 11): 2,
-    (0, 6, 7, 9, 12): 3,
-    (0, 6, 7, 9, 13): 1,
-    (0, 6, 7, 10, 10): 1,
-    (0, 6, 7, 10, 11): 2,
-    (0, 6, 7, 10, 12): 3,
-    (0, 6, 7, 10, 13): 1,
-    (0, 6, 7, 11, 11): 1,
-    (0, 6, 7, 11, 12): 3,
-    (0, 6, 7, 11, 13): 1,
-    (0, 6, 7, 12, 12): 3,
-    (0, 6, 7, 12, 13): 2,
-    (0, 6, 7, 13, 13): 2,
-    (0, 6, 8, 8, 8): 1,
-    (0, 6, 8, 8, 9): 1,
-    (0, 6, 8, 8, 11): 1,
-    (0, 6, 8, 8, 13): 1,
-    (0, 6, 8, 9, 9): 1,
-    (0, 6, 8, 9, 10): 2,
-    (0, 6, 8, 9, 12): 6,
-    (0, 6, 8, 10, 10): 3,
-    (0, 6, 8, 10, 11): 3,
-    (0, 6, 8, 10, 13): 1,
-    (0, 6, 8, 11, 11): 1,
-    (0, 6, 8, 11, 12): 2,
-    (0, 6, 8, 12, 12): 2,
-    (0, 6, 8, 12, 13): 3,
-    (0, 6, 8, 13, 13): 1,
-    (0, 6, 9, 9, 10): 1,
-    (0, 6, 9, 9, 11): 2,
-    (0, 6, 9, 9, 12): 1,
-    (0, 6, 9, 9, 13): 1,
-    (0, 6, 9, 10, 12): 3,
-    (0, 6, 9, 11, 12): 2,
-    (0, 6, 9, 11, 13): 1,
-    (0, 6, 9, 12, 12): 4,
-    (0, 6, 9, 12, 13): 2,
-    (0, 6, 10, 10, 13): 2,
-    (0, 6, 10, 11, 12): 1,
-    (0, 6, 10, 12, 13): 2,
-    (0, 6, 10, 13, 13): 1,
-    (0, 6, 11, 11, 13): 2,
-    (0, 6, 11, 12, 12): 1,
-    (0, 6, 11, 12, 13): 1,
-    (0, 6, 12, 12, 12): 1,
-    (0, 7, 7, 7, 7): 1,
-    (0, 7, 7, 7, 8): 3,
-    (0, 7, 7, 7, 9): 1,
-    (0, 7, 7, 7, 10): 2,
-    (0, 7, 7, 7, 11): 1,
-    (0, 7, 7, 7, 12): 2,
-    (0, 7, 7, 7, 13): 2,
-    (0, 7, 7, 8, 8): 1,
-    (0, 7, 7, 8, 9): 1,
-    (0, 7, 7, 8, 11): 1,
-    (0, 7, 7, 8, 13): 2,
-    (0, 7, 7, 9, 9): 1,
-    (0, 7, 7, 9, 10): 1,
-    (0, 7, 7, 9, 12): 2,
-    (0, 7, 7, 9, 13): 1,
-    (0, 7, 7, 10, 10): 1,
-    (0, 7, 7, 10, 11): 1,
-    (0, 7, 7, 10, 13): 2,
-    (0, 7, 7, 11, 11): 1,
-    (0, 7, 7, 11, 12): 1,
-    (0, 7, 7, 11, 13): 1,
-    (0, 7, 7, 12, 12): 1,
-    (0, 7, 7, 12, 13): 2,
-    (0, 7, 7, 13, 13): 2,
-    (0, 7, 8, 8, 10): 1,
-    (0, 7, 8, 9, 11): 1,
-    (0, 7, 8, 9, 12): 1,
-    (0, 7, 8, 9, 13): 2,
-    (0, 7, 8, 10, 11): 1,
-    (0, 7, 8, 10, 12): 3,
-    (0, 7, 8, 11, 13): 1,
-    (0, 7, 9, 9, 12): 3,
-    (0, 7, 9, 10, 11): 3,
-    (0, 7, 9, 10, 13): 1,
-    (0, 7, 9, 11, 12): 1,
-    (0, 7, 9, 12, 13): 1,
-    (0, 7, 9, 13, 13): 1,
-    (0, 7, 10, 10, 12): 1,
-    (0, 7, 10, 11, 13): 1,
-    (0, 7, 10, 12, 12): 1,
-    (0, 7, 10, 12, 13): 1,
-    (0, 7, 11, 11, 13): 1,
-    (0, 7, 11, 12, 12): 1,
-    (0, 7, 11, 12, 13): 2,
-    (0, 8, 8, 9, 13): 1,
-    (0, 8, 8, 10, 12): 2,
-    (0, 8, 8, 10, 13): 2,
-    (0, 8, 8, 11, 11): 1,
-    (0, 8, 8, 13, 13): 1,
-    (0, 8, 9, 10, 12): 1,
-    (0, 8, 9, 10, 13): 1,
-    (0, 8, 9, 11, 11): 1,
-    (0, 8, 9, 11, 13): 1,
-    (0, 8, 9, 12, 13): 1,
-    (0, 8, 10, 10, 11): 1,
-    (0, 8, 10, 11, 12): 1,
-    (0, 8, 10, 11, 13): 2,
-    (0, 8, 10, 12, 12): 1,
-    (0, 8, 10, 12, 13): 2,
-    (0, 8, 11, 11, 12): 1,
-    (0, 8, 11, 13, 13): 2,
-    (0, 9, 9, 11, 12): 2,
-    (0, 9, 9, 11, 13): 1,
-    (0, 9, 9, 12, 12): 1,
-    (0, 9, 10, 10, 13): 1,
-    (0, 9, 10, 11, 11): 1,
-    (0, 9, 10, 11, 12): 2,
-    (0, 9, 10, 11, 13): 1,
-    (0, 9, 10, 12, 12): 2,
-    (0, 9, 10, 13, 13): 1,
-    (0, 9, 11, 11, 11): 1,
-    (0, 9, 11, 12, 13): 1,
-    (0, 10, 10, 10, 12): 1,
-    (0, 10, 10, 11, 11): 1,
-    (0, 10, 10, 11, 12): 1,
-    (0, 10, 10, 12, 13): 1,
-    (0, 10, 11, 11, 13): 1,
-    (1, 1, 1, 1, 13): 1,
-    (1, 1, 1, 2, 7): 2,
-    (1, 1, 1, 2, 10): 2,
-    (1, 1, 1, 2, 11): 2,
-    (1, 1, 1, 2, 12): 2,
-    (1, 1, 1, 2, 13): 1,
-    (1, 1, 1, 3, 6): 2,
-    (1, 1, 1, 3, 7): 2,
-    (1, 1, 1, 3, 8): 1,
-    (1, 1, 1, 3, 10): 1,
-    (1, 1, 1, 3, 11): 3,
-    (1, 1, 1, 3, 12): 2,
-    (1, 1, 1, 3, 13): 3,
-    (1, 1, 1, 4, 5): 1,
-    (1, 1, 1, 4, 6): 3,
-    (1, 1, 1, 4, 7): 2,
-    (1, 1, 1, 4, 8): 2,
-    (1, 1, 1, 4, 9): 1,
-    (1, 1, 1, 4, 10): 4,
-    (1, 1, 1, 4, 11): 3,
-    (1, 1, 1, 4, 12): 3,
-    (1, 1, 1, 4, 13): 1,
-    (1, 1, 1, 5, 5): 1,
-    (1, 1, 1, 5, 6): 2,
-    (1, 1, 1, 5, 7): 3,
-    (1, 1, 1, 5, 8): 2,
-    (1, 1, 1, 5, 9): 4,
-    (1, 1, 1, 5, 10): 1,
-    (1, 1, 1, 5, 11): 1,
-    (1, 1, 1, 5, 12): 1,
-    (1, 1, 1, 5, 13): 1,
-    (1, 1, 1, 6, 6): 1,
-    (1, 1, 1, 6, 7): 3,
-    (1, 1, 1, 6, 8): 4,
-    (1, 1, 1, 6, 9): 1,
-    (1, 1, 1, 6, 10): 1,
-    (1, 1, 1, 6, 12): 3,
-    (1, 1, 1, 6, 13): 1,
-    (1, 1, 1, 7, 7): 2,
-    (1, 1, 1, 7, 8): 2,
-    (1, 1, 1, 7, 9): 2,
-    (1, 1, 1, 7, 10): 1,
-    (1, 1, 1, 7, 11): 1,
-    (1, 1, 1, 7, 12): 1,
-    (1, 1, 1, 7, 13): 2,
-    (1, 1, 1, 8, 8): 1,
-    (1, 1, 1, 8, 12): 2,
-    (1, 1, 1, 8, 13): 1,
-    (1, 1, 1, 9, 11): 2,
-    (1, 1, 1, 9, 12): 2,
-    (1, 1, 1, 9, 13): 1,
-    (1, 1, 1, 10, 10): 1,
-    (1, 1, 1, 10, 11): 1,
-    (1, 1, 1, 10, 12): 2,
-    (1, 1, 1, 11, 11): 1,
-    (1, 1, 2, 2, 6): 2,
-    (1, 1, 2, 2, 7): 4,
-    (1, 1, 2, 2, 8): 1,
-    (1, 1, 2, 2, 9): 1,
-    (1, 1, 2, 2, 10): 6,
-    (1, 1, 2, 2, 11): 7,
-    (1, 1, 2, 2, 12): 3,
-    (1, 1, 2, 2, 13): 4,
-    (1, 1, 2, 3, 5): 6,
-    (1, 1, 2, 3, 6): 8,
-    (1, 1, 2, 3, 7): 6,
-    (1, 1, 2, 3, 8): 6,
-    (1, 1, 2, 3, 9): 5,
-    (1, 1, 2, 3, 10): 8,
-    (1, 1, 2, 3, 11): 8,
-    (1, 1, 2, 3, 12): 11,
-    (1, 1, 2, 3, 13): 5,
-    (1, 1, 2, 4, 4): 1,
-    (1, 1, 2, 4, 5): 7,
-    (1, 1, 2, 4, 6): 6,
-    (1, 1, 2, 4, 7): 8,
-    (1, 1, 2, 4, 8): 5,
-    (1, 1, 2, 4, 9): 9,
-    (1, 1, 2, 4, 10): 5,
-    (1, 1, 2, 4, 11): 7,
-    (1, 1, 2, 4, 12): 8,
-    (1, 1, 2, 4, 13): 10,
-    (1, 1, 2, 5, 5): 2,
-    (1, 1, 2, 5, 6): 6,
-    (1, 1, 2, 5, 7): 5,
-    (1, 1, 2, 5, 8): 9,
-    (1, 1, 2, 5, 9): 6,
-    (1, 1, 2, 5, 10): 8,
-    (1, 1, 2, 5, 11): 6,
-    (1, 1, 2, 5, 12): 9,
-    (1, 1, 2, 5, 13): 5,
-    (1, 1, 2, 6, 6): 1,
-    (1, 1, 2, 6, 7): 6,
-    (1, 1, 2, 6, 8): 4,
-    (1, 1, 2, 6, 9): 9,
-    (1, 1, 2, 6, 10): 6,
-    (1, 1, 2, 6, 11): 7,
-    (1, 1, 2, 6, 12): 8,
-    (1, 1, 2, 6, 13): 7,
-    (1, 1, 2, 7, 7): 3,
-    (1, 1, 2, 7, 8): 8,
-    (1, 1, 2, 7, 9): 4,
-    (1, 1, 2, 7, 10): 6,
-    (1, 1, 2, 7, 11): 2,
-    (1, 1, 2, 7, 12): 7,
-    (1, 1, 2, 7, 13): 6,
-    (1, 1, 2, 8, 8): 1,
-    (1, 1, 2, 8, 9): 3,
-    (1, 1, 2, 8, 10): 5,
-    (1, 1, 2, 8, 11): 6,
-    (1, 1, 2, 8, 12): 5,
-    (1, 1, 2, 8, 13): 6,
-    (1, 1, 2, 9, 9): 1,
-    (1, 1, 2, 9, 10): 3,
-    (1, 1, 2, 9, 11): 6,
-    (1, 1, 2, 9, 12): 9,
-    (1, 1, 2, 9, 13): 5,
-    (1, 1, 2, 10, 10): 3,
-    (1, 1, 2, 10, 11): 6,
-    (1, 1, 2, 10, 12): 5,
-    (1, 1, 2, 10, 13): 5,
-    (1, 1, 2, 11, 11): 3,
-    (1, 1, 2, 11, 12): 5,
-    (1, 1, 2, 12, 13): 2,
-    (1, 1, 2, 13, 13): 1,
-    (1, 1, 3, 3, 4): 3,
-    (1, 1, 3, 3, 5): 3,
-    (1, 1, 3, 3, 6): 6,
-    (1, 1, 3, 3, 7): 3,
-    (1, 1, 3, 3, 8): 3,
-    (1, 1, 3, 3, 9): 3,
-    (1, 1, 3, 3, 10): 3,
-    (1, 1, 3, 3, 11): 3,
-    (1, 1, 3, 3, 12): 4,
-    (1, 1, 3, 3, 13): 2,
-    (1, 1, 3, 4, 4): 2,
-    (1, 1, 3, 4, 5): 5,
-    (1, 1, 3, 4, 6): 5,
-    (1, 1, 3, 4, 7): 7,
-    (1, 1, 3, 4, 8): 6,
-    (1, 1, 3, 4, 9): 9,
-    (1, 1, 3, 4, 10): 7,
-    (1, 1, 3, 4, 11): 6,
-    (1, 1, 3, 4, 12): 12,
-    (1, 1, 3, 4, 13): 4,
-    (1, 1, 3, 5, 5): 2,
-    (1, 1, 3, 5, 6): 3,
-    (1, 1, 3, 5, 7): 5,
-    (1, 1, 3, 5, 8): 5,
-    (1, 1, 3, 5, 9): 7,
-    (1, 1, 3, 5, 10): 6,
-    (1, 1, 3, 5, 11): 7,
-    (1, 1, 3, 5, 12): 6,
-    (1, 1, 3, 5, 13): 5,
-    (1, 1, 3, 6, 6): 4,
-    (1, 1, 3, 6, 7): 6,
-    (1, 1, 3, 6, 8): 9,
-    (1, 1, 3, 6, 9): 7,
-    (1, 1, 3, 6, 10): 8,
-    (1, 1, 3, 6, 11): 5,
-    (1, 1, 3, 6, 12): 10,
-    (1, 1, 3, 6, 13): 9,
-    (1, 1, 3, 7, 7): 3,
-    (1, 1, 3, 7, 8): 4,
-    (1, 1, 3, 7, 9): 8,
-    (1, 1, 3, 7, 10): 5,
-    (1, 1, 3, 7, 11): 7,
-    (1, 1, 3, 7, 12): 6,
-    (1, 1, 3, 7, 13): 5,
-    (1, 1, 3, 8, 8): 3,
-    (1, 1, 3, 8, 9): 4,
-    (1, 1, 3, 8, 10): 7,
-    (1, 1, 3, 8, 11): 4,
-    (1, 1, 3, 8, 12): 6,
-    (1, 1, 3, 8, 13): 2,
-    (1, 1, 3, 9, 9): 4,
-    (1, 1, 3, 9, 10): 6,
-    (1, 1, 3, 9, 11): 4,
-    (1, 1, 3, 9, 12): 7,
-    (1, 1, 3, 9, 13): 6,
-    (1, 1, 3, 10, 10): 3,
-    (1, 1, 3, 10, 11): 4,
-    (1, 1, 3, 10, 12): 8,
-    (1, 1, 3, 10, 13): 5,
-    (1, 1, 3, 11, 11): 3,
-    (1, 1, 3, 11, 12): 3,
-    (1, 1, 3, 11, 13): 4,
-    (1, 1, 3, 12, 12): 4,
-    (1, 1, 3, 12, 13): 4,
-    (1, 1, 3, 13, 13): 3,
-    (1, 1, 4, 4, 5): 3,
-    (1, 1, 4, 4, 6): 2,
-    (1, 1, 4, 4, 7): 4,
-    (1, 1, 4, 4, 8): 1,
-    (1, 1, 4, 4, 9): 3,
-    (1, 1, 4, 4, 10): 6,
-    (1, 1, 4, 4, 11): 5,
-    (1, 1, 4, 4, 12): 2,
-    (1, 1, 4, 4, 13): 4,
-    (1, 1, 4, 5, 5): 2,
-    (1, 1, 4, 5, 6): 3,
-    (1, 1, 4, 5, 7): 2,
-    (1, 1, 4, 5, 8): 8,
-    (1, 1, 4, 5, 9): 6,
-    (1, 1, 4, 5, 10): 8,
-    (1, 1, 4, 5, 11): 5,
-    (1, 1, 4, 5, 12): 8,
-    (1, 1, 4, 5, 13): 3,
-    (1, 1, 4, 6, 6): 4,
-    (1, 1, 4, 6, 7): 6,
-    (1, 1, 4, 6, 8): 5,
-    (1, 1, 4, 6, 9): 9,
-    (1, 1, 4, 6, 10): 7,
-    (1, 1, 4, 6, 11): 7,
-    (1, 1, 4, 6, 12): 5,
-    (1, 1, 4, 6, 13): 9,
-    (1, 1, 4, 7, 7): 4,
-    (1, 1, 4, 7, 8): 8,
-    (1, 1, 4, 7, 9): 4,
-    (1, 1, 4, 7, 10): 6,
-    (1, 1, 4, 7, 11): 4,
-    (1, 1, 4, 7, 12): 13,
-    (1, 1, 4, 7, 13): 3,
-    (1, 1, 4, 8, 8): 1,
-    (1, 1, 4, 8, 9): 6,
-    (1, 1, 4, 8, 10): 5,
-    (1, 1, 4, 8, 11): 9,
-    (1, 1, 4, 8, 12): 3,
-    (1, 1, 4, 8, 13): 8,
-    (1, 1, 4, 9, 9): 1,
-    (1, 1, 4, 9, 10): 5,
-    (1, 1, 4, 9, 11): 3,
-    (1, 1, 4, 9, 12): 8,
-    (1, 1, 4, 9, 13): 2,
-    (1, 1, 4, 10, 10): 2,
-    (1, 1, 4, 10, 11): 6,
-    (1, 1, 4, 10, 12): 4,
-    (1, 1, 4, 10, 13): 5,
-    (1, 1, 4, 11, 11): 1,
-    (1, 1, 4, 11, 12): 7,
-    (1, 1, 4, 11, 13): 3,
-    (1, 1, 4, 12, 12): 2,
-    (1, 1, 4, 12, 13): 6,
-    (1, 1, 4, 13, 13): 2,
-    (1, 1, 5, 5, 6): 2,
-    (1, 1, 5, 5, 7): 3,
-    (1, 1, 5, 5, 8): 4,
-    (1, 1, 5, 5, 9): 3,
-    (1, 1, 5, 5, 10): 1,
-    (1, 1, 5, 5, 11): 4,
-    (1, 1, 5, 5, 12): 3,
-    (1, 1, 5, 5, 13): 3,
-    (1, 1, 5, 6, 6): 5,
-    (1, 1, 5, 6, 7): 12,
-    (1, 1, 5, 6, 8): 7,
-    (1, 1, 5, 6, 9): 7,
-    (1, 1, 5, 6, 10): 6,
-    (1, 1, 5, 6, 11): 4,
-    (1, 1, 5, 6, 12): 10,
-    (1, 1, 5, 6, 13): 5,
-    (1, 1, 5, 7, 7): 6,
-    (1, 1, 5, 7, 8): 6,
-    (1, 1, 5, 7, 9): 6,
-    (1, 1, 5, 7, 10): 3,
-    (1, 1, 5, 7, 11): 5,
-    (1, 1, 5, 7, 12): 5,
-    (1, 1, 5, 7, 13): 8,
-    (1, 1, 5, 8, 8): 4,
-    (1, 1, 5, 8, 9): 2,
-    (1, 1, 5, 8, 10): 4,
-    (1, 1, 5, 8, 11): 3,
-    (1, 1, 5, 8, 12): 8,
-    (1, 1, 5, 8, 13): 1,
-    (1, 1, 5, 9, 9): 1,
-    (1, 1, 5, 9, 10): 3,
-    (1, 1, 5, 9, 11): 5,
-    (1, 1, 5, 9, 12): 2,
-    (1, 1, 5, 9, 13): 4,
-    (1, 1, 5, 10, 10): 1,
-    (1, 1, 5, 10, 11): 2,
-    (1, 1, 5, 10, 12): 6,
-    (1, 1, 5, 10, 13): 3,
-    (1, 1, 5, 11, 11): 1,
-    (1, 1, 5, 11, 12): 1,
-    (1, 1, 5, 11, 13): 3,
-    (1, 1, 5, 12, 12): 3,
-    (1, 1, 5, 12, 13): 3,
-    (1, 1, 5, 13, 13): 3,
-    (1, 1, 6, 6, 6): 1,
-    (1, 1, 6, 6, 7): 8,
-    (1, 1, 6, 6, 8): 5,
-    (1, 1, 6, 6, 9): 3,
-    (1, 1, 6, 6, 10): 2,
-    (1, 1, 6, 6, 11): 3,
-    (1, 1, 6, 6, 12): 7,
-    (1, 1, 6, 6, 13): 4,
-    (1, 1, 6, 7, 7): 8,
-    (1, 1, 6, 7, 8): 13,
-    (1, 1, 6, 7, 9): 6,
-    (1, 1, 6, 7, 10): 3,
-    (1, 1, 6, 7, 11): 4,
-    (1, 1, 6, 7, 12): 9,
-    (1, 1, 6, 7, 13): 8,
-    (1, 1, 6, 8, 8): 3,
-    (1, 1, 6, 8, 9): 3,
-    (1, 1, 6, 8, 10): 3,
-    (1, 1, 6, 8, 11): 6,
-    (1, 1, 6, 8, 12): 4,
-    (1, 1, 6, 8, 13): 8,
-    (1, 1, 6, 9, 9): 1,
-    (1, 1, 6, 9, 10): 4,
-    (1, 1, 6, 9, 11): 3,
-    (1, 1, 6, 9, 12): 6,
-    (1, 1, 6, 9, 13): 3,
-    (1, 1, 6, 10, 10): 2,
-    (1, 1, 6, 10, 11): 2,
-    (1, 1, 6, 10, 12): 4,
-    (1, 1, 6, 10, 13): 6,
-    (1, 1, 6, 11, 12): 3,
-    (1, 1, 6, 11, 13): 2,
-    (1, 1, 6, 12, 12): 3,
-    (1, 1, 6, 12, 13): 5,
-    (1, 1, 7, 7, 7): 2,
-    (1, 1, 7, 7, 8): 5,
-    (1, 1, 7, 7, 9): 2,
-    (1, 1, 7, 7, 10): 2,
-    (1, 1, 7, 7, 11): 2,
-    (1, 1, 7, 7, 12): 2,
-    (1, 1, 7, 7, 13): 4,
-    (1, 1, 7, 8, 8): 2,
-    (1, 1, 7, 8, 10): 4,
-    (1, 1, 7, 8, 11): 1,
-    (1, 1, 7, 8, 12): 7,
-    (1, 1, 7, 8, 13): 3,
-    (1, 1, 7, 9, 10): 1,
-    (1, 1, 7, 9, 11): 2,
-    (1, 1, 7, 9, 12): 5,
-    (1, 1, 7, 9, 13): 7,
-    (1, 1, 7, 10, 11): 3,
-    (1, 1, 7, 10, 12): 4,
-    (1, 1, 7, 10, 13): 3,
-    (1, 1, 7, 11, 11): 1,
-    (1, 1, 7, 11, 12): 2,
-    (1, 1, 7, 11, 13): 3,
-    (1, 1, 7, 12, 12): 2,
-    (1, 1, 7, 12, 13): 1,
-    (1, 1, 8, 8, 9): 1,
-    (1, 1, 8, 8, 10): 2,
-    (1, 1, 8, 8, 11): 1,
-    (1, 1, 8, 8, 13): 4,
-    (1, 1, 8, 9, 12): 4,
-    (1, 1, 8, 10, 10): 1,
-    (1, 1, 8, 10, 12): 3,
-    (1, 1, 8, 10, 13): 2,
-    (1, 1, 8, 11, 12): 3,
-    (1, 1, 8, 11, 13): 1,
-    (1, 1, 8, 12, 12): 2,
-    (1, 1, 8, 12, 13): 3,
-    (1, 1, 8, 13, 13): 1,
-    (1, 1, 9, 9, 12): 1,
-    (1, 1, 9, 10, 13): 2,
-    (1, 1, 9, 11, 11): 1,
-    (1, 1, 9, 11, 12): 1,
-    (1, 1, 9, 11, 13): 4,
-    (1, 1, 9, 12, 12): 3,
-    (1, 1, 9, 12, 13): 2,
-    (1, 1, 9, 13, 13): 1,
-    (1, 1, 10, 10, 11): 1,
-    (1, 1, 10, 10, 12): 1,
-    (1, 1, 10, 11, 11): 1,
-    (1, 1, 10, 11, 13): 1,
-    (1, 1, 10, 12, 13): 4,
-    (1, 1, 10, 13, 13): 2,
-    (1, 1, 11, 13, 13): 1,
-    (1, 2, 2, 2, 5): 3,
-    (1, 2, 2, 2, 6): 6,
-    (1, 2, 2, 2, 7): 4,
-    (1, 2, 2, 2, 8): 5,
-    (1, 2, 2, 2, 9): 4,
-    (1, 2, 2, 2, 10): 6,
-    (1, 2, 2, 2, 11): 4,
-    (1, 2, 2, 2, 12): 8,
-    (1, 2, 2, 2, 13): 2,
-    (1, 2, 2, 3, 3): 1,
-    (1, 2, 2, 3, 4): 7,
-    (1, 2, 2, 3, 5): 6,
-    (1, 2, 2, 3, 6): 9,
-    (1, 2, 2, 3, 7): 12,
-    (1, 2, 2, 3, 8): 12,
-    (1, 2, 2, 3, 9): 13,
-    (1, 2, 2, 3, 10): 10,
-    (1, 2, 2, 3, 11): 12,
-    (1, 2, 2, 3, 12): 13,
-    (1, 2, 2, 3, 13): 13,
-    (1, 2, 2, 4, 4): 4,
-    (1, 2, 2, 4, 5): 7,
-    (1, 2, 2, 4, 6): 12,
-    (1, 2, 2, 4, 7): 11,
-    (1, 2, 2, 4, 8): 10,
-    (1, 2, 2, 4, 9): 12,
-    (1, 2, 2, 4, 10): 16,
-    (1, 2, 2, 4, 11): 11,
-    (1, 2, 2, 4, 12): 19,
-    (1, 2, 2, 4, 13): 7,
-    (1, 2, 2, 5, 5): 4,
-    (1, 2, 2, 5, 6): 11,
-    (1, 2, 2, 5, 7): 8,
-    (1, 2, 2, 5, 8): 11,
-    (1, 2, 2, 5, 9): 12,
-    (1, 2, 2, 5, 10): 7,
-    (1, 2, 2, 5, 11): 9,
-    (1, 2, 2, 5, 12): 13,
-    (1, 2, 2, 5, 13): 8,
-    (1, 2, 2, 6, 6): 6,
-    (1, 2, 2, 6, 7): 7,
-    (1, 2, 2, 6, 8): 14,
-    (1, 2, 2, 6, 9): 9,
-    (1, 2, 2, 6, 10): 19,
-    (1, 2, 2, 6, 11): 12,
-    (1, 2, 2, 6, 12): 17,
-    (1, 2, 2, 6, 13): 11,
-    (1, 2, 2, 7, 7): 8,
-    (1, 2, 2, 7, 8): 9,
-    (1, 2, 2, 7, 9): 14,
-    (1, 2, 2, 7, 10): 9,
-    (1, 2, 2, 7, 11): 10,
-    (1, 2, 2, 7, 12): 11,
-    (1, 2, 2, 7, 13): 9,
-    (1, 2, 2, 8, 8): 6,
-    (1, 2, 2, 8, 9): 8,
-    (1, 2, 2, 8, 10): 14,
-    (1, 2, 2, 8, 11): 9,
-    (1, 2, 2, 8, 12): 12,
-    (1, 2, 2, 8, 13): 6,
-    (1, 2, 2, 9, 9): 5,
-    (1, 2, 2, 9, 10): 9,
-    (1, 2, 2, 9, 11): 6,
-    (1, 2, 2, 9, 12): 7,
-    (1, 2, 2, 9, 13): 7,
-    (1, 2, 2, 10, 10): 5,
-    (1, 2, 2, 10, 11): 4,
-    (1, 2, 2, 10, 12): 12,
-    (1, 2, 2, 10, 13): 6,
-    (1, 2, 2, 11, 11): 5,
-    (1, 2, 2, 11, 12): 6,
-    (1, 2, 2, 11, 13): 7,
-    (1, 2, 2, 12, 12): 6,
-    (1, 2, 2, 12, 13): 8,
-    (1, 2, 2, 13, 13): 4,
-    (1, 2, 3, 3, 3): 4,
-    (1, 2, 3, 3, 4): 9,
-    (1, 2, 3, 3, 5): 13,
-    (1, 2, 3, 3, 6): 11,
-    (1, 2, 3, 3, 7): 10,
-    (1, 2, 3, 3, 8): 13,
-    (1, 2, 3, 3, 9): 19,
-    (1, 2, 3, 3, 10): 10,
-    (1, 2, 3, 3, 11): 6,
-    (1, 2, 3, 3, 12): 19,
-    (1, 2, 3, 3, 13): 6,
-    (1, 2, 3, 4, 4): 9,
-    (1, 2, 3, 4, 5): 14,
-    (1, 2, 3, 4, 6): 19,
-    (1, 2, 3, 4, 7): 21,
-    (1, 2, 3, 4, 8): 22,
-    (1, 2, 3, 4, 9): 23,
-    (1, 2, 3, 4, 10): 24,
-    (1, 2, 3, 4, 11): 26,
-    (1, 2, 3, 4, 12): 23,
-    (1, 2, 3, 4, 13): 26,
-    (1, 2, 3, 5, 5): 9,
-    (1, 2, 3, 5, 6): 21,
-    (1, 2, 3, 5, 7): 19,
-    (1, 2, 3, 5, 8): 18,
-    (1, 2, 3, 5, 9): 17,
-    (1, 2, 3, 5, 10): 18,
-    (1, 2, 3, 5, 11): 18,
-    (1, 2, 3, 5, 12): 26,
-    (1, 2, 3, 5, 13): 18,
-    (1, 2, 3, 6, 6): 15,
-    (1, 2, 3, 6, 7): 28,
-    (1, 2, 3, 6, 8): 15,
-    (1, 2, 3, 6, 9): 26,
-    (1, 2, 3, 6, 10): 16,
-    (1, 2, 3, 6, 11): 25,
-    (1, 2, 3, 6, 12): 35,
-    (1, 2, 3, 6, 13): 21,
-    (1, 2, 3, 7, 7): 11,
-    (1, 2, 3, 7, 8): 21,
-    (1, 2, 3, 7, 9): 14,
-    (1, 2, 3, 7, 10): 25,
-    (1, 2, 3, 7, 11): 16,
-    (1, 2, 3, 7, 12): 26,
-    (1, 2, 3, 7, 13): 16,
-    (1, 2, 3, 8, 8): 7,
-    (1, 2, 3, 8, 9): 24,
-    (1, 2, 3, 8, 10): 20,
-    (1, 2, 3, 8, 11): 18,
-    (1, 2, 3, 8, 12): 15,
-    (1, 2, 3, 8, 13): 16,
-    (1, 2, 3, 9, 9): 14,
-    (1, 2, 3, 9, 10): 21,
-    (1, 2, 3, 9, 11): 15,
-    (1, 2, 3, 9, 12): 23,
-    (1, 2, 3, 9, 13): 16,
-    (1, 2, 3, 10, 10): 8,
-    (1, 2, 3, 10, 11): 14,
-    (1, 2, 3, 10, 12): 16,
-    (1, 2, 3, 10, 13): 13,
-    (1, 2, 3, 11, 11): 8,
-    (1, 2, 3, 11, 12): 21,
-    (1, 2, 3, 11, 13): 11,
-    (1, 2, 3, 12, 12): 15,
-    (1, 2, 3, 12, 13): 18,
-    (1, 2, 3, 13, 13): 5,
-    (1, 2, 4, 4, 4): 4,
-    (1, 2, 4, 4, 5): 9,
-    (1, 2, 4, 4, 6): 18,
-    (1, 2, 4, 4, 7): 9,
-    (1, 2, 4, 4, 8): 12,
-    (1, 2, 4, 4, 9): 10,
-    (1, 2, 4, 4, 10): 12,
-    (1, 2, 4, 4, 11): 11,
-    (1, 2, 4, 4, 12): 19,
-    (1, 2, 4, 4, 13): 9,
-    (1, 2, 4, 5, 5): 11,
-    (1, 2, 4, 5, 6): 22,
-    (1, 2, 4, 5, 7): 24,
-    (1, 2, 4, 5, 8): 15,
-    (1, 2, 4, 5, 9): 18,
-    (1, 2, 4, 5, 10): 20,
-    (1, 2, 4, 5, 11): 23,
-    (1, 2, 4, 5, 12): 20,
-    (1, 2, 4, 5, 13): 21,
-    (1, 2, 4, 6, 6): 13,
-    (1, 2, 4, 6, 7): 33,
-    (1, 2, 4, 6, 8): 25,
-    (1, 2, 4, 6, 9): 17,
-    (1, 2, 4, 6, 10): 26,
-    (1, 2, 4, 6, 11): 16,
-    (1, 2, 4, 6, 12): 30,
-    (1, 2, 4, 6, 13): 16,
-    (1, 2, 4, 7, 7): 14,
-    (1, 2, 4, 7, 8): 19,
-    (1, 2, 4, 7, 9): 18,
-    (1, 2, 4, 7, 10): 13,
-    (1, 2, 4, 7, 11): 15,
-    (1, 2, 4, 7, 12): 19,
-    (1, 2, 4, 7, 13): 22,
-    (1, 2, 4, 8, 8): 10,
-    (1, 2, 4, 8, 9): 12,
-    (1, 2, 4, 8, 10): 22,
-    (1, 2, 4, 8, 11): 16,
-    (1, 2, 4, 8, 12): 31,
-    (1, 2, 4, 8, 13): 10,
-    (1, 2, 4, 9, 9): 9,
-    (1, 2, 4, 9, 10): 16,
-    (1, 2, 4, 9, 11): 14,
-    (1, 2, 4, 9, 12): 15,
-    (1, 2, 4, 9, 13): 14,
-    (1, 2, 4, 10, 10): 8,
-    (1, 2, 4, 10, 11): 15,
-    (1, 2, 4, 10, 12): 18,
-    (1, 2, 4, 10, 13): 9,
-    (1, 2, 4, 11, 11): 7,
-    (1, 2, 4, 11, 12): 17,
-    (1, 2, 4, 11, 13): 11,
-    (1, 2, 4, 12, 12): 14,
-    (1, 2, 4, 12, 13): 17,
-    (1, 2, 4, 13, 13): 5,
-    (1, 2, 5, 5, 5): 2,
-    (1, 2, 5, 5, 6): 12,
-    (1, 2, 5, 5, 7): 6,
-    (1, 2, 5, 5, 8): 9,
-    (1, 2, 5, 5, 9): 11,
-    (1, 2, 5, 5, 10): 9,
-    (1, 2, 5, 5, 11): 5,
-    (1, 2, 5, 5, 12): 10,
-    (1, 2, 5, 5, 13): 6,
-    (1, 2, 5, 6, 6): 10,
-    (1, 2, 5, 6, 7): 25,
-    (1, 2, 5, 6, 8): 23,
-    (1, 2, 5, 6, 9): 26,
-    (1, 2, 5, 6, 10): 17,
-    (1, 2, 5, 6, 11): 14,
-    (1, 2, 5, 6, 12): 15,
-    (1, 2, 5, 6, 13): 16,
-    (1, 2, 5, 7, 7): 9,
-    (1, 2, 5, 7, 8): 18,
-    (1, 2, 5, 7, 9): 15,
-    (1, 2, 5, 7, 10): 18,
-    (1, 2, 5, 7, 11): 8,
-    (1, 2, 5, 7, 12): 22,
-    (1, 2, 5, 7, 13): 11,
-    (1, 2, 5, 8, 8): 5,
-    (1, 2, 5, 8, 9): 16,
-    (1, 2, 5, 8, 10): 9,
-    (1, 2, 5, 8, 11): 14,
-    (1, 2, 5, 8, 12): 13,
-    (1, 2, 5, 8, 13): 18,
-    (1, 2, 5, 9, 9): 6,
-    (1, 2, 5, 9, 10): 15,
-    (1, 2, 5, 9, 11): 11,
-    (1, 2, 5, 9, 12): 21,
-    (1, 2, 5, 9, 13): 8,
-    (1, 2, 5, 10, 10): 7,
-    (1, 2, 5, 10, 11): 16,
-    (1, 2, 5, 10, 12): 14,
-    (1, 2, 5, 10, 13): 11,
-    (1, 2, 5, 11, 11): 4,
-    (1, 2, 5, 11, 12): 14,
-    (1, 2, 5, 11, 13): 6,
-    (1, 2, 5, 12, 12): 7,
-    (1, 2, 5, 12, 13): 13,
-    (1, 2, 5, 13, 13): 5,
-    (1, 2, 6, 6, 6): 4,
-    (1, 2, 6, 6, 7): 13,
-    (1, 2, 6, 6, 8): 7,
-    (1, 2, 6, 6, 9): 17,
-    (1, 2, 6, 6, 10): 14,
-    (1, 2, 6, 6, 11): 9,
-    (1, 2, 6, 6, 12): 13,
-    (1, 2, 6, 6, 13): 10,
-    (1, 2, 6, 7, 7): 15,
-    (1, 2, 6, 7, 8): 28,
-    (1, 2, 6, 7, 9): 24,
-    (1, 2, 6, 7, 10): 16,
-    (1, 2, 6, 7, 11): 15,
-    (1, 2, 6, 7, 12): 27,
-    (1, 2, 6, 7, 13): 18,
-    (1, 2, 6, 8, 8): 9,
-    (1, 2, 6, 8, 9): 14,
-    (1, 2, 6, 8, 10): 22,
-    (1, 2, 6, 8, 11): 18,
-    (1, 2, 6, 8, 12): 24,
-    (1, 2, 6, 8, 13): 11,
-    (1, 2, 6, 9, 9): 11,
-    (1, 2, 6, 9, 10): 14,
-    (1, 2, 6, 9, 11): 18,
-    (1, 2, 6, 9, 12): 20,
-    (1, 2, 6, 9, 13): 18,
-    (1, 2, 6, 10, 10): 9,
-    (1, 2, 6, 10, 11): 14,
-    (1, 2, 6, 10, 12): 21,
-    (1, 2, 6, 10, 13): 12,
-    (1, 2, 6, 11, 11): 4,
-    (1, 2, 6, 11, 12): 14,
-    (1, 2, 6, 11, 13): 12,
-    (1, 2, 6, 12, 12): 19,
-    (1, 2, 6, 12, 13): 11,
-    (1, 2, 6, 13, 13): 5,
-    (1, 2, 7, 7, 7): 4,
-    (1, 2, 7, 7, 8): 9,
-    (1, 2, 7, 7, 9): 9,
-    (1, 2, 7, 7, 10): 10,
-    (1, 2, 7, 7, 11): 8,
-    (1, 2, 7, 7, 12): 12,
-    (1, 2, 7, 7, 13): 10,
-    (1, 2, 7, 8, 8): 8,
-    (1, 2, 7, 8, 9): 11,
-    (1, 2, 7, 8, 10): 15,
-    (1, 2, 7, 8, 11): 15,
-    (1, 2, 7, 8, 12): 15,
-    (1, 2, 7, 8, 13): 16,
-    (1, 2, 7, 9, 9): 4,
-    (1, 2, 7, 9, 10): 17,
-    (1, 2, 7, 9, 11): 15,
-    (1, 2, 7, 9, 12): 18,
-    (1, 2, 7, 9, 13): 6,
-    (1, 2, 7, 10, 10): 5,
-    (1, 2, 7, 10, 11): 8,
-    (1, 2, 7, 10, 12): 15,
-    (1, 2, 7, 10, 13): 17,
-    (1, 2, 7, 11, 11): 5,
-    (1, 2, 7, 11, 12): 17,
-    (1, 2, 7, 11, 13): 7,
-    (1, 2, 7, 12, 12): 7,
-    (1, 2, 7, 12, 13): 14,
-    (1, 2, 7, 13, 13): 3,
-    (1, 2, 8, 8, 8): 1,
-    (1, 2, 8, 8, 9): 3,
-    (1, 2, 8, 8, 10): 10,
-    (1, 2, 8, 8, 11): 4,
-    (1, 2, 8, 8, 12): 9,
-    (1, 2, 8, 8, 13): 4,
-    (1, 2, 8, 9, 9): 4,
-    (1, 2, 8, 9, 10): 7,
-    (1, 2, 8, 9, 11): 7,
-    (1, 2, 8, 9, 12): 7,
-    (1, 2, 8, 9, 13): 13,
-    (1, 2, 8, 10, 10): 5,
-    (1, 2, 8, 10, 11): 8,
-    (1, 2, 8, 10, 12): 19,
-    (1, 2, 8, 10, 13): 6,
-    (1, 2, 8, 11, 11): 4,
-    (1, 2, 8, 11, 12): 13,
-    (1, 2, 8, 11, 13): 11,
-    (1, 2, 8, 12, 12): 12,
-    (1, 2, 8, 12, 13): 8,
-    (1, 2, 8, 13, 13): 6,
-    (1, 2, 9, 9, 11): 2,
-    (1, 2, 9, 9, 12): 7,
-    (1, 2, 9, 9, 13): 7,
-    (1, 2, 9, 10, 10): 1,
-    (1, 2, 9, 10, 11): 5,
-    (1, 2, 9, 10, 12): 9,
-    (1, 2, 9, 10, 13): 9,
-    (1, 2, 9, 11, 11): 5,
-    (1, 2, 9, 11, 12): 12,
-    (1, 2, 9, 11, 13): 9,
-    (1, 2, 9, 12, 12): 9,
-    (1, 2, 9, 12, 13): 12,
-    (1, 2, 9, 13, 13): 2,
-    (1, 2, 10, 10, 10): 2,
-    (1, 2, 10, 10, 11): 3,
-    (1, 2, 10, 10, 12): 4,
-    (1, 2, 10, 10, 13): 5,
-    (1, 2, 10, 11, 11): 3,
-    (1, 2, 10, 11, 12): 7,
-    (1, 2, 10, 11, 13): 9,
-    (1, 2, 10, 12, 12): 6,
-    (1, 2, 10, 12, 13): 7,
-    (1, 2, 10, 13, 13): 6,
-    (1, 2, 11, 11, 11): 2,
-    (1, 2, 11, 11, 13): 4,
-    (1, 2, 11, 12, 12): 1,
-    (1, 2, 11, 12, 13): 5,
-    (1, 2, 11, 13, 13): 1,
-    (1, 2, 12, 12, 13): 1,
-    (1, 2, 12, 13, 13): 3,
-    (1, 2, 13, 13, 13): 2,
-    (1, 3, 3, 3, 3): 1,
-    (1, 3, 3, 3, 4): 5,
-    (1, 3, 3, 3, 5): 3,
-    (1, 3, 3, 3, 6): 5,
-    (1, 3, 3, 3, 7): 3,
-    (1, 3, 3, 3, 8): 4,
-    (1, 3, 3, 3, 9): 6,
-    (1, 3, 3, 3, 10): 3,
-    (1, 3, 3, 3, 11): 3,
-    (1, 3, 3, 3, 12): 5,
-    (1, 3, 3, 3, 13): 2,
-    (1, 3, 3, 4, 4): 4,
-    (1, 3, 3, 4, 5): 7,
-    (1, 3, 3, 4, 6): 8,
-    (1, 3, 3, 4, 7): 10,
-    (1, 3, 3, 4, 8): 8,
-    (1, 3, 3, 4, 9): 12,
-    (1, 3, 3, 4, 10): 10,
-    (1, 3, 3, 4, 11): 7,
-    (1, 3, 3, 4, 12): 16,
-    (1, 3, 3, 4, 13): 5,
-    (1, 3, 3, 5, 5): 4,
-    (1, 3, 3, 5, 6): 20,
-    (1, 3, 3, 5, 7): 8,
-    (1, 3, 3, 5, 8): 8,
-    (1, 3, 3, 5, 9): 7,
-    (1, 3, 3, 5, 10): 6,
-    (1, 3, 3, 5, 11): 10,
-    (1, 3, 3, 5, 12): 15,
-    (1, 3, 3, 5, 13): 9,
-    (1, 3, 3, 6, 6): 10,
-    (1, 3, 3, 6, 7): 19,
-    (1, 3, 3, 6, 8): 9,
-    (1, 3, 3, 6, 9): 13,
-    (1, 3, 3, 6, 10): 11,
-    (1, 3, 3, 6, 11): 12,
-    (1, 3, 3, 6, 12): 20,
-    (1, 3, 3, 6, 13): 16,
-    (1, 3, 3, 7, 7): 5,
-    (1, 3, 3, 7, 8): 12,
-    (1, 3, 3, 7, 9): 9,
-    (1, 3, 3, 7, 10): 4,
-    (1, 3, 3, 7, 11): 8,
-    (1, 3, 3, 7, 12): 13,
-    (1, 3, 3, 7, 13): 9,
-    (1, 3, 3, 8, 8): 5,
-    (1, 3, 3, 8, 9): 10,
-    (1, 3, 3, 8, 10): 9,
-    (1, 3, 3, 8, 11): 4,
-    (1, 3, 3, 8, 12): 8,
-    (1, 3, 3, 8, 13): 7,
-    (1, 3, 3, 9, 9): 8,
-    (1, 3, 3, 9, 10): 8,
-    (1, 3, 3, 9, 11): 5,
-    (1, 3, 3, 9, 12): 12,
-    (1, 3, 3, 9, 13): 10,
-    (1, 3, 3, 10, 10): 3,
-    (1, 3, 3, 10, 11): 5,
-    (1, 3, 3, 10, 12): 8,
-    (1, 3, 3, 10, 13): 7,
-    (1, 3, 3, 11, 11): 2,
-    (1, 3, 3, 11, 12): 7,
-    (1, 3, 3, 11, 13): 5,
-    (1, 3, 3, 12, 12): 5,
-    (1, 3, 3, 12, 13): 12,
-    (1, 3, 3, 13, 13): 2,
-    (1, 3, 4, 4, 5): 6,
-    (1, 3, 4, 4, 6): 10,
-    (1, 3, 4, 4, 7): 9,
-    (1, 3, 4, 4, 9): 7,
-    (1, 3, 4, 4, 10): 12,
-    (1, 3, 4, 4, 11): 8,
-    (1, 3, 4, 4, 12): 4,
-    (1, 3, 4, 4, 13): 7,
-    (1, 3, 4, 5, 5): 10,
-    (1, 3, 4, 5, 6): 24,
-    (1, 3, 4, 5, 7): 18,
-    (1, 3, 4, 5, 8): 15,
-    (1, 3, 4, 5, 9): 14,
-    (1, 3, 4, 5, 10): 16,
-    (1, 3, 4, 5, 11): 16,
-    (1, 3, 4, 5, 12): 19,
-    (1, 3, 4, 5, 13): 9,
-    (1, 3, 4, 6, 6): 17,
-    (1, 3, 4, 6, 7): 25,
-    (1, 3, 4, 6, 8): 24,
-    (1, 3, 4, 6, 9): 27,
-    (1, 3, 4, 6, 10): 17,
-    (1, 3, 4, 6, 11): 21,
-    (1, 3, 4, 6, 12): 28,
-    (1, 3, 4, 6, 13): 21,
-    (1, 3, 4, 7, 7): 13,
-    (1, 3, 4, 7, 8): 20,
-    (1, 3, 4, 7, 9): 14,
-    (1, 3, 4, 7, 10): 18,
-    (1, 3, 4, 7, 11): 8,
-    (1, 3, 4, 7, 12): 21,
-    (1, 3, 4, 7, 13): 9,
-    (1, 3, 4, 8, 8): 4,
-    (1, 3, 4, 8, 9): 13,
-    (1, 3, 4, 8, 10): 17,
-    (1, 3, 4, 8, 11): 18,
-    (1, 3, 4, 8, 12): 8,
-    (1, 3, 4, 8, 13): 19,
-    (1, 3, 4, 9, 9): 8,
-    (1, 3, 4, 9, 10): 19,
-    (1, 3, 4, 9, 11): 10,
-    (1, 3, 4, 9, 12): 17,
-    (1, 3, 4, 9, 13): 13,
-    (1, 3, 4, 10, 10): 6,
-    (1, 3, 4, 10, 11): 12,
-    (1, 3, 4, 10, 12): 19,
-    (1, 3, 4, 10, 13): 12,
-    (1, 3, 4, 11, 11): 5,
-    (1, 3, 4, 11, 12): 10,
-    (1, 3, 4, 11, 13): 11,
-    (1, 3, 4, 12, 12): 6,
-    (1, 3, 4, 12, 13): 11,
-    (1, 3, 4, 13, 13): 8,
-    (1, 3, 5, 5, 5): 4,
-    (1, 3, 5, 5, 6): 9,
-    (1, 3, 5, 5, 7): 7,
-    (1, 3, 5, 5, 8): 8,
-    (1, 3, 5, 5, 9): 7,
-    (1, 3, 5, 5, 10): 7,
-    (1, 3, 5, 5, 11): 8,
-    (1, 3, 5, 5, 12): 5,
-    (1, 3, 5, 5, 13): 6,
-    (1, 3, 5, 6, 6): 7,
-    (1, 3, 5, 6, 7): 15,
-    (1, 3, 5, 6, 8): 15,
-    (1, 3, 5, 6, 9): 33,
-    (1, 3, 5, 6, 10): 24,
-    (1, 3, 5, 6, 11): 10,
-    (1, 3, 5, 6, 12): 17,
-    (1, 3, 5, 6, 13): 9,
-    (1, 3, 5, 7, 7): 8,
-    (1, 3, 5, 7, 8): 14,
-    (1, 3, 5, 7, 9): 19,
-    (1, 3, 5, 7, 10): 15,
-    (1, 3, 5, 7, 11): 11,
-    (1, 3, 5, 7, 12): 11,
-    (1, 3, 5, 7, 13): 13,
-    (1, 3, 5, 8, 8): 6,
-    (1, 3, 5, 8, 9): 12,
-    (1, 3, 5, 8, 10): 11,
-    (1, 3, 5, 8, 11): 6,
-    (1, 3, 5, 8, 12): 18,
-    (1, 3, 5, 8, 13): 11,
-    (1, 3, 5, 9, 9): 7,
-    (1, 3, 5, 9, 10): 14,
-    (1, 3, 5, 9, 11): 14,
-    (1, 3, 5, 9, 12): 21,
-    (1, 3, 5, 9, 13): 12,
-    (1, 3, 5, 10, 10): 10,
-    (1, 3, 5, 10, 11): 15,
-    (1, 3, 5, 10, 12): 21,
-    (1, 3, 5, 10, 13): 10,
-    (1, 3, 5, 11, 11): 7,
-    (1, 3, 5, 11, 12): 9,
-    (1, 3, 5, 11, 13): 6,
-    (1, 3, 5, 12, 12): 10,
-    (1, 3, 5, 12, 13): 8,
-    (1, 3, 5, 13, 13): 5,
-    (1, 3, 6, 6, 6): 3,
-    (1, 3, 6, 6, 7): 7,
-    (1, 3, 6, 6, 8): 13,
-    (1, 3, 6, 6, 9): 13,
-    (1, 3, 6, 6, 10): 10,
-    (1, 3, 6, 6, 11): 7,
-    (1, 3, 6, 6, 12): 17,
-    (1, 3, 6, 6, 13): 4,
-    (1, 3, 6, 7, 7): 6,
-    (1, 3, 6, 7, 8): 13,
-    (1, 3, 6, 7, 9): 29,
-    (1, 3, 6, 7, 10): 22,
-    (1, 3, 6, 7, 11): 17,
-    (1, 3, 6, 7, 12): 18,
-    (1, 3, 6, 7, 13): 9,
-    (1, 3, 6, 8, 8): 8,
-    (1, 3, 6, 8, 9): 13,
-    (1, 3, 6, 8, 10): 15,
-    (1, 3, 6, 8, 11): 16,
-    (1, 3, 6, 8, 12): 18,
-    (1, 3, 6, 8, 13): 16,
-    (1, 3, 6, 9, 9): 16,
-    (1, 3, 6, 9, 10): 15,
-    (1, 3, 6, 9, 11): 19,
-    (1, 3, 6, 9, 12): 29,
-    (1, 3, 6, 9, 13): 13,
-    (1, 3, 6, 10, 10): 7,
-    (1, 3, 6, 10, 11): 16,
-    (1, 3, 6, 10, 12): 23,
-    (1, 3, 6, 10, 13): 14,
-    (1, 3, 6, 11, 11): 4,
-    (1, 3, 6, 11, 12): 25,
-    (1, 3, 6, 11, 13): 10,
-    (1, 3, 6, 12, 12): 17,
-    (1, 3, 6, 12, 13): 20,
-    (1, 3, 6, 13, 13): 1,
-    (1, 3, 7, 7, 7): 5,
-    (1, 3, 7, 7, 8): 9,
-    (1, 3, 7, 7, 9): 10,
-    (1, 3, 7, 7, 10): 10,
-    (1, 3, 7, 7, 11): 8,
-    (1, 3, 7, 7, 12): 11,
-    (1, 3, 7, 7, 13): 5,
-    (1, 3, 7, 8, 8): 7,
-    (1, 3, 7, 8, 9): 17,
-    (1, 3, 7, 8, 10): 19,
-    (1, 3, 7, 8, 11): 10,
-    (1, 3, 7, 8, 12): 14,
-    (1, 3, 7, 8, 13): 5,
-    (1, 3, 7, 9, 9): 9,
-    (1, 3, 7, 9, 10): 16,
-    (1, 3, 7, 9, 11): 12,
-    (1, 3, 7, 9, 12): 16,
-    (1, 3, 7, 9, 13): 12,
-    (1, 3, 7, 10, 10): 5,
-    (1, 3, 7, 10, 11): 10,
-    (1, 3, 7, 10, 12): 19,
-    (1, 3, 7, 10, 13): 9,
-    (1, 3, 7, 11, 11): 6,
-    (1, 3, 7, 11, 12): 9,
-    (1, 3, 7, 11, 13): 14,
-    (1, 3, 7, 12, 12): 14,
-    (1, 3, 7, 12, 13): 13,
-    (1, 3, 7, 13, 13): 4,
-    (1, 3, 8, 8, 9): 6,
-    (1, 3, 8, 8, 10): 9,
-    (1, 3, 8, 8, 11): 6,
-    (1, 3, 8, 8, 12): 1,
-    (1, 3, 8, 8, 13): 6,
-    (1, 3, 8, 9, 9): 8,
-    (1, 3, 8, 9, 10): 10,
-    (1, 3, 8, 9, 11): 5,
-    (1, 3, 8, 9, 12): 15,
-    (1, 3, 8, 9, 13): 9,
-    (1, 3, 8, 10, 10): 5,
-    (1, 3, 8, 10, 11): 8,
-    (1, 3, 8, 10, 12): 11,
-    (1, 3, 8, 10, 13): 13,
-    (1, 3, 8, 11, 11): 4,
-    (1, 3, 8, 11, 12): 11,
-    (1, 3, 8, 11, 13): 5,
-    (1, 3, 8, 12, 12): 4,
-    (1, 3, 8, 12, 13): 7,
-    (1, 3, 8, 13, 13): 2,
-    (1, 3, 9, 9, 9): 2,
-    (1, 3, 9, 9, 10): 4,
-    (1, 3, 9, 9, 11): 4,
-    (1, 3, 9, 9, 12): 10,
-    (1, 3, 9, 9, 13): 7,
-    (1, 3, 9, 10, 10): 1,
-    (1, 3, 9, 10, 11): 9,
-    (1, 3, 9, 10, 12): 14,
-    (1, 3, 9, 10, 13): 11,
-    (1, 3, 9, 11, 11): 4,
-    (1, 3, 9, 11, 12): 12,
-    (1, 3, 9, 11, 13): 7,
-    (1, 3, 9, 12, 12): 6,
-    (1, 3, 9, 12, 13): 8,
-    (1, 3, 9, 13, 13): 2,
-    (1, 3, 10, 10, 11): 2,
-    (1, 3, 10, 10, 12): 5,
-    (1, 3, 10, 10, 13): 3,
-    (1, 3, 10, 11, 11): 2,
-    (1, 3, 10, 11, 12): 8,
-    (1, 3, 10, 11, 13): 6,
-    (1, 3, 10, 12, 12): 7,
-    (1, 3, 10, 12, 13): 8,
-    (1, 3, 10, 13, 13): 4,
-    (1, 3, 11, 11, 12): 1,
-    (1, 3, 11, 11, 13): 3,
-    (1, 3, 11, 12, 12): 1,
-    (1, 3, 11, 12, 13): 4,
-    (1, 3, 11, 13, 13): 3,
-    (1, 3, 12, 12, 12): 1,
-    (1, 3, 12, 12, 13): 2,
-    (1, 3, 12, 13, 13): 4,
-    (1, 3, 13, 13, 13): 2,
-    (1, 4, 4, 4, 5): 1,
-    (1, 4, 4, 4, 6): 3,
-    (1, 4, 4, 4, 7): 1,
-    (1, 4, 4, 4, 8): 1,
-    (1, 4, 4, 4, 9): 1,
-    (1, 4, 4, 4, 10): 4,
-    (1, 4, 4, 4, 11): 2,
-    (1, 4, 4, 4, 13): 1,
-    (1, 4, 4, 5, 5): 4,
-    (1, 4, 4, 5, 6): 10,
-    (1, 4, 4, 5, 7): 5,
-    (1, 4, 4, 5, 8): 7,
-    (1, 4, 4, 5, 9): 5,
-    (1, 4, 4, 5, 10): 8,
-    (1, 4, 4, 5, 11): 4,
-    (1, 4, 4, 5, 12): 3,
-    (1, 4, 4, 5, 13): 6,
-    (1, 4, 4, 6, 6): 4,
-    (1, 4, 4, 6, 7): 10,
-    (1, 4, 4, 6, 8): 14,
-    (1, 4, 4, 6, 9): 8,
-    (1, 4, 4, 6, 10): 13,
-    (1, 4, 4, 6, 11): 7,
-    (1, 4, 4, 6, 12): 13,
-    (1, 4, 4, 6, 13): 5,
-    (1, 4, 4, 7, 7): 4,
-    (1, 4, 4, 7, 8): 7,
-    (1, 4, 4, 7, 9): 9,
-    (1, 4, 4, 7, 10): 8,
-    (1, 4, 4, 7, 11): 9,
-    (1, 4, 4, 7, 12): 6,
-    (1, 4, 4, 7, 13): 9,
-    (1, 4, 4, 8, 8): 2,
-    (1, 4, 4, 8, 9): 5,
-    (1, 4, 4, 8, 10): 12,
-    (1, 4, 4, 8, 11): 6,
-    (1, 4, 4, 8, 12): 6,
-    (1, 4, 4, 8, 13): 6,
-    (1, 4, 4, 9, 9): 4,
-    (1, 4, 4, 9, 10): 6,
-    (1, 4, 4, 9, 11): 7,
-    (1, 4, 4, 9, 12): 8,
-    (1, 4, 4, 9, 13): 4,
-    (1, 4, 4, 10, 10): 5,
-    (1, 4, 4, 10, 11): 7,
-    (1, 4, 4, 10, 12): 10,
-    (1, 4, 4, 10, 13): 5,
-    (1, 4, 4, 11, 11): 2,
-    (1, 4, 4, 11, 12): 5,
-    (1, 4, 4, 11, 13): 4,
-    (1, 4, 4, 12, 13): 4,
-    (1, 4, 4, 13, 13): 4,
-    (1, 4, 5, 5, 5): 1,
-    (1, 4, 5, 5, 6): 5,
-    (1, 4, 5, 5, 7): 6,
-    (1, 4, 5, 5, 8): 11,
-    (1, 4, 5, 5, 9): 3,
-    (1, 4, 5, 5, 10): 4,
-    (1, 4, 5, 5, 11): 3,
-    (1, 4, 5, 5, 12): 7,
-    (1, 4, 5, 5, 13): 6,
-    (1, 4, 5, 6, 6): 5,
-    (1, 4, 5, 6, 7): 11,
-    (1, 4, 5, 6, 8): 12,
-    (1, 4, 5, 6, 9): 18,
-    (1, 4, 5, 6, 10): 13,
-    (1, 4, 5, 6, 11): 11,
-    (1, 4, 5, 6, 12): 18,
-    (1, 4, 5, 6, 13): 14,
-    (1, 4, 5, 7, 7): 6,
-    (1, 4, 5, 7, 8): 16,
-    (1, 4, 5, 7, 9): 10,
-    (1, 4, 5, 7, 10): 21,
-    (1, 4, 5, 7, 11): 7,
-    (1, 4, 5, 7, 12): 15,
-    (1, 4, 5, 7, 13): 8,
-    (1, 4, 5, 8, 8): 2,
-    (1, 4, 5, 8, 9): 15,
-    (1, 4, 5, 8, 10): 23,
-    (1, 4, 5, 8, 11): 15,
-    (1, 4, 5, 8, 12): 10,
-    (1, 4, 5, 8, 13): 9,
-    (1, 4, 5, 9, 9): 6,
-    (1, 4, 5, 9, 10): 15,
-    (1, 4, 5, 9, 11): 9,
-    (1, 4, 5, 9, 12): 15,
-    (1, 4, 5, 9, 13): 8,
-    (1, 4, 5, 10, 10): 6,
-    (1, 4, 5, 10, 11): 17,
-    (1, 4, 5, 10, 12): 23,
-    (1, 4, 5, 10, 13): 11,
-    (1, 4, 5, 11, 11): 6,
-    (1, 4, 5, 11, 12): 13,
-    (1, 4, 5, 11, 13): 7,
-    (1, 4, 5, 12, 12): 3,
-    (1, 4, 5, 12, 13): 7,
-    (1, 4, 5, 13, 13): 2,
-    (1, 4, 6, 6, 6): 3,
-    (1, 4, 6, 6, 7): 4,
-    (1, 4, 6, 6, 8): 11,
-    (1, 4, 6, 6, 9): 6,
-    (1, 4, 6, 6, 10): 8,
-    (1, 4, 6, 6, 11): 6,
-    (1, 4, 6, 6, 12): 9,
-    (1, 4, 6, 6, 13): 6,
-    (1, 4, 6, 7, 7): 6,
-    (1, 4, 6, 7, 8): 9,
-    (1, 4, 6, 7, 9): 17,
-    (1, 4, 6, 7, 10): 18,
-    (1, 4, 6, 7, 11): 19,
-    (1, 4, 6, 7, 12): 19,
-    (1, 4, 6, 7, 13): 10,
-    (1, 4, 6, 8, 8): 12,
-    (1, 4, 6, 8, 9): 15,
-    (1, 4, 6, 8, 10): 18,
-    (1, 4, 6, 8, 11): 14,
-    (1, 4, 6, 8, 12): 19,
-    (1, 4, 6, 8, 13): 9,
-    (1, 4, 6, 9, 9): 7,
-    (1, 4, 6, 9, 10): 16,
-    (1, 4, 6, 9, 11): 15,
-    (1, 4, 6, 9, 12): 22,
-    (1, 4, 6, 9, 13): 11,
-    (1, 4, 6, 10, 10): 5,
-    (1, 4, 6, 10, 11): 10,
-    (1, 4, 6, 10, 12): 25,
-    (1, 4, 6, 10, 13): 9,
-    (1, 4, 6, 11, 11): 6,
-    (1, 4, 6, 11, 12): 16,
-    (1, 4, 6, 11, 13): 12,
-    (1, 4, 6, 12, 12): 17,
-    (1, 4, 6, 12, 13): 10,
-    (1, 4, 6, 13, 13): 3,
-    (1, 4, 7, 7, 7): 3,
-    (1, 4, 7, 7, 8): 11,
-    (1, 4, 7, 7, 9): 7,
-    (1, 4, 7, 7, 10): 8,
-    (1, 4, 7, 7, 11): 7,
-    (1, 4, 7, 7, 12): 7,
-    (1, 4, 7, 7, 13): 6,
-    (1, 4, 7, 8, 8): 4,
-    (1, 4, 7, 8, 9): 14,
-    (1, 4, 7, 8, 10): 21,
-    (1, 4, 7, 8, 11): 12,
-    (1, 4, 7, 8, 12): 10,
-    (1, 4, 7, 8, 13): 9,
-    (1, 4, 7, 9, 9): 8,
-    (1, 4, 7, 9, 10): 12,
-    (1, 4, 7, 9, 11): 10,
-    (1, 4, 7, 9, 12): 21,
-    (1, 4, 7, 9, 13): 5,
-    (1, 4, 7, 10, 10): 6,
-    (1, 4, 7, 10, 11): 10,
-    (1, 4, 7, 10, 12): 12,
-    (1, 4, 7, 10, 13): 13,
-    (1, 4, 7, 11, 11): 1,
-    (1, 4, 7, 11, 12): 9,
-    (1, 4, 7, 11, 13): 7,
-    (1, 4, 7, 12, 12): 7,
-    (1, 4, 7, 12, 13): 12,
-    (1, 4, 7, 13, 13): 2,
-    (1, 4, 8, 8, 8): 1,
-    (1, 4, 8, 8, 9): 3,
-    (1, 4, 8, 8, 10): 7,
-    (1, 4, 8, 8, 11): 4,
-    (1, 4, 8, 8, 12): 5,
-    (1, 4, 8, 8, 13): 5,
-    (1, 4, 8, 9, 9): 3,
-    (1, 4, 8, 9, 10): 11,
-    (1, 4, 8, 9, 11): 13,
-    (1, 4, 8, 9, 12): 6,
-    (1, 4, 8, 9, 13): 9,
-    (1, 4, 8, 10, 10): 7,
-    (1, 4, 8, 10, 11): 7,
-    (1, 4, 8, 10, 12): 22,
-    (1, 4, 8, 10, 13): 4,
-    (1, 4, 8, 11, 11): 4,
-    (1, 4, 8, 11, 12): 4,
-    (1, 4, 8, 11, 13): 9,
-    (1, 4, 8, 12, 12): 3,
-    (1, 4, 8, 12, 13): 8,
-    (1, 4, 8, 13, 13): 1,
-    (1, 4, 9, 9, 10): 3,
-    (1, 4, 9, 9, 11): 3,
-    (1, 4, 9, 9, 12): 10,
-    (1, 4, 9, 9, 13): 4,
-    (1, 4, 9, 10, 10): 1,
-    (1, 4, 9, 10, 11): 9,
-    (1, 4, 9, 10, 12): 11,
-    (1, 4, 9, 10, 13): 9,
-    (1, 4, 9, 11, 11): 4,
-    (1, 4, 9, 11, 12): 12,
-    (1, 4, 9, 11, 13): 3,
-    (1, 4, 9, 12, 12): 4,
-    (1, 4, 9, 12, 13): 5,
-    (1, 4, 9, 13, 13): 2,
-    (1, 4, 10, 10, 10): 1,
-    (1, 4, 10, 10, 11): 3,
-    (1, 4, 10, 10, 12): 7,
-    (1, 4, 10, 10, 13): 4,
-    (1, 4, 10, 11, 11): 2,
-    (1, 4, 10, 11, 12): 9,
-    (1, 4, 10, 11, 13): 9,
-    (1, 4, 10, 12, 12): 5,
-    (1, 4, 10, 12, 13): 8,
-    (1, 4, 10, 13, 13): 3,
-    (1, 4, 11, 11, 11): 1,
-    (1, 4, 11, 11, 12): 2,
-    (1, 4, 11, 11, 13): 5,
-    (1, 4, 11, 12, 12): 3,
-    (1, 4, 11, 12, 13): 8,
-    (1, 4, 11, 13, 13): 3,
-    (1, 4, 12, 12, 12): 1,
-    (1, 4, 12, 12, 13): 3,
-    (1, 4, 12, 13, 13): 5,
-    (1, 4, 13, 13, 13): 3,
-    (1, 5, 5, 5, 6): 2,
-    (1, 5, 5, 5, 7): 3,
-    (1, 5, 5, 5, 8): 4,
-    (1, 5, 5, 5, 9): 1,
-    (1, 5, 5, 5, 10): 2,
-    (1, 5, 5, 5, 11): 1,
-    (1, 5, 5, 5, 12): 1,
-    (1, 5, 5, 5, 13): 3,
-    (1, 5, 5, 6, 6): 4,
-    (1, 5, 5, 6, 7): 5,
-    (1, 5, 5, 6, 8): 7,
-    (1, 5, 5, 6, 9): 2,
-    (1, 5, 5, 6, 10): 3,
-    (1, 5, 5, 6, 11): 7,
-    (1, 5, 5, 6, 12): 13,
-    (1, 5, 5, 6, 13): 6,
-    (1, 5, 5, 7, 7): 3,
-    (1, 5, 5, 7, 8): 4,
-    (1, 5, 5, 7, 9): 7,
-    (1, 5, 5, 7, 10): 6,
-    (1, 5, 5, 7, 11): 7,
-    (1, 5, 5, 7, 12): 5,
-    (1, 5, 5, 7, 13): 4,
-    (1, 5, 5, 8, 8): 5,
-    (1, 5, 5, 8, 9): 7,
-    (1, 5, 5, 8, 10): 7,
-    (1, 5, 5, 8, 11): 4,
-    (1, 5, 5, 8, 12): 5,
-    (1, 5, 5, 8, 13): 1,
-    (1, 5, 5, 9, 9): 4,
-    (1, 5, 5, 9, 10): 8,
-    (1, 5, 5, 9, 11): 3,
-    (1, 5, 5, 9, 12): 6,
-    (1, 5, 5, 9, 13): 2,
-    (1, 5, 5, 10, 10): 2,
-    (1, 5, 5, 10, 11): 4,
-    (1, 5, 5, 10, 12): 8,
-    (1, 5, 5, 10, 13): 5,
-    (1, 5, 5, 11, 11): 3,
-    (1, 5, 5, 11, 12): 4,
-    (1, 5, 5, 11, 13): 4,
-    (1, 5, 5, 12, 12): 4,
-    (1, 5, 5, 12, 13): 1,
-    (1, 5, 5, 13, 13): 2,
-    (1, 5, 6, 6, 6): 5,
-    (1, 5, 6, 6, 7): 8,
-    (1, 5, 6, 6, 8): 3,
-    (1, 5, 6, 6, 9): 3,
-    (1, 5, 6, 6, 10): 4,
-    (1, 5, 6, 6, 11): 5,
-    (1, 5, 6, 6, 12): 9,
-    (1, 5, 6, 6, 13): 8,
-    (1, 5, 6, 7, 7): 8,
-    (1, 5, 6, 7, 8): 13,
-    (1, 5, 6, 7, 9): 4,
-    (1, 5, 6, 7, 10): 10,
-    (1, 5, 6, 7, 11): 13,
-    (1, 5, 6, 7, 12): 24,
-    (1, 5, 6, 7, 13): 11,
-    (1, 5, 6, 8, 8): 6,
-    (1, 5, 6, 8, 9): 22,
-    (1, 5, 6, 8, 10): 18,
-    (1, 5, 6, 8, 11): 9,
-    (1, 5, 6, 8, 12): 11,
-    (1, 5, 6, 8, 13): 7,
-    (1, 5, 6, 9, 9): 14,
-    (1, 5, 6, 9, 10): 13,
-    (1, 5, 6, 9, 11): 8,
-    (1, 5, 6, 9, 12): 16,
-    (1, 5, 6, 9, 13): 5,
-    (1, 5, 6, 10, 10): 7,
-    (1, 5, 6, 10, 11): 5,
-    (1, 5, 6, 10, 12): 15,
-    (1, 5, 6, 10, 13): 8,
-    (1, 5, 6, 11, 11): 2,
-    (1, 5, 6, 11, 12): 15,
-    (1, 5, 6, 11, 13): 7,
-    (1, 5, 6, 12, 12): 9,
-    (1, 5, 6, 12, 13): 14,
-    (1, 5, 6, 13, 13): 3,
-    (1, 5, 7, 7, 7): 2,
-    (1, 5, 7, 7, 8): 5,
-    (1, 5, 7, 7, 9): 8,
-    (1, 5, 7, 7, 10): 5,
-    (1, 5, 7, 7, 11): 5,
-    (1, 5, 7, 7, 12): 4,
-    (1, 5, 7, 7, 13): 7,
-    (1, 5, 7, 8, 8): 6,
-    (1, 5, 7, 8, 9): 7,
-    (1, 5, 7, 8, 10): 11,
-    (1, 5, 7, 8, 11): 7,
-    (1, 5, 7, 8, 12): 10,
-    (1, 5, 7, 8, 13): 5,
-    (1, 5, 7, 9, 9): 6,
-    (1, 5, 7, 9, 10): 12,
-    (1, 5, 7, 9, 11): 10,
-    (1, 5, 7, 9, 12): 8,
-    (1, 5, 7, 9, 13): 4,
-    (1, 5, 7, 10, 10): 6,
-    (1, 5, 7, 10, 11): 5,
-    (1, 5, 7, 10, 12): 12,
-    (1, 5, 7, 10, 13): 7,
-    (1, 5, 7, 11, 11): 4,
-    (1, 5, 7, 11, 12): 5,
-    (1, 5, 7, 11, 13): 9,
-    (1, 5, 7, 12, 12): 8,
-    (1, 5, 7, 12, 13): 5,
-    (1, 5, 7, 13, 13): 4,
-    (1, 5, 8, 8, 8): 2,
-    (1, 5, 8, 8, 9): 4,
-    (1, 5, 8, 8, 10): 5,
-    (1, 5, 8, 8, 11): 5,
-    (1, 5, 8, 8, 12): 1,
-    (1, 5, 8, 8, 13): 2,
-    (1, 5, 8, 9, 9): 4,
-    (1, 5, 8, 9, 10): 15,
-    (1, 5, 8, 9, 11): 8,
-    (1, 5, 8, 9, 12): 17,
-    (1, 5, 8, 9, 13): 3,
-    (1, 5, 8, 10, 10): 5,
-    (1, 5, 8, 10, 11): 16,
-    (1, 5, 8, 10, 12): 9,
-    (1, 5, 8, 10, 13): 9,
-    (1, 5, 8, 11, 11): 3,
-    (1, 5, 8, 11, 12): 10,
-    (1, 5, 8, 11, 13): 3,
-    (1, 5, 8, 12, 12): 5,
-    (1, 5, 8, 12, 13): 10,
-    (1, 5, 8, 13, 13): 3,
-    (1, 5, 9, 9, 10): 2,
-    (1, 5, 9, 9, 11): 7,
-    (1, 5, 9, 9, 12): 6,
-    (1, 5, 9, 9, 13): 5,
-    (1, 5, 9, 10, 10): 2,
-    (1, 5, 9, 10, 11): 5,
-    (1, 5, 9, 10, 12): 16,
-    (1, 5, 9, 10, 13): 6,
-    (1, 5, 9, 11, 11): 2,
-    (1, 5, 9, 11, 12): 6,
-    (1, 5, 9, 11, 13): 8,
-    (1, 5, 9, 12, 12): 5,
-    (1, 5, 9, 12, 13): 4,
-    (1, 5, 9, 13, 13): 2,
-    (1, 5, 10, 10, 10): 1,
-    (1, 5, 10, 10, 11): 3,
-    (1, 5, 10, 10, 12): 3,
-    (1, 5, 10, 10, 13): 5,
-    (1, 5, 10, 11, 11): 2,
-    (1, 5, 10, 11, 12): 4,
-    (1, 5, 10, 11, 13): 5,
-    (1, 5, 10, 12, 12): 3,
-    (1, 5, 10, 12, 13): 6,
-    (1, 5, 10, 13, 13): 3,
-    (1, 5, 11, 11, 12): 1,
-    (1, 5, 11, 11, 13): 3,
-    (1, 5, 11, 12, 12): 2,
-    (1, 5, 11, 12, 13): 7,
-    (1, 5, 11, 13, 13): 4,
-    (1, 5, 12, 12, 12): 1,
-    (1, 5, 12, 12, 13): 4,
-    (1, 5, 12, 13, 13): 1,
-    (1, 6, 6, 6, 6): 1,
-    (1, 6, 6, 6, 7): 2,
-    (1, 6, 6, 6, 8): 1,
-    (1, 6, 6, 6, 9): 1,
-    (1, 6, 6, 6, 10): 1,
-    (1, 6, 6, 6, 11): 2,
-    (1, 6, 6, 6, 12): 2,
-    (1, 6, 6, 6, 13): 3,
-    (1, 6, 6, 7, 7): 1,
-    (1, 6, 6, 7, 8): 8,
-    (1, 6, 6, 7, 9): 6,
-    (1, 6, 6, 7, 10): 1,
-    (1, 6, 6, 7, 11): 5,
-    (1, 6, 6, 7, 12): 13,
-    (1, 6, 6, 7, 13): 12,
-    (1, 6, 6, 8, 8): 5,
-    (1, 6, 6, 8, 9): 9,
-    (1, 6, 6, 8, 10): 4,
-    (1, 6, 6, 8, 11): 2,
-    (1, 6, 6, 8, 12): 11,
-    (1, 6, 6, 8, 13): 7,
-    (1, 6, 6, 9, 9): 5,
-    (1, 6, 6, 9, 10): 5,
-    (1, 6, 6, 9, 11): 4,
-    (1, 6, 6, 9, 12): 9,
-    (1, 6, 6, 9, 13): 3,
-    (1, 6, 6, 10, 10): 2,
-    (1, 6, 6, 10, 11): 4,
-    (1, 6, 6, 10, 12): 8,
-    (1, 6, 6, 10, 13): 2,
-    (1, 6, 6, 11, 11): 2,
-    (1, 6, 6, 11, 12): 4,
-    (1, 6, 6, 11, 13): 4,
-    (1, 6, 6, 12, 12): 6,
-    (1, 6, 6, 12, 13): 4,
-    (1, 6, 6, 13, 13): 3,
-    (1, 6, 7, 7, 7): 2,
-    (1, 6, 7, 7, 8): 9,
-    (1, 6, 7, 7, 9): 4,
-    (1, 6, 7, 7, 10): 3,
-    (1, 6, 7, 7, 11): 1,
-    (1, 6, 7, 7, 12): 10,
-    (1, 6, 7, 7, 13): 12,
-    (1, 6, 7, 8, 8): 4,
-    (1, 6, 7, 8, 9): 11,
-    (1, 6, 7, 8, 10): 4,
-    (1, 6, 7, 8, 11): 8,
-    (1, 6, 7, 8, 12): 11,
-    (1, 6, 7, 8, 13): 13,
-    (1, 6, 7, 9, 9): 2,
-    (1, 6, 7, 9, 10): 10,
-    (1, 6, 7, 9, 11): 3,
-    (1, 6, 7, 9, 12): 16,
-    (1, 6, 7, 9, 13): 5,
-    (1, 6, 7, 10, 10): 4,
-    (1, 6, 7, 10, 11): 8,
-    (1, 6, 7, 10, 12): 10,
-    (1, 6, 7, 10, 13): 4,
-    (1, 6, 7, 11, 11): 4,
-    (1, 6, 7, 11, 12): 10,
-    (1, 6, 7, 11, 13): 4,
-    (1, 6, 7, 12, 12): 5,
-    (1, 6, 7, 12, 13): 10,
-    (1, 6, 7, 13, 13): 3,
-    (1, 6, 8, 8, 8): 2,
-    (1, 6, 8, 8, 9): 3,
-    (1, 6, 8, 8, 10): 7,
-    (1, 6, 8, 8, 11): 1,
-    (1, 6, 8, 8, 12): 8,
-    (1, 6, 8, 8, 13): 3,
-    (1, 6, 8, 9, 9): 3,
-    (1, 6, 8, 9, 10): 7,
-    (1, 6, 8, 9, 11): 17,
-    (1, 6, 8, 9, 12): 12,
-    (1, 6, 8, 9, 13): 9,
-    (1, 6, 8, 10, 10): 6,
-    (1, 6, 8, 10, 11): 7,
-    (1, 6, 8, 10, 12): 20,
-    (1, 6, 8, 10, 13): 6,
-    (1, 6, 8, 11, 11): 4,
-    (1, 6, 8, 11, 12): 6,
-    (1, 6, 8, 11, 13): 9,
-    (1, 6, 8, 12, 12): 9,
-    (1, 6, 8, 12, 13): 6,
-    (1, 6, 8, 13, 13): 5,
-    (1, 6, 9, 9, 9): 2,
-    (1, 6, 9, 9, 10): 4,
-    (1, 6, 9, 9, 11): 6,
-    (1, 6, 9, 9, 12): 13,
-    (1, 6, 9, 9, 13): 5,
-    (1, 6, 9, 10, 10): 3,
-    (1, 6, 9, 10, 11): 8,
-    (1, 6, 9, 10, 12): 9,
-    (1, 6, 9, 10, 13): 10,
-    (1, 6, 9, 11, 11): 3,
-    (1, 6, 9, 11, 12): 12,
-    (1, 6, 9, 11, 13): 5,
-    (1, 6, 9, 12, 12): 12,
-    (1, 6, 9, 12, 13): 12,
-    (1, 6, 9, 13, 13): 3,
-    (1, 6, 10, 10, 11): 1,
-    (1, 6, 10, 10, 12): 6,
-    (1, 6, 10, 10, 13): 2,
-    (1, 6, 10, 11, 11): 1,
-    (1, 6, 10, 11, 12): 3,
-    (1, 6, 10, 11, 13): 11,
-    (1, 6, 10, 12, 12): 10,
-    (1, 6, 10, 12, 13): 7,
-    (1, 6, 10, 13, 13): 6,
-    (1, 6, 11, 11, 12): 4,
-    (1, 6, 11, 11, 13): 4,
-    (1, 6, 11, 12, 12): 2,
-    (1, 6, 11, 12, 13): 10,
-    (1, 6, 11, 13, 13): 2,
-    (1, 6, 12, 12, 12): 2,
-    (1, 6, 12, 12, 13): 1,
-    (1, 7, 7, 7, 7): 1,
-    (1, 7, 7, 7, 8): 4,
-    (1, 7, 7, 7, 9): 3,
-    (1, 7, 7, 7, 10): 1,
-    (1, 7, 7, 7, 11): 2,
-    (1, 7, 7, 7, 12): 3,
-    (1, 7, 7, 7, 13): 3,
-    (1, 7, 7, 8, 8): 4,
-    (1, 7, 7, 8, 9): 1,
-    (1, 7, 7, 8, 10): 4,
-    (1, 7, 7, 8, 11): 1,
-    (1, 7, 7, 8, 12): 7,
-    (1, 7, 7, 8, 13): 7,
-    (1, 7, 7, 9, 9): 1,
-    (1, 7, 7, 9, 10): 3,
-    (1, 7, 7, 9, 11): 5,
-    (1, 7, 7, 9, 12): 5,
-    (1, 7, 7, 9, 13): 5,
-    (1, 7, 7, 10, 10): 1,
-    (1, 7, 7, 10, 11): 5,
-    (1, 7, 7, 10, 12): 7,
-    (1, 7, 7, 10, 13): 1,
-    (1, 7, 7, 11, 11): 1,
-    (1, 7, 7, 11, 12): 2,
-    (1, 7, 7, 11, 13): 5,
-    (1, 7, 7, 12, 12): 3,
-    (1, 7, 7, 12, 13): 2,
-    (1, 7, 7, 13, 13): 3,
-    (1, 7, 8, 8, 8): 2,
-    (1, 7, 8, 8, 9): 3,
-    (1, 7, 8, 8, 10): 1,
-    (1, 7, 8, 8, 11): 2,
-    (1, 7, 8, 8, 12): 2,
-    (1, 7, 8, 8, 13): 5,
-    (1, 7, 8, 9, 9): 2,
-    (1, 7, 8, 9, 10): 5,
-    (1, 7, 8, 9, 11): 4,
-    (1, 7, 8, 9, 12): 14,
-    (1, 7, 8, 9, 13): 6,
-    (1, 7, 8, 10, 10): 6,
-    (1, 7, 8, 10, 11): 9,
-    (1, 7, 8, 10, 12): 8,
-    (1, 7, 8, 10, 13): 9,
-    (1, 7, 8, 11, 11): 4,
-    (1, 7, 8, 11, 12): 6,
-    (1, 7, 8, 11, 13): 1,
-    (1, 7, 8, 12, 12): 4,
-    (1, 7, 8, 12, 13): 10,
-    (1, 7, 8, 13, 13): 4,
-    (1, 7, 9, 9, 10): 2,
-    (1, 7, 9, 9, 11): 5,
-    (1, 7, 9, 9, 12): 6,
-    (1, 7, 9, 9, 13): 4,
-    (1, 7, 9, 10, 10): 3,
-    (1, 7, 9, 10, 11): 6,
-    (1, 7, 9, 10, 12): 12,
-    (1, 7, 9, 10, 13): 3,
-    (1, 7, 9, 11, 11): 4,
-    (1, 7, 9, 11, 12): 5,
-    (1, 7, 9, 11, 13): 6,
-    (1, 7, 9, 12, 12): 5,
-    (1, 7, 9, 12, 13): 5,
-    (1, 7, 9, 13, 13): 4,
-    (1, 7, 10, 10, 11): 4,
-    (1, 7, 10, 10, 12): 3,
-    (1, 7, 10, 10, 13): 4,
-    (1, 7, 10, 11, 12): 9,
-    (1, 7, 10, 11, 13): 6,
-    (1, 7, 10, 12, 12): 2,
-    (1, 7, 10, 12, 13): 10,
-    (1, 7, 10, 13, 13): 1,
-    (1, 7, 11, 11, 12): 2,
-    (1, 7, 11, 11, 13): 6,
-    (1, 7, 11, 12, 12): 5,
-    (1, 7, 11, 12, 13): 5,
-    (1, 7, 11, 13, 13): 4,
-    (1, 7, 12, 12, 12): 2,
-    (1, 7, 12, 12, 13): 2,
-    (1, 7, 12, 13, 13): 1,
-    (1, 8, 8, 8, 10): 1,
-    (1, 8, 8, 8, 12): 1,
-    (1, 8, 8, 8, 13): 2,
-    (1, 8, 8, 9, 11): 1,
-    (1, 8, 8, 9, 12): 4,
-    (1, 8, 8, 9, 13): 4,
-    (1, 8, 8, 10, 10): 1,
-    (1, 8, 8, 10, 11): 3,
-    (1, 8, 8, 10, 12): 6,
-    (1, 8, 8, 10, 13): 4,
-    (1, 8, 8, 11, 11): 2,
-    (1, 8, 8, 11, 12): 2,
-    (1, 8, 8, 11, 13): 3,
-    (1, 8, 8, 12, 12): 1,
-    (1, 8, 8, 12, 13): 2,
-    (1, 8, 8, 13, 13): 2,
-    (1, 8, 9, 9, 11): 1,
-    (1, 8, 9, 9, 12): 3,
-    (1, 8, 9, 9, 13): 3,
-    (1, 8, 9, 10, 11): 5,
-    (1, 8, 9, 10, 12): 7,
-    (1, 8, 9, 10, 13): 6,
-    (1, 8, 9, 11, 11): 3,
-    (1, 8, 9, 11, 12): 9,
-    (1, 8, 9, 11, 13): 5,
-    (1, 8, 9, 12, 12): 2,
-    (1, 8, 9, 12, 13): 4,
-    (1, 8, 9, 13, 13): 1,
-    (1, 8, 10, 10, 10): 1,
-    (1, 8, 10, 10, 11): 1,
-    (1, 8, 10, 10, 12): 4,
-    (1, 8, 10, 10, 13): 5,
-    (1, 8, 10, 11, 11): 5,
-    (1, 8, 10, 11, 12): 7,
-    (1, 8, 10, 11, 13): 8,
-    (1, 8, 10, 12, 12): 6,
-    (1, 8, 10, 12, 13): 4,
-    (1, 8, 10, 13, 13): 3,
-    (1, 8, 11, 11, 11): 1,
-    (1, 8, 11, 11, 12): 2,
-    (1, 8, 11, 11, 13): 3,
-    (1, 8, 11, 12, 12): 1,
-    (1, 8, 11, 12, 13): 6,
-    (1, 8, 11, 13, 13): 3,
-    (1, 8, 12, 12, 12): 1,
-    (1, 8, 12, 12, 13): 3,
-    (1, 8, 12, 13, 13): 3,
-    (1, 8, 13, 13, 13): 1,
-    (1, 9, 9, 9, 12): 1,
-    (1, 9, 9, 10, 11): 1,
-    (1, 9, 9, 10, 12): 2,
-    (1, 9, 9, 10, 13): 2,
-    (1, 9, 9, 11, 11): 2,
-    (1, 9, 9, 11, 12): 6,
-    (1, 9, 9, 11, 13): 3,
-    (1, 9, 9, 12, 12): 4,
-    (1, 9, 9, 12, 13): 2,
-    (1, 9, 9, 13, 13): 1,
-    (1, 9, 10, 10, 11): 2,
-    (1, 9, 10, 10, 12): 3,
-    (1, 9, 10, 10, 13): 2,
-    (1, 9, 10, 11, 11): 4,
-    (1, 9, 10, 11, 12): 10,
-    (1, 9, 10, 11, 13): 7,
-    (1, 9, 10, 12, 12): 6,
-    (1, 9, 10, 12, 13): 11,
-    (1, 9, 10, 13, 13): 2,
-    (1, 9, 11, 11, 11): 2,
-    (1, 9, 11, 11, 12): 3,
-    (1, 9, 11, 11, 13): 2,
-    (1, 9, 11, 12, 12): 3,
-    (1, 9, 11, 12, 13): 3,
-    (1, 9, 11, 13, 13): 3,
-    (1, 9, 12, 12, 12): 1,
-    (1, 9, 12, 12, 13): 1,
-    (1, 9, 12, 13, 13): 2,
-    (1, 9, 13, 13, 13): 1,
-    (1, 10, 10, 10, 11): 2,
-    (1, 10, 10, 10, 12): 2,
-    (1, 10, 10, 10, 13): 1,
-    (1, 10, 10, 11, 11): 2,
-    (1, 10, 10, 11, 12): 4,
-    (1, 10, 10, 11, 13): 5,
-    (1, 10, 10, 12, 12): 2,
-    (1, 10, 10, 12, 13): 2,
-    (1, 10, 10, 13, 13): 2,
-    (1, 10, 11, 11, 11): 2,
-    (1, 10, 11, 11, 12): 2,
-    (1, 10, 11, 11, 13): 1,
-    (1, 10, 11, 12, 12): 1,
-    (1, 10, 11, 12, 13): 5,
-    (1, 10, 11, 13, 13): 2,
-    (1, 10, 12, 12, 13): 1,
-    (1, 11, 11, 11, 13): 1,
-    (2, 2, 2, 2, 5): 4,
-    (2, 2, 2, 2, 7): 3,
-    (2, 2, 2, 2, 8): 2,
-    (2, 2, 2, 2, 9): 5,
-    (2, 2, 2, 2, 10): 2,
-    (2, 2, 2, 2, 11): 2,
-    (2, 2, 2, 2, 12): 4,
-    (2, 2, 2, 2, 13): 4,
-    (2, 2, 2, 3, 3): 4,
-    (2, 2, 2, 3, 4): 8,
-    (2, 2, 2, 3, 5): 3,
-    (2, 2, 2, 3, 6): 10,
-    (2, 2, 2, 3, 7): 7,
-    (2, 2, 2, 3, 8): 10,
-    (2, 2, 2, 3, 9): 9,
-    (2, 2, 2, 3, 10): 10,
-    (2, 2, 2, 3, 11): 9,
-    (2, 2, 2, 3, 12): 12,
-    (2, 2, 2, 3, 13): 8,
-    (2, 2, 2, 4, 4): 1,
-    (2, 2, 2, 4, 5): 7,
-    (2, 2, 2, 4, 6): 9,
-    (2, 2, 2, 4, 7): 12,
-    (2, 2, 2, 4, 8): 3,
-    (2, 2, 2, 4, 9): 8,
-    (2, 2, 2, 4, 10): 18,
-    (2, 2, 2, 4, 11): 19,
-    (2, 2, 2, 4, 12): 13,
-    (2, 2, 2, 4, 13): 8,
-    (2, 2, 2, 5, 5): 6,
-    (2, 2, 2, 5, 6): 8,
-    (2, 2, 2, 5, 7): 8,
-    (2, 2, 2, 5, 8): 8,
-    (2, 2, 2, 5, 9): 7,
-    (2, 2, 2, 5, 10): 10,
-    (2, 2, 2, 5, 11): 5,
-    (2, 2, 2, 5, 12): 13,
-    (2, 2, 2, 5, 13): 6,
-    (2, 2, 2, 6, 6): 10,
-    (2, 2, 2, 6, 7): 10,
-    (2, 2, 2, 6, 8): 15,
-    (2, 2, 2, 6, 9): 9,
-    (2, 2, 2, 6, 10): 10,
-    (2, 2, 2, 6, 11): 8,
-    (2, 2, 2, 6, 12): 9,
-    (2, 2, 2, 6, 13): 12,
-    (2, 2, 2, 7, 7): 9,
-    (2, 2, 2, 7, 8): 8,
-    (2, 2, 2, 7, 9): 4,
-    (2, 2, 2, 7, 10): 7,
-    (2, 2, 2, 7, 11): 3,
-    (2, 2, 2, 7, 12): 12,
-    (2, 2, 2, 7, 13): 4,
-    (2, 2, 2, 8, 8): 4,
-    (2, 2, 2, 8, 9): 9,
-    (2, 2, 2, 8, 10): 7,
-    (2, 2, 2, 8, 11): 10,
-    (2, 2, 2, 8, 12): 10,
-    (2, 2, 2, 8, 13): 10,
-    (2, 2, 2, 9, 9): 1,
-    (2, 2, 2, 9, 10): 7,
-    (2, 2, 2, 9, 11): 3,
-    (2, 2, 2, 9, 12): 9,
-    (2, 2, 2, 9, 13): 3,
-    (2, 2, 2, 10, 10): 6,
-    (2, 2, 2, 10, 11): 7,
-    (2, 2, 2, 10, 12): 9,
-    (2, 2, 2, 10, 13): 4,
-    (2, 2, 2, 11, 11): 3,
-    (2, 2, 2, 11, 12): 7,
-    (2, 2, 2, 11, 13): 1,
-    (2, 2, 2, 12, 12): 6,
-    (2, 2, 2, 12, 13): 7,
-    (2, 2, 3, 3, 3): 5,
-    (2, 2, 3, 3, 4): 7,
-    (2, 2, 3, 3, 5): 6,
-    (2, 2, 3, 3, 6): 16,
-    (2, 2, 3, 3, 7): 9,
-    (2, 2, 3, 3, 8): 7,
-    (2, 2, 3, 3, 9): 12,
-    (2, 2, 3, 3, 10): 11,
-    (2, 2, 3, 3, 11): 11,
-    (2, 2, 3, 3, 12): 18,
-    (2, 2, 3, 3, 13): 6,
-    (2, 2, 3, 4, 4): 9,
-    (2, 2, 3, 4, 5): 15,
-    (2, 2, 3, 4, 6): 24,
-    (2, 2, 3, 4, 7): 18,
-    (2, 2, 3, 4, 8): 25,
-    (2, 2, 3, 4, 9): 15,
-    (2, 2, 3, 4, 10): 26,
-    (2, 2, 3, 4, 11): 20,
-    (2, 2, 3, 4, 12): 23,
-    (2, 2, 3, 4, 13): 16,
-    (2, 2, 3, 5, 5): 8,
-    (2, 2, 3, 5, 6): 19,
-    (2, 2, 3, 5, 7): 20,
-    (2, 2, 3, 5, 8): 17,
-    (2, 2, 3, 5, 9): 11,
-    (2, 2, 3, 5, 10): 20,
-    (2, 2, 3, 5, 11): 15,
-    (2, 2, 3, 5, 12): 15,
-    (2, 2, 3, 5, 13): 13,
-    (2, 2, 3, 6, 6): 22,
-    (2, 2, 3, 6, 7): 21,
-    (2, 2, 3, 6, 8): 21,
-    (2, 2, 3, 6, 9): 36,
-    (2, 2, 3, 6, 10): 22,
-    (2, 2, 3, 6, 11): 20,
-    (2, 2, 3, 6, 12): 37,
-    (2, 2, 3, 6, 13): 17,
-    (2, 2, 3, 7, 7): 12,
-    (2, 2, 3, 7, 8): 19,
-    (2, 2, 3, 7, 9): 14,
-    (2, 2, 3, 7, 10): 14,
-    (2, 2, 3, 7, 11): 15,
-    (2, 2, 3, 7, 12): 17,
-    (2, 2, 3, 7, 13): 21,
-    (2, 2, 3, 8, 8): 12,
-    (2, 2, 3, 8, 9): 18,
-    (2, 2, 3, 8, 10): 21,
-    (2, 2, 3, 8, 11): 12,
-    (2, 2, 3, 8, 12): 23,
-    (2, 2, 3, 8, 13): 14,
-    (2, 2, 3, 9, 9): 13,
-    (2, 2, 3, 9, 10): 14,
-    (2, 2, 3, 9, 11): 13,
-    (2, 2, 3, 9, 12): 24,
-    (2, 2, 3, 9, 13): 8,
-    (2, 2, 3, 10, 10): 13,
-    (2, 2, 3, 10, 11): 18,
-    (2, 2, 3, 10, 12): 15,
-    (2, 2, 3, 10, 13): 15,
-    (2, 2, 3, 11, 11): 4,
-    (2, 2, 3, 11, 12): 13,
-    (2, 2, 3, 11, 13): 10,
-    (2, 2, 3, 12, 12): 12,
-    (2, 2, 3, 12, 13): 13,
-    (2, 2, 3, 13, 13): 6,
-    (2, 2, 4, 4, 4): 2,
-    (2, 2, 4, 4, 5): 14,
-    (2, 2, 4, 4, 6): 12,
-    (2, 2, 4, 4, 7): 12,
-    (2, 2, 4, 4, 8): 7,
-    (2, 2, 4, 4, 9): 13,
-    (2, 2, 4, 4, 10): 13,
-    (2, 2, 4, 4, 11): 11,
-    (2, 2, 4, 4, 12): 11,
-    (2, 2, 4, 4, 13): 14,
-    (2, 2, 4, 5, 5): 6,
-    (2, 2, 4, 5, 6): 22,
-    (2, 2, 4, 5, 7): 18,
-    (2, 2, 4, 5, 8): 25,
-    (2, 2, 4, 5, 9): 18,
-    (2, 2, 4, 5, 10): 20,
-    (2, 2, 4, 5, 11): 10,
-    (2, 2, 4, 5, 12): 28,
-    (2, 2, 4, 5, 13): 11,
-    (2, 2, 4, 6, 6): 14,
-    (2, 2, 4, 6, 7): 21,
-    (2, 2, 4, 6, 8): 32,
-    (2, 2, 4, 6, 9): 23,
-    (2, 2, 4, 6, 10): 33,
-    (2, 2, 4, 6, 11): 27,
-    (2, 2, 4, 6, 12): 33,
-    (2, 2, 4, 6, 13): 28,
-    (2, 2, 4, 7, 7): 15,
-    (2, 2, 4, 7, 8): 24,
-    (2, 2, 4, 7, 9): 17,
-    (2, 2, 4, 7, 10): 25,
-    (2, 2, 4, 7, 11): 13,
-    (2, 2, 4, 7, 12): 24,
-    (2, 2, 4, 7, 13): 13,
-    (2, 2, 4, 8, 8): 5,
-    (2, 2, 4, 8, 9): 20,
-    (2, 2, 4, 8, 10): 33,
-    (2, 2, 4, 8, 11): 30,
-    (2, 2, 4, 8, 12): 19,
-    (2, 2, 4, 8, 13): 19,
-    (2, 2, 4, 9, 9): 2,
-    (2, 2, 4, 9, 10): 22,
-    (2, 2, 4, 9, 11): 12,
-    (2, 2, 4, 9, 12): 21,
-    (2, 2, 4, 9, 13): 9,
-    (2, 2, 4, 10, 10): 12,
-    (2, 2, 4, 10, 11): 17,
-    (2, 2, 4, 10, 12): 34,
-    (2, 2, 4, 10, 13): 15,
-    (2, 2, 4, 11, 11): 5,
-    (2, 2, 4, 11, 12): 20,
-    (2, 2, 4, 11, 13): 6,
-    (2, 2, 4, 12, 12): 10,
-    (2, 2, 4, 12, 13): 12,
-    (2, 2, 4, 13, 13): 5,
-    (2, 2, 5, 5, 5): 3,
-    (2, 2, 5, 5, 6): 9,
-    (2, 2, 5, 5, 7): 9,
-    (2, 2, 5, 5, 8): 7,
-    (2, 2, 5, 5, 9): 5,
-    (2, 2, 5, 5, 10): 6,
-    (2, 2, 5, 5, 11): 7,
-    (2, 2, 5, 5, 12): 9,
-    (2, 2, 5, 5, 13): 8,
-    (2, 2, 5, 6, 6): 15,
-    (2, 2, 5, 6, 7): 20,
-    (2, 2, 5, 6, 8): 33,
-    (2, 2, 5, 6, 9): 9,
-    (2, 2, 5, 6, 10): 15,
-    (2, 2, 5, 6, 11): 16,
-    (2, 2, 5, 6, 12): 17,
-    (2, 2, 5, 6, 13): 18,
-    (2, 2, 5, 7, 7): 10,
-    (2, 2, 5, 7, 8): 13,
-    (2, 2, 5, 7, 9): 18,
-    (2, 2, 5, 7, 10): 16,
-    (2, 2, 5, 7, 11): 17,
-    (2, 2, 5, 7, 12): 17,
-    (2, 2, 5, 7, 13): 11,
-    (2, 2, 5, 8, 8): 13,
-    (2, 2, 5, 8, 9): 13,
-    (2, 2, 5, 8, 10): 21,
-    (2, 2, 5, 8, 11): 10,
-    (2, 2, 5, 8, 12): 17,
-    (2, 2, 5, 8, 13): 6,
-    (2, 2, 5, 9, 9): 6,
-    (2, 2, 5, 9, 10): 12,
-    (2, 2, 5, 9, 11): 6,
-    (2, 2, 5, 9, 12): 17,
-    (2, 2, 5, 9, 13): 11,
-    (2, 2, 5, 10, 10): 9,
-    (2, 2, 5, 10, 11): 12,
-    (2, 2, 5, 10, 12): 25,
-    (2, 2, 5, 10, 13): 11,
-    (2, 2, 5, 11, 11): 8,
-    (2, 2, 5, 11, 12): 12,
-    (2, 2, 5, 11, 13): 6,
-    (2, 2, 5, 12, 12): 9,
-    (2, 2, 5, 12, 13): 11,
-    (2, 2, 5, 13, 13): 3,
-    (2, 2, 6, 6, 6): 7,
-    (2, 2, 6, 6, 7): 10,
-    (2, 2, 6, 6, 8): 8,
-    (2, 2, 6, 6, 9): 15,
-    (2, 2, 6, 6, 10): 14,
-    (2, 2, 6, 6, 11): 11,
-    (2, 2, 6, 6, 12): 23,
-    (2, 2, 6, 6, 13): 6,
-    (2, 2, 6, 7, 7): 12,
-    (2, 2, 6, 7, 8): 21,
-    (2, 2, 6, 7, 9): 18,
-    (2, 2, 6, 7, 10): 23,
-    (2, 2, 6, 7, 11): 15,
-    (2, 2, 6, 7, 12): 25,
-    (2, 2, 6, 7, 13): 10,
-    (2, 2, 6, 8, 8): 11,
-    (2, 2, 6, 8, 9): 22,
-    (2, 2, 6, 8, 10): 30,
-    (2, 2, 6, 8, 11): 19,
-    (2, 2, 6, 8, 12): 24,
-    (2, 2, 6, 8, 13): 18,
-    (2, 2, 6, 9, 9): 15,
-    (2, 2, 6, 9, 10): 13,
-    (2, 2, 6, 9, 11): 5,
-    (2, 2, 6, 9, 12): 27,
-    (2, 2, 6, 9, 13): 12,
-    (2, 2, 6, 10, 10): 8,
-    (2, 2, 6, 10, 11): 17,
-    (2, 2, 6, 10, 12): 29,
-    (2, 2, 6, 10, 13): 15,
-    (2, 2, 6, 11, 11): 5,
-    (2, 2, 6, 11, 12): 17,
-    (2, 2, 6, 11, 13): 7,
-    (2, 2, 6, 12, 12): 17,
-    (2, 2, 6, 12, 13): 13,
-    (2, 2, 6, 13, 13): 4,
-    (2, 2, 7, 7, 7): 9,
-    (2, 2, 7, 7, 8): 13,
-    (2, 2, 7, 7, 9): 11,
-    (2, 2, 7, 7, 10): 12,
-    (2, 2, 7, 7, 11): 9,
-    (2, 2, 7, 7, 12): 10,
-    (2, 2, 7, 7, 13): 4,
-    (2, 2, 7, 8, 8): 11,
-    (2, 2, 7, 8, 9): 13,
-    (2, 2, 7, 8, 10): 13,
-    (2, 2, 7, 8, 11): 7,
-    (2, 2, 7, 8, 12): 23,
-    (2, 2, 7, 8, 13): 8,
-    (2, 2, 7, 9, 9): 4,
-    (2, 2, 7, 9, 10): 12,
-    (2, 2, 7, 9, 11): 16,
-    (2, 2, 7, 9, 12): 11,
-    (2, 2, 7, 9, 13): 9,
-    (2, 2, 7, 10, 10): 10,
-    (2, 2, 7, 10, 11): 7,
-    (2, 2, 7, 10, 12): 21,
-    (2, 2, 7, 10, 13): 9,
-    (2, 2, 7, 11, 11): 4,
-    (2, 2, 7, 11, 12): 12,
-    (2, 2, 7, 11, 13): 14,
-    (2, 2, 7, 12, 12): 7,
-    (2, 2, 7, 12, 13): 11,
-    (2, 2, 7, 13, 13): 5,
-    (2, 2, 8, 8, 8): 3,
-    (2, 2, 8, 8, 9): 8,
-    (2, 2, 8, 8, 10): 13,
-    (2, 2, 8, 8, 11): 17,
-    (2, 2, 8, 8, 12): 9,
-    (2, 2, 8, 8, 13): 9,
-    (2, 2, 8, 9, 9): 1,
-    (2, 2, 8, 9, 10): 16,
-    (2, 2, 8, 9, 11): 5,
-    (2, 2, 8, 9, 12): 19,
-    (2, 2, 8, 9, 13): 7,
-    (2, 2, 8, 10, 10): 11,
-    (2, 2, 8, 10, 11): 12,
-    (2, 2, 8, 10, 12): 15,
-    (2, 2, 8, 10, 13): 11,
-    (2, 2, 8, 11, 11): 3,
-    (2, 2, 8, 11, 12): 13,
-    (2, 2, 8, 11, 13): 7,
-    (2, 2, 8, 12, 12): 9,
-    (2, 2, 8, 12, 13): 13,
-    (2, 2, 8, 13, 13): 5,
-    (2, 2, 9, 9, 10): 3,
-    (2, 2, 9, 9, 11): 3,
-    (2, 2, 9, 9, 12): 10,
-    (2, 2, 9, 9, 13): 4,
-    (2, 2, 9, 10, 10): 5,
-    (2, 2, 9, 10, 11): 10,
-    (2, 2, 9, 10, 12): 14,
-    (2, 2, 9, 10, 13): 4,
-    (2, 2, 9, 11, 11): 7,
-    (2, 2, 9, 11, 12): 5,
-    (2, 2, 9, 11, 13): 6,
-    (2, 2, 9, 12, 12): 11,
-    (2, 2, 9, 12, 13): 5,
-    (2, 2, 9, 13, 13): 3,
-    (2, 2, 10, 10, 10): 3,
-    (2, 2, 10, 10, 11): 4,
-    (2, 2, 10, 10, 12): 10,
-    (2, 2, 10, 10, 13): 6,
-    (2, 2, 10, 11, 11): 5,
-    (2, 2, 10, 11, 12): 10,
-    (2, 2, 10, 11, 13): 8,
-    (2, 2, 10, 12, 12): 9,
-    (2, 2, 10, 12, 13): 9,
-    (2, 2, 10, 13, 13): 6,
-    (2, 2, 11, 11, 11): 2,
-    (2, 2, 11, 11, 12): 4,
-    (2, 2, 11, 11, 13): 5,
-    (2, 2, 11, 12, 12): 5,
-    (2, 2, 11, 12, 13): 5,
-    (2, 2, 11, 13, 13): 1,
-    (2, 2, 12, 12, 12): 4,
-    (2, 2, 12, 12, 13): 7,
-    (2, 2, 12, 13, 13): 4,
-    (2, 3, 3, 3, 3): 4,
-    (2, 3, 3, 3, 4): 6,
-    (2, 3, 3, 3, 5): 9,
-    (2, 3, 3, 3, 6): 12,
-    (2, 3, 3, 3, 7): 9,
-    (2, 3, 3, 3, 8): 8,
-    (2, 3, 3, 3, 9): 11,
-    (2, 3, 3, 3, 10): 10,
-    (2, 3, 3, 3, 11): 9,
-    (2, 3, 3, 3, 12): 10,
-    (2, 3, 3, 3, 13): 10,
-    (2, 3, 3, 4, 4): 12,
-    (2, 3, 3, 4, 5): 14,
-    (2, 3, 3, 4, 6): 33,
-    (2, 3, 3, 4, 7): 15,
-    (2, 3, 3, 4, 8): 18,
-    (2, 3, 3, 4, 9): 26,
-    (2, 3, 3, 4, 10): 15,
-    (2, 3, 3, 4, 11): 12,
-    (2, 3, 3, 4, 12): 31,
-    (2, 3, 3, 4, 13): 13,
-    (2, 3, 3, 5, 5): 9,
-    (2, 3, 3, 5, 6): 22,
-    (2, 3, 3, 5, 7): 16,
-    (2, 3, 3, 5, 8): 11,
-    (2, 3, 3, 5, 9): 31,
-    (2, 3, 3, 5, 10): 19,
-    (2, 3, 3, 5, 11): 11,
-    (2, 3, 3, 5, 12): 20,
-    (2, 3, 3, 5, 13): 9,
-    (2, 3, 3, 6, 6): 21,
-    (2, 3, 3, 6, 7): 21,
-    (2, 3, 3, 6, 8): 30,
-    (2, 3, 3, 6, 9): 30,
-    (2, 3, 3, 6, 10): 32,
-    (2, 3, 3, 6, 11): 17,
-    (2, 3, 3, 6, 12): 36,
-    (2, 3, 3, 6, 13): 17,
-    (2, 3, 3, 7, 7): 12,
-    (2, 3, 3, 7, 8): 11,
-    (2, 3, 3, 7, 9): 26,
-    (2, 3, 3, 7, 10): 15,
-    (2, 3, 3, 7, 11): 13,
-    (2, 3, 3, 7, 12): 21,
-    (2, 3, 3, 7, 13): 16,
-    (2, 3, 3, 8, 8): 8,
-    (2, 3, 3, 8, 9): 15,
-    (2, 3, 3, 8, 10): 6,
-    (2, 3, 3, 8, 11): 11,
-    (2, 3, 3, 8, 12): 29,
-    (2, 3, 3, 8, 13): 11,
-    (2, 3, 3, 9, 9): 12,
-    (2, 3, 3, 9, 10): 18,
-    (2, 3, 3, 9, 11): 21,
-    (2, 3, 3, 9, 12): 27,
-    (2, 3, 3, 9, 13): 20,
-    (2, 3, 3, 10, 10): 7,
-    (2, 3, 3, 10, 11): 8,
-    (2, 3, 3, 10, 12): 21,
-    (2, 3, 3, 10, 13): 8,
-    (2, 3, 3, 11, 11): 8,
-    (2, 3, 3, 11, 12): 13,
-    (2, 3, 3, 11, 13): 10,
-    (2, 3, 3, 12, 12): 18,
-    (2, 3, 3, 12, 13): 12,
-    (2, 3, 3, 13, 13): 3,
-    (2, 3, 4, 4, 4): 9,
-    (2, 3, 4, 4, 5): 16,
-    (2, 3, 4, 4, 6): 21,
-    (2, 3, 4, 4, 7): 25,
-    (2, 3, 4, 4, 8): 26,
-    (2, 3, 4, 4, 9): 23,
-    (2, 3, 4, 4, 10): 22,
-    (2, 3, 4, 4, 11): 16,
-    (2, 3, 4, 4, 12): 28,
-    (2, 3, 4, 4, 13): 16,
-    (2, 3, 4, 5, 5): 12,
-    (2, 3, 4, 5, 6): 27,
-    (2, 3, 4, 5, 7): 26,
-    (2, 3, 4, 5, 8): 34,
-    (2, 3, 4, 5, 9): 28,
-    (2, 3, 4, 5, 10): 24,
-    (2, 3, 4, 5, 11): 22,
-    (2, 3, 4, 5, 12): 30,
-    (2, 3, 4, 5, 13): 28,
-    (2, 3, 4, 6, 6): 35,
-    (2, 3, 4, 6, 7): 36,
-    (2, 3, 4, 6, 8): 41,
-    (2, 3, 4, 6, 9): 51,
-    (2, 3, 4, 6, 10): 33,
-    (2, 3, 4, 6, 11): 24,
-    (2, 3, 4, 6, 12): 62,
-    (2, 3, 4, 6, 13): 28,
-    (2, 3, 4, 7, 7): 17,
-    (2, 3, 4, 7, 8): 33,
-    (2, 3, 4, 7, 9): 31,
-    (2, 3, 4, 7, 10): 41,
-    (2, 3, 4, 7, 11): 34,
-    (2, 3, 4, 7, 12): 32,
-    (2, 3, 4, 7, 13): 23,
-    (2, 3, 4, 8, 8): 20,
-    (2, 3, 4, 8, 9): 30,
-    (2, 3, 4, 8, 10): 40,
-    (2, 3, 4, 8, 11): 26,
-    (2, 3, 4, 8, 12): 43,
-    (2, 3, 4, 8, 13): 16,
-    (2, 3, 4, 9, 9): 21,
-    (2, 3, 4, 9, 10): 17,
-    (2, 3, 4, 9, 11): 19,
-    (2, 3, 4, 9, 12): 50,
-    (2, 3, 4, 9, 13): 25,
-    (2, 3, 4, 10, 10): 16,
-    (2, 3, 4, 10, 11): 22,
-    (2, 3, 4, 10, 12): 38,
-    (2, 3, 4, 10, 13): 25,
-    (2, 3, 4, 11, 11): 13,
-    (2, 3, 4, 11, 12): 23,
-    (2, 3, 4, 11, 13): 21,
-    (2, 3, 4, 12, 12): 33,
-    (2, 3, 4, 12, 13): 20,
-    (2, 3, 4, 13, 13): 6,
-    (2, 3, 5, 5, 5): 2,
-    (2, 3, 5, 5, 6): 15,
-    (2, 3, 5, 5, 7): 14,
-    (2, 3, 5, 5, 8): 15,
-    (2, 3, 5, 5, 9): 15,
-    (2, 3, 5, 5, 10): 14,
-    (2, 3, 5, 5, 11): 12,
-    (2, 3, 5, 5, 12): 18,
-    (2, 3, 5, 5, 13): 11,
-    (2, 3, 5, 6, 6): 26,
-    (2, 3, 5, 6, 7): 27,
-    (2, 3, 5, 6, 8): 30,
-    (2, 3, 5, 6, 9): 30,
-    (2, 3, 5, 6, 10): 24,
-    (2, 3, 5, 6, 11): 27,
-    (2, 3, 5, 6, 12): 53,
-    (2, 3, 5, 6, 13): 23,
-    (2, 3, 5, 7, 7): 18,
-    (2, 3, 5, 7, 8): 28,
-    (2, 3, 5, 7, 9): 27,
-    (2, 3, 5, 7, 10): 31,
-    (2, 3, 5, 7, 11): 25,
-    (2, 3, 5, 7, 12): 32,
-    (2, 3, 5, 7, 13): 22,
-    (2, 3, 5, 8, 8): 11,
-    (2, 3, 5, 8, 9): 25,
-    (2, 3, 5, 8, 10): 34,
-    (2, 3, 5, 8, 11): 27,
-    (2, 3, 5, 8, 12): 19,
-    (2, 3, 5, 8, 13): 19,
-    (2, 3, 5, 9, 9): 22,
-    (2, 3, 5, 9, 10): 21,
-    (2, 3, 5, 9, 11): 23,
-    (2, 3, 5, 9, 12): 32,
-    (2, 3, 5, 9, 13): 19,
-    (2, 3, 5, 10, 10): 8,
-    (2, 3, 5, 10, 11): 17,
-    (2, 3, 5, 10, 12): 23,
-    (2, 3, 5, 10, 13): 25,
-    (2, 3, 5, 11, 11): 5,
-    (2, 3, 5, 11, 12): 24,
-    (2, 3, 5, 11, 13): 23,
-    (2, 3, 5, 12, 12): 18,
-    (2, 3, 5, 12, 13): 14,
-    (2, 3, 5, 13, 13): 11,
-    (2, 3, 6, 6, 6): 15,
-    (2, 3, 6, 6, 7): 16,
-    (2, 3, 6, 6, 8): 28,
-    (2, 3, 6, 6, 9): 30,
-    (2, 3, 6, 6, 10): 27,
-    (2, 3, 6, 6, 11): 26,
-    (2, 3, 6, 6, 12): 44,
-    (2, 3, 6, 6, 13): 23,
-    (2, 3, 6, 7, 7): 21,
-    (2, 3, 6, 7, 8): 26,
-    (2, 3, 6, 7, 9): 36,
-    (2, 3, 6, 7, 10): 32,
-    (2, 3, 6, 7, 11): 23,
-    (2, 3, 6, 7, 12): 35,
-    (2, 3, 6, 7, 13): 23,
-    (2, 3, 6, 8, 8): 15,
-    (2, 3, 6, 8, 9): 46,
-    (2, 3, 6, 8, 10): 35,
-    (2, 3, 6, 8, 11): 20,
-    (2, 3, 6, 8, 12): 49,
-    (2, 3, 6, 8, 13): 11,
-    (2, 3, 6, 9, 9): 24,
-    (2, 3, 6, 9, 10): 40,
-    (2, 3, 6, 9, 11): 28,
-    (2, 3, 6, 9, 12): 53,
-    (2, 3, 6, 9, 13): 33,
-    (2, 3, 6, 10, 10): 16,
-    (2, 3, 6, 10, 11): 19,
-    (2, 3, 6, 10, 12): 47,
-    (2, 3, 6, 10, 13): 23,
-    (2, 3, 6, 11, 11): 16,
-    (2, 3, 6, 11, 12): 31,
-    (2, 3, 6, 11, 13): 16,
-    (2, 3, 6, 12, 12): 29,
-    (2, 3, 6, 12, 13): 25,
-    (2, 3, 6, 13, 13): 12,
-    (2, 3, 7, 7, 7): 10,
-    (2, 3, 7, 7, 8): 17,
-    (2, 3, 7, 7, 9): 13,
-    (2, 3, 7, 7, 10): 12,
-    (2, 3, 7, 7, 11): 18,
-    (2, 3, 7, 7, 12): 20,
-    (2, 3, 7, 7, 13): 13,
-    (2, 3, 7, 8, 8): 10,
-    (2, 3, 7, 8, 9): 20,
-    (2, 3, 7, 8, 10): 22,
-    (2, 3, 7, 8, 11): 14,
-    (2, 3, 7, 8, 12): 24,
-    (2, 3, 7, 8, 13): 27,
-    (2, 3, 7, 9, 9): 21,
-    (2, 3, 7, 9, 10): 19,
-    (2, 3, 7, 9, 11): 19,
-    (2, 3, 7, 9, 12): 29,
-    (2, 3, 7, 9, 13): 17,
-    (2, 3, 7, 10, 10): 11,
-    (2, 3, 7, 10, 11): 28,
-    (2, 3, 7, 10, 12): 21,
-    (2, 3, 7, 10, 13): 14,
-    (2, 3, 7, 11, 11): 8,
-    (2, 3, 7, 11, 12): 19,
-    (2, 3, 7, 11, 13): 15,
-    (2, 3, 7, 12, 12): 19,
-    (2, 3, 7, 12, 13): 18,
-    (2, 3, 7, 13, 13): 7,
-    (2, 3, 8, 8, 8): 8,
-    (2, 3, 8, 8, 9): 8,
-    (2, 3, 8, 8, 10): 10,
-    (2, 3, 8, 8, 11): 9,
-    (2, 3, 8, 8, 12): 13,
-    (2, 3, 8, 8, 13): 9,
-    (2, 3, 8, 9, 9): 12,
-    (2, 3, 8, 9, 10): 18,
-    (2, 3, 8, 9, 11): 25,
-    (2, 3, 8, 9, 12): 39,
-    (2, 3, 8, 9, 13): 11,
-    (2, 3, 8, 10, 10): 20,
-    (2, 3, 8, 10, 11): 17,
-    (2, 3, 8, 10, 12): 28,
-    (2, 3, 8, 10, 13): 18,
-    (2, 3, 8, 11, 11): 7,
-    (2, 3, 8, 11, 12): 17,
-    (2, 3, 8, 11, 13): 17,
-    (2, 3, 8, 12, 12): 23,
-    (2, 3, 8, 12, 13): 15,
-    (2, 3, 8, 13, 13): 8,
-    (2, 3, 9, 9, 9): 10,
-    (2, 3, 9, 9, 10): 15,
-    (2, 3, 9, 9, 11): 23,
-    (2, 3, 9, 9, 12): 18,
-    (2, 3, 9, 9, 13): 17,
-    (2, 3, 9, 10, 10): 13,
-    (2, 3, 9, 10, 11): 7,
-    (2, 3, 9, 10, 12): 23,
-    (2, 3, 9, 10, 13): 14,
-    (2, 3, 9, 11, 11): 4,
-    (2, 3, 9, 11, 12): 23,
-    (2, 3, 9, 11, 13): 18,
-    (2, 3, 9, 12, 12): 21,
-    (2, 3, 9, 12, 13): 18,
-    (2, 3, 9, 13, 13): 3,
-    (2, 3, 10, 10, 10): 2,
-    (2, 3, 10, 10, 11): 12,
-    (2, 3, 10, 10, 12): 11,
-    (2, 3, 10, 10, 13): 11,
-    (2, 3, 10, 11, 11): 6,
-    (2, 3, 10, 11, 12): 11,
-    (2, 3, 10, 11, 13): 11,
-    (2, 3, 10, 12, 12): 21,
-    (2, 3, 10, 12, 13): 10,
-    (2, 3, 10, 13, 13): 8,
-    (2, 3, 11, 11, 11): 4,
-    (2, 3, 11, 11, 12): 8,
-    (2, 3, 11, 11, 13): 8,
-    (2, 3, 11, 12, 12): 18,
-    (2, 3, 11, 12, 13): 19,
-    (2, 3, 11, 13, 13): 9,
-    (2, 3, 12, 12, 12): 13,
-    (2, 3, 12, 12, 13): 12,
-    (2, 3, 12, 13, 13): 6,
-    (2, 3, 13, 13, 13): 4,
-    (2, 4, 4, 4, 5): 11,
-    (2, 4, 4, 4, 6): 11,
-    (2, 4, 4, 4, 7): 11,
-    (2, 4, 4, 4, 8): 6,
-    (2, 4, 4, 4, 9): 10,
-    (2, 4, 4, 4, 10): 10,
-    (2, 4, 4, 4, 11): 14,
-    (2, 4, 4, 4, 12): 9,
-    (2, 4, 4, 4, 13): 10,
-    (2, 4, 4, 5, 5): 9,
-    (2, 4, 4, 5, 6): 19,
-    (2, 4, 4, 5, 7): 17,
-    (2, 4, 4, 5, 8): 25,
-    (2, 4, 4, 5, 9): 13,
-    (2, 4, 4, 5, 10): 22,
-    (2, 4, 4, 5, 11): 10,
-    (2, 4, 4, 5, 12): 24,
-    (2, 4, 4, 5, 13): 10,
-    (2, 4, 4, 6, 6): 15,
-    (2, 4, 4, 6, 7): 19,
-    (2, 4, 4, 6, 8): 20,
-    (2, 4, 4, 6, 9): 17,
-    (2, 4, 4, 6, 10): 28,
-    (2, 4, 4, 6, 11): 19,
-    (2, 4, 4, 6, 12): 22,
-    (2, 4, 4, 6, 13): 15,
-    (2, 4, 4, 7, 7): 13,
-    (2, 4, 4, 7, 8): 20,
-    (2, 4, 4, 7, 9): 12,
-    (2, 4, 4, 7, 10): 18,
-    (2, 4, 4, 7, 11): 14,
-    (2, 4, 4, 7, 12): 28,
-    (2, 4, 4, 7, 13): 7,
-    (2, 4, 4, 8, 8): 7,
-    (2, 4, 4, 8, 9): 27,
-    (2, 4, 4, 8, 10): 21,
-    (2, 4, 4, 8, 11): 25,
-    (2, 4, 4, 8, 12): 22,
-    (2, 4, 4, 8, 13): 23,
-    (2, 4, 4, 9, 9): 3,
-    (2, 4, 4, 9, 10): 11,
-    (2, 4, 4, 9, 11): 8,
-    (2, 4, 4, 9, 12): 24,
-    (2, 4, 4, 9, 13): 6,
-    (2, 4, 4, 10, 10): 16,
-    (2, 4, 4, 10, 11): 11,
-    (2, 4, 4, 10, 12): 19,
-    (2, 4, 4, 10, 13): 9,
-    (2, 4, 4, 11, 11): 4,
-    (2, 4, 4, 11, 12): 23,
-    (2, 4, 4, 11, 13): 1,
-    (2, 4, 4, 12, 12): 15,
-    (2, 4, 4, 12, 13): 15,
-    (2, 4, 4, 13, 13): 4,
-    (2, 4, 5, 5, 5): 6,
-    (2, 4, 5, 5, 6): 17,
-    (2, 4, 5, 5, 7): 13,
-    (2, 4, 5, 5, 8): 16,
-    (2, 4, 5, 5, 9): 13,
-    (2, 4, 5, 5, 10): 16,
-    (2, 4, 5, 5, 11): 15,
-    (2, 4, 5, 5, 12): 16,
-    (2, 4, 5, 5, 13): 9,
-    (2, 4, 5, 6, 6): 22,
-    (2, 4, 5, 6, 7): 19,
-    (2, 4, 5, 6, 8): 39,
-    (2, 4, 5, 6, 9): 23,
-    (2, 4, 5, 6, 10): 41,
-    (2, 4, 5, 6, 11): 25,
-    (2, 4, 5, 6, 12): 32,
-    (2, 4, 5, 6, 13): 16,
-    (2, 4, 5, 7, 7): 23,
-    (2, 4, 5, 7, 8): 23,
-    (2, 4, 5, 7, 9): 29,
-    (2, 4, 5, 7, 10): 17,
-    (2, 4, 5, 7, 11): 18,
-    (2, 4, 5, 7, 12): 30,
-    (2, 4, 5, 7, 13): 21,
-    (2, 4, 5, 8, 8): 28,
-    (2, 4, 5, 8, 9): 13,
-    (2, 4, 5, 8, 10): 28,
-    (2, 4, 5, 8, 11): 14,
-    (2, 4, 5, 8, 12): 44,
-    (2, 4, 5, 8, 13): 14,
-    (2, 4, 5, 9, 9): 11,
-    (2, 4, 5, 9, 10): 32,
-    (2, 4, 5, 9, 11): 27,
-    (2, 4, 5, 9, 12): 17,
-    (2, 4, 5, 9, 13): 12,
-    (2, 4, 5, 10, 10): 14,
-    (2, 4, 5, 10, 11): 12,
-    (2, 4, 5, 10, 12): 26,
-    (2, 4, 5, 10, 13): 20,
-    (2, 4, 5, 11, 11): 10,
-    (2, 4, 5, 11, 12): 14,
-    (2, 4, 5, 11, 13): 18,
-    (2, 4, 5, 12, 12): 20,
-    (2, 4, 5, 12, 13): 17,
-    (2, 4, 5, 13, 13): 10,
-    (2, 4, 6, 6, 6): 13,
-    (2, 4, 6, 6, 7): 13,
-    (2, 4, 6, 6, 8): 23,
-    (2, 4, 6, 6, 9): 33,
-    (2, 4, 6, 6, 10): 22,
-    (2, 4, 6, 6, 11): 15,
-    (2, 4, 6, 6, 12): 41,
-    (2, 4, 6, 6, 13): 13,
-    (2, 4, 6, 7, 7): 23,
-    (2, 4, 6, 7, 8): 32,
-    (2, 4, 6, 7, 9): 23,
-    (2, 4, 6, 7, 10): 37,
-    (2, 4, 6, 7, 11): 18,
-    (2, 4, 6, 7, 12): 35,
-    (2, 4, 6, 7, 13): 31,
-    (2, 4, 6, 8, 8): 21,
-    (2, 4, 6, 8, 9): 34,
-    (2, 4, 6, 8, 10): 38,
-    (2, 4, 6, 8, 11): 29,
-    (2, 4, 6, 8, 12): 45,
-    (2, 4, 6, 8, 13): 30,
-    (2, 4, 6, 9, 9): 27,
-    (2, 4, 6, 9, 10): 33,
-    (2, 4, 6, 9, 11): 17,
-    (2, 4, 6, 9, 12): 49,
-    (2, 4, 6, 9, 13): 9,
-    (2, 4, 6, 10, 10): 32,
-    (2, 4, 6, 10, 11): 32,
-    (2, 4, 6, 10, 12): 37,
-    (2, 4, 6, 10, 13): 25,
-    (2, 4, 6, 11, 11): 13,
-    (2, 4, 6, 11, 12): 24,
-    (2, 4, 6, 11, 13): 13,
-    (2, 4, 6, 12, 12): 28,
-    (2, 4, 6, 12, 13): 30,
-    (2, 4, 6, 13, 13): 11,
-    (2, 4, 7, 7, 7): 12,
-    (2, 4, 7, 7, 8): 16,
-    (2, 4, 7, 7, 9): 17,
-    (2, 4, 7, 7, 10): 20,
-    (2, 4, 7, 7, 11): 17,
-    (2, 4, 7, 7, 12): 18,
-    (2, 4, 7, 7, 13): 9,
-    (2, 4, 7, 8, 8): 17,
-    (2, 4, 7, 8, 9): 21,
-    (2, 4, 7, 8, 10): 29,
-    (2, 4, 7, 8, 11): 17,
-    (2, 4, 7, 8, 12): 45,
-    (2, 4, 7, 8, 13): 11,
-    (2, 4, 7, 9, 9): 11,
-    (2, 4, 7, 9, 10): 19,
-    (2, 4, 7, 9, 11): 16,
-    (2, 4, 7, 9, 12): 18,
-    (2, 4, 7, 9, 13): 22,
-    (2, 4, 7, 10, 10): 14,
-    (2, 4, 7, 10, 11): 23,
-    (2, 4, 7, 10, 12): 40,
-    (2, 4, 7, 10, 13): 15,
-    (2, 4, 7, 11, 11): 14,
-    (2, 4, 7, 11, 12): 26,
-    (2, 4, 7, 11, 13): 16,
-    (2, 4, 7, 12, 12): 19,
-    (2, 4, 7, 12, 13): 13,
-    (2, 4, 7, 13, 13): 8,
-    (2, 4, 8, 8, 8): 4,
-    (2, 4, 8, 8, 9): 22,
-    (2, 4, 8, 8, 10): 23,
-    (2, 4, 8, 8, 11): 22,
-    (2, 4, 8, 8, 12): 19,
-    (2, 4, 8, 8, 13): 17,
-    (2, 4, 8, 9, 9): 7,
-    (2, 4, 8, 9, 10): 25,
-    (2, 4, 8, 9, 11): 15,
-    (2, 4, 8, 9, 12): 35,
-    (2, 4, 8, 9, 13): 13,
-    (2, 4, 8, 10, 10): 21,
-    (2, 4, 8, 10, 11): 17,
-    (2, 4, 8, 10, 12): 38,
-    (2, 4, 8, 10, 13): 25,
-    (2, 4, 8, 11, 11): 9,
-    (2, 4, 8, 11, 12): 37,
-    (2, 4, 8, 11, 13): 5,
-    (2, 4, 8, 12, 12): 18,
-    (2, 4, 8, 12, 13): 26,
-    (2, 4, 8, 13, 13): 9,
-    (2, 4, 9, 9, 9): 1,
-    (2, 4, 9, 9, 10): 7,
-    (2, 4, 9, 9, 11): 9,
-    (2, 4, 9, 9, 12): 25,
-    (2, 4, 9, 9, 13): 4,
-    (2, 4, 9, 10, 10): 14,
-    (2, 4, 9, 10, 11): 12,
-    (2, 4, 9, 10, 12): 24,
-    (2, 4, 9, 10, 13): 19,
-    (2, 4, 9, 11, 11): 6,
-    (2, 4, 9, 11, 12): 7,
-    (2, 4, 9, 11, 13): 19,
-    (2, 4, 9, 12, 12): 25,
-    (2, 4, 9, 12, 13): 11,
-    (2, 4, 9, 13, 13): 7,
-    (2, 4, 10, 10, 10): 6,
-    (2, 4, 10, 10, 11): 11,
-    (2, 4, 10, 10, 12): 13,
-    (2, 4, 10, 10, 13): 8,
-    (2, 4, 10, 11, 11): 11,
-    (2, 4, 10, 11, 12): 15,
-    (2, 4, 10, 11, 13): 11,
-    (2, 4, 10, 12, 12): 15,
-    (2, 4, 10, 12, 13): 30,
-    (2, 4, 10, 13, 13): 9,
-    (2, 4, 11, 11, 11): 3,
-    (2, 4, 11, 11, 12): 12,
-    (2, 4, 11, 11, 13): 3,
-    (2, 4, 11, 12, 12): 13,
-    (2, 4, 11, 12, 13): 11,
-    (2, 4, 11, 13, 13): 8,
-    (2, 4, 12, 12, 12): 14,
-    (2, 4, 12, 12, 13): 11,
-    (2, 4, 12, 13, 13): 7,
-    (2, 5, 5, 5, 5): 1,
-    (2, 5, 5, 5, 6): 5,
-    (2, 5, 5, 5, 7): 4,
-    (2, 5, 5, 5, 8): 2,
-    (2, 5, 5, 5, 9): 6,
-    (2, 5, 5, 5, 10): 4,
-    (2, 5, 5, 5, 11): 5,
-    (2, 5, 5, 5, 12): 5,
-    (2, 5, 5, 5, 13): 3,
-    (2, 5, 5, 6, 6): 7,
-    (2, 5, 5, 6, 7): 11,
-    (2, 5, 5, 6, 8): 14,
-    (2, 5, 5, 6, 9): 15,
-    (2, 5, 5, 6, 10): 14,
-    (2, 5, 5, 6, 11): 9,
-    (2, 5, 5, 6, 12): 10,
-    (2, 5, 5, 6, 13): 10,
-    (2, 5, 5, 7, 7): 8,
-    (2, 5, 5, 7, 8): 13,
-    (2, 5, 5, 7, 9): 12,
-    (2, 5, 5, 7, 10): 13,
-    (2, 5, 5, 7, 11): 9,
-    (2, 5, 5, 7, 12): 13,
-    (2, 5, 5, 7, 13): 9,
-    (2, 5, 5, 8, 8): 7,
-    (2, 5, 5, 8, 9): 7,
-    (2, 5, 5, 8, 10): 14,
-    (2, 5, 5, 8, 11): 7,
-    (2, 5, 5, 8, 12): 12,
-    (2, 5, 5, 8, 13): 13,
-    (2, 5, 5, 9, 9): 5,
-    (2, 5, 5, 9, 10): 10,
-    (2, 5, 5, 9, 11): 10,
-    (2, 5, 5, 9, 12): 10,
-    (2, 5, 5, 9, 13): 14,
-    (2, 5, 5, 10, 10): 5,
-    (2, 5, 5, 10, 11): 10,
-    (2, 5, 5, 10, 12): 14,
-    (2, 5, 5, 10, 13): 5,
-    (2, 5, 5, 11, 11): 5,
-    (2, 5, 5, 11, 12): 6,
-    (2, 5, 5, 11, 13): 5,
-    (2, 5, 5, 12, 12): 4,
-    (2, 5, 5, 12, 13): 10,
-    (2, 5, 5, 13, 13): 3,
-    (2, 5, 6, 6, 6): 6,
-    (2, 5, 6, 6, 7): 11,
-    (2, 5, 6, 6, 8): 16,
-    (2, 5, 6, 6, 9): 26,
-    (2, 5, 6, 6, 10): 15,
-    (2, 5, 6, 6, 11): 7,
-    (2, 5, 6, 6, 12): 26,
-    (2, 5, 6, 6, 13): 8,
-    (2, 5, 6, 7, 7): 11,
-    (2, 5, 6, 7, 8): 22,
-    (2, 5, 6, 7, 9): 26,
-    (2, 5, 6, 7, 10): 18,
-    (2, 5, 6, 7, 11): 22,
-    (2, 5, 6, 7, 12): 30,
-    (2, 5, 6, 7, 13): 21,
-    (2, 5, 6, 8, 8): 15,
-    (2, 5, 6, 8, 9): 14,
-    (2, 5, 6, 8, 10): 29,
-    (2, 5, 6, 8, 11): 18,
-    (2, 5, 6, 8, 12): 29,
-    (2, 5, 6, 8, 13): 23,
-    (2, 5, 6, 9, 9): 14,
-    (2, 5, 6, 9, 10): 18,
-    (2, 5, 6, 9, 11): 24,
-    (2, 5, 6, 9, 12): 30,
-    (2, 5, 6, 9, 13): 17,
-    (2, 5, 6, 10, 10): 15,
-    (2, 5, 6, 10, 11): 25,
-    (2, 5, 6, 10, 12): 28,
-    (2, 5, 6, 10, 13): 15,
-    (2, 5, 6, 11, 11): 5,
-    (2, 5, 6, 11, 12): 20,
-    (2, 5, 6, 11, 13): 14,
-    (2, 5, 6, 12, 12): 20,
-    (2, 5, 6, 12, 13): 19,
-    (2, 5, 6, 13, 13): 5,
-    (2, 5, 7, 7, 7): 15,
-    (2, 5, 7, 7, 8): 13,
-    (2, 5, 7, 7, 9): 20,
-    (2, 5, 7, 7, 10): 18,
-    (2, 5, 7, 7, 11): 7,
-    (2, 5, 7, 7, 12): 14,
-    (2, 5, 7, 7, 13): 10,
-    (2, 5, 7, 8, 8): 6,
-    (2, 5, 7, 8, 9): 29,
-    (2, 5, 7, 8, 10): 23,
-    (2, 5, 7, 8, 11): 21,
-    (2, 5, 7, 8, 12): 30,
-    (2, 5, 7, 8, 13): 12,
-    (2, 5, 7, 9, 9): 7,
-    (2, 5, 7, 9, 10): 17,
-    (2, 5, 7, 9, 11): 19,
-    (2, 5, 7, 9, 12): 27,
-    (2, 5, 7, 9, 13): 18,
-    (2, 5, 7, 10, 10): 14,
-    (2, 5, 7, 10, 11): 13,
-    (2, 5, 7, 10, 12): 23,
-    (2, 5, 7, 10, 13): 25,
-    (2, 5, 7, 11, 11): 12,
-    (2, 5, 7, 11, 12): 20,
-    (2, 5, 7, 11, 13): 11,
-    (2, 5, 7, 12, 12): 8,
-    (2, 5, 7, 12, 13): 18,
-    (2, 5, 7, 13, 13): 5,
-    (2, 5, 8, 8, 8): 4,
-    (2, 5, 8, 8, 9): 10,
-    (2, 5, 8, 8, 10): 20,
-    (2, 5, 8, 8, 11): 5,
-    (2, 5, 8, 8, 12): 15,
-    (2, 5, 8, 8, 13): 8,
-    (2, 5, 8, 9, 9): 11,
-    (2, 5, 8, 9, 10): 20,
-    (2, 5, 8, 9, 11): 14,
-    (2, 5, 8, 9, 12): 16,
-    (2, 5, 8, 9, 13): 21,
-    (2, 5, 8, 10, 10): 14,
-    (2, 5, 8, 10, 11): 16,
-    (2, 5, 8, 10, 12): 31,
-    (2, 5, 8, 10, 13): 12,
-    (2, 5, 8, 11, 11): 9,
-    (2, 5, 8, 11, 12): 12,
-    (2, 5, 8, 11, 13): 15,
-    (2, 5, 8, 12, 12): 11,
-    (2, 5, 8, 12, 13): 12,
-    (2, 5, 8, 13, 13): 5,
-    (2, 5, 9, 9, 9): 4,
-    (2, 5, 9, 9, 10): 8,
-    (2, 5, 9, 9, 11): 3,
-    (2, 5, 9, 9, 12): 13,
-    (2, 5, 9, 9, 13): 6,
-    (2, 5, 9, 10, 10): 11,
-    (2, 5, 9, 10, 11): 21,
-    (2, 5, 9, 10, 12): 12,
-    (2, 5, 9, 10, 13): 10,
-    (2, 5, 9, 11, 11): 12,
-    (2, 5, 9, 11, 12): 18,
-    (2, 5, 9, 11, 13): 10,
-    (2, 5, 9, 12, 12): 17,
-    (2, 5, 9, 12, 13): 18,
-    (2, 5, 9, 13, 13): 10,
-    (2, 5, 10, 10, 10): 5,
-    (2, 5, 10, 10, 11): 10,
-    (2, 5, 10, 10, 12): 14,
-    (2, 5, 10, 10, 13): 7,
-    (2, 5, 10, 11, 11): 7,
-    (2, 5, 10, 11, 12): 17,
-    (2, 5, 10, 11, 13): 12,
-    (2, 5, 10, 12, 12): 9,
-    (2, 5, 10, 12, 13): 18,
-    (2, 5, 10, 13, 13): 6,
-    (2, 5, 11, 11, 11): 1,
-    (2, 5, 11, 11, 12): 7,
-    (2, 5, 11, 11, 13): 8,
-    (2, 5, 11, 12, 12): 7,
-    (2, 5, 11, 12, 13): 10,
-    (2, 5, 11, 13, 13): 9,
-    (2, 5, 12, 12, 12): 9,
-    (2, 5, 12, 12, 13): 5,
-    (2, 5, 12, 13, 13): 5,
-    (2, 5, 13, 13, 13): 4,
-    (2, 6, 6, 6, 6): 6,
-    (2, 6, 6, 6, 7): 7,
-    (2, 6, 6, 6, 8): 12,
-    (2, 6, 6, 6, 9): 12,
-    (2, 6, 6, 6, 10): 9,
-    (2, 6, 6, 6, 11): 8,
-    (2, 6, 6, 6, 12): 16,
-    (2, 6, 6, 6, 13): 7,
-    (2, 6, 6, 7, 7): 9,
-    (2, 6, 6, 7, 8): 14,
-    (2, 6, 6, 7, 9): 13,
-    (2, 6, 6, 7, 10): 10,
-    (2, 6, 6, 7, 11): 9,
-    (2, 6, 6, 7, 12): 13,
-    (2, 6, 6, 7, 13): 9,
-    (2, 6, 6, 8, 8): 6,
-    (2, 6, 6, 8, 9): 22,
-    (2, 6, 6, 8, 10): 18,
-    (2, 6, 6, 8, 11): 14,
-    (2, 6, 6, 8, 12): 28,
-    (2, 6, 6, 8, 13): 7,
-    (2, 6, 6, 9, 9): 11,
-    (2, 6, 6, 9, 10): 20,
-    (2, 6, 6, 9, 11): 17,
-    (2, 6, 6, 9, 12): 32,
-    (2, 6, 6, 9, 13): 11,
-    (2, 6, 6, 10, 10): 8,
-    (2, 6, 6, 10, 11): 7,
-    (2, 6, 6, 10, 12): 26,
-    (2, 6, 6, 10, 13): 9,
-    (2, 6, 6, 11, 11): 2,
-    (2, 6, 6, 11, 12): 13,
-    (2, 6, 6, 11, 13): 5,
-    (2, 6, 6, 12, 12): 23,
-    (2, 6, 6, 12, 13): 13,
-    (2, 6, 6, 13, 13): 6,
-    (2, 6, 7, 7, 7): 8,
-    (2, 6, 7, 7, 8): 16,
-    (2, 6, 7, 7, 9): 10,
-    (2, 6, 7, 7, 10): 12,
-    (2, 6, 7, 7, 11): 9,
-    (2, 6, 7, 7, 12): 11,
-    (2, 6, 7, 7, 13): 9,
-    (2, 6, 7, 8, 8): 17,
-    (2, 6, 7, 8, 9): 11,
-    (2, 6, 7, 8, 10): 21,
-    (2, 6, 7, 8, 11): 11,
-    (2, 6, 7, 8, 12): 20,
-    (2, 6, 7, 8, 13): 19,
-    (2, 6, 7, 9, 9): 19,
-    (2, 6, 7, 9, 10): 15,
-    (2, 6, 7, 9, 11): 13,
-    (2, 6, 7, 9, 12): 34,
-    (2, 6, 7, 9, 13): 12,
-    (2, 6, 7, 10, 10): 9,
-    (2, 6, 7, 10, 11): 13,
-    (2, 6, 7, 10, 12): 23,
-    (2, 6, 7, 10, 13): 18,
-    (2, 6, 7, 11, 11): 6,
-    (2, 6, 7, 11, 12): 13,
-    (2, 6, 7, 11, 13): 11,
-    (2, 6, 7, 12, 12): 20,
-    (2, 6, 7, 12, 13): 17,
-    (2, 6, 7, 13, 13): 6,
-    (2, 6, 8, 8, 8): 7,
-    (2, 6, 8, 8, 9): 15,
-    (2, 6, 8, 8, 10): 21,
-    (2, 6, 8, 8, 11): 14,
-    (2, 6, 8, 8, 12): 16,
-    (2, 6, 8, 8, 13): 9,
-    (2, 6, 8, 9, 9): 16,
-    (2, 6, 8, 9, 10): 23,
-    (2, 6, 8, 9, 11): 7,
-    (2, 6, 8, 9, 12): 41,
-    (2, 6, 8, 9, 13): 12,
-    (2, 6, 8, 10, 10): 12,
-    (2, 6, 8, 10, 11): 23,
-    (2, 6, 8, 10, 12): 31,
-    (2, 6, 8, 10, 13): 30,
-    (2, 6, 8, 11, 11): 10,
-    (2, 6, 8, 11, 12): 30,
-    (2, 6, 8, 11, 13): 10,
-    (2, 6, 8, 12, 12): 17,
-    (2, 6, 8, 12, 13): 19,
-    (2, 6, 8, 13, 13): 9,
-    (2, 6, 9, 9, 9): 7,
-    (2, 6, 9, 9, 10): 13,
-    (2, 6, 9, 9, 11): 9,
-    (2, 6, 9, 9, 12): 18,
-    (2, 6, 9, 9, 13): 12,
-    (2, 6, 9, 10, 10): 7,
-    (2, 6, 9, 10, 11): 14,
-    (2, 6, 9, 10, 12): 35,
-    (2, 6, 9, 10, 13): 6,
-    (2, 6, 9, 11, 11): 8,
-    (2, 6, 9, 11, 12): 20,
-    (2, 6, 9, 11, 13): 14,
-    (2, 6, 9, 12, 12): 19,
-    (2, 6, 9, 12, 13): 21,
-    (2, 6, 9, 13, 13): 6,
-    (2, 6, 10, 10, 10): 7,
-    (2, 6, 10, 10, 11): 9,
-    (2, 6, 10, 10, 12): 14,
-    (2, 6, 10, 10, 13): 9,
-    (2, 6, 10, 11, 11): 6,
-    (2, 6, 10, 11, 12): 17,
-    (2, 6, 10, 11, 13): 12,
-    (2, 6, 10, 12, 12): 20,
-    (2, 6, 10, 12, 13): 15,
-    (2, 6, 10, 13, 13): 7,
-    (2, 6, 11, 11, 11): 2,
-    (2, 6, 11, 11, 12): 8,
-    (2, 6, 11, 11, 13): 7,
-    (2, 6, 11, 12, 12): 14,
-    (2, 6, 11, 12, 13): 8,
-    (2, 6, 11, 13, 13): 7,
-    (2, 6, 12, 12, 12): 7,
-    (2, 6, 12, 12, 13): 14,
-    (2, 6, 12, 13, 13): 6,
-    (2, 6, 13, 13, 13): 2,
-    (2, 7, 7, 7, 7): 5,
-    (2, 7, 7, 7, 8): 5,
-    (2, 7, 7, 7, 9): 7,
-    (2, 7, 7, 7, 10): 9,
-    (2, 7, 7, 7, 11): 7,
-    (2, 7, 7, 7, 12): 4,
-    (2, 7, 7, 7, 13): 8,
-    (2, 7, 7, 8, 8): 5,
-    (2, 7, 7, 8, 9): 13,
-    (2, 7, 7, 8, 10): 9,
-    (2, 7, 7, 8, 11): 9,
-    (2, 7, 7, 8, 12): 12,
-    (2, 7, 7, 8, 13): 8,
-    (2, 7, 7, 9, 9): 2,
-    (2, 7, 7, 9, 10): 9,
-    (2, 7, 7, 9, 11): 10,
-    (2, 7, 7, 9, 12): 14,
-    (2, 7, 7, 9, 13): 11,
-    (2, 7, 7, 10, 10): 7,
-    (2, 7, 7, 10, 11): 8,
-    (2, 7, 7, 10, 12): 15,
-    (2, 7, 7, 10, 13): 5,
-    (2, 7, 7, 11, 11): 5,
-    (2, 7, 7, 11, 12): 11,
-    (2, 7, 7, 11, 13): 6,
-    (2, 7, 7, 12, 12): 5,
-    (2, 7, 7, 12, 13): 9,
-    (2, 7, 7, 13, 13): 8,
-    (2, 7, 8, 8, 8): 3,
-    (2, 7, 8, 8, 9): 4,
-    (2, 7, 8, 8, 10): 11,
-    (2, 7, 8, 8, 11): 6,
-    (2, 7, 8, 8, 12): 13,
-    (2, 7, 8, 8, 13): 8,
-    (2, 7, 8, 9, 9): 4,
-    (2, 7, 8, 9, 10): 15,
-    (2, 7, 8, 9, 11): 19,
-    (2, 7, 8, 9, 12): 8,
-    (2, 7, 8, 9, 13): 14,
-    (2, 7, 8, 10, 10): 13,
-    (2, 7, 8, 10, 11): 10,
-    (2, 7, 8, 10, 12): 20,
-    (2, 7, 8, 10, 13): 7,
-    (2, 7, 8, 11, 11): 8,
-    (2, 7, 8, 11, 12): 8,
-    (2, 7, 8, 11, 13): 13,
-    (2, 7, 8, 12, 12): 15,
-    (2, 7, 8, 12, 13): 10,
-    (2, 7, 8, 13, 13): 4,
-    (2, 7, 9, 9, 9): 2,
-    (2, 7, 9, 9, 10): 9,
-    (2, 7, 9, 9, 11): 5,
-    (2, 7, 9, 9, 12): 12,
-    (2, 7, 9, 9, 13): 5,
-    (2, 7, 9, 10, 10): 11,
-    (2, 7, 9, 10, 11): 10,
-    (2, 7, 9, 10, 12): 10,
-    (2, 7, 9, 10, 13): 16,
-    (2, 7, 9, 11, 11): 7,
-    (2, 7, 9, 11, 12): 17,
-    (2, 7, 9, 11, 13): 11,
-    (2, 7, 9, 12, 12): 13,
-    (2, 7, 9, 12, 13): 14,
-    (2, 7, 9, 13, 13): 4,
-    (2, 7, 10, 10, 10): 2,
-    (2, 7, 10, 10, 11): 6,
-    (2, 7, 10, 10, 12): 9,
-    (2, 7, 10, 10, 13): 8,
-    (2, 7, 10, 11, 11): 7,
-    (2, 7, 10, 11, 12): 15,
-    (2, 7, 10, 11, 13): 12,
-    (2, 7, 10, 12, 12): 11,
-    (2, 7, 10, 12, 13): 10,
-    (2, 7, 10, 13, 13): 8,
-    (2, 7, 11, 11, 11): 3,
-    (2, 7, 11, 11, 12): 6,
-    (2, 7, 11, 11, 13): 4,
-    (2, 7, 11, 12, 12): 5,
-    (2, 7, 11, 12, 13): 8,
-    (2, 7, 11, 13, 13): 5,
-    (2, 7, 12, 12, 12): 2,
-    (2, 7, 12, 12, 13): 9,
-    (2, 7, 12, 13, 13): 5,
-    (2, 7, 13, 13, 13): 2,
-    (2, 8, 8, 8, 8): 1,
-    (2, 8, 8, 8, 9): 3,
-    (2, 8, 8, 8, 10): 3,
-    (2, 8, 8, 8, 11): 3,
-    (2, 8, 8, 8, 12): 5,
-    (2, 8, 8, 8, 13): 3,
-    (2, 8, 8, 9, 9): 2,
-    (2, 8, 8, 9, 10): 5,
-    (2, 8, 8, 9, 11): 7,
-    (2, 8, 8, 9, 12): 12,
-    (2, 8, 8, 9, 13): 3,
-    (2, 8, 8, 10, 10): 11,
-    (2, 8, 8, 10, 11): 9,
-    (2, 8, 8, 10, 12): 10,
-    (2, 8, 8, 10, 13): 6,
-    (2, 8, 8, 11, 11): 4,
-    (2, 8, 8, 11, 12): 10,
-    (2, 8, 8, 11, 13): 3,
-    (2, 8, 8, 12, 12): 7,
-    (2, 8, 8, 12, 13): 13,
-    (2, 8, 8, 13, 13): 3,
-    (2, 8, 9, 9, 10): 2,
-    (2, 8, 9, 9, 11): 6,
-    (2, 8, 9, 9, 12): 11,
-    (2, 8, 9, 9, 13): 5,
-    (2, 8, 9, 10, 10): 6,
-    (2, 8, 9, 10, 11): 14,
-    (2, 8, 9, 10, 12): 18,
-    (2, 8, 9, 10, 13): 11,
-    (2, 8, 9, 11, 11): 4,
-    (2, 8, 9, 11, 12): 9,
-    (2, 8, 9, 11, 13): 14,
-    (2, 8, 9, 12, 12): 14,
-    (2, 8, 9, 12, 13): 5,
-    (2, 8, 9, 13, 13): 6,
-    (2, 8, 10, 10, 10): 4,
-    (2, 8, 10, 10, 11): 4,
-    (2, 8, 10, 10, 12): 16,
-    (2, 8, 10, 10, 13): 9,
-    (2, 8, 10, 11, 11): 5,
-    (2, 8, 10, 11, 12): 19,
-    (2, 8, 10, 11, 13): 9,
-    (2, 8, 10, 12, 12): 6,
-    (2, 8, 10, 12, 13): 15,
-    (2, 8, 10, 13, 13): 4,
-    (2, 8, 11, 11, 11): 1,
-    (2, 8, 11, 11, 12): 7,
-    (2, 8, 11, 11, 13): 8,
-    (2, 8, 11, 12, 12): 9,
-    (2, 8, 11, 12, 13): 9,
-    (2, 8, 11, 13, 13): 3,
-    (2, 8, 12, 12, 12): 8,
-    (2, 8, 12, 12, 13): 7,
-    (2, 8, 12, 13, 13): 7,
-    (2, 8, 13, 13, 13): 3,
-    (2, 9, 9, 9, 11): 2,
-    (2, 9, 9, 9, 12): 7,
-    (2, 9, 9, 9, 13): 2,
-    (2, 9, 9, 10, 10): 1,
-    (2, 9, 9, 10, 11): 4,
-    (2, 9, 9, 10, 12): 12,
-    (2, 9, 9, 10, 13): 5,
-    (2, 9, 9, 11, 11): 4,
-    (2, 9, 9, 11, 12): 6,
-    (2, 9, 9, 11, 13): 3,
-    (2, 9, 9, 12, 12): 7,
-    (2, 9, 9, 12, 13): 7,
-    (2, 9, 9, 13, 13): 2,
-    (2, 9, 10, 10, 10): 1,
-    (2, 9, 10, 10, 11): 7,
-    (2, 9, 10, 10, 12): 5,
-    (2, 9, 10, 10, 13): 9,
-    (2, 9, 10, 11, 11): 4,
-    (2, 9, 10, 11, 12): 9,
-    (2, 9, 10, 11, 13): 9,
-    (2, 9, 10, 12, 12): 9,
-    (2, 9, 10, 12, 13): 10,
-    (2, 9, 10, 13, 13): 4,
-    (2, 9, 11, 11, 11): 4,
-    (2, 9, 11, 11, 12): 7,
-    (2, 9, 11, 11, 13): 7,
-    (2, 9, 11, 12, 12): 9,
-    (2, 9, 11, 12, 13): 12,
-    (2, 9, 11, 13, 13): 5,
-    (2, 9, 12, 12, 12): 7,
-    (2, 9, 12, 12, 13): 10,
-    (2, 9, 12, 13, 13): 4,
-    (2, 9, 13, 13, 13): 1,
-    (2, 10, 10, 10, 10): 2,
-    (2, 10, 10, 10, 11): 1,
-    (2, 10, 10, 10, 12): 4,
-    (2, 10, 10, 10, 13): 2,
-    (2, 10, 10, 11, 11): 5,
-    (2, 10, 10, 11, 12): 4,
-    (2, 10, 10, 11, 13): 6,
-    (2, 10, 10, 12, 12): 4,
-    (2, 10, 10, 12, 13): 9,
-    (2, 10, 10, 13, 13): 3,
-    (2, 10, 11, 11, 11): 1,
-    (2, 10, 11, 11, 12): 7,
-    (2, 10, 11, 11, 13): 5,
-    (2, 10, 11, 12, 12): 7,
-    (2, 10, 11, 12, 13): 7,
-    (2, 10, 11, 13, 13): 7,
-    (2, 10, 12, 12, 12): 3,
-    (2, 10, 12, 12, 13): 8,
-    (2, 10, 12, 13, 13): 6,
-    (2, 10, 13, 13, 13): 1,
-    (2, 11, 11, 11, 11): 2,
-    (2, 11, 11, 11, 12): 1,
-    (2, 11, 11, 11, 13): 3,
-    (2, 11, 11, 12, 12): 1,
-    (2, 11, 11, 12, 13): 7,
-    (2, 11, 11, 13, 13): 1,
-    (2, 11, 12, 12, 12): 1,
-    (2, 11, 12, 12, 13): 2,
-    (2, 11, 12, 13, 13): 2,
-    (2, 12, 12, 12, 12): 1,
-    (3, 3, 3, 3, 4): 5,
-    (3, 3, 3, 3, 5): 4,
-    (3, 3, 3, 3, 6): 6,
-    (3, 3, 3, 3, 7): 3,
-    (3, 3, 3, 3, 8): 4,
-    (3, 3, 3, 3, 9): 2,
-    (3, 3, 3, 3, 10): 2,
-    (3, 3, 3, 3, 11): 2,
-    (3, 3, 3, 3, 12): 6,
-    (3, 3, 3, 3, 13): 4,
-    (3, 3, 3, 4, 4): 3,
-    (3, 3, 3, 4, 5): 8,
-    (3, 3, 3, 4, 6): 11,
-    (3, 3, 3, 4, 7): 9,
-    (3, 3, 3, 4, 8): 5,
-    (3, 3, 3, 4, 9): 14,
-    (3, 3, 3, 4, 10): 5,
-    (3, 3, 3, 4, 11): 8,
-    (3, 3, 3, 4, 12): 9,
-    (3, 3, 3, 4, 13): 3,
-    (3, 3, 3, 5, 5): 3,
-    (3, 3, 3, 5, 6): 16,
-    (3, 3, 3, 5, 7): 4,
-    (3, 3, 3, 5, 8): 7,
-    (3, 3, 3, 5, 9): 9,
-    (3, 3, 3, 5, 10): 9,
-    (3, 3, 3, 5, 11): 2,
-    (3, 3, 3, 5, 12): 8,
-    (3, 3, 3, 5, 13): 2,
-    (3, 3, 3, 6, 6): 7,
-    (3, 3, 3, 6, 7): 10,
-    (3, 3, 3, 6, 8): 7,
-    (3, 3, 3, 6, 9): 17,
-    (3, 3, 3, 6, 10): 11,
-    (3, 3, 3, 6, 11): 12,
-    (3, 3, 3, 6, 12): 11,
-    (3, 3, 3, 6, 13): 9,
-    (3, 3, 3, 7, 7): 4,
-    (3, 3, 3, 7, 8): 7,
-    (3, 3, 3, 7, 9): 7,
-    (3, 3, 3, 7, 10): 5,
-    (3, 3, 3, 7, 11): 3,
-    (3, 3, 3, 7, 12): 12,
-    (3, 3, 3, 7, 13): 1,
-    (3, 3, 3, 8, 8): 2,
-    (3, 3, 3, 8, 9): 9,
-    (3, 3, 3, 8, 10): 3,
-    (3, 3, 3, 8, 11): 4,
-    (3, 3, 3, 8, 12): 6,
-    (3, 3, 3, 8, 13): 7,
-    (3, 3, 3, 9, 9): 4,
-    (3, 3, 3, 9, 10): 7,
-    (3, 3, 3, 9, 11): 7,
-    (3, 3, 3, 9, 12): 14,
-    (3, 3, 3, 9, 13): 11,
-    (3, 3, 3, 10, 10): 1,
-    (3, 3, 3, 10, 11): 6,
-    (3, 3, 3, 10, 12): 5,
-    (3, 3, 3, 10, 13): 7,
-    (3, 3, 3, 11, 11): 1,
-    (3, 3, 3, 11, 12): 7,
-    (3, 3, 3, 11, 13): 1,
-    (3, 3, 3, 12, 12): 8,
-    (3, 3, 3, 12, 13): 6,
-    (3, 3, 4, 4, 5): 6,
-    (3, 3, 4, 4, 6): 17,
-    (3, 3, 4, 4, 7): 6,
-    (3, 3, 4, 4, 8): 7,
-    (3, 3, 4, 4, 9): 7,
-    (3, 3, 4, 4, 10): 10,
-    (3, 3, 4, 4, 11): 3,
-    (3, 3, 4, 4, 12): 6,
-    (3, 3, 4, 4, 13): 4,
-    (3, 3, 4, 5, 5): 5,
-    (3, 3, 4, 5, 6): 12,
-    (3, 3, 4, 5, 7): 16,
-    (3, 3, 4, 5, 8): 13,
-    (3, 3, 4, 5, 9): 19,
-    (3, 3, 4, 5, 10): 10,
-    (3, 3, 4, 5, 11): 9,
-    (3, 3, 4, 5, 12): 19,
-    (3, 3, 4, 5, 13): 11,
-    (3, 3, 4, 6, 6): 13,
-    (3, 3, 4, 6, 7): 14,
-    (3, 3, 4, 6, 8): 24,
-    (3, 3, 4, 6, 9): 25,
-    (3, 3, 4, 6, 10): 20,
-    (3, 3, 4, 6, 11): 12,
-    (3, 3, 4, 6, 12): 32,
-    (3, 3, 4, 6, 13): 11,
-    (3, 3, 4, 7, 7): 8,
-    (3, 3, 4, 7, 8): 8,
-    (3, 3, 4, 7, 9): 20,
-    (3, 3, 4, 7, 10): 17,
-    (3, 3, 4, 7, 11): 15,
-    (3, 3, 4, 7, 12): 11,
-    (3, 3, 4, 7, 13): 8,
-    (3, 3, 4, 8, 8): 2,
-    (3, 3, 4, 8, 9): 12,
-    (3, 3, 4, 8, 10): 15,
-    (3, 3, 4, 8, 11): 10,
-    (3, 3, 4, 8, 12): 10,
-    (3, 3, 4, 8, 13): 8,
-    (3, 3, 4, 9, 9): 15,
-    (3, 3, 4, 9, 10): 12,
-    (3, 3, 4, 9, 11): 15,
-    (3, 3, 4, 9, 12): 16,
-    (3, 3, 4, 9, 13): 11,
-    (3, 3, 4, 10, 10): 3,
-    (3, 3, 4, 10, 11): 9,
-    (3, 3, 4, 10, 12): 27,
-    (3, 3, 4, 10, 13): 12,
-    (3, 3, 4, 11, 11): 4,
-    (3, 3, 4, 11, 12): 12,
-    (3, 3, 4, 11, 13): 10,
-    (3, 3, 4, 12, 12): 7,
-    (3, 3, 4, 12, 13): 6,
-    (3, 3, 4, 13, 13): 7,
-    (3, 3, 5, 5, 5): 3,
-    (3, 3, 5, 5, 6): 9,
-    (3, 3, 5, 5, 7): 6,
-    (3, 3, 5, 5, 8): 8,
-    (3, 3, 5, 5, 9): 3,
-    (3, 3, 5, 5, 10): 3,
-    (3, 3, 5, 5, 11): 5,
-    (3, 3, 5, 5, 12): 13,
-    (3, 3, 5, 5, 13): 6,
-    (3, 3, 5, 6, 6): 16,
-    (3, 3, 5, 6, 7): 25,
-    (3, 3, 5, 6, 8): 13,
-    (3, 3, 5, 6, 9): 31,
-    (3, 3, 5, 6, 10): 15,
-    (3, 3, 5, 6, 11): 16,
-    (3, 3, 5, 6, 12): 20,
-    (3, 3, 5, 6, 13): 15,
-    (3, 3, 5, 7, 7): 7,
-    (3, 3, 5, 7, 8): 10,
-    (3, 3, 5, 7, 9): 11,
-    (3, 3, 5, 7, 10): 14,
-    (3, 3, 5, 7, 11): 10,
-    (3, 3, 5, 7, 12): 18,
-    (3, 3, 5, 7, 13): 10,
-    (3, 3, 5, 8, 8): 5,
-    (3, 3, 5, 8, 9): 14,
-    (3, 3, 5, 8, 10): 17,
-    (3, 3, 5, 8, 11): 15,
-    (3, 3, 5, 8, 12): 8,
-    (3, 3, 5, 8, 13): 5,
-    (3, 3, 5, 9, 9): 17,
-    (3, 3, 5, 9, 10): 22,
-    (3, 3, 5, 9, 11): 4,
-    (3, 3, 5, 9, 12): 24,
-    (3, 3, 5, 9, 13): 5,
-    (3, 3, 5, 10, 10): 5,
-    (3, 3, 5, 10, 11): 3,
-    (3, 3, 5, 10, 12): 15,
-    (3, 3, 5, 10, 13): 14,
-    (3, 3, 5, 11, 11): 5,
-    (3, 3, 5, 11, 12): 14,
-    (3, 3, 5, 11, 13): 10,
-    (3, 3, 5, 12, 12): 11,
-    (3, 3, 5, 12, 13): 12,
-    (3, 3, 5, 13, 13): 2,
-    (3, 3, 6, 6, 6): 8,
-    (3, 3, 6, 6, 7): 11,
-    (3, 3, 6, 6, 8): 13,
-    (3, 3, 6, 6, 9): 16,
-    (3, 3, 6, 6, 10): 10,
-    (3, 3, 6, 6, 11): 7,
-    (3, 3, 6, 6, 12): 25,
-    (3, 3, 6, 6, 13): 8,
-    (3, 3, 6, 7, 7): 17,
-    (3, 3, 6, 7, 8): 14,
-    (3, 3, 6, 7, 9): 23,
-    (3, 3, 6, 7, 10): 11,
-    (3, 3, 6, 7, 11): 14,
-    (3, 3, 6, 7, 12): 17,
-    (3, 3, 6, 7, 13): 14,
-    (3, 3, 6, 8, 8): 14,
-    (3, 3, 6, 8, 9): 23,
-    (3, 3, 6, 8, 10): 16,
-    (3, 3, 6, 8, 11): 3,
-    (3, 3, 6, 8, 12): 28,
-    (3, 3, 6, 8, 13): 5,
-    (3, 3, 6, 9, 9): 12,
-    (3, 3, 6, 9, 10): 22,
-    (3, 3, 6, 9, 11): 24,
-    (3, 3, 6, 9, 12): 35,
-    (3, 3, 6, 9, 13): 26,
-    (3, 3, 6, 10, 10): 5,
-    (3, 3, 6, 10, 11): 5,
-    (3, 3, 6, 10, 12): 21,
-    (3, 3, 6, 10, 13): 2,
-    (3, 3, 6, 11, 11): 5,
-    (3, 3, 6, 11, 12): 18,
-    (3, 3, 6, 11, 13): 8,
-    (3, 3, 6, 12, 12): 19,
-    (3, 3, 6, 12, 13): 17,
-    (3, 3, 6, 13, 13): 5,
-    (3, 3, 7, 7, 7): 3,
-    (3, 3, 7, 7, 8): 10,
-    (3, 3, 7, 7, 9): 10,
-    (3, 3, 7, 7, 10): 4,
-    (3, 3, 7, 7, 11): 5,
-    (3, 3, 7, 7, 12): 15,
-    (3, 3, 7, 7, 13): 5,
-    (3, 3, 7, 8, 8): 5,
-    (3, 3, 7, 8, 9): 16,
-    (3, 3, 7, 8, 10): 9,
-    (3, 3, 7, 8, 11): 4,
-    (3, 3, 7, 8, 12): 10,
-    (3, 3, 7, 8, 13): 14,
-    (3, 3, 7, 9, 9): 9,
-    (3, 3, 7, 9, 10): 12,
-    (3, 3, 7, 9, 11): 8,
-    (3, 3, 7, 9, 12): 21,
-    (3, 3, 7, 9, 13): 4,
-    (3, 3, 7, 10, 10): 9,
-    (3, 3, 7, 10, 11): 12,
-    (3, 3, 7, 10, 12): 11,
-    (3, 3, 7, 10, 13): 5,
-    (3, 3, 7, 11, 11): 5,
-    (3, 3, 7, 11, 12): 16,
-    (3, 3, 7, 11, 13): 5,
-    (3, 3, 7, 12, 12): 9,
-    (3, 3, 7, 12, 13): 14,
-    (3, 3, 7, 13, 13): 8,
-    (3, 3, 8, 8, 8): 1,
-    (3, 3, 8, 8, 9): 2,
-    (3, 3, 8, 8, 10): 6,
-    (3, 3, 8, 8, 11): 2,
-    (3, 3, 8, 8, 12): 3,
-    (3, 3, 8, 8, 13): 5,
-    (3, 3, 8, 9, 9): 10,
-    (3, 3, 8, 9, 10): 9,
-    (3, 3, 8, 9, 11): 11,
-    (3, 3, 8, 9, 12): 14,
-    (3, 3, 8, 9, 13): 6,
-    (3, 3, 8, 10, 10): 5,
-    (3, 3, 8, 10, 11): 12,
-    (3, 3, 8, 10, 12): 16,
-    (3, 3, 8, 10, 13): 5,
-    (3, 3, 8, 11, 11): 5,
-    (3, 3, 8, 11, 12): 8,
-    (3, 3, 8, 11, 13): 6,
-    (3, 3, 8, 12, 12): 4,
-    (3, 3, 8, 12, 13): 10,
-    (3, 3, 8, 13, 13): 2,
-    (3, 3, 9, 9, 9): 3,
-    (3, 3, 9, 9, 10): 12,
-    (3, 3, 9, 9, 11): 8,
-    (3, 3, 9, 9, 12): 16,
-    (3, 3, 9, 9, 13): 8,
-    (3, 3, 9, 10, 10): 3,
-    (3, 3, 9, 10, 11): 11,
-    (3, 3, 9, 10, 12): 16,
-    (3, 3, 9, 10, 13): 8,
-    (3, 3, 9, 11, 11): 1,
-    (3, 3, 9, 11, 12): 13,
-    (3, 3, 9, 11, 13): 6,
-    (3, 3, 9, 12, 12): 15,
-    (3, 3, 9, 12, 13): 12,
-    (3, 3, 9, 13, 13): 3,
-    (3, 3, 10, 10, 10): 1,
-    (3, 3, 10, 10, 11): 2,
-    (3, 3, 10, 10, 12): 6,
-    (3, 3, 10, 10, 13): 7,
-    (3, 3, 10, 11, 11): 3,
-    (3, 3, 10, 11, 12): 7,
-    (3, 3, 10, 11, 13): 5,
-    (3, 3, 10, 12, 12): 8,
-    (3, 3, 10, 12, 13): 11,
-    (3, 3, 10, 13, 13): 6,
-    (3, 3, 11, 11, 11): 2,
-    (3, 3, 11, 11, 12): 5,
-    (3, 3, 11, 11, 13): 3,
-    (3, 3, 11, 12, 12): 3,
-    (3, 3, 11, 12, 13): 7,
-    (3, 3, 11, 13, 13): 2,
-    (3, 3, 12, 12, 12): 3,
-    (3, 3, 12, 12, 13): 2,
-    (3, 3, 12, 13, 13): 6,
-    (3, 3, 13, 13, 13): 1,
-    (3, 4, 4, 4, 5): 1,
-    (3, 4, 4, 4, 6): 6,
-    (3, 4, 4, 4, 7): 4,
-    (3, 4, 4, 4, 8): 4,
-    (3, 4, 4, 4, 9): 3,
-    (3, 4, 4, 4, 10): 9,
-    (3, 4, 4, 4, 11): 3,
-    (3, 4, 4, 4, 12): 2,
-    (3, 4, 4, 4, 13): 4,
-    (3, 4, 4, 5, 5): 4,
-    (3, 4, 4, 5, 6): 19,
-    (3, 4, 4, 5, 7): 10,
-    (3, 4, 4, 5, 8): 7,
-    (3, 4, 4, 5, 9): 8,
-    (3, 4, 4, 5, 10): 22,
-    (3, 4, 4, 5, 11): 15,
-    (3, 4, 4, 5, 12): 6,
-    (3, 4, 4, 5, 13): 9,
-    (3, 4, 4, 6, 6): 12,
-    (3, 4, 4, 6, 7): 16,
-    (3, 4, 4, 6, 8): 13,
-    (3, 4, 4, 6, 9): 27,
-    (3, 4, 4, 6, 10): 17,
-    (3, 4, 4, 6, 11): 16,
-    (3, 4, 4, 6, 12): 28,
-    (3, 4, 4, 6, 13): 11,
-    (3, 4, 4, 7, 7): 6,
-    (3, 4, 4, 7, 8): 12,
-    (3, 4, 4, 7, 9): 10,
-    (3, 4, 4, 7, 10): 16,
-    (3, 4, 4, 7, 11): 12,
-    (3, 4, 4, 7, 12): 9,
-    (3, 4, 4, 7, 13): 8,
-    (3, 4, 4, 8, 8): 6,
-    (3, 4, 4, 8, 9): 10,
-    (3, 4, 4, 8, 10): 14,
-    (3, 4, 4, 8, 11): 6,
-    (3, 4, 4, 8, 12): 9,
-    (3, 4, 4, 8, 13): 8,
-    (3, 4, 4, 9, 9): 5,
-    (3, 4, 4, 9, 10): 14,
-    (3, 4, 4, 9, 11): 6,
-    (3, 4, 4, 9, 12): 11,
-    (3, 4, 4, 9, 13): 8,
-    (3, 4, 4, 10, 10): 7,
-    (3, 4, 4, 10, 11): 14,
-    (3, 4, 4, 10, 12): 17,
-    (3, 4, 4, 10, 13): 6,
-    (3, 4, 4, 11, 11): 6,
-    (3, 4, 4, 11, 12): 8,
-    (3, 4, 4, 11, 13): 10,
-    (3, 4, 4, 12, 12): 4,
-    (3, 4, 4, 12, 13): 7,
-    (3, 4, 4, 13, 13): 6,
-    (3, 4, 5, 5, 5): 6,
-    (3, 4, 5, 5, 6): 17,
-    (3, 4, 5, 5, 7): 12,
-    (3, 4, 5, 5, 8): 10,
-    (3, 4, 5, 5, 9): 12,
-    (3, 4, 5, 5, 10): 12,
-    (3, 4, 5, 5, 11): 10,
-    (3, 4, 5, 5, 12): 9,
-    (3, 4, 5, 5, 13): 11,
-    (3, 4, 5, 6, 6): 23,
-    (3, 4, 5, 6, 7): 21,
-    (3, 4, 5, 6, 8): 23,
-    (3, 4, 5, 6, 9): 22,
-    (3, 4, 5, 6, 10): 25,
-    (3, 4, 5, 6, 11): 26,
-    (3, 4, 5, 6, 12): 37,
-    (3, 4, 5, 6, 13): 21,
-    (3, 4, 5, 7, 7): 17,
-    (3, 4, 5, 7, 8): 21,
-    (3, 4, 5, 7, 9): 19,
-    (3, 4, 5, 7, 10): 20,
-    (3, 4, 5, 7, 11): 18,
-    (3, 4, 5, 7, 12): 30,
-    (3, 4, 5, 7, 13): 12,
-    (3, 4, 5, 8, 8): 5,
-    (3, 4, 5, 8, 9): 17,
-    (3, 4, 5, 8, 10): 29,
-    (3, 4, 5, 8, 11): 20,
-    (3, 4, 5, 8, 12): 12,
-    (3, 4, 5, 8, 13): 20,
-    (3, 4, 5, 9, 9): 14,
-    (3, 4, 5, 9, 10): 22,
-    (3, 4, 5, 9, 11): 16,
-    (3, 4, 5, 9, 12): 20,
-    (3, 4, 5, 9, 13): 19,
-    (3, 4, 5, 10, 10): 7,
-    (3, 4, 5, 10, 11): 19,
-    (3, 4, 5, 10, 12): 19,
-    (3, 4, 5, 10, 13): 16,
-    (3, 4, 5, 11, 11): 9,
-    (3, 4, 5, 11, 12): 14,
-    (3, 4, 5, 11, 13): 11,
-    (3, 4, 5, 12, 12): 15,
-    (3, 4, 5, 12, 13): 19,
-    (3, 4, 5, 13, 13): 3,
-    (3, 4, 6, 6, 6): 16,
-    (3, 4, 6, 6, 7): 22,
-    (3, 4, 6, 6, 8): 26,
-    (3, 4, 6, 6, 9): 29,
-    (3, 4, 6, 6, 10): 18,
-    (3, 4, 6, 6, 11): 16,
-    (3, 4, 6, 6, 12): 26,
-    (3, 4, 6, 6, 13): 17,
-    (3, 4, 6, 7, 7): 17,
-    (3, 4, 6, 7, 8): 33,
-    (3, 4, 6, 7, 9): 30,
-    (3, 4, 6, 7, 10): 15,
-    (3, 4, 6, 7, 11): 19,
-    (3, 4, 6, 7, 12): 36,
-    (3, 4, 6, 7, 13): 25,
-    (3, 4, 6, 8, 8): 20,
-    (3, 4, 6, 8, 9): 33,
-    (3, 4, 6, 8, 10): 23,
-    (3, 4, 6, 8, 11): 20,
-    (3, 4, 6, 8, 12): 61,
-    (3, 4, 6, 8, 13): 27,
-    (3, 4, 6, 9, 9): 19,
-    (3, 4, 6, 9, 10): 30,
-    (3, 4, 6, 9, 11): 21,
-    (3, 4, 6, 9, 12): 50,
-    (3, 4, 6, 9, 13): 15,
-    (3, 4, 6, 10, 10): 16,
-    (3, 4, 6, 10, 11): 17,
-    (3, 4, 6, 10, 12): 26,
-    (3, 4, 6, 10, 13): 10,
-    (3, 4, 6, 11, 11): 6,
-    (3, 4, 6, 11, 12): 25,
-    (3, 4, 6, 11, 13): 15,
-    (3, 4, 6, 12, 12): 31,
-    (3, 4, 6, 12, 13): 30,
-    (3, 4, 6, 13, 13): 7,
-    (3, 4, 7, 7, 7): 10,
-    (3, 4, 7, 7, 8): 12,
-    (3, 4, 7, 7, 9): 12,
-    (3, 4, 7, 7, 10): 13,
-    (3, 4, 7, 7, 11): 11,
-    (3, 4, 7, 7, 12): 12,
-    (3, 4, 7, 7, 13): 12,
-    (3, 4, 7, 8, 8): 8,
-    (3, 4, 7, 8, 9): 19,
-    (3, 4, 7, 8, 10): 26,
-    (3, 4, 7, 8, 11): 20,
-    (3, 4, 7, 8, 12): 11,
-    (3, 4, 7, 8, 13): 14,
-    (3, 4, 7, 9, 9): 14,
-    (3, 4, 7, 9, 10): 20,
-    (3, 4, 7, 9, 11): 19,
-    (3, 4, 7, 9, 12): 21,
-    (3, 4, 7, 9, 13): 18,
-    (3, 4, 7, 10, 10): 7,
-    (3, 4, 7, 10, 11): 17,
-    (3, 4, 7, 10, 12): 29,
-    (3, 4, 7, 10, 13): 13,
-    (3, 4, 7, 11, 11): 8,
-    (3, 4, 7, 11, 12): 15,
-    (3, 4, 7, 11, 13): 11,
-    (3, 4, 7, 12, 12): 8,
-    (3, 4, 7, 12, 13): 13,
-    (3, 4, 7, 13, 13): 7,
-    (3, 4, 8, 8, 8): 4,
-    (3, 4, 8, 8, 9): 5,
-    (3, 4, 8, 8, 10): 17,
-    (3, 4, 8, 8, 11): 4,
-    (3, 4, 8, 8, 12): 7,
-    (3, 4, 8, 8, 13): 5,
-    (3, 4, 8, 9, 9): 13,
-    (3, 4, 8, 9, 10): 16,
-    (3, 4, 8, 9, 11): 12,
-    (3, 4, 8, 9, 12): 22,
-    (3, 4, 8, 9, 13): 14,
-    (3, 4, 8, 10, 10): 10,
-    (3, 4, 8, 10, 11): 15,
-    (3, 4, 8, 10, 12): 30,
-    (3, 4, 8, 10, 13): 19,
-    (3, 4, 8, 11, 11): 11,
-    (3, 4, 8, 11, 12): 10,
-    (3, 4, 8, 11, 13): 16,
-    (3, 4, 8, 12, 12): 17,
-    (3, 4, 8, 12, 13): 6,
-    (3, 4, 8, 13, 13): 4,
-    (3, 4, 9, 9, 9): 12,
-    (3, 4, 9, 9, 10): 10,
-    (3, 4, 9, 9, 11): 17,
-    (3, 4, 9, 9, 12): 16,
-    (3, 4, 9, 9, 13): 5,
-    (3, 4, 9, 10, 10): 9,
-    (3, 4, 9, 10, 11): 16,
-    (3, 4, 9, 10, 12): 35,
-    (3, 4, 9, 10, 13): 9,
-    (3, 4, 9, 11, 11): 6,
-    (3, 4, 9, 11, 12): 21,
-    (3, 4, 9, 11, 13): 9,
-    (3, 4, 9, 12, 12): 11,
-    (3, 4, 9, 12, 13): 18,
-    (3, 4, 9, 13, 13): 13,
-    (3, 4, 10, 10, 10): 4,
-    (3, 4, 10, 10, 11): 9,
-    (3, 4, 10, 10, 12): 4,
-    (3, 4, 10, 10, 13): 8,
-    (3, 4, 10, 11, 11): 6,
-    (3, 4, 10, 11, 12): 11,
-    (3, 4, 10, 11, 13): 11,
-    (3, 4, 10, 12, 12): 25,
-    (3, 4, 10, 12, 13): 13,
-    (3, 4, 10, 13, 13): 7,
-    (3, 4, 11, 11, 11): 4,
-    (3, 4, 11, 11, 12): 4,
-    (3, 4, 11, 11, 13): 7,
-    (3, 4, 11, 12, 12): 8,
-    (3, 4, 11, 12, 13): 14,
-    (3, 4, 11, 13, 13): 7,
-    (3, 4, 12, 12, 12): 3,
-    (3, 4, 12, 12, 13): 5,
-    (3, 4, 12, 13, 13): 7,
-    (3, 4, 13, 13, 13): 4,
-    (3, 5, 5, 5, 5): 1,
-    (3, 5, 5, 5, 6): 3,
-    (3, 5, 5, 5, 7): 5,
-    (3, 5, 5, 5, 8): 5,
-    (3, 5, 5, 5, 9): 5,
-    (3, 5, 5, 5, 10): 4,
-    (3, 5, 5, 5, 11): 5,
-    (3, 5, 5, 5, 12): 3,
-    (3, 5, 5, 5, 13): 2,
-    (3, 5, 5, 6, 6): 6,
-    (3, 5, 5, 6, 7): 8,
-    (3, 5, 5, 6, 8): 10,
-    (3, 5, 5, 6, 9): 24,
-    (3, 5, 5, 6, 10): 9,
-    (3, 5, 5, 6, 11): 11,
-    (3, 5, 5, 6, 12): 9,
-    (3, 5, 5, 6, 13): 8,
-    (3, 5, 5, 7, 7): 8,
-    (3, 5, 5, 7, 8): 12,
-    (3, 5, 5, 7, 9): 9,
-    (3, 5, 5, 7, 10): 10,
-    (3, 5, 5, 7, 11): 6,
-    (3, 5, 5, 7, 12): 8,
-    (3, 5, 5, 7, 13): 9,
-    (3, 5, 5, 8, 8): 8,
-    (3, 5, 5, 8, 9): 9,
-    (3, 5, 5, 8, 10): 6,
-    (3, 5, 5, 8, 11): 3,
-    (3, 5, 5, 8, 12): 13,
-    (3, 5, 5, 8, 13): 5,
-    (3, 5, 5, 9, 9): 1,
-    (3, 5, 5, 9, 10): 8,
-    (3, 5, 5, 9, 11): 10,
-    (3, 5, 5, 9, 12): 13,
-    (3, 5, 5, 9, 13): 8,
-    (3, 5, 5, 10, 10): 4,
-    (3, 5, 5, 10, 11): 15,
-    (3, 5, 5, 10, 12): 13,
-    (3, 5, 5, 10, 13): 9,
-    (3, 5, 5, 11, 11): 3,
-    (3, 5, 5, 11, 12): 3,
-    (3, 5, 5, 11, 13): 4,
-    (3, 5, 5, 12, 12): 4,
-    (3, 5, 5, 12, 13): 6,
-    (3, 5, 5, 13, 13): 6,
-    (3, 5, 6, 6, 6): 7,
-    (3, 5, 6, 6, 7): 9,
-    (3, 5, 6, 6, 8): 20,
-    (3, 5, 6, 6, 9): 22,
-    (3, 5, 6, 6, 10): 25,
-    (3, 5, 6, 6, 11): 4,
-    (3, 5, 6, 6, 12): 20,
-    (3, 5, 6, 6, 13): 7,
-    (3, 5, 6, 7, 7): 14,
-    (3, 5, 6, 7, 8): 20,
-    (3, 5, 6, 7, 9): 30,
-    (3, 5, 6, 7, 10): 22,
-    (3, 5, 6, 7, 11): 13,
-    (3, 5, 6, 7, 12): 28,
-    (3, 5, 6, 7, 13): 22,
-    (3, 5, 6, 8, 8): 12,
-    (3, 5, 6, 8, 9): 19,
-    (3, 5, 6, 8, 10): 16,
-    (3, 5, 6, 8, 11): 20,
-    (3, 5, 6, 8, 12): 43,
-    (3, 5, 6, 8, 13): 20,
-    (3, 5, 6, 9, 9): 18,
-    (3, 5, 6, 9, 10): 21,
-    (3, 5, 6, 9, 11): 27,
-    (3, 5, 6, 9, 12): 33,
-    (3, 5, 6, 9, 13): 19,
-    (3, 5, 6, 10, 10): 14,
-    (3, 5, 6, 10, 11): 19,
-    (3, 5, 6, 10, 12): 24,
-    (3, 5, 6, 10, 13): 16,
-    (3, 5, 6, 11, 11): 9,
-    (3, 5, 6, 11, 12): 17,
-    (3, 5, 6, 11, 13): 11,
-    (3, 5, 6, 12, 12): 21,
-    (3, 5, 6, 12, 13): 14,
-    (3, 5, 6, 13, 13): 8,
-    (3, 5, 7, 7, 7): 5,
-    (3, 5, 7, 7, 8): 14,
-    (3, 5, 7, 7, 9): 14,
-    (3, 5, 7, 7, 10): 14,
-    (3, 5, 7, 7, 11): 10,
-    (3, 5, 7, 7, 12): 9,
-    (3, 5, 7, 7, 13): 6,
-    (3, 5, 7, 8, 8): 9,
-    (3, 5, 7, 8, 9): 11,
-    (3, 5, 7, 8, 10): 23,
-    (3, 5, 7, 8, 11): 14,
-    (3, 5, 7, 8, 12): 17,
-    (3, 5, 7, 8, 13): 13,
-    (3, 5, 7, 9, 9): 7,
-    (3, 5, 7, 9, 10): 17,
-    (3, 5, 7, 9, 11): 12,
-    (3, 5, 7, 9, 12): 34,
-    (3, 5, 7, 9, 13): 20,
-    (3, 5, 7, 10, 10): 13,
-    (3, 5, 7, 10, 11): 21,
-    (3, 5, 7, 10, 12): 23,
-    (3, 5, 7, 10, 13): 14,
-    (3, 5, 7, 11, 11): 4,
-    (3, 5, 7, 11, 12): 14,
-    (3, 5, 7, 11, 13): 9,
-    (3, 5, 7, 12, 12): 7,
-    (3, 5, 7, 12, 13): 9,
-    (3, 5, 7, 13, 13): 5,
-    (3, 5, 8, 8, 8): 3,
-    (3, 5, 8, 8, 9): 11,
-    (3, 5, 8, 8, 10): 14,
-    (3, 5, 8, 8, 11): 7,
-    (3, 5, 8, 8, 12): 2,
-    (3, 5, 8, 8, 13): 5,
-    (3, 5, 8, 9, 9): 12,
-    (3, 5, 8, 9, 10): 13,
-    (3, 5, 8, 9, 11): 10,
-    (3, 5, 8, 9, 12): 16,
-    (3, 5, 8, 9, 13): 16,
-    (3, 5, 8, 10, 10): 11,
-    (3, 5, 8, 10, 11): 12,
-    (3, 5, 8, 10, 12): 21,
-    (3, 5, 8, 10, 13): 17,
-    (3, 5, 8, 11, 11): 7,
-    (3, 5, 8, 11, 12): 18,
-    (3, 5, 8, 11, 13): 6,
-    (3, 5, 8, 12, 12): 6,
-    (3, 5, 8, 12, 13): 15,
-    (3, 5, 8, 13, 13): 12,
-    (3, 5, 9, 9, 9): 7,
-    (3, 5, 9, 9, 10): 18,
-    (3, 5, 9, 9, 11): 4,
-    (3, 5, 9, 9, 12): 17,
-    (3, 5, 9, 9, 13): 2,
-    (3, 5, 9, 10, 10): 8,
-    (3, 5, 9, 10, 11): 12,
-    (3, 5, 9, 10, 12): 14,
-    (3, 5, 9, 10, 13): 14,
-    (3, 5, 9, 11, 11): 9,
-    (3, 5, 9, 11, 12): 19,
-    (3, 5, 9, 11, 13): 10,
-    (3, 5, 9, 12, 12): 11,
-    (3, 5, 9, 12, 13): 16,
-    (3, 5, 9, 13, 13): 4,
-    (3, 5, 10, 10, 10): 5,
-    (3, 5, 10, 10, 11): 11,
-    (3, 5, 10, 10, 12): 9,
-    (3, 5, 10, 10, 13): 8,
-    (3, 5, 10, 11, 11): 10,
-    (3, 5, 10, 11, 12): 15,
-    (3, 5, 10, 11, 13): 15,
-    (3, 5, 10, 12, 12): 24,
-    (3, 5, 10, 12, 13): 17,
-    (3, 5, 10, 13, 13): 5,
-    (3, 5, 11, 11, 11): 1,
-    (3, 5, 11, 11, 12): 6,
-    (3, 5, 11, 11, 13): 5,
-    (3, 5, 11, 12, 12): 8,
-    (3, 5, 11, 12, 13): 5,
-    (3, 5, 11, 13, 13): 4,
-    (3, 5, 12, 12, 12): 1,
-    (3, 5, 12, 12, 13): 3,
-    (3, 5, 12, 13, 13): 2,
-    (3, 5, 13, 13, 13): 1,
-    (3, 6, 6, 6, 6): 3,
-    (3, 6, 6, 6, 7): 7,
-    (3, 6, 6, 6, 8): 9,
-    (3, 6, 6, 6, 9): 14,
-    (3, 6, 6, 6, 10): 9,
-    (3, 6, 6, 6, 11): 8,
-    (3, 6, 6, 6, 12): 20,
-    (3, 6, 6, 6, 13): 4,
-    (3, 6, 6, 7, 7): 2,
-    (3, 6, 6, 7, 8): 10,
-    (3, 6, 6, 7, 9): 11,
-    (3, 6, 6, 7, 10): 13,
-    (3, 6, 6, 7, 11): 10,
-    (3, 6, 6, 7, 12): 19,
-    (3, 6, 6, 7, 13): 8,
-    (3, 6, 6, 8, 8): 7,
-    (3, 6, 6, 8, 9): 14,
-    (3, 6, 6, 8, 10): 20,
-    (3, 6, 6, 8, 11): 14,
-    (3, 6, 6, 8, 12): 23,
-    (3, 6, 6, 8, 13): 10,
-    (3, 6, 6, 9, 9): 15,
-    (3, 6, 6, 9, 10): 19,
-    (3, 6, 6, 9, 11): 18,
-    (3, 6, 6, 9, 12): 32,
-    (3, 6, 6, 9, 13): 16,
-    (3, 6, 6, 10, 10): 8,
-    (3, 6, 6, 10, 11): 9,
-    (3, 6, 6, 10, 12): 22,
-    (3, 6, 6, 10, 13): 11,
-    (3, 6, 6, 11, 11): 3,
-    (3, 6, 6, 11, 12): 16,
-    (3, 6, 6, 11, 13): 7,
-    (3, 6, 6, 12, 12): 18,
-    (3, 6, 6, 12, 13): 16,
-    (3, 6, 6, 13, 13): 2,
-    (3, 6, 7, 7, 7): 6,
-    (3, 6, 7, 7, 8): 8,
-    (3, 6, 7, 7, 9): 22,
-    (3, 6, 7, 7, 10): 9,
-    (3, 6, 7, 7, 11): 16,
-    (3, 6, 7, 7, 12): 12,
-    (3, 6, 7, 7, 13): 7,
-    (3, 6, 7, 8, 8): 5,
-    (3, 6, 7, 8, 9): 20,
-    (3, 6, 7, 8, 10): 27,
-    (3, 6, 7, 8, 11): 16,
-    (3, 6, 7, 8, 12): 28,
-    (3, 6, 7, 8, 13): 13,
-    (3, 6, 7, 9, 9): 22,
-    (3, 6, 7, 9, 10): 15,
-    (3, 6, 7, 9, 11): 20,
-    (3, 6, 7, 9, 12): 30,
-    (3, 6, 7, 9, 13): 22,
-    (3, 6, 7, 10, 10): 6,
-    (3, 6, 7, 10, 11): 21,
-    (3, 6, 7, 10, 12): 23,
-    (3, 6, 7, 10, 13): 23,
-    (3, 6, 7, 11, 11): 8,
-    (3, 6, 7, 11, 12): 14,
-    (3, 6, 7, 11, 13): 16,
-    (3, 6, 7, 12, 12): 19,
-    (3, 6, 7, 12, 13): 9,
-    (3, 6, 7, 13, 13): 4,
-    (3, 6, 8, 8, 8): 3,
-    (3, 6, 8, 8, 9): 16,
-    (3, 6, 8, 8, 10): 15,
-    (3, 6, 8, 8, 11): 11,
-    (3, 6, 8, 8, 12): 13,
-    (3, 6, 8, 8, 13): 7,
-    (3, 6, 8, 9, 9): 22,
-    (3, 6, 8, 9, 10): 19,
-    (3, 6, 8, 9, 11): 11,
-    (3, 6, 8, 9, 12): 36,
-    (3, 6, 8, 9, 13): 12,
-    (3, 6, 8, 10, 10): 7,
-    (3, 6, 8, 10, 11): 10,
-    (3, 6, 8, 10, 12): 34,
-    (3, 6, 8, 10, 13): 25,
-    (3, 6, 8, 11, 11): 7,
-    (3, 6, 8, 11, 12): 21,
-    (3, 6, 8, 11, 13): 22,
-    (3, 6, 8, 12, 12): 26,
-    (3, 6, 8, 12, 13): 12,
-    (3, 6, 8, 13, 13): 4,
-    (3, 6, 9, 9, 9): 10,
-    (3, 6, 9, 9, 10): 13,
-    (3, 6, 9, 9, 11): 20,
-    (3, 6, 9, 9, 12): 21,
-    (3, 6, 9, 9, 13): 25,
-    (3, 6, 9, 10, 10): 13,
-    (3, 6, 9, 10, 11): 14,
-    (3, 6, 9, 10, 12): 19,
-    (3, 6, 9, 10, 13): 11,
-    (3, 6, 9, 11, 11): 11,
-    (3, 6, 9, 11, 12): 25,
-    (3, 6, 9, 11, 13): 13,
-    (3, 6, 9, 12, 12): 32,
-    (3, 6, 9, 12, 13): 25,
-    (3, 6, 9, 13, 13): 9,
-    (3, 6, 10, 10, 10): 2,
-    (3, 6, 10, 10, 11): 7,
-    (3, 6, 10, 10, 12): 14,
-    (3, 6, 10, 10, 13): 5,
-    (3, 6, 10, 11, 11): 8,
-    (3, 6, 10, 11, 12): 15,
-    (3, 6, 10, 11, 13): 12,
-    (3, 6, 10, 12, 12): 14,
-    (3, 6, 10, 12, 13): 19,
-    (3, 6, 10, 13, 13): 12,
-    (3, 6, 11, 11, 11): 4,
-    (3, 6, 11, 11, 12): 5,
-    (3, 6, 11, 11, 13): 6,
-    (3, 6, 11, 12, 12): 14,
-    (3, 6, 11, 12, 13): 12,
-    (3, 6, 11, 13, 13): 8,
-    (3, 6, 12, 12, 12): 12,
-    (3, 6, 12, 12, 13): 11,
-    (3, 6, 12, 13, 13): 6,
-    (3, 6, 13, 13, 13): 4,
-    (3, 7, 7, 7, 7): 3,
-    (3, 7, 7, 7, 8): 6,
-    (3, 7, 7, 7, 9): 3,
-    (3, 7, 7, 7, 10): 7,
-    (3, 7, 7, 7, 11): 5,
-    (3, 7, 7, 7, 12): 10,
-    (3, 7, 7, 7, 13): 2,
-    (3, 7, 7, 8, 8): 3,
-    (3, 7, 7, 8, 9): 6,
-    (3, 7, 7, 8, 10): 10,
-    (3, 7, 7, 8, 11): 12,
-    (3, 7, 7, 8, 12): 10,
-    (3, 7, 7, 8, 13): 6,
-    (3, 7, 7, 9, 9): 7,
-    (3, 7, 7, 9, 10): 9,
-    (3, 7, 7, 9, 11): 10,
-    (3, 7, 7, 9, 12): 15,
-    (3, 7, 7, 9, 13): 6,
-    (3, 7, 7, 10, 10): 2,
-    (3, 7, 7, 10, 11): 7,
-    (3, 7, 7, 10, 12): 9,
-    (3, 7, 7, 10, 13): 8,
-    (3, 7, 7, 11, 11): 3,
-    (3, 7, 7, 11, 12): 7,
-    (3, 7, 7, 11, 13): 9,
-    (3, 7, 7, 12, 12): 4,
-    (3, 7, 7, 12, 13): 6,
-    (3, 7, 7, 13, 13): 1,
-    (3, 7, 8, 8, 8): 3,
-    (3, 7, 8, 8, 9): 4,
-    (3, 7, 8, 8, 10): 7,
-    (3, 7, 8, 8, 11): 7,
-    (3, 7, 8, 8, 12): 6,
-    (3, 7, 8, 8, 13): 6,
-    (3, 7, 8, 9, 9): 13,
-    (3, 7, 8, 9, 10): 18,
-    (3, 7, 8, 9, 11): 9,
-    (3, 7, 8, 9, 12): 16,
-    (3, 7, 8, 9, 13): 11,
-    (3, 7, 8, 10, 10): 6,
-    (3, 7, 8, 10, 11): 11,
-    (3, 7, 8, 10, 12): 11,
-    (3, 7, 8, 10, 13): 9,
-    (3, 7, 8, 11, 11): 3,
-    (3, 7, 8, 11, 12): 15,
-    (3, 7, 8, 11, 13): 11,
-    (3, 7, 8, 12, 12): 11,
-    (3, 7, 8, 12, 13): 14,
-    (3, 7, 8, 13, 13): 7,
-    (3, 7, 9, 9, 9): 6,
-    (3, 7, 9, 9, 10): 11,
-    (3, 7, 9, 9, 11): 5,
-    (3, 7, 9, 9, 12): 11,
-    (3, 7, 9, 9, 13): 5,
-    (3, 7, 9, 10, 10): 4,
-    (3, 7, 9, 10, 11): 11,
-    (3, 7, 9, 10, 12): 20,
-    (3, 7, 9, 10, 13): 14,
-    (3, 7, 9, 11, 11): 6,
-    (3, 7, 9, 11, 12): 24,
-    (3, 7, 9, 11, 13): 12,
-    (3, 7, 9, 12, 12): 11,
-    (3, 7, 9, 12, 13): 13,
-    (3, 7, 9, 13, 13): 6,
-    (3, 7, 10, 10, 10): 3,
-    (3, 7, 10, 10, 11): 5,
-    (3, 7, 10, 10, 12): 6,
-    (3, 7, 10, 10, 13): 2,
-    (3, 7, 10, 11, 11): 6,
-    (3, 7, 10, 11, 12): 14,
-    (3, 7, 10, 11, 13): 10,
-    (3, 7, 10, 12, 12): 11,
-    (3, 7, 10, 12, 13): 14,
-    (3, 7, 10, 13, 13): 5,
-    (3, 7, 11, 11, 11): 1,
-    (3, 7, 11, 11, 12): 5,
-    (3, 7, 11, 11, 13): 4,
-    (3, 7, 11, 12, 12): 4,
-    (3, 7, 11, 12, 13): 8,
-    (3, 7, 11, 13, 13): 2,
-    (3, 7, 12, 12, 12): 3,
-    (3, 7, 12, 12, 13): 9,
-    (3, 7, 12, 13, 13): 6,
-    (3, 7, 13, 13, 13): 1,
-    (3, 8, 8, 8, 9): 1,
-    (3, 8, 8, 8, 10): 4,
-    (3, 8, 8, 8, 11): 2,
-    (3, 8, 8, 8, 12): 2,
-    (3, 8, 8, 8, 13): 2,
-    (3, 8, 8, 9, 9): 2,
-    (3, 8, 8, 9, 10): 11,
-    (3, 8, 8, 9, 11): 8,
-    (3, 8, 8, 9, 12): 5,
-    (3, 8, 8, 9, 13): 2,
-    (3, 8, 8, 10, 10): 5,
-    (3, 8, 8, 10, 11): 9,
-    (3, 8, 8, 10, 12): 12,
-    (3, 8, 8, 10, 13): 6,
-    (3, 8, 8, 11, 11): 1,
-    (3, 8, 8, 11, 12): 3,
-    (3, 8, 8, 11, 13): 3,
-    (3, 8, 8, 12, 12): 7,
-    (3, 8, 8, 12, 13): 4,
-    (3, 8, 8, 13, 13): 8,
-    (3, 8, 9, 9, 9): 3,
-    (3, 8, 9, 9, 10): 8,
-    (3, 8, 9, 9, 11): 5,
-    (3, 8, 9, 9, 12): 16,
-    (3, 8, 9, 9, 13): 8,
-    (3, 8, 9, 10, 10): 7,
-    (3, 8, 9, 10, 11): 11,
-    (3, 8, 9, 10, 12): 23,
-    (3, 8, 9, 10, 13): 12,
-    (3, 8, 9, 11, 11): 11,
-    (3, 8, 9, 11, 12): 9,
-    (3, 8, 9, 11, 13): 12,
-    (3, 8, 9, 12, 12): 9,
-    (3, 8, 9, 12, 13): 12,
-    (3, 8, 9, 13, 13): 3,
-    (3, 8, 10, 10, 10): 3,
-    (3, 8, 10, 10, 11): 5,
-    (3, 8, 10, 10, 12): 11,
-    (3, 8, 10, 10, 13): 4,
-    (3, 8, 10, 11, 11): 2,
-    (3, 8, 10, 11, 12): 14,
-    (3, 8, 10, 11, 13): 15,
-    (3, 8, 10, 12, 12): 12,
-    (3, 8, 10, 12, 13): 8,
-    (3, 8, 10, 13, 13): 3,
-    (3, 8, 11, 11, 11): 2,
-    (3, 8, 11, 11, 12): 3,
-    (3, 8, 11, 11, 13): 8,
-    (3, 8, 11, 12, 12): 5,
-    (3, 8, 11, 12, 13): 9,
-    (3, 8, 11, 13, 13): 7,
-    (3, 8, 12, 12, 12): 3,
-    (3, 8, 12, 12, 13): 7,
-    (3, 8, 12, 13, 13): 4,
-    (3, 8, 13, 13, 13): 1,
-    (3, 9, 9, 9, 10): 5,
-    (3, 9, 9, 9, 11): 6,
-    (3, 9, 9, 9, 12): 12,
-    (3, 9, 9, 9, 13): 7,
-    (3, 9, 9, 10, 10): 2,
-    (3, 9, 9, 10, 11): 13,
-    (3, 9, 9, 10, 12): 11,
-    (3, 9, 9, 10, 13): 5,
-    (3, 9, 9, 11, 11): 1,
-    (3, 9, 9, 11, 12): 11,
-    (3, 9, 9, 11, 13): 5,
-    (3, 9, 9, 12, 12): 9,
-    (3, 9, 9, 12, 13): 9,
-    (3, 9, 9, 13, 13): 3,
-    (3, 9, 10, 10, 10): 3,
-    (3, 9, 10, 10, 11): 5,
-    (3, 9, 10, 10, 12): 9,
-    (3, 9, 10, 10, 13): 7,
-    (3, 9, 10, 11, 11): 4,
-    (3, 9, 10, 11, 12): 11,
-    (3, 9, 10, 11, 13): 11,
-    (3, 9, 10, 12, 12): 14,
-    (3, 9, 10, 12, 13): 10,
-    (3, 9, 10, 13, 13): 9,
-    (3, 9, 11, 11, 11): 2,
-    (3, 9, 11, 11, 12): 9,
-    (3, 9, 11, 11, 13): 4,
-    (3, 9, 11, 12, 12): 10,
-    (3, 9, 11, 12, 13): 16,
-    (3, 9, 11, 13, 13): 5,
-    (3, 9, 12, 12, 12): 4,
-    (3, 9, 12, 12, 13): 6,
-    (3, 9, 12, 13, 13): 11,
-    (3, 9, 13, 13, 13): 3,
-    (3, 10, 10, 10, 11): 3,
-    (3, 10, 10, 10, 12): 4,
-    (3, 10, 10, 10, 13): 3,
-    (3, 10, 10, 11, 11): 4,
-    (3, 10, 10, 11, 12): 2,
-    (3, 10, 10, 11, 13): 2,
-    (3, 10, 10, 12, 12): 3,
-    (3, 10, 10, 12, 13): 4,
-    (3, 10, 10, 13, 13): 2,
-    (3, 10, 11, 11, 11): 3,
-    (3, 10, 11, 11, 12): 3,
-    (3, 10, 11, 11, 13): 4,
-    (3, 10, 11, 12, 12): 12,
-    (3, 10, 11, 12, 13): 11,
-    (3, 10, 11, 13, 13): 6,
-    (3, 10, 12, 12, 12): 7,
-    (3, 10, 12, 12, 13): 7,
-    (3, 10, 12, 13, 13): 6,
-    (3, 10, 13, 13, 13): 4,
-    (3, 11, 11, 11, 12): 5,
-    (3, 11, 11, 11, 13): 3,
-    (3, 11, 11, 12, 12): 2,
-    (3, 11, 11, 12, 13): 2,
-    (3, 11, 11, 13, 13): 2,
-    (3, 11, 12, 12, 12): 1,
-    (3, 11, 12, 12, 13): 6,
-    (3, 11, 12, 13, 13): 3,
-    (3, 11, 13, 13, 13): 1,
-    (3, 12, 12, 12, 12): 2,
-    (3, 12, 12, 12, 13): 1,
-    (3, 12, 12, 13, 13): 1,
-    (3, 12, 13, 13, 13): 2,
-    (3, 13, 13, 13, 13): 1,
-    (4, 4, 4, 4, 5): 1,
-    (4, 4, 4, 4, 6): 4,
-    (4, 4, 4, 4, 7): 1,
-    (4, 4, 4, 4, 10): 4,
-    (4, 4, 4, 4, 11): 2,
-    (4, 4, 4, 4, 12): 1,
-    (4, 4, 4, 5, 5): 1,
-    (4, 4, 4, 5, 6): 10,
-    (4, 4, 4, 5, 7): 1,
-    (4, 4, 4, 5, 8): 4,
-    (4, 4, 4, 5, 9): 3,
-    (4, 4, 4, 5, 10): 5,
-    (4, 4, 4, 5, 11): 1,
-    (4, 4, 4, 5, 12): 2,
-    (4, 4, 4, 6, 6): 2,
-    (4, 4, 4, 6, 7): 10,
-    (4, 4, 4, 6, 8): 7,
-    (4, 4, 4, 6, 9): 6,
-    (4, 4, 4, 6, 10): 9,
-    (4, 4, 4, 6, 11): 4,
-    (4, 4, 4, 6, 12): 8,
-    (4, 4, 4, 6, 13): 7,
-    (4, 4, 4, 7, 7): 3,
-    (4, 4, 4, 7, 8): 7,
-    (4, 4, 4, 7, 9): 2,
-    (4, 4, 4, 7, 10): 4,
-    (4, 4, 4, 7, 11): 2,
-    (4, 4, 4, 7, 12): 3,
-    (4, 4, 4, 7, 13): 2,
-    (4, 4, 4, 8, 8): 1,
-    (4, 4, 4, 8, 9): 4,
-    (4, 4, 4, 8, 10): 13,
-    (4, 4, 4, 8, 11): 9,
-    (4, 4, 4, 8, 12): 3,
-    (4, 4, 4, 8, 13): 4,
-    (4, 4, 4, 9, 10): 5,
-    (4, 4, 4, 9, 11): 1,
-    (4, 4, 4, 9, 12): 3,
-    (4, 4, 4, 9, 13): 3,
-    (4, 4, 4, 10, 10): 2,
-    (4, 4, 4, 10, 11): 5,
-    (4, 4, 4, 10, 12): 9,
-    (4, 4, 4, 10, 13): 3,
-    (4, 4, 4, 11, 11): 2,
-    (4, 4, 4, 11, 12): 2,
-    (4, 4, 4, 11, 13): 2,
-    (4, 4, 4, 12, 12): 2,
-    (4, 4, 4, 12, 13): 2,
-    (4, 4, 4, 13, 13): 2,
-    (4, 4, 5, 5, 5): 1,
-    (4, 4, 5, 5, 6): 4,
-    (4, 4, 5, 5, 7): 6,
-    (4, 4, 5, 5, 8): 5,
-    (4, 4, 5, 5, 9): 5,
-    (4, 4, 5, 5, 10): 5,
-    (4, 4, 5, 5, 11): 3,
-    (4, 4, 5, 5, 12): 7,
-    (4, 4, 5, 5, 13): 4,
-    (4, 4, 5, 6, 6): 5,
-    (4, 4, 5, 6, 7): 13,
-    (4, 4, 5, 6, 8): 25,
-    (4, 4, 5, 6, 9): 9,
-    (4, 4, 5, 6, 10): 10,
-    (4, 4, 5, 6, 11): 15,
-    (4, 4, 5, 6, 12): 18,
-    (4, 4, 5, 6, 13): 10,
-    (4, 4, 5, 7, 7): 5,
-    (4, 4, 5, 7, 8): 6,
-    (4, 4, 5, 7, 9): 10,
-    (4, 4, 5, 7, 10): 17,
-    (4, 4, 5, 7, 11): 7,
-    (4, 4, 5, 7, 12): 9,
-    (4, 4, 5, 7, 13): 9,
-    (4, 4, 5, 8, 8): 7,
-    (4, 4, 5, 8, 9): 5,
-    (4, 4, 5, 8, 10): 16,
-    (4, 4, 5, 8, 11): 6,
-    (4, 4, 5, 8, 12): 8,
-    (4, 4, 5, 8, 13): 4,
-    (4, 4, 5, 9, 9): 1,
-    (4, 4, 5, 9, 10): 9,
-    (4, 4, 5, 9, 11): 9,
-    (4, 4, 5, 9, 12): 5,
-    (4, 4, 5, 9, 13): 5,
-    (4, 4, 5, 10, 10): 9,
-    (4, 4, 5, 10, 11): 9,
-    (4, 4, 5, 10, 12): 20,
-    (4, 4, 5, 10, 13): 11,
-    (4, 4, 5, 11, 11): 3,
-    (4, 4, 5, 11, 12): 5,
-    (4, 4, 5, 11, 13): 8,
-    (4, 4, 5, 12, 12): 2,
-    (4, 4, 5, 12, 13): 5,
-    (4, 4, 5, 13, 13): 2,
-    (4, 4, 6, 6, 6): 5,
-    (4, 4, 6, 6, 7): 6,
-    (4, 4, 6, 6, 8): 10,
-    (4, 4, 6, 6, 9): 11,
-    (4, 4, 6, 6, 10): 8,
-    (4, 4, 6, 6, 11): 3,
-    (4, 4, 6, 6, 12): 14,
-    (4, 4, 6, 6, 13): 3,
-    (4, 4, 6, 7, 7): 11,
-    (4, 4, 6, 7, 8): 17,
-    (4, 4, 6, 7, 9): 8,
-    (4, 4, 6, 7, 10): 11,
-    (4, 4, 6, 7, 11): 6,
-    (4, 4, 6, 7, 12): 17,
-    (4, 4, 6, 7, 13): 9,
-    (4, 4, 6, 8, 8): 11,
-    (4, 4, 6, 8, 9): 19,
-    (4, 4, 6, 8, 10): 18,
-    (4, 4, 6, 8, 11): 18,
-    (4, 4, 6, 8, 12): 18,
-    (4, 4, 6, 8, 13): 18,
-    (4, 4, 6, 9, 9): 4,
-    (4, 4, 6, 9, 10): 5,
-    (4, 4, 6, 9, 11): 5,
-    (4, 4, 6, 9, 12): 24,
-    (4, 4, 6, 9, 13): 11,
-    (4, 4, 6, 10, 10): 8,
-    (4, 4, 6, 10, 11): 8,
-    (4, 4, 6, 10, 12): 16,
-    (4, 4, 6, 10, 13): 9,
-    (4, 4, 6, 11, 11): 3,
-    (4, 4, 6, 11, 12): 16,
-    (4, 4, 6, 11, 13): 5,
-    (4, 4, 6, 12, 12): 15,
-    (4, 4, 6, 12, 13): 11,
-    (4, 4, 6, 13, 13): 3,
-    (4, 4, 7, 7, 7): 4,
-    (4, 4, 7, 7, 8): 9,
-    (4, 4, 7, 7, 9): 5,
-    (4, 4, 7, 7, 10): 6,
-    (4, 4, 7, 7, 11): 5,
-    (4, 4, 7, 7, 12): 7,
-    (4, 4, 7, 7, 13): 6,
-    (4, 4, 7, 8, 8): 6,
-    (4, 4, 7, 8, 9): 3,
-    (4, 4, 7, 8, 10): 12,
-    (4, 4, 7, 8, 11): 4,
-    (4, 4, 7, 8, 12): 15,
-    (4, 4, 7, 8, 13): 7,
-    (4, 4, 7, 9, 9): 4,
-    (4, 4, 7, 9, 10): 9,
-    (4, 4, 7, 9, 11): 11,
-    (4, 4, 7, 9, 12): 7,
-    (4, 4, 7, 9, 13): 10,
-    (4, 4, 7, 10, 10): 6,
-    (4, 4, 7, 10, 11): 8,
-    (4, 4, 7, 10, 12): 15,
-    (4, 4, 7, 10, 13): 4,
-    (4, 4, 7, 11, 11): 4,
-    (4, 4, 7, 11, 12): 3,
-    (4, 4, 7, 11, 13): 6,
-    (4, 4, 7, 12, 12): 4,
-    (4, 4, 7, 12, 13): 6,
-    (4, 4, 7, 13, 13): 2,
-    (4, 4, 8, 8, 8): 2,
-    (4, 4, 8, 8, 9): 8,
-    (4, 4, 8, 8, 10): 9,
-    (4, 4, 8, 8, 11): 8,
-    (4, 4, 8, 8, 12): 10,
-    (4, 4, 8, 8, 13): 8,
-    (4, 4, 8, 9, 9): 1,
-    (4, 4, 8, 9, 10): 10,
-    (4, 4, 8, 9, 11): 2,
-    (4, 4, 8, 9, 12): 6,
-    (4, 4, 8, 9, 13): 2,
-    (4, 4, 8, 10, 10): 8,
-    (4, 4, 8, 10, 11): 11,
-    (4, 4, 8, 10, 12): 21,
-    (4, 4, 8, 10, 13): 10,
-    (4, 4, 8, 11, 11): 2,
-    (4, 4, 8, 11, 12): 13,
-    (4, 4, 8, 11, 13): 1,
-    (4, 4, 8, 12, 12): 7,
-    (4, 4, 8, 12, 13): 11,
-    (4, 4, 8, 13, 13): 2,
-    (4, 4, 9, 9, 10): 4,
-    (4, 4, 9, 9, 11): 3,
-    (4, 4, 9, 9, 12): 5,
-    (4, 4, 9, 9, 13): 1,
-    (4, 4, 9, 10, 10): 3,
-    (4, 4, 9, 10, 11): 10,
-    (4, 4, 9, 10, 12): 11,
-    (4, 4, 9, 10, 13): 6,
-    (4, 4, 9, 11, 11): 6,
-    (4, 4, 9, 11, 12): 5,
-    (4, 4, 9, 11, 13): 9,
-    (4, 4, 9, 12, 12): 7,
-    (4, 4, 9, 12, 13): 5,
-    (4, 4, 10, 10, 10): 2,
-    (4, 4, 10, 10, 11): 2,
-    (4, 4, 10, 10, 12): 8,
-    (4, 4, 10, 10, 13): 2,
-    (4, 4, 10, 11, 11): 1,
-    (4, 4, 10, 11, 12): 14,
-    (4, 4, 10, 11, 13): 7,
-    (4, 4, 10, 12, 12): 8,
-    (4, 4, 10, 12, 13): 12,
-    (4, 4, 10, 13, 13): 2,
-    (4, 4, 11, 11, 11): 1,
-    (4, 4, 11, 11, 12): 2,
-    (4, 4, 11, 11, 13): 6,
-    (4, 4, 11, 12, 12): 3,
-    (4, 4, 11, 12, 13): 4,
-    (4, 4, 11, 13, 13): 4,
-    (4, 4, 12, 12, 12): 2,
-    (4, 4, 12, 12, 13): 1,
-    (4, 4, 12, 13, 13): 1,
-    (4, 4, 13, 13, 13): 1,
-    (4, 5, 5, 5, 5): 1,
-    (4, 5, 5, 5, 7): 3,
-    (4, 5, 5, 5, 8): 6,
-    (4, 5, 5, 5, 9): 3,
-    (4, 5, 5, 5, 10): 6,
-    (4, 5, 5, 5, 11): 3,
-    (4, 5, 5, 5, 12): 6,
-    (4, 5, 5, 5, 13): 2,
-    (4, 5, 5, 6, 6): 3,
-    (4, 5, 5, 6, 7): 13,
-    (4, 5, 5, 6, 8): 19,
-    (4, 5, 5, 6, 9): 7,
-    (4, 5, 5, 6, 10): 14,
-    (4, 5, 5, 6, 11): 6,
-    (4, 5, 5, 6, 12): 12,
-    (4, 5, 5, 6, 13): 10,
-    (4, 5, 5, 7, 7): 5,
-    (4, 5, 5, 7, 8): 11,
-    (4, 5, 5, 7, 9): 12,
-    (4, 5, 5, 7, 10): 12,
-    (4, 5, 5, 7, 11): 10,
-    (4, 5, 5, 7, 12): 8,
-    (4, 5, 5, 7, 13): 7,
-    (4, 5, 5, 8, 8): 5,
-    (4, 5, 5, 8, 9): 8,
-    (4, 5, 5, 8, 10): 12,
-    (4, 5, 5, 8, 11): 12,
-    (4, 5, 5, 8, 12): 2,
-    (4, 5, 5, 8, 13): 7,
-    (4, 5, 5, 9, 9): 1,
-    (4, 5, 5, 9, 10): 3,
-    (4, 5, 5, 9, 11): 7,
-    (4, 5, 5, 9, 12): 11,
-    (4, 5, 5, 9, 13): 3,
-    (4, 5, 5, 10, 10): 7,
-    (4, 5, 5, 10, 11): 4,
-    (4, 5, 5, 10, 12): 14,
-    (4, 5, 5, 10, 13): 9,
-    (4, 5, 5, 11, 11): 2,
-    (4, 5, 5, 11, 12): 7,
-    (4, 5, 5, 11, 13): 9,
-    (4, 5, 5, 12, 12): 1,
-    (4, 5, 5, 12, 13): 3,
-    (4, 5, 5, 13, 13): 2,
-    (4, 5, 6, 6, 6): 4,
-    (4, 5, 6, 6, 7): 13,
-    (4, 5, 6, 6, 8): 11,
-    (4, 5, 6, 6, 9): 22,
-    (4, 5, 6, 6, 10): 16,
-    (4, 5, 6, 6, 11): 5,
-    (4, 5, 6, 6, 12): 17,
-    (4, 5, 6, 6, 13): 6,
-    (4, 5, 6, 7, 7): 14,
-    (4, 5, 6, 7, 8): 20,
-    (4, 5, 6, 7, 9): 21,
-    (4, 5, 6, 7, 10): 21,
-    (4, 5, 6, 7, 11): 11,
-    (4, 5, 6, 7, 12): 12,
-    (4, 5, 6, 7, 13): 10,
-    (4, 5, 6, 8, 8): 16,
-    (4, 5, 6, 8, 9): 21,
-    (4, 5, 6, 8, 10): 31,
-    (4, 5, 6, 8, 11): 12,
-    (4, 5, 6, 8, 12): 34,
-    (4, 5, 6, 8, 13): 9,
-    (4, 5, 6, 9, 9): 7,
-    (4, 5, 6, 9, 10): 11,
-    (4, 5, 6, 9, 11): 12,
-    (4, 5, 6, 9, 12): 24,
-    (4, 5, 6, 9, 13): 18,
-    (4, 5, 6, 10, 10): 8,
-    (4, 5, 6, 10, 11): 12,
-    (4, 5, 6, 10, 12): 22,
-    (4, 5, 6, 10, 13): 19,
-    (4, 5, 6, 11, 11): 5,
-    (4, 5, 6, 11, 12): 14,
-    (4, 5, 6, 11, 13): 10,
-    (4, 5, 6, 12, 12): 12,
-    (4, 5, 6, 12, 13): 11,
-    (4, 5, 6, 13, 13): 5,
-    (4, 5, 7, 7, 7): 7,
-    (4, 5, 7, 7, 8): 12,
-    (4, 5, 7, 7, 9): 12,
-    (4, 5, 7, 7, 10): 10,
-    (4, 5, 7, 7, 11): 4,
-    (4, 5, 7, 7, 12): 11,
-    (4, 5, 7, 7, 13): 6,
-    (4, 5, 7, 8, 8): 3,
-    (4, 5, 7, 8, 9): 20,
-    (4, 5, 7, 8, 10): 10,
-    (4, 5, 7, 8, 11): 16,
-    (4, 5, 7, 8, 12): 12,
-    (4, 5, 7, 8, 13): 20,
-    (4, 5, 7, 9, 9): 4,
-    (4, 5, 7, 9, 10): 19,
-    (4, 5, 7, 9, 11): 8,
-    (4, 5, 7, 9, 12): 21,
-    (4, 5, 7, 9, 13): 5,
-    (4, 5, 7, 10, 10): 9,
-    (4, 5, 7, 10, 11): 15,
-    (4, 5, 7, 10, 12): 24,
-    (4, 5, 7, 10, 13): 8,
-    (4, 5, 7, 11, 11): 5,
-    (4, 5, 7, 11, 12): 10,
-    (4, 5, 7, 11, 13): 4,
-    (4, 5, 7, 12, 12): 3,
-    (4, 5, 7, 12, 13): 13,
-    (4, 5, 7, 13, 13): 5,
-    (4, 5, 8, 8, 8): 5,
-    (4, 5, 8, 8, 9): 5,
-    (4, 5, 8, 8, 10): 14,
-    (4, 5, 8, 8, 11): 1,
-    (4, 5, 8, 8, 12): 14,
-    (4, 5, 8, 8, 13): 2,
-    (4, 5, 8, 9, 9): 8,
-    (4, 5, 8, 9, 10): 19,
-    (4, 5, 8, 9, 11): 17,
-    (4, 5, 8, 9, 12): 8,
-    (4, 5, 8, 9, 13): 6,
-    (4, 5, 8, 10, 10): 12,
-    (4, 5, 8, 10, 11): 20,
-    (4, 5, 8, 10, 12): 24,
-    (4, 5, 8, 10, 13): 19,
-    (4, 5, 8, 11, 11): 10,
-    (4, 5, 8, 11, 12): 5,
-    (4, 5, 8, 11, 13): 13,
-    (4, 5, 8, 12, 12): 6,
-    (4, 5, 8, 12, 13): 10,
-    (4, 5, 8, 13, 13): 6,
-    (4, 5, 9, 9, 9): 3,
-    (4, 5, 9, 9, 10): 8,
-    (4, 5, 9, 9, 11): 6,
-    (4, 5, 9, 9, 12): 6,
-    (4, 5, 9, 10, 10): 10,
-    (4, 5, 9, 10, 11): 8,
-    (4, 5, 9, 10, 12): 18,
-    (4, 5, 9, 10, 13): 9,
-    (4, 5, 9, 11, 11): 7,
-    (4, 5, 9, 11, 12): 16,
-    (4, 5, 9, 11, 13): 11,
-    (4, 5, 9, 12, 12): 10,
-    (4, 5, 9, 12, 13): 13,
-    (4, 5, 9, 13, 13): 6,
-    (4, 5, 10, 10, 10): 6,
-    (4, 5, 10, 10, 11): 8,
-    (4, 5, 10, 10, 12): 16,
-    (4, 5, 10, 10, 13): 6,
-    (4, 5, 10, 11, 11): 6,
-    (4, 5, 10, 11, 12): 21,
-    (4, 5, 10, 11, 13): 10,
-    (4, 5, 10, 12, 12): 13,
-    (4, 5, 10, 12, 13): 10,
-    (4, 5, 10, 13, 13): 4,
-    (4, 5, 11, 11, 11): 3,
-    (4, 5, 11, 11, 12): 6,
-    (4, 5, 11, 11, 13): 3,
-    (4, 5, 11, 12, 12): 4,
-    (4, 5, 11, 12, 13): 8,
-    (4, 5, 11, 13, 13): 5,
-    (4, 5, 12, 12, 12): 4,
-    (4, 5, 12, 12, 13): 5,
-    (4, 5, 12, 13, 13): 2,
-    (4, 6, 6, 6, 6): 2,
-    (4, 6, 6, 6, 7): 5,
-    (4, 6, 6, 6, 8): 13,
-    (4, 6, 6, 6, 9): 8,
-    (4, 6, 6, 6, 10): 10,
-    (4, 6, 6, 6, 11): 5,
-    (4, 6, 6, 6, 12): 15,
-    (4, 6, 6, 6, 13): 3,
-    (4, 6, 6, 7, 7): 5,
-    (4, 6, 6, 7, 8): 7,
-    (4, 6, 6, 7, 9): 19,
-    (4, 6, 6, 7, 10): 8,
-    (4, 6, 6, 7, 11): 12,
-    (4, 6, 6, 7, 12): 13,
-    (4, 6, 6, 7, 13): 6,
-    (4, 6, 6, 8, 8): 6,
-    (4, 6, 6, 8, 9): 23,
-    (4, 6, 6, 8, 10): 20,
-    (4, 6, 6, 8, 11): 11,
-    (4, 6, 6, 8, 12): 19,
-    (4, 6, 6, 8, 13): 7,
-    (4, 6, 6, 9, 9): 8,
-    (4, 6, 6, 9, 10): 18,
-    (4, 6, 6, 9, 11): 11,
-    (4, 6, 6, 9, 12): 23,
-    (4, 6, 6, 9, 13): 7,
-    (4, 6, 6, 10, 10): 3,
-    (4, 6, 6, 10, 11): 4,
-    (4, 6, 6, 10, 12): 27,
-    (4, 6, 6, 10, 13): 9,
-    (4, 6, 6, 11, 11): 2,
-    (4, 6, 6, 11, 12): 12,
-    (4, 6, 6, 11, 13): 11,
-    (4, 6, 6, 12, 12): 13,
-    (4, 6, 6, 12, 13): 11,
-    (4, 6, 6, 13, 13): 2,
-    (4, 6, 7, 7, 7): 4,
-    (4, 6, 7, 7, 8): 15,
-    (4, 6, 7, 7, 9): 6,
-    (4, 6, 7, 7, 10): 13,
-    (4, 6, 7, 7, 11): 5,
-    (4, 6, 7, 7, 12): 17,
-    (4, 6, 7, 7, 13): 6,
-    (4, 6, 7, 8, 8): 14,
-    (4, 6, 7, 8, 9): 11,
-    (4, 6, 7, 8, 10): 24,
-    (4, 6, 7, 8, 11): 19,
-    (4, 6, 7, 8, 12): 28,
-    (4, 6, 7, 8, 13): 15,
-    (4, 6, 7, 9, 9): 12,
-    (4, 6, 7, 9, 10): 14,
-    (4, 6, 7, 9, 11): 18,
-    (4, 6, 7, 9, 12): 26,
-    (4, 6, 7, 9, 13): 11,
-    (4, 6, 7, 10, 10): 12,
-    (4, 6, 7, 10, 11): 15,
-    (4, 6, 7, 10, 12): 15,
-    (4, 6, 7, 10, 13): 14,
-    (4, 6, 7, 11, 11): 6,
-    (4, 6, 7, 11, 12): 13,
-    (4, 6, 7, 11, 13): 17,
-    (4, 6, 7, 12, 12): 26,
-    (4, 6, 7, 12, 13): 11,
-    (4, 6, 7, 13, 13): 2,
-    (4, 6, 8, 8, 8): 5,
-    (4, 6, 8, 8, 9): 12,
-    (4, 6, 8, 8, 10): 15,
-    (4, 6, 8, 8, 11): 14,
-    (4, 6, 8, 8, 12): 17,
-    (4, 6, 8, 8, 13): 15,
-    (4, 6, 8, 9, 9): 15,
-    (4, 6, 8, 9, 10): 20,
-    (4, 6, 8, 9, 11): 12,
-    (4, 6, 8, 9, 12): 39,
-    (4, 6, 8, 9, 13): 6,
-    (4, 6, 8, 10, 10): 20,
-    (4, 6, 8, 10, 11): 22,
-    (4, 6, 8, 10, 12): 23,
-    (4, 6, 8, 10, 13): 17,
-    (4, 6, 8, 11, 11): 5,
-    (4, 6, 8, 11, 12): 25,
-    (4, 6, 8, 11, 13): 11,
-    (4, 6, 8, 12, 12): 31,
-    (4, 6, 8, 12, 13): 22,
-    (4, 6, 8, 13, 13): 6,
-    (4, 6, 9, 9, 9): 5,
-    (4, 6, 9, 9, 10): 14,
-    (4, 6, 9, 9, 11): 7,
-    (4, 6, 9, 9, 12): 18,
-    (4, 6, 9, 9, 13): 10,
-    (4, 6, 9, 10, 10): 7,
-    (4, 6, 9, 10, 11): 7,
-    (4, 6, 9, 10, 12): 31,
-    (4, 6, 9, 10, 13): 14,
-    (4, 6, 9, 11, 11): 6,
-    (4, 6, 9, 11, 12): 19,
-    (4, 6, 9, 11, 13): 16,
-    (4, 6, 9, 12, 12): 26,
-    (4, 6, 9, 12, 13): 12,
-    (4, 6, 9, 13, 13): 5,
-    (4, 6, 10, 10, 10): 3,
-    (4, 6, 10, 10, 11): 9,
-    (4, 6, 10, 10, 12): 20,
-    (4, 6, 10, 10, 13): 9,
-    (4, 6, 10, 11, 11): 12,
-    (4, 6, 10, 11, 12): 17,
-    (4, 6, 10, 11, 13): 8,
-    (4, 6, 10, 12, 12): 13,
-    (4, 6, 10, 12, 13): 14,
-    (4, 6, 10, 13, 13): 5,
-    (4, 6, 11, 11, 11): 3,
-    (4, 6, 11, 11, 12): 7,
-    (4, 6, 11, 11, 13): 3,
-    (4, 6, 11, 12, 12): 11,
-    (4, 6, 11, 12, 13): 6,
-    (4, 6, 11, 13, 13): 7,
-    (4, 6, 12, 12, 12): 11,
-    (4, 6, 12, 12, 13): 16,
-    (4, 6, 12, 13, 13): 6,
-    (4, 6, 13, 13, 13): 1,
-    (4, 7, 7, 7, 7): 2,
-    (4, 7, 7, 7, 8): 6,
-    (4, 7, 7, 7, 9): 8,
-    (4, 7, 7, 7, 10): 8,
-    (4, 7, 7, 7, 11): 6,
-    (4, 7, 7, 7, 12): 5,
-    (4, 7, 7, 7, 13): 3,
-    (4, 7, 7, 8, 8): 5,
-    (4, 7, 7, 8, 9): 12,
-    (4, 7, 7, 8, 10): 14,
-    (4, 7, 7, 8, 11): 12,
-    (4, 7, 7, 8, 12): 6,
-    (4, 7, 7, 8, 13): 5,
-    (4, 7, 7, 9, 9): 4,
-    (4, 7, 7, 9, 10): 8,
-    (4, 7, 7, 9, 11): 7,
-    (4, 7, 7, 9, 12): 13,
-    (4, 7, 7, 9, 13): 4,
-    (4, 7, 7, 10, 10): 4,
-    (4, 7, 7, 10, 11): 10,
-    (4, 7, 7, 10, 12): 16,
-    (4, 7, 7, 10, 13): 9,
-    (4, 7, 7, 11, 11): 3,
-    (4, 7, 7, 11, 12): 8,
-    (4, 7, 7, 11, 13): 11,
-    (4, 7, 7, 12, 12): 4,
-    (4, 7, 7, 12, 13): 8,
-    (4, 7, 7, 13, 13): 3,
-    (4, 7, 8, 8, 8): 4,
-    (4, 7, 8, 8, 9): 5,
-    (4, 7, 8, 8, 10): 16,
-    (4, 7, 8, 8, 11): 6,
-    (4, 7, 8, 8, 12): 11,
-    (4, 7, 8, 8, 13): 4,
-    (4, 7, 8, 9, 9): 10,
-    (4, 7, 8, 9, 10): 17,
-    (4, 7, 8, 9, 11): 15,
-    (4, 7, 8, 9, 12): 9,
-    (4, 7, 8, 9, 13): 14,
-    (4, 7, 8, 10, 10): 6,
-    (4, 7, 8, 10, 11): 8,
-    (4, 7, 8, 10, 12): 28,
-    (4, 7, 8, 10, 13): 13,
-    (4, 7, 8, 11, 11): 7,
-    (4, 7, 8, 11, 12): 9,
-    (4, 7, 8, 11, 13): 15,
-    (4, 7, 8, 12, 12): 6,
-    (4, 7, 8, 12, 13): 5,
-    (4, 7, 8, 13, 13): 6,
-    (4, 7, 9, 9, 9): 3,
-    (4, 7, 9, 9, 10): 6,
-    (4, 7, 9, 9, 11): 4,
-    (4, 7, 9, 9, 12): 9,
-    (4, 7, 9, 9, 13): 10,
-    (4, 7, 9, 10, 10): 6,
-    (4, 7, 9, 10, 11): 15,
-    (4, 7, 9, 10, 12): 13,
-    (4, 7, 9, 10, 13): 11,
-    (4, 7, 9, 11, 11): 9,
-    (4, 7, 9, 11, 12): 18,
-    (4, 7, 9, 11, 13): 2,
-    (4, 7, 9, 12, 12): 9,
-    (4, 7, 9, 12, 13): 16,
-    (4, 7, 9, 13, 13): 4,
-    (4, 7, 10, 10, 10): 5,
-    (4, 7, 10, 10, 11): 9,
-    (4, 7, 10, 10, 12): 6,
-    (4, 7, 10, 10, 13): 6,
-    (4, 7, 10, 11, 11): 4,
-    (4, 7, 10, 11, 12): 14,
-    (4, 7, 10, 11, 13): 12,
-    (4, 7, 10, 12, 12): 14,
-    (4, 7, 10, 12, 13): 14,
-    (4, 7, 10, 13, 13): 7,
-    (4, 7, 11, 11, 11): 3,
-    (4, 7, 11, 11, 12): 4,
-    (4, 7, 11, 11, 13): 2,
-    (4, 7, 11, 12, 12): 5,
-    (4, 7, 11, 12, 13): 12,
-    (4, 7, 11, 13, 13): 4,
-    (4, 7, 12, 12, 12): 3,
-    (4, 7, 12, 12, 13): 5,
-    (4, 7, 12, 13, 13): 5,
-    (4, 7, 13, 13, 13): 4,
-    (4, 8, 8, 8, 9): 2,
-    (4, 8, 8, 8, 10): 9,
-    (4, 8, 8, 8, 11): 7,
-    (4, 8, 8, 8, 12): 3,
-    (4, 8, 8, 8, 13): 4,
-    (4, 8, 8, 9, 9): 2,
-    (4, 8, 8, 9, 10): 7,
-    (4, 8, 8, 9, 11): 6,
-    (4, 8, 8, 9, 12): 8,
-    (4, 8, 8, 9, 13): 4,
-    (4, 8, 8, 10, 10): 5,
-    (4, 8, 8, 10, 11): 11,
-    (4, 8, 8, 10, 12): 19,
-    (4, 8, 8, 10, 13): 8,
-    (4, 8, 8, 11, 11): 3,
-    (4, 8, 8, 11, 12): 8,
-    (4, 8, 8, 11, 13): 3,
-    (4, 8, 8, 12, 12): 6,
-    (4, 8, 8, 12, 13): 4,
-    (4, 8, 8, 13, 13): 3,
-    (4, 8, 9, 9, 9): 1,
-    (4, 8, 9, 9, 10): 3,
-    (4, 8, 9, 9, 11): 7,
-    (4, 8, 9, 9, 12): 8,
-    (4, 8, 9, 9, 13): 1,
-    (4, 8, 9, 10, 10): 13,
-    (4, 8, 9, 10, 11): 14,
-    (4, 8, 9, 10, 12): 26,
-    (4, 8, 9, 10, 13): 10,
-    (4, 8, 9, 11, 11): 8,
-    (4, 8, 9, 11, 12): 5,
-    (4, 8, 9, 11, 13): 18,
-    (4, 8, 9, 12, 12): 12,
-    (4, 8, 9, 12, 13): 11,
-    (4, 8, 9, 13, 13): 5,
-    (4, 8, 10, 10, 10): 6,
-    (4, 8, 10, 10, 11): 8,
-    (4, 8, 10, 10, 12): 9,
-    (4, 8, 10, 10, 13): 7,
-    (4, 8, 10, 11, 11): 5,
-    (4, 8, 10, 11, 12): 17,
-    (4, 8, 10, 11, 13): 8,
-    (4, 8, 10, 12, 12): 16,
-    (4, 8, 10, 12, 13): 23,
-    (4, 8, 10, 13, 13): 5,
-    (4, 8, 11, 11, 11): 1,
-    (4, 8, 11, 11, 12): 6,
-    (4, 8, 11, 11, 13): 7,
-    (4, 8, 11, 12, 12): 1,
-    (4, 8, 11, 12, 13): 8,
-    (4, 8, 11, 13, 13): 6,
-    (4, 8, 12, 12, 12): 3,
-    (4, 8, 12, 12, 13): 1,
-    (4, 8, 12, 13, 13): 3,
-    (4, 9, 9, 9, 10): 3,
-    (4, 9, 9, 9, 11): 4,
-    (4, 9, 9, 9, 12): 9,
-    (4, 9, 9, 9, 13): 1,
-    (4, 9, 9, 10, 10): 3,
-    (4, 9, 9, 10, 11): 3,
-    (4, 9, 9, 10, 12): 8,
-    (4, 9, 9, 10, 13): 6,
-    (4, 9, 9, 11, 12): 10,
-    (4, 9, 9, 11, 13): 2,
-    (4, 9, 9, 12, 12): 5,
-    (4, 9, 9, 12, 13): 6,
-    (4, 9, 9, 13, 13): 2,
-    (4, 9, 10, 10, 10): 1,
-    (4, 9, 10, 10, 11): 6,
-    (4, 9, 10, 10, 12): 7,
-    (4, 9, 10, 10, 13): 3,
-    (4, 9, 10, 11, 11): 8,
-    (4, 9, 10, 11, 12): 6,
-    (4, 9, 10, 11, 13): 10,
-    (4, 9, 10, 12, 12): 13,
-    (4, 9, 10, 12, 13): 8,
-    (4, 9, 10, 13, 13): 8,
-    (4, 9, 11, 11, 11): 2,
-    (4, 9, 11, 11, 12): 6,
-    (4, 9, 11, 11, 13): 6,
-    (4, 9, 11, 12, 12): 6,
-    (4, 9, 11, 12, 13): 12,
-    (4, 9, 11, 13, 13): 2,
-    (4, 9, 12, 12, 12): 3,
-    (4, 9, 12, 12, 13): 4,
-    (4, 9, 12, 13, 13): 2,
-    (4, 9, 13, 13, 13): 2,
-    (4, 10, 10, 10, 10): 2,
-    (4, 10, 10, 10, 11): 2,
-    (4, 10, 10, 10, 12): 6,
-    (4, 10, 10, 10, 13): 2,
-    (4, 10, 10, 11, 12): 9,
-    (4, 10, 10, 11, 13): 6,
-    (4, 10, 10, 12, 12): 2,
-    (4, 10, 10, 12, 13): 7,
-    (4, 10, 10, 13, 13): 3,
-    (4, 10, 11, 11, 11): 2,
-    (4, 10, 11, 11, 12): 6,
-    (4, 10, 11, 11, 13): 7,
-    (4, 10, 11, 12, 12): 8,
-    (4, 10, 11, 12, 13): 10,
-    (4, 10, 11, 13, 13): 3,
-    (4, 10, 12, 12, 12): 8,
-    (4, 10, 12, 12, 13): 6,
-    (4, 10, 12, 13, 13): 8,
-    (4, 10, 13, 13, 13): 3,
-    (4, 11, 11, 11, 11): 2,
-    (4, 11, 11, 11, 12): 1,
-    (4, 11, 11, 11, 13): 3,
-    (4, 11, 11, 12, 12): 1,
-    (4, 11, 11, 12, 13): 8,
-    (4, 11, 11, 13, 13): 1,
-    (4, 11, 12, 12, 12): 3,
-    (4, 11, 12, 12, 13): 6,
-    (4, 11, 12, 13, 13): 6,
-    (4, 11, 13, 13, 13): 4,
-    (4, 12, 12, 12, 12): 2,
-    (4, 12, 12, 12, 13): 1,
-    (4, 12, 12, 13, 13): 3,
-    (4, 12, 13, 13, 13): 4,
-    (4, 13, 13, 13, 13): 1,
-    (5, 5, 5, 5, 6): 1,
-    (5, 5, 5, 5, 7): 2,
-    (5, 5, 5, 5, 8): 2,
-    (5, 5, 5, 5, 12): 2,
-    (5, 5, 5, 5, 13): 1,
-    (5, 5, 5, 6, 6): 4,
-    (5, 5, 5, 6, 7): 5,
-    (5, 5, 5, 6, 8): 5,
-    (5, 5, 5, 6, 9): 4,
-    (5, 5, 5, 6, 10): 1,
-    (5, 5, 5, 6, 11): 4,
-    (5, 5, 5, 6, 12): 4,
-    (5, 5, 5, 6, 13): 6,
-    (5, 5, 5, 7, 7): 2,
-    (5, 5, 5, 7, 8): 4,
-    (5, 5, 5, 7, 9): 3,
-    (5, 5, 5, 7, 10): 5,
-    (5, 5, 5, 7, 11): 3,
-    (5, 5, 5, 7, 12): 6,
-    (5, 5, 5, 7, 13): 2,
-    (5, 5, 5, 8, 8): 1,
-    (5, 5, 5, 8, 9): 4,
-    (5, 5, 5, 8, 10): 6,
-    (5, 5, 5, 8, 11): 3,
-    (5, 5, 5, 8, 12): 3,
-    (5, 5, 5, 8, 13): 2,
-    (5, 5, 5, 9, 10): 7,
-    (5, 5, 5, 9, 12): 2,
-    (5, 5, 5, 9, 13): 4,
-    (5, 5, 5, 10, 11): 4,
-    (5, 5, 5, 10, 12): 2,
-    (5, 5, 5, 10, 13): 3,
-    (5, 5, 5, 11, 11): 1,
-    (5, 5, 5, 11, 12): 2,
-    (5, 5, 5, 11, 13): 1,
-    (5, 5, 5, 12, 12): 1,
-    (5, 5, 5, 12, 13): 1,
-    (5, 5, 5, 13, 13): 1,
-    (5, 5, 6, 6, 6): 2,
-    (5, 5, 6, 6, 7): 9,
-    (5, 5, 6, 6, 8): 2,
-    (5, 5, 6, 6, 9): 3,
-    (5, 5, 6, 6, 10): 3,
-    (5, 5, 6, 6, 11): 4,
-    (5, 5, 6, 6, 12): 11,
-    (5, 5, 6, 6, 13): 3,
-    (5, 5, 6, 7, 7): 3,
-    (5, 5, 6, 7, 8): 9,
-    (5, 5, 6, 7, 9): 9,
-    (5, 5, 6, 7, 10): 8,
-    (5, 5, 6, 7, 11): 10,
-    (5, 5, 6, 7, 12): 14,
-    (5, 5, 6, 7, 13): 9,
-    (5, 5, 6, 8, 8): 4,
-    (5, 5, 6, 8, 9): 10,
-    (5, 5, 6, 8, 10): 14,
-    (5, 5, 6, 8, 11): 7,
-    (5, 5, 6, 8, 12): 6,
-    (5, 5, 6, 8, 13): 5,
-    (5, 5, 6, 9, 9): 6,
-    (5, 5, 6, 9, 10): 7,
-    (5, 5, 6, 9, 11): 3,
-    (5, 5, 6, 9, 12): 7,
-    (5, 5, 6, 9, 13): 10,
-    (5, 5, 6, 10, 10): 8,
-    (5, 5, 6, 10, 11): 1,
-    (5, 5, 6, 10, 12): 8,
-    (5, 5, 6, 10, 13): 8,
-    (5, 5, 6, 11, 11): 2,
-    (5, 5, 6, 11, 12): 8,
-    (5, 5, 6, 11, 13): 7,
-    (5, 5, 6, 12, 12): 4,
-    (5, 5, 6, 12, 13): 8,
-    (5, 5, 6, 13, 13): 1,
-    (5, 5, 7, 7, 7): 3,
-    (5, 5, 7, 7, 8): 3,
-    (5, 5, 7, 7, 9): 4,
-    (5, 5, 7, 7, 10): 8,
-    (5, 5, 7, 7, 11): 3,
-    (5, 5, 7, 7, 12): 5,
-    (5, 5, 7, 7, 13): 3,
-    (5, 5, 7, 8, 8): 4,
-    (5, 5, 7, 8, 9): 8,
-    (5, 5, 7, 8, 10): 8,
-    (5, 5, 7, 8, 11): 5,
-    (5, 5, 7, 8, 12): 10,
-    (5, 5, 7, 8, 13): 6,
-    (5, 5, 7, 9, 9): 4,
-    (5, 5, 7, 9, 10): 10,
-    (5, 5, 7, 9, 11): 8,
-    (5, 5, 7, 9, 12): 3,
-    (5, 5, 7, 9, 13): 4,
-    (5, 5, 7, 10, 10): 2,
-    (5, 5, 7, 10, 11): 6,
-    (5, 5, 7, 10, 12): 9,
-    (5, 5, 7, 10, 13): 4,
-    (5, 5, 7, 11, 11): 1,
-    (5, 5, 7, 11, 12): 3,
-    (5, 5, 7, 11, 13): 6,
-    (5, 5, 7, 12, 12): 7,
-    (5, 5, 7, 12, 13): 4,
-    (5, 5, 7, 13, 13): 2,
-    (5, 5, 8, 8, 9): 1,
-    (5, 5, 8, 8, 10): 5,
-    (5, 5, 8, 8, 11): 3,
-    (5, 5, 8, 8, 12): 6,
-    (5, 5, 8, 8, 13): 6,
-    (5, 5, 8, 9, 9): 3,
-    (5, 5, 8, 9, 10): 8,
-    (5, 5, 8, 9, 11): 5,
-    (5, 5, 8, 9, 12): 6,
-    (5, 5, 8, 9, 13): 2,
-    (5, 5, 8, 10, 10): 5,
-    (5, 5, 8, 10, 11): 6,
-    (5, 5, 8, 10, 12): 9,
-    (5, 5, 8, 10, 13): 7,
-    (5, 5, 8, 11, 11): 4,
-    (5, 5, 8, 11, 12): 4,
-    (5, 5, 8, 11, 13): 6,
-    (5, 5, 8, 12, 12): 1,
-    (5, 5, 8, 12, 13): 5,
-    (5, 5, 9, 9, 10): 1,
-    (5, 5, 9, 9, 11): 4,
-    (5, 5, 9, 9, 12): 7,
-    (5, 5, 9, 9, 13): 2,
-    (5, 5, 9, 10, 10): 3,
-    (5, 5, 9, 10, 11): 7,
-    (5, 5, 9, 10, 12): 9,
-    (5, 5, 9, 10, 13): 5,
-    (5, 5, 9, 11, 11): 3,
-    (5, 5, 9, 11, 12): 5,
-    (5, 5, 9, 11, 13): 4,
-    (5, 5, 9, 12, 12): 2,
-    (5, 5, 9, 12, 13): 1,
-    (5, 5, 9, 13, 13): 2,
-    (5, 5, 10, 10, 10): 1,
-    (5, 5, 10, 10, 11): 3,
-    (5, 5, 10, 10, 12): 8,
-    (5, 5, 10, 10, 13): 3,
-    (5, 5, 10, 11, 11): 2,
-    (5, 5, 10, 11, 12): 7,
-    (5, 5, 10, 11, 13): 5,
-    (5, 5, 10, 12, 12): 3,
-    (5, 5, 10, 12, 13): 6,
-    (5, 5, 10, 13, 13): 3,
-    (5, 5, 11, 11, 12): 2,
-    (5, 5, 11, 11, 13): 2,
-    (5, 5, 11, 12, 12): 3,
-    (5, 5, 11, 12, 13): 4,
-    (5, 5, 11, 13, 13): 1,
-    (5, 5, 12, 12, 12): 2,
-    (5, 5, 12, 12, 13): 4,
-    (5, 5, 12, 13, 13): 2,
-    (5, 6, 6, 6, 6): 4,
-    (5, 6, 6, 6, 7): 12,
-    (5, 6, 6, 6, 8): 6,
-    (5, 6, 6, 6, 9): 5,
-    (5, 6, 6, 6, 10): 4,
-    (5, 6, 6, 6, 11): 4,
-    (5, 6, 6, 6, 12): 7,
-    (5, 6, 6, 6, 13): 4,
-    (5, 6, 6, 7, 7): 13,
-    (5, 6, 6, 7, 8): 9,
-    (5, 6, 6, 7, 9): 8,
-    (5, 6, 6, 7, 10): 11,
-    (5, 6, 6, 7, 11): 5,
-    (5, 6, 6, 7, 12): 14,
-    (5, 6, 6, 7, 13): 7,
-    (5, 6, 6, 8, 8): 3,
-    (5, 6, 6, 8, 9): 16,
-    (5, 6, 6, 8, 10): 17,
-    (5, 6, 6, 8, 11): 8,
-    (5, 6, 6, 8, 12): 11,
-    (5, 6, 6, 8, 13): 7,
-    (5, 6, 6, 9, 9): 8,
-    (5, 6, 6, 9, 10): 11,
-    (5, 6, 6, 9, 11): 5,
-    (5, 6, 6, 9, 12): 17,
-    (5, 6, 6, 9, 13): 4,
-    (5, 6, 6, 10, 10): 4,
-    (5, 6, 6, 10, 11): 4,
-    (5, 6, 6, 10, 12): 16,
-    (5, 6, 6, 10, 13): 9,
-    (5, 6, 6, 11, 11): 3,
-    (5, 6, 6, 11, 12): 12,
-    (5, 6, 6, 11, 13): 8,
-    (5, 6, 6, 12, 12): 10,
-    (5, 6, 6, 12, 13): 8,
-    (5, 6, 6, 13, 13): 5,
-    (5, 6, 7, 7, 7): 9,
-    (5, 6, 7, 7, 8): 11,
-    (5, 6, 7, 7, 9): 6,
-    (5, 6, 7, 7, 10): 6,
-    (5, 6, 7, 7, 11): 11,
-    (5, 6, 7, 7, 12): 10,
-    (5, 6, 7, 7, 13): 9,
-    (5, 6, 7, 8, 8): 11,
-    (5, 6, 7, 8, 9): 16,
-    (5, 6, 7, 8, 10): 9,
-    (5, 6, 7, 8, 11): 12,
-    (5, 6, 7, 8, 12): 14,
-    (5, 6, 7, 8, 13): 10,
-    (5, 6, 7, 9, 9): 17,
-    (5, 6, 7, 9, 10): 21,
-    (5, 6, 7, 9, 11): 9,
-    (5, 6, 7, 9, 12): 19,
-    (5, 6, 7, 9, 13): 7,
-    (5, 6, 7, 10, 10): 9,
-    (5, 6, 7, 10, 11): 11,
-    (5, 6, 7, 10, 12): 13,
-    (5, 6, 7, 10, 13): 14,
-    (5, 6, 7, 11, 11): 6,
-    (5, 6, 7, 11, 12): 17,
-    (5, 6, 7, 11, 13): 15,
-    (5, 6, 7, 12, 12): 15,
-    (5, 6, 7, 12, 13): 18,
-    (5, 6, 7, 13, 13): 7,
-    (5, 6, 8, 8, 8): 7,
-    (5, 6, 8, 8, 9): 5,
-    (5, 6, 8, 8, 10): 10,
-    (5, 6, 8, 8, 11): 9,
-    (5, 6, 8, 8, 12): 14,
-    (5, 6, 8, 8, 13): 5,
-    (5, 6, 8, 9, 9): 9,
-    (5, 6, 8, 9, 10): 19,
-    (5, 6, 8, 9, 11): 20,
-    (5, 6, 8, 9, 12): 17,
-    (5, 6, 8, 9, 13): 15,
-    (5, 6, 8, 10, 10): 12,
-    (5, 6, 8, 10, 11): 12,
-    (5, 6, 8, 10, 12): 15,
-    (5, 6, 8, 10, 13): 11,
-    (5, 6, 8, 11, 11): 6,
-    (5, 6, 8, 11, 12): 10,
-    (5, 6, 8, 11, 13): 7,
-    (5, 6, 8, 12, 12): 19,
-    (5, 6, 8, 12, 13): 10,
-    (5, 6, 8, 13, 13): 6,
-    (5, 6, 9, 9, 9): 12,
-    (5, 6, 9, 9, 10): 6,
-    (5, 6, 9, 9, 11): 9,
-    (5, 6, 9, 9, 12): 11,
-    (5, 6, 9, 9, 13): 8,
-    (5, 6, 9, 10, 10): 8,
-    (5, 6, 9, 10, 11): 14,
-    (5, 6, 9, 10, 12): 31,
-    (5, 6, 9, 10, 13): 12,
-    (5, 6, 9, 11, 11): 4,
-    (5, 6, 9, 11, 12): 15,
-    (5, 6, 9, 11, 13): 8,
-    (5, 6, 9, 12, 12): 8,
-    (5, 6, 9, 12, 13): 12,
-    (5, 6, 9, 13, 13): 4,
-    (5, 6, 10, 10, 10): 5,
-    (5, 6, 10, 10, 11): 9,
-    (5, 6, 10, 10, 12): 10,
-    (5, 6, 10, 10, 13): 10,
-    (5, 6, 10, 11, 11): 4,
-    (5, 6, 10, 11, 12): 12,
-    (5, 6, 10, 11, 13): 10,
-    (5, 6, 10, 12, 12): 12,
-    (5, 6, 10, 12, 13): 8,
-    (5, 6, 10, 13, 13): 1,
-    (5, 6, 11, 11, 11): 4,
-    (5, 6, 11, 11, 12): 6,
-    (5, 6, 11, 11, 13): 7,
-    (5, 6, 11, 12, 12): 10,
-    (5, 6, 11, 12, 13): 13,
-    (5, 6, 11, 13, 13): 6,
-    (5, 6, 12, 12, 12): 7,
-    (5, 6, 12, 12, 13): 12,
-    (5, 6, 12, 13, 13): 6,
-    (5, 6, 13, 13, 13): 5,
-    (5, 7, 7, 7, 7): 2,
-    (5, 7, 7, 7, 8): 6,
-    (5, 7, 7, 7, 9): 6,
-    (5, 7, 7, 7, 10): 8,
-    (5, 7, 7, 7, 11): 3,
-    (5, 7, 7, 7, 12): 8,
-    (5, 7, 7, 7, 13): 3,
-    (5, 7, 7, 8, 8): 1,
-    (5, 7, 7, 8, 9): 9,
-    (5, 7, 7, 8, 10): 14,
-    (5, 7, 7, 8, 11): 6,
-    (5, 7, 7, 8, 12): 11,
-    (5, 7, 7, 8, 13): 5,
-    (5, 7, 7, 9, 9): 4,
-    (5, 7, 7, 9, 10): 6,
-    (5, 7, 7, 9, 11): 8,
-    (5, 7, 7, 9, 12): 5,
-    (5, 7, 7, 9, 13): 5,
-    (5, 7, 7, 10, 10): 3,
-    (5, 7, 7, 10, 11): 5,
-    (5, 7, 7, 10, 12): 8,
-    (5, 7, 7, 10, 13): 8,
-    (5, 7, 7, 11, 11): 3,
-    (5, 7, 7, 11, 12): 6,
-    (5, 7, 7, 11, 13): 7,
-    (5, 7, 7, 12, 12): 6,
-    (5, 7, 7, 12, 13): 5,
-    (5, 7, 7, 13, 13): 1,
-    (5, 7, 8, 8, 8): 3,
-    (5, 7, 8, 8, 9): 11,
-    (5, 7, 8, 8, 10): 9,
-    (5, 7, 8, 8, 11): 7,
-    (5, 7, 8, 8, 12): 4,
-    (5, 7, 8, 8, 13): 8,
-    (5, 7, 8, 9, 9): 5,
-    (5, 7, 8, 9, 10): 11,
-    (5, 7, 8, 9, 11): 5,
-    (5, 7, 8, 9, 12): 17,
-    (5, 7, 8, 9, 13): 10,
-    (5, 7, 8, 10, 10): 9,
-    (5, 7, 8, 10, 11): 10,
-    (5, 7, 8, 10, 12): 23,
-    (5, 7, 8, 10, 13): 13,
-    (5, 7, 8, 11, 11): 5,
-    (5, 7, 8, 11, 12): 11,
-    (5, 7, 8, 11, 13): 6,
-    (5, 7, 8, 12, 12): 5,
-    (5, 7, 8, 12, 13): 8,
-    (5, 7, 8, 13, 13): 3,
-    (5, 7, 9, 9, 9): 1,
-    (5, 7, 9, 9, 10): 6,
-    (5, 7, 9, 9, 11): 6,
-    (5, 7, 9, 9, 12): 15,
-    (5, 7, 9, 9, 13): 5,
-    (5, 7, 9, 10, 10): 10,
-    (5, 7, 9, 10, 11): 15,
-    (5, 7, 9, 10, 12): 14,
-    (5, 7, 9, 10, 13): 10,
-    (5, 7, 9, 11, 11): 3,
-    (5, 7, 9, 11, 12): 4,
-    (5, 7, 9, 11, 13): 11,
-    (5, 7, 9, 12, 12): 7,
-    (5, 7, 9, 12, 13): 9,
-    (5, 7, 9, 13, 13): 3,
-    (5, 7, 10, 10, 10): 6,
-    (5, 7, 10, 10, 11): 7,
-    (5, 7, 10, 10, 12): 8,
-    (5, 7, 10, 10, 13): 7,
-    (5, 7, 10, 11, 11): 8,
-    (5, 7, 10, 11, 12): 12,
-    (5, 7, 10, 11, 13): 6,
-    (5, 7, 10, 12, 12): 4,
-    (5, 7, 10, 12, 13): 10,
-    (5, 7, 10, 13, 13): 7,
-    (5, 7, 11, 11, 11): 3,
-    (5, 7, 11, 11, 12): 9,
-    (5, 7, 11, 12, 12): 7,
-    (5, 7, 11, 12, 13): 9,
-    (5, 7, 11, 13, 13): 2,
-    (5, 7, 12, 12, 12): 5,
-    (5, 7, 12, 12, 13): 6,
-    (5, 7, 12, 13, 13): 4,
-    (5, 7, 13, 13, 13): 1,
-    (5, 8, 8, 8, 8): 1,
-    (5, 8, 8, 8, 9): 2,
-    (5, 8, 8, 8, 10): 4,
-    (5, 8, 8, 8, 11): 2,
-    (5, 8, 8, 8, 12): 2,
-    (5, 8, 8, 8, 13): 2,
-    (5, 8, 8, 9, 9): 3,
-    (5, 8, 8, 9, 10): 9,
-    (5, 8, 8, 9, 11): 6,
-    (5, 8, 8, 9, 12): 4,
-    (5, 8, 8, 9, 13): 7,
-    (5, 8, 8, 10, 10): 5,
-    (5, 8, 8, 10, 11): 4,
-    (5, 8, 8, 10, 12): 14,
-    (5, 8, 8, 10, 13): 7,
-    (5, 8, 8, 11, 11): 2,
-    (5, 8, 8, 11, 12): 3,
-    (5, 8, 8, 11, 13): 10,
-    (5, 8, 8, 12, 12): 1,
-    (5, 8, 8, 12, 13): 1,
-    (5, 8, 9, 9, 9): 2,
-    (5, 8, 9, 9, 10): 2,
-    (5, 8, 9, 9, 11): 7,
-    (5, 8, 9, 9, 12): 8,
-    (5, 8, 9, 9, 13): 4,
-    (5, 8, 9, 10, 10): 6,
-    (5, 8, 9, 10, 11): 13,
-    (5, 8, 9, 10, 12): 5,
-    (5, 8, 9, 10, 13): 6,
-    (5, 8, 9, 11, 11): 2,
-    (5, 8, 9, 11, 12): 13,
-    (5, 8, 9, 11, 13): 7,
-    (5, 8, 9, 12, 12): 12,
-    (5, 8, 9, 12, 13): 9,
-    (5, 8, 9, 13, 13): 3,
-    (5, 8, 10, 10, 10): 5,
-    (5, 8, 10, 10, 11): 7,
-    (5, 8, 10, 10, 12): 10,
-    (5, 8, 10, 10, 13): 4,
-    (5, 8, 10, 11, 11): 6,
-    (5, 8, 10, 11, 12): 12,
-    (5, 8, 10, 11, 13): 4,
-    (5, 8, 10, 12, 12): 14,
-    (5, 8, 10, 12, 13): 15,
-    (5, 8, 10, 13, 13): 10,
-    (5, 8, 11, 11, 11): 4,
-    (5, 8, 11, 11, 12): 4,
-    (5, 8, 11, 11, 13): 2,
-    (5, 8, 11, 12, 12): 5,
-    (5, 8, 11, 12, 13): 12,
-    (5, 8, 11, 13, 13): 5,
-    (5, 8, 12, 12, 12): 2,
-    (5, 8, 12, 12, 13): 1,
-    (5, 8, 12, 13, 13): 3,
-    (5, 8, 13, 13, 13): 3,
-    (5, 9, 9, 9, 10): 2,
-    (5, 9, 9, 9, 12): 3,
-    (5, 9, 9, 10, 10): 1,
-    (5, 9, 9, 10, 11): 3,
-    (5, 9, 9, 10, 12): 9,
-    (5, 9, 9, 10, 13): 5,
-    (5, 9, 9, 11, 11): 3,
-    (5, 9, 9, 11, 12): 9,
-    (5, 9, 9, 11, 13): 2,
-    (5, 9, 9, 12, 12): 6,
-    (5, 9, 9, 12, 13): 8,
-    (5, 9, 9, 13, 13): 1,
-    (5, 9, 10, 10, 10): 1,
-    (5, 9, 10, 10, 11): 2,
-    (5, 9, 10, 10, 12): 7,
-    (5, 9, 10, 10, 13): 10,
-    (5, 9, 10, 11, 11): 5,
-    (5, 9, 10, 11, 12): 12,
-    (5, 9, 10, 11, 13): 8,
-    (5, 9, 10, 12, 12): 10,
-    (5, 9, 10, 12, 13): 10,
-    (5, 9, 10, 13, 13): 4,
-    (5, 9, 11, 11, 11): 1,
-    (5, 9, 11, 11, 12): 5,
-    (5, 9, 11, 11, 13): 5,
-    (5, 9, 11, 12, 12): 5,
-    (5, 9, 11, 12, 13): 3,
-    (5, 9, 11, 13, 13): 2,
-    (5, 9, 12, 12, 12): 1,
-    (5, 9, 12, 12, 13): 3,
-    (5, 9, 12, 13, 13): 2,
-    (5, 10, 10, 10, 10): 1,
-    (5, 10, 10, 10, 11): 4,
-    (5, 10, 10, 10, 12): 3,
-    (5, 10, 10, 10, 13): 3,
-    (5, 10, 10, 11, 11): 2,
-    (5, 10, 10, 11, 12): 3,
-    (5, 10, 10, 11, 13): 5,
-    (5, 10, 10, 12, 12): 2,
-    (5, 10, 10, 12, 13): 4,
-    (5, 10, 10, 13, 13): 2,
-    (5, 10, 11, 11, 12): 2,
-    (5, 10, 11, 11, 13): 7,
-    (5, 10, 11, 12, 12): 1,
-    (5, 10, 11, 12, 13): 9,
-    (5, 10, 11, 13, 13): 3,
-    (5, 10, 12, 12, 12): 3,
-    (5, 10, 12, 12, 13): 4,
-    (5, 10, 12, 13, 13): 5,
-    (5, 10, 13, 13, 13): 2,
-    (5, 11, 11, 11, 12): 1,
-    (5, 11, 11, 11, 13): 2,
-    (5, 11, 11, 12, 12): 3,
-    (5, 11, 11, 12, 13): 4,
-    (5, 11, 11, 13, 13): 1,
-    (5, 11, 12, 12, 12): 2,
-    (5, 11, 12, 12, 13): 3,
-    (5, 11, 12, 13, 13): 9,
-    (5, 11, 13, 13, 13): 2,
-    (5, 12, 12, 12, 13): 1,
-    (5, 12, 12, 13, 13): 1,
-    (5, 12, 13, 13, 13): 1,
-    (6, 6, 6, 6, 6): 1,
-    (6, 6, 6, 6, 7): 2,
-    (6, 6, 6, 6, 8): 1,
-    (6, 6, 6, 6, 9): 2,
-    (6, 6, 6, 6, 10): 2,
-    (6, 6, 6, 6, 11): 2,
-    (6, 6, 6, 6, 12): 3,
-    (6, 6, 6, 6, 13): 1,
-    (6, 6, 6, 7, 7): 8,
-    (6, 6, 6, 7, 8): 9,
-    (6, 6, 6, 7, 9): 2,
-    (6, 6, 6, 7, 10): 2,
-    (6, 6, 6, 7, 11): 4,
-    (6, 6, 6, 7, 12): 5,
-    (6, 6, 6, 7, 13): 9,
-    (6, 6, 6, 8, 8): 2,
-    (6, 6, 6, 8, 9): 9,
-    (6, 6, 6, 8, 10): 3,
-    (6, 6, 6, 8, 11): 2,
-    (6, 6, 6, 8, 12): 10,
-    (6, 6, 6, 8, 13): 4,
-    (6, 6, 6, 9, 9): 3,
-    (6, 6, 6, 9, 10): 5,
-    (6, 6, 6, 9, 11): 5,
-    (6, 6, 6, 9, 12): 10,
-    (6, 6, 6, 9, 13): 3,
-    (6, 6, 6, 10, 10): 1,
-    (6, 6, 6, 10, 11): 2,
-    (6, 6, 6, 10, 12): 4,
-    (6, 6, 6, 10, 13): 2,
-    (6, 6, 6, 11, 11): 1,
-    (6, 6, 6, 11, 12): 3,
-    (6, 6, 6, 11, 13): 4,
-    (6, 6, 6, 12, 12): 6,
-    (6, 6, 6, 12, 13): 3,
-    (6, 6, 6, 13, 13): 2,
-    (6, 6, 7, 7, 7): 8,
-    (6, 6, 7, 7, 8): 13,
-    (6, 6, 7, 7, 9): 4,
-    (6, 6, 7, 7, 11): 1,
-    (6, 6, 7, 7, 12): 10,
-    (6, 6, 7, 7, 13): 2,
-    (6, 6, 7, 8, 8): 4,
-    (6, 6, 7, 8, 9): 17,
-    (6, 6, 7, 8, 10): 7,
-    (6, 6, 7, 8, 11): 3,
-    (6, 6, 7, 8, 12): 9,
-    (6, 6, 7, 8, 13): 8,
-    (6, 6, 7, 9, 9): 8,
-    (6, 6, 7, 9, 10): 14,
-    (6, 6, 7, 9, 11): 4,
-    (6, 6, 7, 9, 12): 13,
-    (6, 6, 7, 9, 13): 4,
-    (6, 6, 7, 10, 10): 7,
-    (6, 6, 7, 10, 11): 12,
-    (6, 6, 7, 10, 12): 8,
-    (6, 6, 7, 10, 13): 2,
-    (6, 6, 7, 11, 11): 5,
-    (6, 6, 7, 11, 12): 11,
-    (6, 6, 7, 11, 13): 6,
-    (6, 6, 7, 12, 12): 4,
-    (6, 6, 7, 12, 13): 14,
-    (6, 6, 7, 13, 13): 7,
-    (6, 6, 8, 8, 8): 2,
-    (6, 6, 8, 8, 9): 7,
-    (6, 6, 8, 8, 10): 8,
-    (6, 6, 8, 8, 11): 4,
-    (6, 6, 8, 8, 12): 11,
-    (6, 6, 8, 8, 13): 2,
-    (6, 6, 8, 9, 9): 6,
-    (6, 6, 8, 9, 10): 11,
-    (6, 6, 8, 9, 11): 8,
-    (6, 6, 8, 9, 12): 16,
-    (6, 6, 8, 9, 13): 5,
-    (6, 6, 8, 10, 10): 6,
-    (6, 6, 8, 10, 11): 8,
-    (6, 6, 8, 10, 12): 17,
-    (6, 6, 8, 10, 13): 7,
-    (6, 6, 8, 11, 11): 3,
-    (6, 6, 8, 11, 12): 8,
-    (6, 6, 8, 11, 13): 5,
-    (6, 6, 8, 12, 12): 7,
-    (6, 6, 8, 12, 13): 6,
-    (6, 6, 8, 13, 13): 1,
-    (6, 6, 9, 9, 9): 4,
-    (6, 6, 9, 9, 10): 7,
-    (6, 6, 9, 9, 11): 8,
-    (6, 6, 9, 9, 12): 13,
-    (6, 6, 9, 9, 13): 3,
-    (6, 6, 9, 10, 10): 2,
-    (6, 6, 9, 10, 11): 8,
-    (6, 6, 9, 10, 12): 21,
-    (6, 6, 9, 10, 13): 7,
-    (6, 6, 9, 11, 11): 3,
-    (6, 6, 9, 11, 12): 13,
-    (6, 6, 9, 11, 13): 6,
-    (6, 6, 9, 12, 12): 15,
-    (6, 6, 9, 12, 13): 4,
-    (6, 6, 9, 13, 13): 1,
-    (6, 6, 10, 10, 10): 2,
-    (6, 6, 10, 10, 11): 1,
-    (6, 6, 10, 10, 12): 12,
-    (6, 6, 10, 10, 13): 4,
-    (6, 6, 10, 11, 12): 7,
-    (6, 6, 10, 11, 13): 5,
-    (6, 6, 10, 12, 12): 13,
-    (6, 6, 10, 12, 13): 7,
-    (6, 6, 10, 13, 13): 1,
-    (6, 6, 11, 11, 11): 1,
-    (6, 6, 11, 11, 12): 3,
-    (6, 6, 11, 11, 13): 2,
-    (6, 6, 11, 12, 12): 8,
-    (6, 6, 11, 12, 13): 7,
-    (6, 6, 11, 13, 13): 1,
-    (6, 6, 12, 12, 12): 7,
-    (6, 6, 12, 12, 13): 3,
-    (6, 6, 12, 13, 13): 5,
-    (6, 6, 13, 13, 13): 2,
-    (6, 7, 7, 7, 7): 2,
-    (6, 7, 7, 7, 8): 13,
-    (6, 7, 7, 7, 9): 5,
-    (6, 7, 7, 7, 10): 3,
-    (6, 7, 7, 7, 11): 3,
-    (6, 7, 7, 7, 12): 4,
-    (6, 7, 7, 7, 13): 9,
-    (6, 7, 7, 8, 8): 8,
-    (6, 7, 7, 8, 9): 10,
-    (6, 7, 7, 8, 10): 8,
-    (6, 7, 7, 8, 11): 5,
-    (6, 7, 7, 8, 12): 9,
-    (6, 7, 7, 8, 13): 7,
-    (6, 7, 7, 9, 9): 8,
-    (6, 7, 7, 9, 10): 12,
-    (6, 7, 7, 9, 11): 8,
-    (6, 7, 7, 9, 12): 10,
-    (6, 7, 7, 9, 13): 5,
-    (6, 7, 7, 10, 10): 3,
-    (6, 7, 7, 10, 11): 12,
-    (6, 7, 7, 10, 12): 13,
-    (6, 7, 7, 10, 13): 2,
-    (6, 7, 7, 11, 11): 5,
-    (6, 7, 7, 11, 12): 12,
-    (6, 7, 7, 11, 13): 4,
-    (6, 7, 7, 12, 12): 4,
-    (6, 7, 7, 12, 13): 12,
-    (6, 7, 7, 13, 13): 7,
-    (6, 7, 8, 8, 8): 5,
-    (6, 7, 8, 8, 9): 6,
-    (6, 7, 8, 8, 10): 10,
-    (6, 7, 8, 8, 11): 4,
-    (6, 7, 8, 8, 12): 10,
-    (6, 7, 8, 8, 13): 10,
-    (6, 7, 8, 9, 9): 9,
-    (6, 7, 8, 9, 10): 11,
-    (6, 7, 8, 9, 11): 14,
-    (6, 7, 8, 9, 12): 21,
-    (6, 7, 8, 9, 13): 16,
-    (6, 7, 8, 10, 10): 6,
-    (6, 7, 8, 10, 11): 14,
-    (6, 7, 8, 10, 12): 17,
-    (6, 7, 8, 10, 13): 8,
-    (6, 7, 8, 11, 11): 6,
-    (6, 7, 8, 11, 12): 12,
-    (6, 7, 8, 11, 13): 7,
-    (6, 7, 8, 12, 12): 15,
-    (6, 7, 8, 12, 13): 9,
-    (6, 7, 8, 13, 13): 7,
-    (6, 7, 9, 9, 9): 6,
-    (6, 7, 9, 9, 10): 8,
-    (6, 7, 9, 9, 11): 11,
-    (6, 7, 9, 9, 12): 13,
-    (6, 7, 9, 9, 13): 6,
-    (6, 7, 9, 10, 10): 6,
-    (6, 7, 9, 10, 11): 9,
-    (6, 7, 9, 10, 12): 17,
-    (6, 7, 9, 10, 13): 17,
-    (6, 7, 9, 11, 11): 4,
-    (6, 7, 9, 11, 12): 10,
-    (6, 7, 9, 11, 13): 7,
-    (6, 7, 9, 12, 12): 15,
-    (6, 7, 9, 12, 13): 11,
-    (6, 7, 9, 13, 13): 1,
-    (6, 7, 10, 10, 10): 3,
-    (6, 7, 10, 10, 11): 6,
-    (6, 7, 10, 10, 12): 6,
-    (6, 7, 10, 10, 13): 5,
-    (6, 7, 10, 11, 11): 4,
-    (6, 7, 10, 11, 12): 16,
-    (6, 7, 10, 11, 13): 8,
-    (6, 7, 10, 12, 12): 16,
-    (6, 7, 10, 12, 13): 11,
-    (6, 7, 10, 13, 13): 3,
-    (6, 7, 11, 11, 11): 3,
-    (6, 7, 11, 11, 12): 6,
-    (6, 7, 11, 11, 13): 7,
-    (6, 7, 11, 12, 12): 8,
-    (6, 7, 11, 12, 13): 13,
-    (6, 7, 11, 13, 13): 4,
-    (6, 7, 12, 12, 12): 7,
-    (6, 7, 12, 12, 13): 9,
-    (6, 7, 12, 13, 13): 5,
-    (6, 7, 13, 13, 13): 6,
-    (6, 8, 8, 8, 8): 2,
-    (6, 8, 8, 8, 9): 2,
-    (6, 8, 8, 8, 10): 5,
-    (6, 8, 8, 8, 11): 3,
-    (6, 8, 8, 8, 12): 4,
-    (6, 8, 8, 8, 13): 3,
-    (6, 8, 8, 9, 10): 6,
-    (6, 8, 8, 9, 11): 7,
-    (6, 8, 8, 9, 12): 16,
-    (6, 8, 8, 9, 13): 4,
-    (6, 8, 8, 10, 10): 5,
-    (6, 8, 8, 10, 11): 4,
-    (6, 8, 8, 10, 12): 12,
-    (6, 8, 8, 10, 13): 6,
-    (6, 8, 8, 11, 11): 1,
-    (6, 8, 8, 11, 12): 7,
-    (6, 8, 8, 11, 13): 6,
-    (6, 8, 8, 12, 12): 6,
-    (6, 8, 8, 12, 13): 6,
-    (6, 8, 8, 13, 13): 1,
-    (6, 8, 9, 9, 9): 4,
-    (6, 8, 9, 9, 10): 8,
-    (6, 8, 9, 9, 11): 8,
-    (6, 8, 9, 9, 12): 12,
-    (6, 8, 9, 9, 13): 5,
-    (6, 8, 9, 10, 10): 7,
-    (6, 8, 9, 10, 11): 8,
-    (6, 8, 9, 10, 12): 18,
-    (6, 8, 9, 10, 13): 9,
-    (6, 8, 9, 11, 11): 9,
-    (6, 8, 9, 11, 12): 7,
-    (6, 8, 9, 11, 13): 12,
-    (6, 8, 9, 12, 12): 19,
-    (6, 8, 9, 12, 13): 10,
-    (6, 8, 9, 13, 13): 2,
-    (6, 8, 10, 10, 10): 5,
-    (6, 8, 10, 10, 11): 8,
-    (6, 8, 10, 10, 12): 11,
-    (6, 8, 10, 10, 13): 4,
-    (6, 8, 10, 11, 11): 3,
-    (6, 8, 10, 11, 12): 14,
-    (6, 8, 10, 11, 13): 10,
-    (6, 8, 10, 12, 12): 17,
-    (6, 8, 10, 12, 13): 13,
-    (6, 8, 10, 13, 13): 5,
-    (6, 8, 11, 11, 11): 1,
-    (6, 8, 11, 11, 12): 6,
-    (6, 8, 11, 11, 13): 4,
-    (6, 8, 11, 12, 12): 15,
-    (6, 8, 11, 12, 13): 5,
-    (6, 8, 11, 13, 13): 2,
-    (6, 8, 12, 12, 12): 10,
-    (6, 8, 12, 12, 13): 7,
-    (6, 8, 12, 13, 13): 3,
-    (6, 8, 13, 13, 13): 1,
-    (6, 9, 9, 9, 9): 2,
-    (6, 9, 9, 9, 10): 1,
-    (6, 9, 9, 9, 11): 4,
-    (6, 9, 9, 9, 12): 3,
-    (6, 9, 9, 9, 13): 9,
-    (6, 9, 9, 10, 10): 1,
-    (6, 9, 9, 10, 11): 5,
-    (6, 9, 9, 10, 12): 11,
-    (6, 9, 9, 10, 13): 5,
-    (6, 9, 9, 11, 11): 4,
-    (6, 9, 9, 11, 12): 11,
-    (6, 9, 9, 11, 13): 4,
-    (6, 9, 9, 12, 12): 7,
-    (6, 9, 9, 12, 13): 9,
-    (6, 9, 9, 13, 13): 2,
-    (6, 9, 10, 10, 10): 1,
-    (6, 9, 10, 10, 11): 3,
-    (6, 9, 10, 10, 12): 10,
-    (6, 9, 10, 10, 13): 5,
-    (6, 9, 10, 11, 11): 3,
-    (6, 9, 10, 11, 12): 12,
-    (6, 9, 10, 11, 13): 17,
-    (6, 9, 10, 12, 12): 8,
-    (6, 9, 10, 12, 13): 9,
-    (6, 9, 10, 13, 13): 4,
-    (6, 9, 11, 11, 11): 2,
-    (6, 9, 11, 11, 12): 4,
-    (6, 9, 11, 11, 13): 5,
-    (6, 9, 11, 12, 12): 10,
-    (6, 9, 11, 12, 13): 13,
-    (6, 9, 11, 13, 13): 1,
-    (6, 9, 12, 12, 12): 11,
-    (6, 9, 12, 12, 13): 11,
-    (6, 9, 12, 13, 13): 2,
-    (6, 9, 13, 13, 13): 4,
-    (6, 10, 10, 10, 12): 4,
-    (6, 10, 10, 10, 13): 1,
-    (6, 10, 10, 11, 11): 1,
-    (6, 10, 10, 11, 12): 4,
-    (6, 10, 10, 11, 13): 5,
-    (6, 10, 10, 12, 12): 5,
-    (6, 10, 10, 12, 13): 9,
-    (6, 10, 10, 13, 13): 1,
-    (6, 10, 11, 11, 11): 1,
-    (6, 10, 11, 11, 12): 2,
-    (6, 10, 11, 11, 13): 2,
-    (6, 10, 11, 12, 12): 5,
-    (6, 10, 11, 12, 13): 7,
-    (6, 10, 11, 13, 13): 6,
-    (6, 10, 12, 12, 12): 6,
-    (6, 10, 12, 12, 13): 14,
-    (6, 10, 12, 13, 13): 5,
-    (6, 10, 13, 13, 13): 1,
-    (6, 11, 11, 11, 13): 2,
-    (6, 11, 11, 12, 12): 2,
-    (6, 11, 11, 12, 13): 6,
-    (6, 11, 11, 13, 13): 2,
-    (6, 11, 12, 12, 12): 2,
-    (6, 11, 12, 12, 13): 7,
-    (6, 11, 12, 13, 13): 5,
-    (6, 11, 13, 13, 13): 1,
-    (6, 12, 12, 12, 12): 1,
-    (6, 12, 12, 12, 13): 1,
-    (7, 7, 7, 7, 7): 1,
-    (7, 7, 7, 7, 8): 4,
-    (7, 7, 7, 7, 9): 3,
-    (7, 7, 7, 7, 11): 2,
-    (7, 7, 7, 7, 12): 2,
-    (7, 7, 7, 7, 13): 1,
-    (7, 7, 7, 8, 8): 2,
-    (7, 7, 7, 8, 9): 2,
-    (7, 7, 7, 8, 10): 3,
-    (7, 7, 7, 8, 11): 1,
-    (7, 7, 7, 8, 12): 3,
-    (7, 7, 7, 8, 13): 6,
-    (7, 7, 7, 9, 9): 1,
-    (7, 7, 7, 9, 10): 5,
-    (7, 7, 7, 9, 11): 4,
-    (7, 7, 7, 9, 12): 7,
-    (7, 7, 7, 9, 13): 3,
-    (7, 7, 7, 10, 10): 2,
-    (7, 7, 7, 10, 11): 5,
-    (7, 7, 7, 10, 12): 3,
-    (7, 7, 7, 10, 13): 1,
-    (7, 7, 7, 11, 11): 1,
-    (7, 7, 7, 11, 12): 2,
-    (7, 7, 7, 11, 13): 3,
-    (7, 7, 7, 12, 12): 2,
-    (7, 7, 7, 12, 13): 1,
-    (7, 7, 7, 13, 13): 2,
-    (7, 7, 8, 8, 8): 4,
-    (7, 7, 8, 8, 9): 3,
-    (7, 7, 8, 8, 10): 3,
-    (7, 7, 8, 8, 11): 2,
-    (7, 7, 8, 8, 12): 4,
-    (7, 7, 8, 8, 13): 3,
-    (7, 7, 8, 9, 9): 2,
-    (7, 7, 8, 9, 10): 8,
-    (7, 7, 8, 9, 11): 8,
-    (7, 7, 8, 9, 12): 8,
-    (7, 7, 8, 9, 13): 3,
-    (7, 7, 8, 10, 10): 7,
-    (7, 7, 8, 10, 11): 8,
-    (7, 7, 8, 10, 12): 7,
-    (7, 7, 8, 10, 13): 7,
-    (7, 7, 8, 11, 11): 3,
-    (7, 7, 8, 11, 12): 3,
-    (7, 7, 8, 11, 13): 4,
-    (7, 7, 8, 12, 12): 5,
-    (7, 7, 8, 12, 13): 5,
-    (7, 7, 8, 13, 13): 4,
-    (7, 7, 9, 9, 9): 1,
-    (7, 7, 9, 9, 10): 4,
-    (7, 7, 9, 9, 11): 2,
-    (7, 7, 9, 9, 12): 9,
-    (7, 7, 9, 9, 13): 3,
-    (7, 7, 9, 10, 10): 1,
-    (7, 7, 9, 10, 11): 5,
-    (7, 7, 9, 10, 12): 8,
-    (7, 7, 9, 10, 13): 5,
-    (7, 7, 9, 11, 11): 4,
-    (7, 7, 9, 11, 12): 6,
-    (7, 7, 9, 11, 13): 6,
-    (7, 7, 9, 12, 12): 4,
-    (7, 7, 9, 12, 13): 2,
-    (7, 7, 10, 10, 10): 1,
-    (7, 7, 10, 10, 11): 3,
-    (7, 7, 10, 10, 12): 4,
-    (7, 7, 10, 10, 13): 5,
-    (7, 7, 10, 11, 12): 5,
-    (7, 7, 10, 11, 13): 5,
-    (7, 7, 10, 12, 12): 3,
-    (7, 7, 10, 12, 13): 3,
-    (7, 7, 10, 13, 13): 1,
-    (7, 7, 11, 11, 11): 1,
-    (7, 7, 11, 11, 12): 1,
-    (7, 7, 11, 11, 13): 3,
-    (7, 7, 11, 12, 12): 3,
-    (7, 7, 11, 12, 13): 4,
-    (7, 7, 11, 13, 13): 1,
-    (7, 7, 12, 12, 12): 2,
-    (7, 7, 12, 12, 13): 2,
-    (7, 7, 12, 13, 13): 2,
-    (7, 7, 13, 13, 13): 2,
-    (7, 8, 8, 8, 8): 1,
-    (7, 8, 8, 8, 11): 1,
-    (7, 8, 8, 8, 12): 3,
-    (7, 8, 8, 8, 13): 3,
-    (7, 8, 8, 9, 9): 1,
-    (7, 8, 8, 9, 10): 6,
-    (7, 8, 8, 9, 11): 3,
-    (7, 8, 8, 9, 12): 4,
-    (7, 8, 8, 9, 13): 7,
-    (7, 8, 8, 10, 10): 5,
-    (7, 8, 8, 10, 11): 4,
-    (7, 8, 8, 10, 12): 8,
-    (7, 8, 8, 10, 13): 3,
-    (7, 8, 8, 11, 11): 4,
-    (7, 8, 8, 11, 13): 3,
-    (7, 8, 8, 12, 12): 1,
-    (7, 8, 8, 12, 13): 2,
-    (7, 8, 8, 13, 13): 1,
-    (7, 8, 9, 9, 9): 2,
-    (7, 8, 9, 9, 10): 2,
-    (7, 8, 9, 9, 11): 2,
-    (7, 8, 9, 9, 12): 8,
-    (7, 8, 9, 9, 13): 4,
-    (7, 8, 9, 10, 10): 4,
-    (7, 8, 9, 10, 11): 8,
-    (7, 8, 9, 10, 12): 14,
-    (7, 8, 9, 10, 13): 10,
-    (7, 8, 9, 11, 11): 2,
-    (7, 8, 9, 11, 12): 15,
-    (7, 8, 9, 11, 13): 4,
-    (7, 8, 9, 12, 12): 9,
-    (7, 8, 9, 12, 13): 8,
-    (7, 8, 9, 13, 13): 2,
-    (7, 8, 10, 10, 10): 2,
-    (7, 8, 10, 10, 11): 2,
-    (7, 8, 10, 10, 12): 8,
-    (7, 8, 10, 10, 13): 7,
-    (7, 8, 10, 11, 11): 5,
-    (7, 8, 10, 11, 12): 8,
-    (7, 8, 10, 11, 13): 16,
-    (7, 8, 10, 12, 12): 10,
-    (7, 8, 10, 12, 13): 7,
-    (7, 8, 10, 13, 13): 3,
-    (7, 8, 11, 11, 11): 1,
-    (7, 8, 11, 11, 12): 1,
-    (7, 8, 11, 11, 13): 5,
-    (7, 8, 11, 12, 12): 1,
-    (7, 8, 11, 12, 13): 9,
-    (7, 8, 11, 13, 13): 1,
-    (7, 8, 12, 12, 12): 4,
-    (7, 8, 12, 12, 13): 5,
-    (7, 8, 12, 13, 13): 5,
-    (7, 8, 13, 13, 13): 4,
-    (7, 9, 9, 9, 12): 7,
-    (7, 9, 9, 10, 10): 1,
-    (7, 9, 9, 10, 11): 3,
-    (7, 9, 9, 10, 12): 5,
-    (7, 9, 9, 10, 13): 10,
-    (7, 9, 9, 11, 11): 1,
-    (7, 9, 9, 11, 12): 5,
-    (7, 9, 9, 11, 13): 6,
-    (7, 9, 9, 12, 12): 7,
-    (7, 9, 9, 12, 13): 3,
-    (7, 9, 9, 13, 13): 1,
-    (7, 9, 10, 10, 11): 1,
-    (7, 9, 10, 10, 12): 6,
-    (7, 9, 10, 10, 13): 2,
-    (7, 9, 10, 11, 11): 7,
-    (7, 9, 10, 11, 12): 10,
-    (7, 9, 10, 11, 13): 4,
-    (7, 9, 10, 12, 12): 6,
-    (7, 9, 10, 12, 13): 13,
-    (7, 9, 10, 13, 13): 1,
-    (7, 9, 11, 11, 11): 1,
-    (7, 9, 11, 11, 12): 5,
-    (7, 9, 11, 11, 13): 2,
-    (7, 9, 11, 12, 12): 6,
-    (7, 9, 11, 12, 13): 5,
-    (7, 9, 11, 13, 13): 5,
-    (7, 9, 12, 12, 12): 2,
-    (7, 9, 12, 12, 13): 5,
-    (7, 9, 12, 13, 13): 3,
-    (7, 10, 10, 10, 12): 3,
-    (7, 10, 10, 10, 13): 1,
-    (7, 10, 10, 11, 12): 5,
-    (7, 10, 10, 11, 13): 4,
-    (7, 10, 10, 12, 12): 1,
-    (7, 10, 10, 12, 13): 3,
-    (7, 10, 10, 13, 13): 5,
-    (7, 10, 11, 11, 12): 2,
-    (7, 10, 11, 11, 13): 4,
-    (7, 10, 11, 12, 12): 4,
-    (7, 10, 11, 12, 13): 7,
-    (7, 10, 11, 13, 13): 2,
-    (7, 10, 12, 12, 12): 3,
-    (7, 10, 12, 12, 13): 2,
-    (7, 10, 12, 13, 13): 7,
-    (7, 10, 13, 13, 13): 2,
-    (7, 11, 11, 11, 12): 1,
-    (7, 11, 11, 11, 13): 2,
-    (7, 11, 11, 12, 12): 1,
-    (7, 11, 11, 12, 13): 5,
-    (7, 11, 11, 13, 13): 3,
-    (7, 11, 12, 12, 13): 8,
-    (7, 11, 12, 13, 13): 1,
-    (7, 12, 12, 12, 12): 1,
-    (7, 12, 12, 12, 13): 1,
-    (7, 12, 13, 13, 13): 1,
-    (8, 8, 8, 8, 10): 1,
-    (8, 8, 8, 8, 12): 1,
-    (8, 8, 8, 8, 13): 1,
-    (8, 8, 8, 9, 9): 1,
-    (8, 8, 8, 9, 10): 1,
-    (8, 8, 8, 9, 12): 2,
-    (8, 8, 8, 9, 13): 1,
-    (8, 8, 8, 10, 10): 2,
-    (8, 8, 8, 10, 11): 4,
-    (8, 8, 8, 10, 12): 3,
-    (8, 8, 8, 10, 13): 2,
-    (8, 8, 8, 11, 11): 1,
-    (8, 8, 8, 11, 12): 1,
-    (8, 8, 8, 11, 13): 1,
-    (8, 8, 8, 12, 12): 1,
-    (8, 8, 8, 12, 13): 1,
-    (8, 8, 9, 9, 11): 3,
-    (8, 8, 9, 9, 12): 1,
-    (8, 8, 9, 9, 13): 1,
-    (8, 8, 9, 10, 11): 4,
-    (8, 8, 9, 10, 12): 8,
-    (8, 8, 9, 10, 13): 3,
-    (8, 8, 9, 11, 11): 2,
-    (8, 8, 9, 11, 12): 1,
-    (8, 8, 9, 11, 13): 8,
-    (8, 8, 9, 12, 12): 3,
-    (8, 8, 9, 12, 13): 1,
-    (8, 8, 9, 13, 13): 1,
-    (8, 8, 10, 10, 10): 1,
-    (8, 8, 10, 10, 12): 5,
-    (8, 8, 10, 10, 13): 4,
-    (8, 8, 10, 11, 11): 1,
-    (8, 8, 10, 11, 12): 7,
-    (8, 8, 10, 11, 13): 3,
-    (8, 8, 10, 12, 12): 2,
-    (8, 8, 10, 12, 13): 8,
-    (8, 8, 10, 13, 13): 3,
-    (8, 8, 11, 11, 11): 1,
-    (8, 8, 11, 11, 13): 3,
-    (8, 8, 11, 13, 13): 2,
-    (8, 8, 12, 12, 12): 2,
-    (8, 8, 12, 12, 13): 1,
-    (8, 9, 9, 9, 12): 3,
-    (8, 9, 9, 9, 13): 1,
-    (8, 9, 9, 10, 11): 1,
-    (8, 9, 9, 10, 12): 5,
-    (8, 9, 9, 10, 13): 3,
-    (8, 9, 9, 11, 11): 1,
-    (8, 9, 9, 11, 12): 4,
-    (8, 9, 9, 11, 13): 4,
-    (8, 9, 9, 12, 12): 2,
-    (8, 9, 9, 12, 13): 7,
-    (8, 9, 10, 10, 10): 1,
-    (8, 9, 10, 10, 11): 3,
-    (8, 9, 10, 10, 12): 2,
-    (8, 9, 10, 10, 13): 4,
-    (8, 9, 10, 11, 11): 1,
-    (8, 9, 10, 11, 12): 4,
-    (8, 9, 10, 11, 13): 6,
-    (8, 9, 10, 12, 12): 12,
-    (8, 9, 10, 12, 13): 1,
-    (8, 9, 10, 13, 13): 3,
-    (8, 9, 11, 11, 11): 1,
-    (8, 9, 11, 11, 12): 5,
-    (8, 9, 11, 11, 13): 1,
-    (8, 9, 11, 12, 12): 6,
-    (8, 9, 11, 12, 13): 7,
-    (8, 9, 11, 13, 13): 3,
-    (8, 9, 12, 12, 13): 1,
-    (8, 10, 10, 10, 11): 1,
-    (8, 10, 10, 10, 12): 2,
-    (8, 10, 10, 10, 13): 1,
-    (8, 10, 10, 11, 11): 1,
-    (8, 10, 10, 11, 12): 4,
-    (8, 10, 10, 11, 13): 5,
-    (8, 10, 10, 12, 12): 3,
-    (8, 10, 10, 12, 13): 5,
-    (8, 10, 10, 13, 13): 1,
-    (8, 10, 11, 11, 13): 3,
-    (8, 10, 11, 12, 12): 4,
-    (8, 10, 11, 12, 13): 6,
-    (8, 10, 11, 13, 13): 5,
-    (8, 10, 12, 12, 12): 4,
-    (8, 10, 12, 12, 13): 1,
-    (8, 10, 12, 13, 13): 3,
-    (8, 10, 13, 13, 13): 1,
-    (8, 11, 11, 11, 13): 2,
-    (8, 11, 11, 12, 13): 3,
-    (8, 11, 11, 13, 13): 1,
-    (8, 11, 12, 12, 13): 5,
-    (8, 11, 12, 13, 13): 5,
-    (8, 11, 13, 13, 13): 3,
-    (8, 12, 12, 12, 12): 1,
-    (8, 12, 12, 12, 13): 2,
-    (8, 12, 12, 13, 13): 1,
-    (8, 13, 13, 13, 13): 1,
-    (9, 9, 9, 9, 12): 1,
-    (9, 9, 9, 10, 11): 1,
-    (9, 9, 9, 10, 12): 1,
-    (9, 9, 9, 11, 12): 3,
-    (9, 9, 9, 12, 12): 2,
-    (9, 9, 9, 12, 13): 4,
-    (9, 9, 10, 11, 12): 2,
-    (9, 9, 10, 11, 13): 4,
-    (9, 9, 10, 12, 12): 2,
-    (9, 9, 10, 12, 13): 4,
-    (9, 9, 10, 13, 13): 4,
-    (9, 9, 11, 11, 11): 1,
-    (9, 9, 11, 11, 12): 2,
-    (9, 9, 11, 11, 13): 2,
-    (9, 9, 11, 12, 12): 3,
-    (9, 9, 11, 12, 13): 4,
-    (9, 9, 11, 13, 13): 1,
-    (9, 9, 12, 12, 13): 1,
-    (9, 9, 12, 13, 13): 1,
-    (9, 9, 13, 13, 13): 1,
-    (9, 10, 10, 10, 12): 1,
-    (9, 10, 10, 11, 11): 2,
-    (9, 10, 10, 11, 12): 2,
-    (9, 10, 10, 12, 12): 1,
-    (9, 10, 10, 12, 13): 5,
-    (9, 10, 10, 13, 13): 1,
-    (9, 10, 11, 11, 11): 2,
-    (9, 10, 11, 11, 12): 2,
-    (9, 10, 11, 11, 13): 5,
-    (9, 10, 11, 12, 12): 3,
-    (9, 10, 11, 12, 13): 6,
-    (9, 10, 11, 13, 13): 3,
-    (9, 10, 12, 12, 12): 5,
-    (9, 10, 12, 12, 13): 3,
-    (9, 10, 12, 13, 13): 3,
-    (9, 10, 13, 13, 13): 1,
-    (9, 11, 11, 11, 12): 1,
-    (9, 11, 11, 11, 13): 1,
-    (9, 11, 11, 12, 13): 3,
-    (9, 11, 11, 13, 13): 2,
-    (9, 11, 12, 12, 13): 4,
-    (9, 12, 12, 12, 12): 1,
-    (9, 12, 12, 12, 13): 1,
-    (9, 12, 12, 13, 13): 3,
-    (9, 12, 13, 13, 13): 3,
-    (10, 10, 10, 10, 11): 1,
-    (10, 10, 10, 11, 12): 2,
-    (10, 10, 10, 12, 12): 1,
-    (10, 10, 10, 12, 13): 1,
-    (10, 10, 10, 13, 13): 1,
-    (10, 10, 11, 11, 12): 2,
-    (10, 10, 11, 11, 13): 1,
-    (10, 10, 11, 12, 13): 2,
-    (10, 10, 11, 13, 13): 1,
-    (10, 10, 12, 12, 13): 3,
-    (10, 10, 12, 13, 13): 2,
-    (10, 10, 13, 13, 13): 1,
-    (10, 11, 11, 11, 11): 1,
-    (10, 11, 11, 11, 13): 1,
-    (10, 11, 11, 12, 13): 2,
-    (10, 11, 11, 13, 13): 2,
-    (10, 11, 12, 12, 12): 2,
-    (10, 11, 12, 13, 13): 2,
-    (10, 11, 13, 13, 13): 2,
-    (10, 12, 12, 12, 13): 1,
-    (10, 12, 12, 13, 13): 1,
-    (10, 12, 13, 13, 13): 1,
-    (10, 13, 13, 13, 13): 2
-}
+
+class _SolutionNumbers(Mapping):
+    """Numbers of distinct answers of all solvable hands, read from a packaged database."""
+
+    def __init__(self, target: int):
+        """Initialize the mapping."""
+        self.__target = target
+        self.__database = None
+
+    def __get_database(self):
+        """Open the database on first use."""
+        if self.__database is None:
+            self.__database = get_database(self.__target)
+        return self.__database
+
+    def __getitem__(self, problem) -> int:
+        """Return the number of distinct answers of a solvable hand, given as a sorted tuple like the keys."""
+        database = self.__get_database()
+        if type(problem) is not tuple or list(problem) != sorted(problem):
+            raise KeyError(problem)
+        count = database.count(problem) if problem in database else 0
+        if count == 0:
+            raise KeyError(problem)
+        return count
+
+    def __iter__(self):
+        """Iterate all solvable hands."""
+        database = self.__get_database()
+        return (hand for hand, count in zip(all_hands(database.size, database.maximum), database.counts()) if count)
+
+    def __len__(self) -> int:
+        """Return the number of solvable hands."""
+        return sum(1 for count in self.__get_database().counts() if count)
+
+
+DATABASE_42 = _SolutionNumbers(42)
@@ -1,10 +1,37 @@
 import unittest
 import datetime
+import hashlib
+import inspect
+import json
+import os
 import random
+import subprocess
+import sys
+import tempfile
+import threading
 import time
+import zlib
 from fractions import Fraction
-from ftptsgame import FTPtsGame
-from ftptsgame.expr_utils import build_node
+from ftptsgame import FTPtsGame, is_solvable
+from ftptsgame.cache_utils import PROBLEM_CACHE, ProblemCache, SolutionCache
+from ftptsgame import database as ftpts_database
+from ftptsgame.database import build, build_counts, main, _solve_all
+from ftptsgame.database_utils import CountTable, Database, all_hands, count_hand, get_database, solve_hand, write_database
+from ftptsgame import fingerprint_utils
+from ftptsgame.expr_utils import RULES_VERSION, Node, NodePool, build_node
+from ftptsgame.problem_utils import Problem, rank_hand, reachable_values, unrank_hand, _get_all_expr, _operator_rules
+from ftptsgame.fingerprint_utils import get_numpy, group_by_fingerprint, random_points
+from tests.database import DATABASE_42
+
+
+def _solve_unless(hand, argument):
+    """Solve a hand for _solve_all, failing on forbidden hands and marking solved hands in a directory."""
+    forbidden, directory = argument
+    if hand in forbidden:
+        raise RuntimeError(hand)
+    open(os.path.join(directory, '-'.join(map(str, hand))), 'w').close()
+    return bytes(hand)
+
 
 class TestGameApp(unittest.TestCase):
     def test_game_status(self):
@@ -134,6 +161,16 @@ class TestGameApp(unittest.TestCase):
         self.assertEqual(str(a), '(4-3+5)*(2-1)')
         a = build_node('9/(11/6-2)+12')
         self.assertEqual(str(a), '9/(2-11/6)-12')
+        a = Node(Node.NODE_TYPE_OPERATOR, '-', Node(Node.NODE_TYPE_NUMBER, 1), Node(Node.NODE_TYPE_NUMBER, 2))
+        self.assertEqual(a.unique_id(), '-[1][2]')
+        a.reduce_negative_number()
+        self.assertEqual(a.unique_id(), '-[2][1]')
+        pool = NodePool()
+        b = pool.operator('-', pool.number(1), pool.number(2))
+        self.assertRaises(ValueError, b.reduce_negative_number)
+        c = Node(Node.NODE_TYPE_OPERATOR, '*', b, Node(Node.NODE_TYPE_NUMBER, 3))
+        self.assertRaises(ValueError, c.reduce_negative_number)
+        self.assertEqual(b.unique_id(), '-[1][2]')
 
     def test_different_targets(self):
         # additional tests for different target
@@ -146,3 +183,289 @@ class TestGameApp(unittest.TestCase):
         self.assertRaises(ArithmeticError, app.solve, '12*(8-4-3/6)')
         self.assertRaises(LookupError, app.solve, '4*(6*8-12)/3')
         app.stop()
+
+    def test_solvable(self):
+        # solvability tests without generating answers
+        self.assertTrue(is_solvable([0, 0, 0, 6, 7]))
+        self.assertTrue(is_solvable([3, 4, 6, 8, 12], target=48))
+        self.assertTrue(is_solvable([0, 0, 0, 5, 6], target=0))
+        self.assertFalse(is_solvable([0, 0, 0, 5, 6]))
+        self.assertFalse(is_solvable([0, 0, 1, 5, 5]))
+        self.assertFalse(is_solvable([13, 13, 13, 13, 13]))
+
+    def test_reachable_values(self):
+        # value reachability tests without building expressions
+        self.assertEqual(reachable_values([1, 2]), {1, 2, 3, Fraction(1, 2)})
+        self.assertEqual(reachable_values([2, 2]), {0, 1, 4})
+        self.assertEqual(reachable_values([1, 2], histogram=True), {3: 2, 2: 3, 1: 1, Fraction(1, 2): 1})
+        problem = Problem([1, 1, 6, 7, 12])
+        problem.generate_answers(42)
+        histogram = reachable_values([1, 1, 6, 7, 12], histogram=True)
+        self.assertEqual(histogram[42], len(problem.answer_table))
+        self.assertEqual(set(histogram), reachable_values([1, 1, 6, 7, 12]))
+        cache = {}
+        self.assertEqual(reachable_values([1, 1, 6, 7, 12], cache=cache), set(histogram))
+        self.assertEqual(reachable_values([1, 1, 6, 7, 12], histogram=True, cache=cache), histogram)
+
+    def test_operator_rules(self):
+        # solving, value sets and histograms agree with the generated answers
+        for hand in all_hands(3, 6):
+            values, histogram = reachable_values(list(hand)), reachable_values(list(hand), histogram=True)
+            for target in range(-3, 13):
+                problem = Problem(hand)
+                solvable = problem.has_solution(target)
+                problem.generate_answers(target)
+                self.assertEqual(solvable, len(problem.answer_table) > 0)
+                self.assertEqual(target in values, solvable)
+                self.assertEqual(histogram.get(target, 0), len(problem.answer_table))
+
+    def test_canonicalize(self):
+        # canonical representatives of equivalence classes
+        problem = Problem([3, 4, 6, 7, 12])
+        problem.generate_answers(42)
+        node = problem.canonicalize(build_node('6*7+(12-3*4)'))
+        self.assertIs(node, problem.canonicalize(build_node('(12-3*4)+6*7')))
+        self.assertIs(node, problem.canonicalize(build_node('6*(7/12)*3*4')))
+        self.assertIsNot(node, problem.canonicalize(build_node('(12+6/3)*(7-4)')))
+        self.assertIn(node, problem.distinct_answer_table)
+        another_problem = Problem([3, 4, 6, 7, 12])
+        another_problem.generate_answers(42)
+        self.assertEqual(str(node), str(another_problem.canonicalize(build_node('6*7+(12-3*4)'))))
+
+    def test_fingerprint(self):
+        # rule 1 fingerprints with modular arithmetic
+        answers = _get_all_expr([1, 1, 6, 7, 12], 5, 42)
+        points = random_points([1, 1, 6, 7, 12], 10, random.Random(0))
+        groups = group_by_fingerprint(answers, points, use_numpy=False)
+        self.assertEqual(len(groups), len(answers))
+        for i, first in enumerate(groups):
+            self.assertLessEqual(first, i)
+            self.assertEqual(groups[first], first)
+        a = build_node('6*(7/12)*3*4')
+        b = build_node('3*4*(6*7)/12')
+        c = build_node('6*7+(12-3*4)')
+        other_points = random_points([3, 4, 6, 7, 12], 10, random.Random(0))
+        self.assertEqual(group_by_fingerprint([a, b, c], other_points, use_numpy=False), [0, 0, 2])
+        if get_numpy() is not None:
+            self.assertEqual(group_by_fingerprint(answers, points), groups)
+
+    def test_deterministic_classification(self):
+        # classification is seeded and doesn't touch the global random generator
+        state = random.getstate()
+        a = Problem([3, 4, 6, 8, 12])
+        a.generate_answers(48)
+        b = Problem([3, 4, 6, 8, 12], seed=random.Random(1))
+        b.generate_answers(48)
+        self.assertEqual(random.getstate(), state)
+        self.assertEqual(a.equivalence_dict, b.equivalence_dict)
+        self.assertEqual([str(x) for x in a.distinct_answer_table], [str(x) for x in b.distinct_answer_table])
+
+    def test_solution_cache(self):
+        with tempfile.TemporaryDirectory() as path:
+            cache = SolutionCache(path)
+            self.assertIsNone(cache.load([3, 4, 6, 8, 12], 48))
+            a = cache.solve([12, 8, 6, 4, 3], 48)
+            self.assertEqual(len(os.listdir(path)), 1)
+            b = cache.load([3, 4, 6, 8, 12], 48)
+            self.assertEqual(a.equivalence_dict, b.equivalence_dict)
+            self.assertEqual([str(x) for x in a.distinct_answer_table], [str(x) for x in b.distinct_answer_table])
+            expr = build_node('8*6+(12-3*4)')
+            self.assertEqual(str(b.canonicalize(expr)), str(a.canonicalize(expr)))
+            self.assertIsNone(cache.load([3, 4, 6, 8, 12], 48, seed=1))
+            cache.solve([3, 4, 6, 8, 12], 48, seed=random.Random(1))
+            self.assertEqual(len(os.listdir(path)), 1)
+            entry = os.path.join(path, os.listdir(path)[0])
+            broken = [
+                [],
+                {'version': RULES_VERSION},
+                {'version': RULES_VERSION, 'nodes': [3, 1.5], 'answers': [1], 'representatives': [0]},
+                {'version': RULES_VERSION, 'nodes': [3, ['+', 0, 2]], 'answers': [1], 'representatives': [0]},
+            ]
+            for item in broken:
+                with open(entry, 'wb') as f:
+                    f.write(zlib.compress(json.dumps(item).encode()))
+                self.assertIsNone(cache.load([3, 4, 6, 8, 12], 48))
+
+            PROBLEM_CACHE.clear()  # so the app doesn't find the problem in memory
+            os.remove(entry)
+            app = FTPtsGame(cache_path=path)
+            app.generate_problem([3, 4, 6, 8, 12], target=48)
+            self.assertTrue(os.path.exists(entry))
+            app.start()
+            self.assertEqual(app.get_total_solution_number(), len(a.distinct_answer_table))
+            app.solve('8*6+(12-3*4)')
+            self.assertRaises(LookupError, app.solve, '(12-3*4)+6*8')
+
+    def test_rules_version(self):
+        # saved answers are trusted by RULES_VERSION, so the rules must not change without a bump
+        rules = [Node._Node__equivalent_expression, Problem._Problem__classify, _operator_rules, fingerprint_utils]
+        digest = hashlib.sha256(''.join(inspect.getsource(x) for x in rules).encode()).hexdigest()
+        self.assertEqual((RULES_VERSION, digest), (1, '13fb91448ee9d28d45f987946ce6c305e8acc07777e68f6cafbaa3ce27f14b5f'),
+                         'Bump RULES_VERSION and rebuild the packaged data if answers could be classified differently, '
+                         'then update the digest here.')
+
+    def test_problem_cache(self):
+        cache = ProblemCache()
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(cache.get([1, 2, 3, 4, 5]))) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(len(results), 4)
+        cached = cache.get([5, 4, 3, 2, 1])
+        self.assertTrue(all(x is cached for x in results))
+        self.assertEqual(cache.hits + cache.misses, 5)
+        self.assertEqual(len(cache), 1)
+        self.assertEqual(cache.size, results[0].estimated_size())
+        size = cache.size
+        self.assertEqual(len(results[0].equivalence_dict), len(results[0].answer_table))
+        self.assertGreater(results[0].estimated_size(), size)
+
+        cache.max_bytes = size + 1
+        other = cache.get([1, 2, 3, 4, 5], target=24)
+        self.assertEqual(cache.evictions, 1)
+        self.assertEqual(cache.size, other.estimated_size())
+        self.assertEqual(cache.stats()['entries'], 1)
+        self.assertIs(cache.get([1, 2, 3, 4, 5], target=24), other)
+        self.assertIsNot(cache.get([1, 2, 3, 4, 5], seed=random.Random(42)), results[0])
+        self.assertEqual(len(cache), 1)
+
+    def test_database(self):
+        with tempfile.TemporaryDirectory() as path:
+            path = os.path.join(path, 'database.bin')
+            hands = list(all_hands(3, 4))
+            write_database(path, 6, (solve_hand(hand, 6) for hand in hands), 3, 4)
+            with Database(path) as database:
+                self.assertEqual(len(database), 35)
+                for hand in hands:
+                    problem = Problem(hand)
+                    problem.generate_answers(6)
+                    loaded = database.load(hand[::-1])
+                    self.assertEqual(database.count(hand), len(problem.distinct_answer_table))
+                    self.assertEqual(loaded.equivalence_dict, problem.equivalence_dict)
+                    self.assertEqual(loaded.estimated_size(), problem.estimated_size())
+                    self.assertEqual([str(x) for x in loaded.distinct_answer_table],
+                                     [str(x) for x in problem.distinct_answer_table])
+                self.assertNotIn((1, 2, 5), database)
+                self.assertRaises(KeyError, database.count, (1, 2, 3, 4))
+            self.assertRaises(ValueError, database.count, (1, 2, 3))  # closed, so the file can be removed
+
+        database = get_database(42)
+        self.assertEqual(len(database), 8568)
+        self.assertEqual(database.count((1, 2, 3, 4, 5)), 10)
+        self.assertEqual(database.count((0, 0, 0, 0, 0)), 0)
+        self.assertIsNone(get_database(43))
+        self.assertEqual(database.counts()[database.rank((1, 2, 3, 4, 5))], 10)
+        self.assertEqual(len(DATABASE_42), 7065)
+        self.assertEqual(DATABASE_42[(1, 2, 3, 4, 5)], 10)
+        self.assertNotIn((0, 0, 0, 0, 0), DATABASE_42)
+        self.assertNotIn((2, 1, 3, 4, 5), DATABASE_42)
+        self.assertRaises(KeyError, DATABASE_42.__getitem__, [1, 2, 3, 4, 5])
+        self.assertEqual(next(iter(DATABASE_42)), (0, 0, 0, 6, 7))
+
+    def test_database_build(self):
+        def _interrupt(solved, total):
+            if solved:
+                raise KeyboardInterrupt
+
+        with tempfile.TemporaryDirectory() as path:
+            expected = os.path.join(path, 'expected.bin')
+            write_database(expected, 6, (solve_hand(hand, 6) for hand in all_hands(3, 4)), 3, 4)
+            output = os.path.join(path, 'database.bin')
+            checkpoint = os.path.join(path, 'parts')
+            self.assertRaises(KeyboardInterrupt, build, output, 6, 3, 4, 1, 8, checkpoint, _interrupt)
+            self.assertFalse(os.path.exists(output))
+            self.assertTrue(os.listdir(checkpoint))
+
+            progress = []
+            build(output, 6, 3, 4, 1, 8, checkpoint, lambda solved, total: progress.append((solved, total)))
+            self.assertGreater(progress[0][0], 0)
+            self.assertEqual(progress[-1], (35, 35))
+            self.assertFalse(os.path.exists(checkpoint))
+            with open(output, 'rb') as f, open(expected, 'rb') as g:
+                self.assertEqual(f.read(), g.read())
+
+            main(['build', '-t', '6', '-s', '3', '-m', '4', '-j', '1', '-o', output])
+            with open(output, 'rb') as f, open(expected, 'rb') as g:
+                self.assertEqual(f.read(), g.read())
+
+    def test_rank_hand(self):
+        for i, hand in enumerate(all_hands()):
+            self.assertEqual(rank_hand(hand[::-1]), i)
+            self.assertEqual(unrank_hand(i), hand)
+        self.assertEqual(rank_hand([13] * 5), 8567)
+        self.assertEqual(unrank_hand(34, 3, 4), (4, 4, 4))
+        self.assertRaises(ValueError, rank_hand, [1, 2, 3, 4, 14])
+        self.assertRaises(ValueError, unrank_hand, 8568)
+        self.assertIsNone(get_database(42).rank([1, 2, 3, 4, 14]))
+
+    def test_generate_random_problem(self):
+        app = FTPtsGame()
+        for low, high in [(1, 1), (5, 5), (20, 30), (50, None)]:
+            app.generate_random_problem(min_solutions=low, max_solutions=high)
+            app.start()
+            self.assertGreaterEqual(app.get_total_solution_number(), low)
+            self.assertLessEqual(app.get_total_solution_number(), high or 1000)
+            self.assertRaises(PermissionError, app.generate_random_problem)
+            app.stop()
+        self.assertRaises(ValueError, app.generate_random_problem, 1000)
+        self.assertRaises(ValueError, app.generate_random_problem, 3, 2)
+        self.assertRaises(ValueError, app.generate_random_problem, target=43)
+
+        database = get_database(42)
+        rng = random.Random(0)
+        hands = {database.random_hand(0, 0, rng) for _ in range(100)}
+        self.assertTrue(all(database.count(hand) == 0 for hand in hands))
+        self.assertGreater(len(hands), 1)
+
+    def test_count_table(self):
+        with tempfile.TemporaryDirectory() as path:
+            output = os.path.join(path, 'counts.bin')
+            build_counts(output, range(1, 11), 3, 4, 1)
+            with CountTable(output) as table:
+                self.assertEqual(table.targets, range(1, 11))
+                hands = list(all_hands(3, 4))
+                for hand in hands:
+                    counts = count_hand(hand, table.targets)
+                    self.assertEqual([table.count(hand[::-1], target) for target in table.targets], counts)
+                self.assertEqual(table.count((1, 2, 3), 6), 2)
+                self.assertEqual(table.counts(6), [count_hand(hand, [6])[0] for hand in hands])
+                self.assertEqual(table.count(table.random_hand(2, 2, 6, random.Random(0)), 6), 2)
+                self.assertRaises(KeyError, table.count, (2, 2, 2), 11)
+                self.assertRaises(KeyError, table.count, (2, 2, 5), 6)
+                self.assertRaises(ValueError, table.random_hand, 100, None, 6)
+
+    def test_lazy_database(self):
+        code = ('import sys, ftptsgame, ftptsgame.database_utils as d; '
+                'assert not d._databases and not d._count_tables; '
+                'assert "numpy" not in sys.modules and "ftptsgame.database" not in sys.modules')
+        subprocess.check_call([sys.executable, '-c', code], cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+        problem = ftpts_database.get([12, 7, 6, 4, 3])
+        self.assertIs(ftpts_database.get((3, 4, 6, 7, 12)), problem)
+        self.assertEqual(len(problem.distinct_answer_table), 26)
+        seeded = ftpts_database.get([3, 4, 6, 7, 12], seed=1)
+        self.assertIsNot(seeded, problem)
+        self.assertEqual(seeded.seed, 1)
+        self.assertEqual(seeded.equivalence_dict, problem.equivalence_dict)
+        self.assertEqual(ftpts_database.count([1, 2, 3, 4, 5]), 10)
+        self.assertRaises(KeyError, ftpts_database.get, [1, 2, 3, 4, 14])
+        self.assertRaises(ValueError, ftpts_database.get, [1, 2, 3, 4, 5], 43)
+
+    def test_database_build_failure(self):
+        hands = list(all_hands(3, 6))
+        with tempfile.TemporaryDirectory() as checkpoint, tempfile.TemporaryDirectory() as marks:
+            self.assertRaises(RuntimeError, _solve_all, _solve_unless, ({hands[20]}, marks), hands, 1, 4, checkpoint, None)
+            self.assertLess(len(os.listdir(marks)), 40)  # queued chunks are cancelled, not solved
+            saved = set()
+            for name in os.listdir(checkpoint):
+                start, length = map(int, name[:-len('.part')].split('-'))
+                saved.update(hands[start:start + length])
+            self.assertEqual(len(saved), len(os.listdir(marks)))  # all finished chunks are saved
+            self.assertTrue(set(hands[:20]) <= saved)
+            self.assertNotIn(hands[20], saved)
+
+            # saved hands aren't solved again
+            records = _solve_all(_solve_unless, (saved, marks), hands, 1, 4, checkpoint, None)
+            self.assertEqual(records, [bytes(hand) for hand in hands])